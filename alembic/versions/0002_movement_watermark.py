@@ -0,0 +1,47 @@
+"""Track a movement high-watermark and history digest per legal case
+
+Revision ID: 0002_movement_watermark
+Revises: 0001_initial_schema
+Create Date: 2026-10-19 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_movement_watermark"
+down_revision: Union[str, None] = "0001_initial_schema"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "legal_cases",
+        sa.Column("movement_watermark", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "legal_cases",
+        sa.Column("movement_digest", sa.String(length=64), nullable=True),
+    )
+    # The digest stays NULL until the next sync recomputes it from the
+    # provider history; the watermark can be backfilled right away.
+    op.execute(
+        """
+        UPDATE legal_cases AS lc
+        SET movement_watermark = mv.latest
+        FROM (
+            SELECT legal_case_id, MAX(movement_date) AS latest
+            FROM legal_case_movements
+            GROUP BY legal_case_id
+        ) AS mv
+        WHERE mv.legal_case_id = lc.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("legal_cases", "movement_digest")
+    op.drop_column("legal_cases", "movement_watermark")
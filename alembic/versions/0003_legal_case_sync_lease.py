@@ -0,0 +1,33 @@
+"""Add per-case sync leases so replicas can share the legal case cron
+
+Revision ID: 0003_legal_case_sync_lease
+Revises: 0002_movement_watermark
+Create Date: 2026-10-19 10:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_legal_case_sync_lease"
+down_revision: Union[str, None] = "0002_movement_watermark"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "legal_cases",
+        sa.Column("sync_lease_owner", sa.String(length=100), nullable=True),
+    )
+    op.add_column(
+        "legal_cases",
+        sa.Column("sync_lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("legal_cases", "sync_lease_expires_at")
+    op.drop_column("legal_cases", "sync_lease_owner")
@@ -0,0 +1,77 @@
+"""Record legal case sync runs so interrupted runs can be resumed
+
+Revision ID: 0004_sync_runs
+Revises: 0003_legal_case_sync_lease
+Create Date: 2026-10-19 11:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_sync_runs"
+down_revision: Union[str, None] = "0003_legal_case_sync_lease"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+sync_run_status_enum = postgresql.ENUM(
+    "running",
+    "completed",
+    "failed",
+    "interrupted",
+    name="sync_run_status",
+)
+
+
+def upgrade() -> None:
+    sync_run_status_enum.create(op.get_bind(), checkfirst=True)
+    op.create_table(
+        "sync_runs",
+        sa.Column("id", sa.dialects.postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("owner", sa.String(length=100), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                "running",
+                "completed",
+                "failed",
+                "interrupted",
+                name="sync_run_status",
+                create_type=False,
+            ),
+            nullable=False,
+            server_default="running",
+        ),
+        sa.Column(
+            "resumed_from", sa.dialects.postgresql.UUID(as_uuid=True), nullable=True
+        ),
+        sa.Column("pending_case_ids", sa.JSON(), nullable=True),
+        sa.Column("total_cases", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_cases", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("skipped_cases", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("failed_cases", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "started_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column(
+            "heartbeat_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_sync_runs_status", "sync_runs", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sync_runs_status", table_name="sync_runs")
+    op.drop_table("sync_runs")
+    sync_run_status_enum.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,42 @@
+"""Schedule legal case syncs individually through next_sync_at
+
+Revision ID: 0005_legal_case_next_sync_at
+Revises: 0004_sync_runs
+Create Date: 2026-10-19 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_legal_case_next_sync_at"
+down_revision: Union[str, None] = "0004_sync_runs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "legal_cases",
+        sa.Column("next_sync_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    # Keep the previous cadence until each case is resynced and rescheduled.
+    op.execute(
+        """
+        UPDATE legal_cases
+        SET next_sync_at = COALESCE(last_synced_at + INTERVAL '3 days', NOW())
+        """
+    )
+    op.create_index(
+        "ix_legal_cases_next_sync_at",
+        "legal_cases",
+        ["next_sync_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_legal_cases_next_sync_at", table_name="legal_cases")
+    op.drop_column("legal_cases", "next_sync_at")
@@ -0,0 +1,40 @@
+"""Add the shared DataJud lookup cache tier
+
+Revision ID: 0006_datajud_lookup_cache
+Revises: 0005_legal_case_next_sync_at
+Create Date: 2026-10-19 13:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_datajud_lookup_cache"
+down_revision: Union[str, None] = "0005_legal_case_next_sync_at"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "datajud_lookup_cache",
+        sa.Column("cache_key", sa.String(length=64), primary_key=True),
+        sa.Column("found", sa.Boolean(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_datajud_lookup_cache_expires_at",
+        "datajud_lookup_cache",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_datajud_lookup_cache_expires_at", table_name="datajud_lookup_cache"
+    )
+    op.drop_table("datajud_lookup_cache")
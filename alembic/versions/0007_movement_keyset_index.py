@@ -0,0 +1,31 @@
+"""Index movements for keyset pagination by case
+
+Revision ID: 0007_movement_keyset_index
+Revises: 0006_datajud_lookup_cache
+Create Date: 2026-10-19 14:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_movement_keyset_index"
+down_revision: Union[str, None] = "0006_datajud_lookup_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_legal_case_movements_case_date_id",
+        "legal_case_movements",
+        ["legal_case_id", "movement_date", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_legal_case_movements_case_date_id", table_name="legal_case_movements"
+    )
@@ -0,0 +1,98 @@
+"""Add Portuguese full-text search vectors to cases and movements
+
+Revision ID: 0008_full_text_search
+Revises: 0007_movement_keyset_index
+Create Date: 2026-10-19 15:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0008_full_text_search"
+down_revision: Union[str, None] = "0007_movement_keyset_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CASE_SEARCH_EXPRESSION = (
+    "setweight(to_tsvector('portuguese', "
+    "coalesce(assunto, '') || ' ' || coalesce(classe_processual, '')), 'A') || "
+    "setweight(to_tsvector('portuguese', "
+    "coalesce(orgao_julgador, '') || ' ' || coalesce(tribunal, '') || ' ' || "
+    "coalesce(ultima_movimentacao_descricao, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "legal_case_movements",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('portuguese', description)", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_legal_case_movements_search_vector",
+        "legal_case_movements",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.add_column(
+        "legal_cases",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(CASE_SEARCH_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "legal_cases",
+        sa.Column("movement_search_vector", postgresql.TSVECTOR(), nullable=True),
+    )
+    # From here on the repository appends each synced movement to the vector.
+    op.execute(
+        """
+        UPDATE legal_cases AS lc
+        SET movement_search_vector = setweight(
+            to_tsvector('portuguese', agg.descriptions), 'B'
+        )
+        FROM (
+            SELECT legal_case_id, string_agg(description, E'\\n') AS descriptions
+            FROM legal_case_movements
+            GROUP BY legal_case_id
+        ) AS agg
+        WHERE agg.legal_case_id = lc.id
+        """
+    )
+    op.create_index(
+        "ix_legal_cases_search_vector",
+        "legal_cases",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_legal_cases_movement_search_vector",
+        "legal_cases",
+        ["movement_search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_legal_cases_movement_search_vector", table_name="legal_cases")
+    op.drop_index("ix_legal_cases_search_vector", table_name="legal_cases")
+    op.drop_column("legal_cases", "movement_search_vector")
+    op.drop_column("legal_cases", "search_vector")
+    op.drop_index(
+        "ix_legal_case_movements_search_vector", table_name="legal_case_movements"
+    )
+    op.drop_column("legal_case_movements", "search_vector")
@@ -0,0 +1,36 @@
+"""Add composite indexes for the keyset case listing
+
+Revision ID: 0009_legal_case_listing_indexes
+Revises: 0008_full_text_search
+Create Date: 2026-10-19 16:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0009_legal_case_listing_indexes"
+down_revision: Union[str, None] = "0008_full_text_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_legal_cases_created_at_id": ["created_at", "id"],
+    "ix_legal_cases_ultima_movimentacao_id": ["ultima_movimentacao", "id"],
+    "ix_legal_cases_data_ajuizamento_id": ["data_ajuizamento", "id"],
+    "ix_legal_cases_movimentacoes_id": ["movimentacoes", "id"],
+    "ix_legal_cases_status_created_at_id": ["status", "created_at", "id"],
+    "ix_legal_cases_prioridade_created_at_id": ["prioridade", "created_at", "id"],
+    "ix_legal_cases_tribunal_created_at_id": ["tribunal", "created_at", "id"],
+}
+
+
+def upgrade() -> None:
+    for name, columns in INDEXES.items():
+        op.create_index(name, "legal_cases", columns, unique=False)
+
+
+def downgrade() -> None:
+    for name in reversed(list(INDEXES)):
+        op.drop_index(name, table_name="legal_cases")
@@ -0,0 +1,90 @@
+"""Add the legal case change outbox
+
+Revision ID: 0010_legal_case_change_events
+Revises: 0009_legal_case_listing_indexes
+Create Date: 2026-10-19 17:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0010_legal_case_change_events"
+down_revision: Union[str, None] = "0009_legal_case_listing_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "legal_case_change_events",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "txid",
+            sa.BigInteger(),
+            server_default=sa.text("(pg_current_xact_id()::text)::bigint"),
+            nullable=False,
+        ),
+        sa.Column(
+            "legal_case_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("legal_cases.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("numero_processo", sa.String(length=25), nullable=False),
+        sa.Column("event_type", sa.String(length=50), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("delivered_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "delivery_attempts", sa.Integer(), server_default="0", nullable=False
+        ),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_legal_case_change_events_feed",
+        "legal_case_change_events",
+        ["txid", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_legal_case_change_events_case_feed",
+        "legal_case_change_events",
+        ["numero_processo", "txid", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_legal_case_change_events_undelivered",
+        "legal_case_change_events",
+        ["next_attempt_at"],
+        unique=False,
+        postgresql_where=sa.text("delivered_at IS NULL"),
+    )
+    op.create_index(
+        "ix_legal_case_change_events_created_at",
+        "legal_case_change_events",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_legal_case_change_events_created_at",
+        table_name="legal_case_change_events",
+    )
+    op.drop_index(
+        "ix_legal_case_change_events_undelivered",
+        table_name="legal_case_change_events",
+    )
+    op.drop_index(
+        "ix_legal_case_change_events_case_feed",
+        table_name="legal_case_change_events",
+    )
+    op.drop_index(
+        "ix_legal_case_change_events_feed", table_name="legal_case_change_events"
+    )
+    op.drop_table("legal_case_change_events")
@@ -0,0 +1,57 @@
+"""Archive raw DataJud payloads for offline re-mapping
+
+Revision ID: 0011_datajud_raw_archive
+Revises: 0010_legal_case_change_events
+Create Date: 2026-10-19 18:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0011_datajud_raw_archive"
+down_revision: Union[str, None] = "0010_legal_case_change_events"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "datajud_raw_payloads",
+        sa.Column("content_hash", sa.String(length=64), primary_key=True),
+        sa.Column("codec", sa.String(length=16), nullable=False),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+        sa.Column("raw_size", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    # Blobs are already compressed; skip TOAST's pglz pass over them.
+    op.execute(
+        "ALTER TABLE datajud_raw_payloads ALTER COLUMN payload SET STORAGE EXTERNAL"
+    )
+    op.create_table(
+        "legal_case_raw_sources",
+        sa.Column("numero_processo", sa.String(length=25), primary_key=True),
+        sa.Column("court_acronym", sa.String(length=16), nullable=False),
+        sa.Column(
+            "content_hash",
+            sa.String(length=64),
+            sa.ForeignKey("datajud_raw_payloads.content_hash"),
+            nullable=False,
+        ),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_legal_case_raw_sources_content_hash",
+        "legal_case_raw_sources",
+        ["content_hash"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_legal_case_raw_sources_content_hash", table_name="legal_case_raw_sources"
+    )
+    op.drop_table("legal_case_raw_sources")
+    op.drop_table("datajud_raw_payloads")
@@ -0,0 +1,75 @@
+"""Add bulk legal case imports
+
+Revision ID: 0012_legal_case_imports
+Revises: 0011_datajud_raw_archive
+Create Date: 2026-10-19 19:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0012_legal_case_imports"
+down_revision: Union[str, None] = "0011_datajud_raw_archive"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "legal_case_imports",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("created_by", sa.String(length=100), nullable=True),
+        sa.Column("source_format", sa.String(length=10), nullable=False),
+        sa.Column("total_received", sa.Integer(), nullable=False),
+        sa.Column("invalid_count", sa.Integer(), nullable=False),
+        sa.Column("duplicate_count", sa.Integer(), nullable=False),
+        sa.Column("already_tracked_count", sa.Integer(), nullable=False),
+        sa.Column("queued_count", sa.Integer(), nullable=False),
+        sa.Column("invalid_entries", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_table(
+        "legal_case_import_items",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "import_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("legal_case_imports.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "legal_case_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("legal_cases.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("numero_processo", sa.String(length=25), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_legal_case_import_items_import_id",
+        "legal_case_import_items",
+        ["import_id"],
+    )
+    op.create_index(
+        "ix_legal_case_import_items_legal_case_id",
+        "legal_case_import_items",
+        ["legal_case_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_legal_case_import_items_legal_case_id",
+        table_name="legal_case_import_items",
+    )
+    op.drop_index(
+        "ix_legal_case_import_items_import_id", table_name="legal_case_import_items"
+    )
+    op.drop_table("legal_case_import_items")
+    op.drop_table("legal_case_imports")
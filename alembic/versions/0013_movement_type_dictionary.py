@@ -0,0 +1,127 @@
+"""Dictionary-encode movement descriptions
+
+Revision ID: 0013_movement_type_dictionary
+Revises: 0012_legal_case_imports
+Create Date: 2026-10-19 20:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0013_movement_type_dictionary"
+down_revision: Union[str, None] = "0012_legal_case_imports"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "legal_case_movement_types",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("description_hash", sa.LargeBinary(length=16), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('portuguese', description)", persisted=True),
+            nullable=True,
+        ),
+        sa.UniqueConstraint("description_hash", name="uq_legal_case_movement_type"),
+    )
+    # md5() hashes the UTF-8 bytes, the same key the repository computes.
+    op.execute(
+        """
+        INSERT INTO legal_case_movement_types (description_hash, description)
+        SELECT decode(md5(description), 'hex'), description
+        FROM (SELECT DISTINCT description FROM legal_case_movements) AS d
+        ORDER BY description
+        """
+    )
+    op.create_index(
+        "ix_legal_case_movement_types_search_vector",
+        "legal_case_movement_types",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+    op.add_column(
+        "legal_case_movements",
+        sa.Column("movement_type_id", sa.Integer(), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE legal_case_movements AS m
+        SET movement_type_id = t.id
+        FROM legal_case_movement_types AS t
+        WHERE t.description_hash = decode(md5(m.description), 'hex')
+        """
+    )
+    op.alter_column("legal_case_movements", "movement_type_id", nullable=False)
+    op.create_foreign_key(
+        "fk_legal_case_movements_movement_type_id",
+        "legal_case_movements",
+        "legal_case_movement_types",
+        ["movement_type_id"],
+        ["id"],
+    )
+    op.drop_constraint("uq_legal_case_movement", "legal_case_movements", type_="unique")
+    op.create_unique_constraint(
+        "uq_legal_case_movement",
+        "legal_case_movements",
+        ["legal_case_id", "movement_date", "movement_type_id"],
+    )
+    op.drop_index(
+        "ix_legal_case_movements_search_vector", table_name="legal_case_movements"
+    )
+    op.drop_column("legal_case_movements", "search_vector")
+    op.drop_column("legal_case_movements", "description")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "legal_case_movements",
+        sa.Column("description", sa.Text(), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE legal_case_movements AS m
+        SET description = t.description
+        FROM legal_case_movement_types AS t
+        WHERE t.id = m.movement_type_id
+        """
+    )
+    op.alter_column("legal_case_movements", "description", nullable=False)
+    op.add_column(
+        "legal_case_movements",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('portuguese', description)", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_legal_case_movements_search_vector",
+        "legal_case_movements",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.drop_constraint("uq_legal_case_movement", "legal_case_movements", type_="unique")
+    op.create_unique_constraint(
+        "uq_legal_case_movement",
+        "legal_case_movements",
+        ["legal_case_id", "movement_date", "description"],
+    )
+    op.drop_constraint(
+        "fk_legal_case_movements_movement_type_id",
+        "legal_case_movements",
+        type_="foreignkey",
+    )
+    op.drop_column("legal_case_movements", "movement_type_id")
+    op.drop_table("legal_case_movement_types")
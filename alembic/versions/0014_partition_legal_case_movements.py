@@ -0,0 +1,150 @@
+"""Range-partition legal_case_movements by movement_date
+
+Revision ID: 0014_partition_legal_case_movements
+Revises: 0013_movement_type_dictionary
+Create Date: 2026-10-19 21:00:00.000000
+"""
+
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "0014_partition_legal_case_movements"
+down_revision: Union[str, None] = "0013_movement_type_dictionary"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Kept in sync with legal_case_movement_partition_repository.
+MIN_PARTITION_YEAR = 1900
+YEARS_AHEAD = 2
+
+COLUMNS = "id, legal_case_id, movement_date, movement_type_id, created_at"
+
+
+def _create_partition(year: int) -> None:
+    op.execute(
+        f"CREATE TABLE legal_case_movements_p{year:04d} "
+        "PARTITION OF legal_case_movements "
+        f"FOR VALUES FROM ('{year:04d}-01-01T00:00:00+00:00') "
+        f"TO ('{year + 1:04d}-01-01T00:00:00+00:00')"
+    )
+
+
+def upgrade() -> None:
+    # Index and constraint names are schema-wide: free them before creating
+    # the partitioned table under the same names.
+    op.drop_index(
+        "ix_legal_case_movements_case_date_id", table_name="legal_case_movements"
+    )
+    op.drop_index(
+        "ix_legal_case_movements_movement_date", table_name="legal_case_movements"
+    )
+    op.drop_constraint("uq_legal_case_movement", "legal_case_movements", type_="unique")
+    op.rename_table("legal_case_movements", "legal_case_movements_unpartitioned")
+    op.execute(
+        "ALTER TABLE legal_case_movements_unpartitioned "
+        "RENAME CONSTRAINT legal_case_movements_pkey "
+        "TO legal_case_movements_unpartitioned_pkey"
+    )
+
+    # The partition key must be part of every unique constraint, so the
+    # primary key becomes (id, movement_date). The standalone movement_date
+    # index is not recreated: date ranges are answered by partition pruning.
+    op.execute(
+        """
+        CREATE TABLE legal_case_movements (
+            id uuid NOT NULL,
+            legal_case_id uuid NOT NULL
+                REFERENCES legal_cases (id) ON DELETE CASCADE,
+            movement_date timestamptz NOT NULL,
+            movement_type_id integer NOT NULL
+                CONSTRAINT fk_legal_case_movements_movement_type_id
+                REFERENCES legal_case_movement_types (id),
+            created_at timestamptz NOT NULL DEFAULT now(),
+            CONSTRAINT legal_case_movements_pkey PRIMARY KEY (id, movement_date),
+            CONSTRAINT uq_legal_case_movement
+                UNIQUE (legal_case_id, movement_date, movement_type_id)
+        ) PARTITION BY RANGE (movement_date)
+        """
+    )
+    op.create_index(
+        "ix_legal_case_movements_case_date_id",
+        "legal_case_movements",
+        ["legal_case_id", "movement_date", "id"],
+        unique=False,
+    )
+    op.execute(
+        "CREATE TABLE legal_case_movements_default "
+        "PARTITION OF legal_case_movements DEFAULT"
+    )
+
+    years = set()
+    if not context.is_offline_mode():
+        # Years without a partition here land in the default one; the
+        # maintenance job splits them out later.
+        years = {
+            int(year)
+            for year in op.get_bind()
+            .exec_driver_sql(
+                "SELECT DISTINCT CAST(EXTRACT(YEAR FROM movement_date AT TIME ZONE"
+                " 'UTC') AS int) FROM legal_case_movements_unpartitioned"
+                f" WHERE movement_date >= '{MIN_PARTITION_YEAR:04d}-01-01"
+                "T00:00:00+00:00'"
+            )
+            .scalars()
+        }
+    current_year = datetime.now(timezone.utc).year
+    years.update(range(current_year, current_year + YEARS_AHEAD + 1))
+    for year in sorted(years):
+        _create_partition(year)
+
+    op.execute(
+        f"INSERT INTO legal_case_movements ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM legal_case_movements_unpartitioned"
+    )
+    op.drop_table("legal_case_movements_unpartitioned")
+    op.execute("ANALYZE legal_case_movements")
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE legal_case_movements_unpartitioned (
+            id uuid NOT NULL,
+            legal_case_id uuid NOT NULL
+                REFERENCES legal_cases (id) ON DELETE CASCADE,
+            movement_date timestamptz NOT NULL,
+            movement_type_id integer NOT NULL
+                CONSTRAINT fk_legal_case_movements_movement_type_id
+                REFERENCES legal_case_movement_types (id),
+            created_at timestamptz NOT NULL DEFAULT now()
+        )
+        """
+    )
+    op.execute(
+        f"INSERT INTO legal_case_movements_unpartitioned ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM legal_case_movements"
+    )
+    # Dropping the parent drops every partition with it.
+    op.drop_table("legal_case_movements")
+    op.rename_table("legal_case_movements_unpartitioned", "legal_case_movements")
+    op.create_primary_key("legal_case_movements_pkey", "legal_case_movements", ["id"])
+    op.create_unique_constraint(
+        "uq_legal_case_movement",
+        "legal_case_movements",
+        ["legal_case_id", "movement_date", "movement_type_id"],
+    )
+    op.create_index(
+        "ix_legal_case_movements_movement_date",
+        "legal_case_movements",
+        ["movement_date"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_legal_case_movements_case_date_id",
+        "legal_case_movements",
+        ["legal_case_id", "movement_date", "id"],
+        unique=False,
+    )
@@ -0,0 +1,215 @@
+"""Daily rollup tables for the dashboards
+
+Revision ID: 0015_dashboard_daily_rollups
+Revises: 0014_partition_legal_case_movements
+Create Date: 2026-10-19 22:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0015_dashboard_daily_rollups"
+down_revision: Union[str, None] = "0014_partition_legal_case_movements"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Snapshot of src.infra.database.dashboard_rollups at this revision; later
+# changes to that module need a migration of their own.
+_CASE_INTERVAL = (
+    "EXTRACT(EPOCH FROM r.ultima_movimentacao - r.data_ajuizamento)"
+    " / CAST(NULLIF(r.movimentacoes, 0) AS numeric)"
+)
+
+LEGAL_CASE_DELTA = f"""
+    SELECT CAST(r.created_at AS date) AS day, r.status AS status,
+        r.prioridade AS prioridade, r.tribunal AS tribunal,
+        {{sign}}(1) AS case_count,
+        {{sign}}(COALESCE({_CASE_INTERVAL}, 0)) AS interval_seconds,
+        {{sign}}(CASE WHEN {_CASE_INTERVAL} IS NULL THEN 0 ELSE 1 END)
+            AS interval_count
+    FROM {{rows}} AS r
+    WHERE r.last_synced_at IS NOT NULL
+"""
+
+LEGAL_CASE_UPSERT = """
+    INSERT INTO legal_case_daily_rollups AS t (day, status, prioridade, tribunal,
+        case_count, interval_seconds, interval_count)
+    SELECT day, status, prioridade, tribunal,
+        sum(case_count), sum(interval_seconds), sum(interval_count)
+    FROM ({deltas}) AS delta
+    GROUP BY day, status, prioridade, tribunal
+    HAVING sum(case_count) <> 0 OR sum(interval_seconds) <> 0
+        OR sum(interval_count) <> 0
+    ORDER BY day, status, prioridade, tribunal
+    ON CONFLICT ON CONSTRAINT uq_legal_case_daily_rollup DO UPDATE SET
+        case_count = t.case_count + EXCLUDED.case_count,
+        interval_seconds = t.interval_seconds + EXCLUDED.interval_seconds,
+        interval_count = t.interval_count + EXCLUDED.interval_count
+"""
+
+SOLICITATION_DELTA = """
+    SELECT CAST(r.created_at AS date) AS day, r.status AS status,
+        r.prioridade AS prioridade, r.estado AS estado, r.municipio AS municipio,
+        {sign}(1) AS solicitation_count,
+        {sign}(EXTRACT(EPOCH FROM r.updated_at - r.created_at))
+            AS processing_seconds
+    FROM {rows} AS r
+"""
+
+SOLICITATION_UPSERT = """
+    INSERT INTO solicitation_daily_rollups AS t (day, status, prioridade, estado,
+        municipio, solicitation_count, processing_seconds)
+    SELECT day, status, prioridade, estado, municipio,
+        sum(solicitation_count), sum(processing_seconds)
+    FROM ({deltas}) AS delta
+    GROUP BY day, status, prioridade, estado, municipio
+    HAVING sum(solicitation_count) <> 0 OR sum(processing_seconds) <> 0
+    ORDER BY day, status, prioridade, estado, municipio
+    ON CONFLICT ON CONSTRAINT uq_solicitation_daily_rollup DO UPDATE SET
+        solicitation_count = t.solicitation_count + EXCLUDED.solicitation_count,
+        processing_seconds = t.processing_seconds + EXCLUDED.processing_seconds
+"""
+
+# (rollup table, source table, delta template, upsert template)
+ROLLUPS = (
+    ("legal_case_daily_rollups", "legal_cases", LEGAL_CASE_DELTA, LEGAL_CASE_UPSERT),
+    (
+        "solicitation_daily_rollups",
+        "solicitacoes",
+        SOLICITATION_DELTA,
+        SOLICITATION_UPSERT,
+    ),
+)
+
+TRANSITIONS = {
+    "insert": "NEW TABLE AS new_rows",
+    "update": "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "delete": "OLD TABLE AS old_rows",
+}
+
+
+def _apply(delta: str, upsert: str, relations) -> str:
+    """Upsert the net delta of ``relations`` (transition table, sign)."""
+    deltas = " UNION ALL ".join(
+        delta.format(rows=rows, sign=sign) for rows, sign in relations
+    )
+    return upsert.format(deltas=deltas).strip()
+
+
+def _install_triggers(table: str, source: str, delta: str, upsert: str) -> None:
+    op.execute(
+        f"""
+        CREATE FUNCTION {table}_apply() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {_apply(delta, upsert, [("new_rows", "+")])};
+            ELSIF TG_OP = 'UPDATE' THEN
+                {_apply(delta, upsert, [("new_rows", "+"), ("old_rows", "-")])};
+            ELSE
+                {_apply(delta, upsert, [("old_rows", "-")])};
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    for event, referencing in TRANSITIONS.items():
+        op.execute(
+            f"CREATE TRIGGER {table}_{event} AFTER {event.upper()} "
+            f"ON {source} REFERENCING {referencing} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION {table}_apply()"
+        )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "legal_case_daily_rollups",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=True),
+        sa.Column(
+            "prioridade",
+            postgresql.ENUM(
+                "baixa", "media", "alta", name="process_priority", create_type=False
+            ),
+            nullable=False,
+        ),
+        sa.Column("tribunal", sa.String(length=100), nullable=True),
+        sa.Column("case_count", sa.BigInteger(), nullable=False),
+        sa.Column("interval_seconds", sa.Numeric(), nullable=False),
+        sa.Column("interval_count", sa.BigInteger(), nullable=False),
+        sa.UniqueConstraint(
+            "day",
+            "status",
+            "prioridade",
+            "tribunal",
+            name="uq_legal_case_daily_rollup",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+    op.create_table(
+        "solicitation_daily_rollups",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                "pendente",
+                "em_analise",
+                "aprovada",
+                "reprovada",
+                "documentacao_incompleta",
+                name="solicitacao_status",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "prioridade",
+            postgresql.ENUM(
+                "baixa",
+                "media",
+                "alta",
+                name="solicitacao_priority",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("estado", sa.String(length=2), nullable=True),
+        sa.Column("municipio", sa.String(length=120), nullable=True),
+        sa.Column("solicitation_count", sa.BigInteger(), nullable=False),
+        sa.Column("processing_seconds", sa.Numeric(), nullable=False),
+        sa.UniqueConstraint(
+            "day",
+            "status",
+            "prioridade",
+            "estado",
+            "municipio",
+            name="uq_solicitation_daily_rollup",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+    # Serves the partial days at the edges of a dashboard date range.
+    op.create_index(
+        "ix_solicitacoes_created_at", "solicitacoes", ["created_at"], unique=False
+    )
+
+    # Triggers first: the lock they take on the source tables holds writers
+    # back until this transaction commits, so no write escapes the backfill.
+    for table, source, delta, upsert in ROLLUPS:
+        _install_triggers(table, source, delta, upsert)
+        op.execute(_apply(delta, upsert, [(source, "+")]))
+
+
+def downgrade() -> None:
+    for table, source, _, _ in ROLLUPS:
+        for event in TRANSITIONS:
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_{event} ON {source}")
+        op.execute(f"DROP FUNCTION IF EXISTS {table}_apply()")
+    op.drop_index("ix_solicitacoes_created_at", table_name="solicitacoes")
+    op.drop_table("solicitation_daily_rollups")
+    op.drop_table("legal_case_daily_rollups")
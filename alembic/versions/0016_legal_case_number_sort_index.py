@@ -0,0 +1,29 @@
+"""Add the (numero_processo, id) index for the keyset case listing
+
+Revision ID: 0016_legal_case_number_sort_index
+Revises: 0015_dashboard_daily_rollups
+Create Date: 2026-10-20 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0016_legal_case_number_sort_index"
+down_revision: Union[str, None] = "0015_dashboard_daily_rollups"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_legal_cases_numero_processo_id",
+        "legal_cases",
+        ["numero_processo", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_legal_cases_numero_processo_id", table_name="legal_cases")
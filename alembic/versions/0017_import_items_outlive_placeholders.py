@@ -0,0 +1,45 @@
+"""Keep import items when their unsynced placeholder case is dropped
+
+Revision ID: 0017_import_items_outlive_placeholders
+Revises: 0016_legal_case_number_sort_index
+Create Date: 2026-10-20 10:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0017_import_items_outlive_placeholders"
+down_revision: Union[str, None] = "0016_legal_case_number_sort_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FOREIGN_KEY = "legal_case_import_items_legal_case_id_fkey"
+
+
+def upgrade() -> None:
+    op.drop_constraint(FOREIGN_KEY, "legal_case_import_items", type_="foreignkey")
+    op.alter_column("legal_case_import_items", "legal_case_id", nullable=True)
+    op.create_foreign_key(
+        FOREIGN_KEY,
+        "legal_case_import_items",
+        "legal_cases",
+        ["legal_case_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM legal_case_import_items WHERE legal_case_id IS NULL")
+    op.drop_constraint(FOREIGN_KEY, "legal_case_import_items", type_="foreignkey")
+    op.alter_column("legal_case_import_items", "legal_case_id", nullable=False)
+    op.create_foreign_key(
+        FOREIGN_KEY,
+        "legal_case_import_items",
+        "legal_cases",
+        ["legal_case_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
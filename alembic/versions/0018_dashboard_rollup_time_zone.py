@@ -0,0 +1,132 @@
+"""Take dashboard rollup days in America/Sao_Paulo
+
+Revision ID: 0018_dashboard_rollup_time_zone
+Revises: 0017_import_items_outlive_placeholders
+Create Date: 2026-10-20 11:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0018_dashboard_rollup_time_zone"
+down_revision: Union[str, None] = "0017_import_items_outlive_placeholders"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Kept in sync with DASHBOARD_TIME_ZONE in src.infra.database.dashboard_rollups.
+PINNED_DAY = "CAST(r.created_at AT TIME ZONE 'America/Sao_Paulo' AS date)"
+SESSION_DAY = "CAST(r.created_at AS date)"
+
+_CASE_INTERVAL = (
+    "EXTRACT(EPOCH FROM r.ultima_movimentacao - r.data_ajuizamento)"
+    " / CAST(NULLIF(r.movimentacoes, 0) AS numeric)"
+)
+
+LEGAL_CASE_DELTA = """
+    SELECT {day} AS day, r.status AS status,
+        r.prioridade AS prioridade, r.tribunal AS tribunal,
+        {sign}(1) AS case_count,
+        {sign}(COALESCE({interval}, 0)) AS interval_seconds,
+        {sign}(CASE WHEN {interval} IS NULL THEN 0 ELSE 1 END) AS interval_count
+    FROM {rows} AS r
+    WHERE r.last_synced_at IS NOT NULL
+"""
+
+LEGAL_CASE_UPSERT = """
+    INSERT INTO legal_case_daily_rollups AS t (day, status, prioridade, tribunal,
+        case_count, interval_seconds, interval_count)
+    SELECT day, status, prioridade, tribunal,
+        sum(case_count), sum(interval_seconds), sum(interval_count)
+    FROM ({deltas}) AS delta
+    GROUP BY day, status, prioridade, tribunal
+    HAVING sum(case_count) <> 0 OR sum(interval_seconds) <> 0
+        OR sum(interval_count) <> 0
+    ORDER BY day, status, prioridade, tribunal
+    ON CONFLICT ON CONSTRAINT uq_legal_case_daily_rollup DO UPDATE SET
+        case_count = t.case_count + EXCLUDED.case_count,
+        interval_seconds = t.interval_seconds + EXCLUDED.interval_seconds,
+        interval_count = t.interval_count + EXCLUDED.interval_count
+"""
+
+SOLICITATION_DELTA = """
+    SELECT {day} AS day, r.status AS status,
+        r.prioridade AS prioridade, r.estado AS estado, r.municipio AS municipio,
+        {sign}(1) AS solicitation_count,
+        {sign}(EXTRACT(EPOCH FROM r.updated_at - r.created_at))
+            AS processing_seconds
+    FROM {rows} AS r
+"""
+
+SOLICITATION_UPSERT = """
+    INSERT INTO solicitation_daily_rollups AS t (day, status, prioridade, estado,
+        municipio, solicitation_count, processing_seconds)
+    SELECT day, status, prioridade, estado, municipio,
+        sum(solicitation_count), sum(processing_seconds)
+    FROM ({deltas}) AS delta
+    GROUP BY day, status, prioridade, estado, municipio
+    HAVING sum(solicitation_count) <> 0 OR sum(processing_seconds) <> 0
+    ORDER BY day, status, prioridade, estado, municipio
+    ON CONFLICT ON CONSTRAINT uq_solicitation_daily_rollup DO UPDATE SET
+        solicitation_count = t.solicitation_count + EXCLUDED.solicitation_count,
+        processing_seconds = t.processing_seconds + EXCLUDED.processing_seconds
+"""
+
+# (rollup table, source table, delta template, upsert template)
+ROLLUPS = (
+    ("legal_case_daily_rollups", "legal_cases", LEGAL_CASE_DELTA, LEGAL_CASE_UPSERT),
+    (
+        "solicitation_daily_rollups",
+        "solicitacoes",
+        SOLICITATION_DELTA,
+        SOLICITATION_UPSERT,
+    ),
+)
+
+
+def _apply(day: str, delta: str, upsert: str, relations) -> str:
+    """Upsert the net delta of ``relations`` (transition table, sign)."""
+    deltas = " UNION ALL ".join(
+        delta.format(day=day, interval=_CASE_INTERVAL, rows=rows, sign=sign)
+        for rows, sign in relations
+    )
+    return upsert.format(deltas=deltas).strip()
+
+
+def _rebuild(day: str) -> None:
+    """Swap the trigger functions to ``day`` and recompute every rollup row."""
+    # Holds writers (not readers) back until commit, so no write is counted
+    # under the old day while the rollups are rebuilt.
+    op.execute("LOCK TABLE legal_cases, solicitacoes IN SHARE ROW EXCLUSIVE MODE")
+    for table, source, delta, upsert in ROLLUPS:
+        inserted = _apply(day, delta, upsert, [("new_rows", "+")])
+        updated = _apply(day, delta, upsert, [("new_rows", "+"), ("old_rows", "-")])
+        deleted = _apply(day, delta, upsert, [("old_rows", "-")])
+        op.execute(
+            f"""
+            CREATE OR REPLACE FUNCTION {table}_apply() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    {inserted};
+                ELSIF TG_OP = 'UPDATE' THEN
+                    {updated};
+                ELSE
+                    {deleted};
+                END IF;
+                RETURN NULL;
+            END
+            $$
+            """
+        )
+        op.execute(f"DELETE FROM {table}")
+        op.execute(_apply(day, delta, upsert, [(source, "+")]))
+
+
+def upgrade() -> None:
+    _rebuild(PINNED_DAY)
+
+
+def downgrade() -> None:
+    _rebuild(SESSION_DAY)
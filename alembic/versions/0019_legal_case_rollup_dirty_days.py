@@ -0,0 +1,113 @@
+"""Refresh the legal case rollup from a log of changed days
+
+Revision ID: 0019_legal_case_rollup_dirty_days
+Revises: 0018_dashboard_rollup_time_zone
+Create Date: 2026-10-20 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0019_legal_case_rollup_dirty_days"
+down_revision: Union[str, None] = "0018_dashboard_rollup_time_zone"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_CASE_INTERVAL = (
+    "EXTRACT(EPOCH FROM r.ultima_movimentacao - r.data_ajuizamento)"
+    " / CAST(NULLIF(r.movimentacoes, 0) AS numeric)"
+)
+
+DELTA = """
+    SELECT CAST(r.created_at AT TIME ZONE 'America/Sao_Paulo' AS date) AS day,
+        r.status AS status, r.prioridade AS prioridade, r.tribunal AS tribunal,
+        {sign}(1) AS case_count,
+        {sign}(COALESCE({interval}, 0)) AS interval_seconds,
+        {sign}(CASE WHEN {interval} IS NULL THEN 0 ELSE 1 END) AS interval_count
+    FROM {rows} AS r
+    WHERE r.last_synced_at IS NOT NULL
+"""
+
+NET_DELTA = """
+    SELECT day, status, prioridade, tribunal,
+        sum(case_count) AS case_count, sum(interval_seconds) AS interval_seconds,
+        sum(interval_count) AS interval_count
+    FROM ({deltas}) AS delta
+    GROUP BY day, status, prioridade, tribunal
+    HAVING sum(case_count) <> 0 OR sum(interval_seconds) <> 0
+        OR sum(interval_count) <> 0
+"""
+
+LOG = """
+    INSERT INTO legal_case_rollup_dirty_days (day)
+    SELECT DISTINCT day FROM ({net}) AS net
+"""
+
+UPSERT = """
+    INSERT INTO legal_case_daily_rollups AS t (day, status, prioridade, tribunal,
+        case_count, interval_seconds, interval_count)
+    SELECT day, status, prioridade, tribunal,
+        case_count, interval_seconds, interval_count
+    FROM ({net}) AS net
+    ORDER BY day, status, prioridade, tribunal
+    ON CONFLICT ON CONSTRAINT uq_legal_case_daily_rollup DO UPDATE SET
+        case_count = t.case_count + EXCLUDED.case_count,
+        interval_seconds = t.interval_seconds + EXCLUDED.interval_seconds,
+        interval_count = t.interval_count + EXCLUDED.interval_count
+"""
+
+
+def _statement(template: str, relations) -> str:
+    """``template`` over the net delta of ``relations`` (table, sign)."""
+    deltas = " UNION ALL ".join(
+        DELTA.format(interval=_CASE_INTERVAL, rows=rows, sign=sign)
+        for rows, sign in relations
+    )
+    return template.format(net=NET_DELTA.format(deltas=deltas)).strip()
+
+
+def _replace_function(template: str) -> None:
+    inserted = _statement(template, [("new_rows", "+")])
+    updated = _statement(template, [("new_rows", "+"), ("old_rows", "-")])
+    deleted = _statement(template, [("old_rows", "-")])
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION legal_case_daily_rollups_apply()
+        RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {inserted};
+            ELSIF TG_OP = 'UPDATE' THEN
+                {updated};
+            ELSE
+                {deleted};
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "legal_case_rollup_dirty_days",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("day", sa.Date(), nullable=False),
+    )
+    # The rollup is exact at this point; from here on the triggers only log
+    # the changed days and the dashboard rollup job recomputes them.
+    _replace_function(LOG)
+
+
+def downgrade() -> None:
+    # Logged days may still be pending, so the rollup is rebuilt while
+    # writers are held back.
+    op.execute("LOCK TABLE legal_cases IN SHARE ROW EXCLUSIVE MODE")
+    _replace_function(UPSERT)
+    op.execute("DELETE FROM legal_case_daily_rollups")
+    op.execute(_statement(UPSERT, [("legal_cases", "+")]))
+    op.drop_table("legal_case_rollup_dirty_days")
@@ -0,0 +1,38 @@
+"""Count not-found lookups of imported placeholders
+
+Revision ID: 0020_import_item_not_found_attempts
+Revises: 0019_legal_case_rollup_dirty_days
+Create Date: 2026-10-20 13:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0020_import_item_not_found_attempts"
+down_revision: Union[str, None] = "0019_legal_case_rollup_dirty_days"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "legal_case_import_items",
+        sa.Column(
+            "not_found_attempts",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+    )
+    # Items already marked not_found were missed at least once.
+    op.execute(
+        "UPDATE legal_case_import_items SET not_found_attempts = 1 "
+        "WHERE status = 'not_found'"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("legal_case_import_items", "not_found_attempts")
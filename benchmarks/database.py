@@ -0,0 +1,32 @@
+"""Disposable Postgres schemas for the database-backed benchmarks."""
+
+from __future__ import annotations
+
+import uuid
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import Table, create_engine, text
+from sqlalchemy.orm import Session
+
+from src.infra.database.base import Base
+
+
+@contextmanager
+def temporary_schema(database_url: str, *tables: Table) -> Iterator[Session]:
+    """Session bound to a fresh schema holding only ``tables``."""
+    schema = f"bench_{uuid.uuid4().hex[:8]}"
+    engine = create_engine(
+        database_url, connect_args={"options": f"-csearch_path={schema}"}
+    )
+    with engine.begin() as connection:
+        connection.execute(text(f"CREATE SCHEMA {schema}"))
+    try:
+        with Session(engine) as session:
+            Base.metadata.create_all(session.connection(), tables=list(tables))
+            yield session
+            session.rollback()
+    finally:
+        with engine.begin() as connection:
+            connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        engine.dispose()
@@ -0,0 +1,109 @@
+"""Benchmark the DataJud mapping paths on synthetic large payloads.
+
+Uso: ``python -m benchmarks.legal_case_mapper [--movements 10000] [--rounds 5]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+from src.infra.external.dto.legal_case_dto import LegalCaseRawDTO
+from src.infra.external.gateway.datajud_gateway import _json_loads
+from src.infra.external.mapper.legal_case_mapper import (
+    LegalCaseMapper,
+    _parse_timestamp,
+)
+
+MOVEMENT_NAMES = ["Despacho", "Conclusão", "Juntada", "Publicação", "Decisão"]
+COMPLEMENT_NAMES = ["Petição", "Mandado", "Ofício", "Certidão"]
+
+
+def build_payload(movements: int, seed: int = 42) -> bytes:
+    """Build a DataJud search response with ``movements`` movements."""
+    rng = random.Random(seed)
+    start = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    raw_movements: List[Dict[str, Any]] = []
+    for _ in range(movements):
+        # Poucos instantes distintos: o DataJud repete muito o mesmo horário.
+        moment = start + timedelta(days=rng.randrange(3000), hours=rng.randrange(3))
+        raw_movements.append(
+            {
+                "dataHora": moment.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "nome": rng.choice(MOVEMENT_NAMES),
+                "complementosTabelados": [
+                    {"nome": rng.choice(COMPLEMENT_NAMES)}
+                    for _ in range(rng.randrange(3))
+                ],
+            }
+        )
+    source = {
+        "numeroProcesso": "07108025520188020001",
+        "tribunal": "TJAL",
+        "classe": {"nome": "Procedimento Comum Cível"},
+        "orgaoJulgador": {"nome": "1ª Vara Cível"},
+        "dataAjuizamento": "2015-01-01T10:00:00Z",
+        "grau": "G1",
+        "assuntos": [{"nome": "Indenização por Dano Moral"}],
+        "movimentos": raw_movements,
+    }
+    return json.dumps({"hits": {"hits": [{"_source": source}]}}).encode("utf-8")
+
+
+def _source(decoded: Dict[str, Any]) -> Dict[str, Any]:
+    return decoded["hits"]["hits"][0]["_source"]
+
+
+def legacy_map(source: Dict[str, Any]):
+    return LegalCaseMapper.from_dto_to_domain(LegalCaseRawDTO.from_dict(source))
+
+
+def fast_map_cold(source: Dict[str, Any]):
+    _parse_timestamp.cache_clear()
+    return LegalCaseMapper.from_source(source)
+
+
+def _best_of(fn: Callable[[Any], Any], arg: Any, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn(arg)
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--movements", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    content = build_payload(args.movements)
+    source = _source(json.loads(content))
+    if legacy_map(source) != LegalCaseMapper.from_source(_source(_json_loads(content))):
+        raise SystemExit("Os caminhos de mapeamento divergiram.")
+
+    rows = [
+        ("decode json.loads", _best_of(json.loads, content, args.rounds)),
+        (
+            f"decode {_json_loads.__module__}.loads",
+            _best_of(_json_loads, content, args.rounds),
+        ),
+        ("map DTO (legado)", _best_of(legacy_map, source, args.rounds)),
+        ("map from_source (cache frio)", _best_of(fast_map_cold, source, args.rounds)),
+        (
+            "map from_source (cache quente)",
+            _best_of(LegalCaseMapper.from_source, source, args.rounds),
+        ),
+    ]
+    print(f"payload: {args.movements} movimentos, {len(content) / 1024:.0f} KiB")
+    for label, millis in rows:
+        print(f"{label:<32}{millis:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""Benchmark the process dashboard aggregation on a seeded Postgres.
+
+Compares ``LegalCaseRepository.aggregate_dashboard`` (one statement over the
+daily rollups) with the original one-query-per-section implementation over
+``legal_cases``, kept here as the baseline. Runs in a temporary schema, with
+the rollup triggers installed and the logged days refreshed, that is dropped
+at the end.
+
+Uso: ``python -m benchmarks.process_dashboard --database-url postgresql://...
+[--cases 100000] [--rounds 5]`` (default: ``DATABASE_URL``)
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+
+from sqlalchemy import desc, func, select, text
+from sqlalchemy.orm import Session
+
+from benchmarks.database import temporary_schema
+from src.domain.repositories.legal_case_repository import (
+    ProcessDashboardAggregation,
+    ProcessDashboardFilters,
+)
+from src.infra.database.dashboard_rollups import (
+    LEGAL_CASE_ROLLUP,
+    install,
+    month_period,
+    refresh_logged_days,
+)
+from src.infra.database.models import (
+    LegalCaseDailyRollupModel,
+    LegalCaseModel,
+    LegalCaseRollupDirtyDayModel,
+)
+from src.infra.database.repositories.legal_case_repository import (
+    LegalCaseRepository,
+)
+
+TRIBUNALS = ["TJAL", "TJSP", "TJRJ", "TRF5", "TRT19", None]
+STATUSES = ["Em andamento", "Arquivado", "Suspenso", "Baixado", None]
+PRIORITIES = ["baixa", "media", "alta"]
+
+SCENARIOS = {
+    "sem filtros": ProcessDashboardFilters(),
+    "status + prioridade": ProcessDashboardFilters(
+        status=["Em andamento", "Suspenso"], priority=["alta", "media"]
+    ),
+    "tribunal + período": ProcessDashboardFilters(
+        tribunal=["TJAL"],
+        date_from=datetime(2022, 1, 1, tzinfo=timezone.utc),
+        date_to=datetime(2023, 12, 31, tzinfo=timezone.utc),
+    ),
+    "período com horário": ProcessDashboardFilters(
+        date_from=datetime(2021, 3, 15, 13, 30, tzinfo=timezone.utc),
+        date_to=datetime(2022, 9, 2, 8, 0, tzinfo=timezone.utc),
+    ),
+}
+
+
+def seed_cases(session: Session, cases: int, seed: int = 48) -> None:
+    """Insert ``cases`` synthetic cases spread over 2019-2024.
+
+    Movement counts and last movement dates are distinct, so the top-5 lists
+    have no ties and both implementations must return them in the same order.
+    Every 20th case is an import placeholder that was never synced.
+    """
+    rng = random.Random(seed)
+    start = datetime(2019, 1, 1, tzinfo=timezone.utc)
+    movement_counts = rng.sample(range(4 * cases), cases)
+    rows = []
+    for index, movements in enumerate(movement_counts):
+        created_at = start + timedelta(
+            minutes=rng.randrange(6 * 365 * 24 * 60), microseconds=index
+        )
+        filed_at = created_at - timedelta(days=rng.randrange(1, 2000))
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "numero_processo": f"{index:020d}",
+                "tribunal": rng.choice(TRIBUNALS),
+                "status": rng.choice(STATUSES),
+                "prioridade": rng.choice(PRIORITIES),
+                "movimentacoes": movements,
+                "data_ajuizamento": filed_at,
+                "ultima_movimentacao": (
+                    created_at + timedelta(days=rng.randrange(0, 900))
+                    if movements
+                    else None
+                ),
+                "created_at": created_at,
+                "updated_at": created_at,
+                "last_synced_at": None if index % 20 == 0 else created_at,
+            }
+        )
+    for offset in range(0, len(rows), 10_000):
+        session.execute(
+            LegalCaseModel.__table__.insert(), rows[offset : offset + 10_000]
+        )
+    session.execute(text("ANALYZE legal_cases"))
+
+
+def legacy_aggregate_dashboard(
+    session: Session, filters: ProcessDashboardFilters
+) -> ProcessDashboardAggregation:
+    """Previous implementation: one query (and one scan) per section."""
+    base_query = select(
+        LegalCaseModel.id,
+        LegalCaseModel.numero_processo,
+        LegalCaseModel.tribunal,
+        LegalCaseModel.status,
+        LegalCaseModel.prioridade,
+        LegalCaseModel.movimentacoes,
+        LegalCaseModel.data_ajuizamento,
+        LegalCaseModel.ultima_movimentacao,
+        LegalCaseModel.created_at,
+    )
+    conditions = LegalCaseRepository._filter_conditions(filters)
+    if conditions:
+        base_query = base_query.where(*conditions)
+    filtered = base_query.subquery()
+
+    status_count = {
+        row[0] or "desconhecido": int(row[1])
+        for row in session.execute(
+            select(filtered.c.status, func.count()).group_by(filtered.c.status)
+        )
+    }
+    by_court = [
+        {"tribunal": row[0] or "desconhecido", "count": int(row[1])}
+        for row in session.execute(
+            select(filtered.c.tribunal, func.count())
+            .group_by(filtered.c.tribunal)
+            .order_by(desc(func.count()))
+        )
+    ]
+    period = month_period(filtered.c.created_at)
+    by_period = [
+        {"period": row[0], "count": int(row[1])}
+        for row in session.execute(
+            select(period, func.count()).group_by(period).order_by(period)
+        )
+    ]
+    avg_time_seconds = (
+        session.execute(
+            select(
+                func.avg(
+                    func.extract(
+                        "epoch",
+                        filtered.c.ultima_movimentacao - filtered.c.data_ajuizamento,
+                    )
+                    / func.nullif(filtered.c.movimentacoes, 0)
+                )
+            )
+        ).scalar_one_or_none()
+        or 0.0
+    )
+    avg_time_days = float(avg_time_seconds) / 86400.0 if avg_time_seconds else 0.0
+
+    def top(order_by) -> List[dict]:
+        return [
+            {
+                "numero_processo": row[0],
+                "tribunal": row[1],
+                "movimentacoes": int(row[2] or 0),
+                "ultima_movimentacao": row[3],
+            }
+            for row in session.execute(
+                select(
+                    filtered.c.numero_processo,
+                    filtered.c.tribunal,
+                    filtered.c.movimentacoes,
+                    filtered.c.ultima_movimentacao,
+                )
+                .order_by(order_by)
+                .limit(5)
+            )
+        ]
+
+    return ProcessDashboardAggregation(
+        data={
+            "status_count": status_count,
+            "by_court": by_court,
+            "by_period": by_period,
+            "period_granularity": "monthly",
+            "avg_time_between_movements_days": round(avg_time_days, 2),
+            "top_by_movements": top(desc(filtered.c.movimentacoes)),
+            "last_updated_list": top(desc(filtered.c.ultima_movimentacao)),
+        }
+    )
+
+
+def _best_of(fn: Callable[[], object], rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--cases", type=int, default=100000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    if not args.database_url:
+        raise SystemExit("Informe --database-url ou DATABASE_URL.")
+
+    with temporary_schema(
+        args.database_url,
+        LegalCaseModel.__table__,
+        LegalCaseDailyRollupModel.__table__,
+        LegalCaseRollupDirtyDayModel.__table__,
+    ) as session:
+        install(session.connection(), LEGAL_CASE_ROLLUP)
+        seed_cases(session, args.cases)
+        while refresh_logged_days(session.connection(), LEGAL_CASE_ROLLUP, 10_000):
+            pass
+        repository = LegalCaseRepository(session)
+        print(f"legal_cases: {args.cases} processos")
+        for label, filters in SCENARIOS.items():
+            legacy = legacy_aggregate_dashboard(session, filters).data
+            if repository.aggregate_dashboard(filters).data != legacy:
+                raise SystemExit(f"Os agregados divergiram ({label}).")
+            legacy_ms = _best_of(
+                lambda: legacy_aggregate_dashboard(session, filters), args.rounds
+            )
+            rollup_ms = _best_of(
+                lambda: repository.aggregate_dashboard(filters), args.rounds
+            )
+            print(
+                f"{label:<24}legado {legacy_ms:8.1f} ms   rollups {rollup_ms:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
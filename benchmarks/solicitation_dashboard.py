@@ -0,0 +1,202 @@
+"""Benchmark the solicitation dashboard aggregation on a seeded Postgres.
+
+Compares ``SolicitationRepository.dashboard`` (one scan of the daily
+rollups) with the original one-query-per-indicator implementation over
+``solicitacoes``, kept here as the baseline. Runs in a temporary schema, with
+the rollup triggers installed, that is dropped at the end.
+
+Uso: ``python -m benchmarks.solicitation_dashboard --database-url postgresql://...
+[--solicitations 200000] [--rounds 5]`` (default: ``DATABASE_URL``)
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from sqlalchemy import case, func, select, text
+from sqlalchemy.orm import Session
+
+from benchmarks.database import temporary_schema
+from src.domain.repositories.solicitation_repository import (
+    SolicitationDashboardAggregation,
+    SolicitationDashboardFilters,
+)
+from src.infra.database.dashboard_rollups import (
+    SOLICITATION_ROLLUP,
+    install,
+    month_period,
+)
+from src.infra.database.models import SolicitationDailyRollupModel, SolicitationModel
+from src.infra.database.repositories.solicitation_repository import (
+    SOLICITATION_STATUSES,
+    SolicitationRepository,
+)
+
+CITIES = {
+    "AL": ["Maceió", "Penedo", "Piaçabuçu"],
+    "PE": ["Recife", "Petrolina"],
+    "BA": ["Salvador", "Juazeiro", "Paulo Afonso"],
+}
+PRIORITIES = ["baixa", "media", "alta"]
+
+SCENARIOS = {
+    "sem filtros": SolicitationDashboardFilters(),
+    "estado + prioridade": SolicitationDashboardFilters(
+        state=["AL", "PE"], priority=["alta"]
+    ),
+    "status + período": SolicitationDashboardFilters(
+        status=["aprovada", "reprovada", "pendente"],
+        date_from=datetime(2023, 1, 1, tzinfo=timezone.utc),
+        date_to=datetime(2023, 6, 30, tzinfo=timezone.utc),
+    ),
+    "período com horário": SolicitationDashboardFilters(
+        date_from=datetime(2022, 2, 10, 18, 45, tzinfo=timezone.utc),
+        date_to=datetime(2022, 11, 3, 9, 15, tzinfo=timezone.utc),
+    ),
+}
+
+
+def seed_solicitations(session: Session, solicitations: int, seed: int = 49) -> None:
+    """Insert ``solicitations`` synthetic solicitations spread over 2021-2024."""
+    rng = random.Random(seed)
+    start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    rows = []
+    for _ in range(solicitations):
+        created_at = start + timedelta(seconds=rng.randrange(4 * 365 * 86400))
+        state = rng.choice(list(CITIES))
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "status": rng.choice(SOLICITATION_STATUSES),
+                "prioridade": rng.choice(PRIORITIES),
+                "estado": state,
+                "municipio": rng.choice(CITIES[state]),
+                "created_at": created_at,
+                "updated_at": created_at + timedelta(seconds=rng.randrange(90 * 86400)),
+            }
+        )
+    for offset in range(0, len(rows), 10_000):
+        session.execute(
+            SolicitationModel.__table__.insert(), rows[offset : offset + 10_000]
+        )
+    session.execute(text("ANALYZE solicitacoes"))
+
+
+def legacy_dashboard(
+    session: Session, filters: SolicitationDashboardFilters
+) -> SolicitationDashboardAggregation:
+    """Previous implementation: one query (and one scan) per indicator."""
+    base_query = select(
+        SolicitationModel.id,
+        SolicitationModel.status,
+        SolicitationModel.created_at,
+        SolicitationModel.updated_at,
+        SolicitationModel.prioridade,
+        SolicitationModel.estado,
+        SolicitationModel.municipio,
+    )
+    conditions = SolicitationRepository._filter_conditions(filters)
+    if conditions:
+        base_query = base_query.where(*conditions)
+    filtered = base_query.subquery()
+
+    status_counts = {
+        row[0]: int(row[1])
+        for row in session.execute(
+            select(filtered.c.status, func.count())
+            .select_from(filtered)
+            .group_by(filtered.c.status)
+        )
+    }
+    period = month_period(filtered.c.created_at)
+    by_period = [
+        {"period": row[0], "count": int(row[1])}
+        for row in session.execute(
+            select(period, func.count())
+            .select_from(filtered)
+            .group_by(period)
+            .order_by(period)
+        )
+    ]
+    avg_processing_seconds = session.execute(
+        select(
+            func.avg(
+                func.extract("epoch", filtered.c.updated_at - filtered.c.created_at)
+            )
+        )
+        .select_from(filtered)
+        .where(filtered.c.status != "pendente")
+    ).scalar_one_or_none()
+    avg_processing_time_days = (
+        float(avg_processing_seconds) / 86400.0 if avg_processing_seconds else 0.0
+    )
+    approved, total_closed = session.execute(
+        select(
+            func.sum(case((filtered.c.status == "aprovada", 1), else_=0)),
+            func.sum(
+                case((filtered.c.status.in_(["aprovada", "reprovada"]), 1), else_=0)
+            ),
+        ).select_from(filtered)
+    ).one()
+    approval_rate = (float(approved) / float(total_closed)) if total_closed else 0.0
+
+    return SolicitationDashboardAggregation(
+        data={
+            "status_count": status_counts,
+            "by_period": by_period,
+            "period_granularity": "monthly",
+            "avg_processing_time_days": round(avg_processing_time_days, 2),
+            "approval_rate": round(approval_rate, 2),
+            "most_missing_documents": [],
+        }
+    )
+
+
+def _best_of(fn: Callable[[], object], rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--solicitations", type=int, default=200000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    if not args.database_url:
+        raise SystemExit("Informe --database-url ou DATABASE_URL.")
+
+    with temporary_schema(
+        args.database_url,
+        SolicitationModel.__table__,
+        SolicitationDailyRollupModel.__table__,
+    ) as session:
+        install(session.connection(), SOLICITATION_ROLLUP)
+        seed_solicitations(session, args.solicitations)
+        repository = SolicitationRepository(session)
+        print(f"solicitacoes: {args.solicitations} solicitações")
+        for label, filters in SCENARIOS.items():
+            legacy = legacy_dashboard(session, filters).data
+            if repository.dashboard(filters).data != legacy:
+                raise SystemExit(f"Os agregados divergiram ({label}).")
+            legacy_ms = _best_of(
+                lambda: legacy_dashboard(session, filters), args.rounds
+            )
+            rollup_ms = _best_of(lambda: repository.dashboard(filters), args.rounds)
+            print(
+                f"{label:<24}legado {legacy_ms:8.1f} ms   rollups {rollup_ms:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -49,6 +49,14 @@ class LegalCaseNotFoundError(DomainError):
         self.case_number = case_number
 
 
+class LegalCaseImportNotFoundError(DomainError):
+    """Raised when a bulk import cannot be located."""
+
+    def __init__(self, import_id: str) -> None:
+        super().__init__(f"Importação '{import_id}' não foi encontrada.")
+        self.import_id = import_id
+
+
 class LegalCasePersistenceError(DomainError):
     """Raised when persisting a legal case fails."""
 
@@ -66,6 +74,16 @@ class ExternalRateLimitError(DomainError):
         super().__init__(message)
 
 
+class ExternalServiceUnavailableError(DomainError):
+    """Raised when an external dependency keeps failing after retries."""
+
+    def __init__(
+        self,
+        message: str = "Serviço externo indisponível. Tente novamente mais tarde.",
+    ) -> None:
+        super().__init__(message)
+
+
 class SolicitationNotFoundError(DomainError):
     """Raised when a solicitation is missing."""
 
@@ -82,6 +100,15 @@ class DocumentNotFoundError(DomainError):
         self.document_id = document_id
 
 
+class RangeNotSatisfiableError(DomainError):
+    """Raised when a requested byte range cannot be served."""
+
+    def __init__(
+        self, message: str = "Intervalo de bytes solicitado é inválido."
+    ) -> None:
+        super().__init__(message)
+
+
 class InvalidInputError(DomainError):
     """Raised when user input validation fails."""
 
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Callable, Dict
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers block until a token is available."""
+
+    def __init__(
+        self,
+        rate_per_minute: int,
+        capacity: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._rate_per_second = max(1, rate_per_minute) / 60.0
+        self._capacity = float(max(1, capacity))
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+        self._lock = Lock()
+
+    def try_acquire(self) -> bool:
+        """Take one token only if available right now; never blocks."""
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._updated_at)
+            self._tokens = min(
+                self._capacity, self._tokens + elapsed * self._rate_per_second
+            )
+            self._updated_at = now
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    def acquire(self) -> float:
+        """Take one token, sleeping if needed. Returns the seconds waited."""
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._updated_at)
+            self._tokens = min(
+                self._capacity, self._tokens + elapsed * self._rate_per_second
+            )
+            self._updated_at = now
+            # Tokens may go negative: each caller reserves its slot in line.
+            self._tokens -= 1.0
+            wait = -self._tokens / self._rate_per_second if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class TokenBucketRegistry:
+    """Lazily creates one token bucket per key (e.g. per tribunal)."""
+
+    def __init__(self, rate_per_minute: int, capacity: int = 1) -> None:
+        self._rate_per_minute = rate_per_minute
+        self._capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = Lock()
+
+    def get(self, key: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(self._rate_per_minute, self._capacity)
+                self._buckets[key] = bucket
+            return bucket
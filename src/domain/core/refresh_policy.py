@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from src.domain.entities.case import Movement, as_utc
+
+# Multiplier applied to the activity-based interval for each priority.
+PRIORITY_FACTORS = {"alta": 0.5, "media": 1.0, "baixa": 1.5}
+
+
+class RefreshPolicy:
+    """Decide when a legal case should be synced again.
+
+    Active cases are revisited about twice per expected movement, never less
+    often than ``freshness_target``; dormant cases back off in proportion to
+    how long they have been idle. Priority scales the result, but only
+    shortens the interval of an active case, which is then kept within
+    ``[min_interval, max_interval]``.
+    """
+
+    def __init__(
+        self,
+        freshness_target: timedelta = timedelta(days=3),
+        min_interval: timedelta = timedelta(hours=6),
+        max_interval: timedelta = timedelta(days=30),
+        activity_window: timedelta = timedelta(days=90),
+    ) -> None:
+        self.freshness_target = freshness_target
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.activity_window = activity_window
+
+    def interval_for(
+        self,
+        movements: Iterable[Movement],
+        prioridade: Optional[str],
+        now: datetime,
+    ) -> timedelta:
+        dates = [as_utc(movement.date) for movement in movements]
+        recent = sum(1 for date in dates if date >= now - self.activity_window)
+        factor = PRIORITY_FACTORS.get(prioridade or "", 1.0)
+        if recent:
+            interval = min(
+                self.freshness_target,
+                self.activity_window / (recent * 2) * factor,
+            )
+        else:
+            latest = max(dates, default=None)
+            idle = now - latest if latest else self.max_interval
+            interval = max(self.freshness_target, idle / 4) * factor
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def next_sync_at(
+        self,
+        movements: Iterable[Movement],
+        prioridade: Optional[str],
+        now: Optional[datetime] = None,
+    ) -> datetime:
+        now = now or datetime.now(timezone.utc)
+        return now + self.interval_for(movements, prioridade, now)
+
+    def not_found_retry_at(self, now: Optional[datetime] = None) -> datetime:
+        """When to look again for a case the provider did not return."""
+        return (now or datetime.now(timezone.utc)) + self.freshness_target
+
+    def error_retry_at(self, now: Optional[datetime] = None) -> datetime:
+        """When to retry a case whose lookup failed transiently."""
+        return (now or datetime.now(timezone.utc)) + self.min_interval
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from threading import Event, Lock
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+from src.domain.core import metrics
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[T]):
+    """Coalesce concurrent calls that share a key into a single execution.
+
+    The first caller runs ``fn``; callers arriving while it is in flight
+    block and receive the same result, or the same exception.
+    """
+
+    def __init__(self, metric_name: str = "single_flight_coalesced") -> None:
+        self._calls: Dict[Hashable, _Call[T]] = {}
+        self._lock = Lock()
+        self._metric_name = metric_name
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            metrics.increment(self._metric_name)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
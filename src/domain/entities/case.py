@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import hashlib
 import re
-from typing import Optional, List
-from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, List
+from datetime import datetime, timezone
 
 PATTERN = re.compile(r"^\d{7}-\d{2}\.\d{4}\.\d\.\d{2}\.\d{4}$")
 
@@ -30,6 +31,24 @@ def format_cnj_number(raw_number: str) -> str:
     )
 
 
+def cnj_check_digits(raw_number: str) -> str:
+    """Expected DD of a 20-digit CNJ number (mod 97, ISO 7064, Res. CNJ 65/2008)."""
+    if not re.match(r"^\d{20}$", raw_number):
+        raise ValueError(
+            f"Input must be a string with exactly 20 digits, got: {raw_number!r}"
+        )
+    # NNNNNNN AAAA J TR OOOO seguido de "00" no lugar do dígito verificador.
+    base = int(raw_number[0:7] + raw_number[9:20] + "00")
+    return f"{98 - base % 97:02d}"
+
+
+def has_valid_cnj_check_digits(raw_number: str) -> bool:
+    try:
+        return raw_number[7:9] == cnj_check_digits(raw_number)
+    except ValueError:
+        return False
+
+
 @dataclass(frozen=True)
 class CNJNumber:
     number: str
@@ -61,6 +80,10 @@ class CNJNumber:
     def clean_number(self) -> str:
         return re.sub(r"[^\d]", "", self.number)
 
+    @property
+    def has_valid_check_digits(self) -> bool:
+        return has_valid_cnj_check_digits(self.clean_number)
+
 
 @dataclass
 class Movement:
@@ -79,3 +102,65 @@ class LegalCase:
     filing_date: Optional[datetime]
     latest_update: Optional[str]
     movement_history: Optional[List[Movement]]
+
+
+def as_utc(value: datetime) -> datetime:
+    """``value`` as an aware datetime; naive values are taken as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def movement_history_digest(movements: Iterable[Movement]) -> str:
+    """Order-independent SHA-256 digest of a movement history.
+
+    Two histories with the same ``(date, description)`` pairs share a digest,
+    so a sync can tell that nothing changed without loading stored movements.
+    """
+    signatures = sorted(
+        f"{movement.date.timestamp():.6f}\x1f{movement.description}"
+        for movement in movements
+    )
+    digest = hashlib.sha256()
+    for signature in signatures:
+        digest.update(signature.encode("utf-8"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+# Case fields whose changes are counted by the sync and published as events.
+CHANGE_TRACKED_FIELDS = (
+    "court",
+    "judging_body",
+    "procedural_class",
+    "subject",
+    "status",
+    "filing_date",
+    "latest_update",
+)
+
+
+def changed_fields(existing: LegalCase, updated: LegalCase) -> List[str]:
+    """Names of the tracked fields that differ between two versions of a case."""
+    return [
+        name
+        for name in CHANGE_TRACKED_FIELDS
+        if getattr(existing, name, None) != getattr(updated, name, None)
+    ]
+
+
+@dataclass
+class LegalCaseChangeEvent:
+    """Outbox entry describing a change applied to a persisted case.
+
+    ``event_type`` is ``movements_added`` or ``fields_changed``. Events are
+    ordered by ``(txid, event_id)``: the id of the transaction that wrote
+    them, then their own sequence.
+    """
+
+    event_id: int
+    txid: int
+    case_id: str
+    numero_processo: str
+    event_type: str
+    payload: Dict[str, Any]
+    created_at: datetime
+    delivery_attempts: int = field(default=0)
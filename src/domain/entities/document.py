@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Iterator, Optional
 
 
 class DocumentMetadata:
@@ -52,3 +52,52 @@ class ClassificationDocument:
     data: bytes
     mimetype: str
     name: str
+
+
+@dataclass(frozen=True)
+class UploadIntent:
+    """File the client intends to upload directly to object storage."""
+
+    name: str
+    mimetype: str
+    size: int
+
+
+@dataclass(frozen=True)
+class PresignedUpload:
+    """Presigned destination for a single direct upload."""
+
+    name: str
+    mimetype: str
+    key: str
+    url: str
+    expires_in: int
+
+
+@dataclass(frozen=True)
+class UploadedDocument:
+    """Reference to an object already uploaded by the client."""
+
+    key: str
+    name: str
+    mimetype: str
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    """Metadata of an object present in storage."""
+
+    key: str
+    size: int
+    content_type: Optional[str]
+
+
+@dataclass
+class ObjectStream:
+    """Streamed (optionally partial) body of a stored object."""
+
+    chunks: Iterator[bytes]
+    content_length: int
+    total_size: int
+    content_type: Optional[str]
+    content_range: Optional[str] = None
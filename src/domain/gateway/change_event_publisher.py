@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.domain.entities.case import LegalCaseChangeEvent
+
+
+class IChangeEventPublisher(ABC):
+    """Pushes change events to an external subscriber."""
+
+    @abstractmethod
+    def publish(self, events: List[LegalCaseChangeEvent]) -> None:
+        """Deliver a batch of events; raises when the subscriber rejects it."""
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional
 
 from src.domain.entities.case import CNJNumber, LegalCase
 
@@ -10,3 +10,18 @@ class LegalCaseGateway(ABC):
         self, case_number: CNJNumber, court_acronym: str
     ) -> Optional[LegalCase]:
         pass
+
+    def find_cases_by_numbers(
+        self, case_numbers: List[CNJNumber], court_acronym: str
+    ) -> Dict[str, LegalCase]:
+        """Look up several cases of one court, keyed by ``clean_number``.
+
+        Providers able to answer many numbers per request should override this;
+        the default performs one lookup per number.
+        """
+        found: Dict[str, LegalCase] = {}
+        for case_number in case_numbers:
+            legal_case = self.find_case_by_number(case_number, court_acronym)
+            if legal_case is not None:
+                found[case_number.clean_number] = legal_case
+        return found
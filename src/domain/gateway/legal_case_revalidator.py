@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from src.domain.repositories.legal_case_repository import PersistedLegalCase
+
+
+class ILegalCaseRevalidator(ABC):
+    """Refreshes a persisted legal case in the background."""
+
+    @abstractmethod
+    def schedule(self, case: PersistedLegalCase) -> bool:
+        """Queue a refresh of ``case``; returns False if it was deduplicated or
+        throttled."""
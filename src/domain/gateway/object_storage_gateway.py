@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import BinaryIO
+from typing import BinaryIO, Optional
+
+from src.domain.entities.document import ObjectStream, StoredObject
 
 
 class IObjectStorageGateway(ABC):
@@ -14,3 +16,25 @@ class IObjectStorageGateway(ABC):
     @abstractmethod
     def download(self, key: str) -> bytes:
         """Download an object identified by the key."""
+
+    @abstractmethod
+    def generate_upload_url(self, key: str, content_type: str, expires_in: int) -> str:
+        """Return a presigned URL allowing a client to PUT the object directly."""
+
+    @abstractmethod
+    def head(self, key: str) -> Optional[StoredObject]:
+        """Return the object metadata or ``None`` when the key does not exist."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove an object from storage."""
+
+    @abstractmethod
+    def generate_download_url(
+        self, key: str, expires_in: int, file_name: Optional[str] = None
+    ) -> str:
+        """Return a short-lived presigned URL to GET the object."""
+
+    @abstractmethod
+    def open_stream(self, key: str, byte_range: Optional[str] = None) -> ObjectStream:
+        """Open the object body as a chunked stream, optionally for a byte range."""
@@ -17,6 +17,10 @@ class IDocumentRepository(ABC):
     def get_document(self, document_id: str) -> Optional[DocumentMetadata]:
         """Fetch a document by identifier."""
 
+    @abstractmethod
+    def get_by_storage_key(self, s3_key: str) -> Optional[DocumentMetadata]:
+        """Fetch a document by its storage key."""
+
     @abstractmethod
     def update_classification(
         self,
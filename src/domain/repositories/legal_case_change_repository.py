@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from src.domain.entities.case import LegalCaseChangeEvent
+
+
+class ChangeCursor:
+    """Position in the change feed: ``(txid, event_id)`` of the last event read."""
+
+    def __init__(self, txid: int, event_id: int) -> None:
+        self.txid = txid
+        self.event_id = event_id
+
+
+class ChangeEventPage:
+    """Events after a cursor and the cursor to resume from."""
+
+    def __init__(
+        self,
+        events: List[LegalCaseChangeEvent],
+        next_cursor: Optional[ChangeCursor] = None,
+    ) -> None:
+        self.events = events
+        self.next_cursor = next_cursor
+
+
+class ILegalCaseChangeRepository(ABC):
+    """Read and delivery side of the legal case change outbox.
+
+    Events are written by ``ILegalCaseRepository.apply_case_updates`` in the
+    same transaction as the change itself.
+    """
+
+    @abstractmethod
+    def list_changes(
+        self,
+        limit: int,
+        after: Optional[ChangeCursor] = None,
+        numero_processo: Optional[str] = None,
+    ) -> ChangeEventPage:
+        """Return committed events after ``after`` in feed order.
+
+        Only events of transactions older than every transaction still in
+        progress are returned, so a slow commit can never land behind a
+        cursor a client already holds.
+        """
+
+    @abstractmethod
+    def claim_undelivered(
+        self, limit: int, now: datetime
+    ) -> List[LegalCaseChangeEvent]:
+        """Lock undelivered events due for a (re)delivery attempt.
+
+        Rows locked by another dispatcher are skipped; the lock lasts until
+        the current transaction ends.
+        """
+
+    @abstractmethod
+    def mark_delivered(self, event_ids: List[int]) -> None:
+        """Record a successful webhook delivery."""
+
+    @abstractmethod
+    def mark_failed(self, event_ids: List[int], retry_at: datetime) -> None:
+        """Count a failed delivery attempt and postpone the next one."""
+
+    @abstractmethod
+    def purge(self, created_before: datetime, limit: int) -> int:
+        """Delete up to ``limit`` events older than ``created_before``."""
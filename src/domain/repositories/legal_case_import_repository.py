@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Set, Tuple
+
+# Outcome of the first sync attempts of an imported placeholder.
+IMPORT_ITEM_STATUSES = ("pending", "found", "not_found", "error")
+
+
+class InvalidImportEntry:
+    """A received value rejected before anything was stored."""
+
+    def __init__(self, line: int, value: str, reason: str) -> None:
+        self.line = line
+        self.value = value
+        self.reason = reason
+
+
+class LegalCaseImportProgress:
+    """Counters of a bulk import; fetch counters move as the cron runs."""
+
+    def __init__(
+        self,
+        import_id: str,
+        source_format: str,
+        created_at: datetime,
+        total_received: int,
+        invalid_count: int,
+        duplicate_count: int,
+        already_tracked_count: int,
+        queued_count: int,
+        invalid_entries: List[InvalidImportEntry],
+        found_count: int = 0,
+        not_found_count: int = 0,
+        error_count: int = 0,
+        pending_count: Optional[int] = None,
+    ) -> None:
+        self.import_id = import_id
+        self.source_format = source_format
+        self.created_at = created_at
+        self.total_received = total_received
+        self.invalid_count = invalid_count
+        self.duplicate_count = duplicate_count
+        self.already_tracked_count = already_tracked_count
+        self.queued_count = queued_count
+        self.invalid_entries = invalid_entries
+        self.found_count = found_count
+        self.not_found_count = not_found_count
+        self.error_count = error_count
+        self.pending_count = queued_count if pending_count is None else pending_count
+
+    @property
+    def completed(self) -> bool:
+        return self.pending_count == 0
+
+
+class ILegalCaseImportRepository(ABC):
+    """Persistence of bulk imports and of the placeholder cases they queue."""
+
+    @abstractmethod
+    def find_existing_numbers(self, numeros_processo: List[str]) -> Set[str]:
+        """Subset of ``numeros_processo`` already stored in ``legal_cases``."""
+
+    @abstractmethod
+    def create_import(
+        self,
+        created_by: Optional[str],
+        source_format: str,
+        total_received: int,
+        invalid_entries: List[InvalidImportEntry],
+        invalid_count: int,
+        duplicate_count: int,
+        already_tracked_count: int,
+        queued: List[Tuple[str, str]],
+    ) -> LegalCaseImportProgress:
+        """Record an import and bulk-insert ``(numero, court_acronym)`` placeholders.
+
+        Placeholders are never-synced cases, so the sync cron fetches them
+        first. Numbers inserted concurrently by someone else count as already
+        tracked instead of queued.
+        """
+
+    @abstractmethod
+    def get_import(self, import_id: str) -> Optional[LegalCaseImportProgress]:
+        """Import counters, with found/not found/error tallied from its items."""
+
+    @abstractmethod
+    def record_outcome(self, case_id: str, result: str) -> None:
+        """Record a sync result (``updated``/``skipped``/``error``/``failed``)
+        for the import item of ``case_id``, if the case came from an import.
+
+        A ``skipped`` placeholder (never synced, unknown to the provider) stays
+        scheduled for another lookup; it is dropped once it has been missed
+        too many times or is too old, and its item keeps ``not_found``.
+        """
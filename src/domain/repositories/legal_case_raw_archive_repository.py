@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+class ArchivedSource:
+    """Raw DataJud ``_source`` last fetched for a case number."""
+
+    def __init__(
+        self,
+        numero_processo: str,
+        court_acronym: str,
+        source: Dict[str, Any],
+        fetched_at: datetime,
+    ) -> None:
+        self.numero_processo = numero_processo
+        self.court_acronym = court_acronym
+        self.source = source
+        self.fetched_at = fetched_at
+
+
+class ILegalCaseRawArchive(ABC):
+    """Archive of raw provider payloads, used to re-map cases offline."""
+
+    @abstractmethod
+    def store(
+        self, numero_processo: str, court_acronym: str, source: Dict[str, Any]
+    ) -> None:
+        """Keep ``source`` as the latest payload of ``numero_processo``."""
+
+    @abstractmethod
+    def list_case_numbers(self, limit: int, after: Optional[str] = None) -> List[str]:
+        """Archived case numbers in ascending order, strictly after ``after``."""
+
+    @abstractmethod
+    def load(self, numeros_processo: List[str]) -> List[ArchivedSource]:
+        """Archived payloads of the given numbers; unknown numbers are skipped."""
@@ -18,6 +18,9 @@ class PersistedLegalCase:
         last_synced_at: Optional[datetime],
         prioridade: str,
         status: Optional[str],
+        movement_watermark: Optional[datetime] = None,
+        movement_digest: Optional[str] = None,
+        movement_count: Optional[int] = None,
     ) -> None:
         self.case = case
         self.case_id = case_id
@@ -25,6 +28,120 @@ class PersistedLegalCase:
         self.last_synced_at = last_synced_at
         self.prioridade = prioridade
         self.status = status
+        self.movement_watermark = movement_watermark
+        self.movement_digest = movement_digest
+        self.movement_count = movement_count
+
+
+class MovementCursor:
+    """Keyset position of a stored movement: ``(movement_date, id)``."""
+
+    def __init__(self, movement_date: datetime, movement_id: str) -> None:
+        self.movement_date = movement_date
+        self.movement_id = movement_id
+
+
+class MovementPage:
+    """One page of a case movement history, newest first."""
+
+    def __init__(
+        self,
+        movements: List[Movement],
+        next_cursor: Optional[MovementCursor] = None,
+    ) -> None:
+        self.movements = movements
+        self.next_cursor = next_cursor
+
+
+class LegalCaseSearchHit:
+    """Case matched by a full-text search, with its best-matching movements."""
+
+    def __init__(
+        self,
+        case_id: str,
+        numero_processo: str,
+        tribunal: Optional[str],
+        classe_processual: Optional[str],
+        assunto: Optional[str],
+        ultima_movimentacao: Optional[datetime],
+        rank: float,
+        matched_movements: Optional[List[Movement]] = None,
+    ) -> None:
+        self.case_id = case_id
+        self.numero_processo = numero_processo
+        self.tribunal = tribunal
+        self.classe_processual = classe_processual
+        self.assunto = assunto
+        self.ultima_movimentacao = ultima_movimentacao
+        self.rank = rank
+        self.matched_movements = matched_movements or []
+
+
+# Sort keys accepted by ``list_cases``; each has a ``(column, id)`` index.
+CASE_LIST_SORT_FIELDS = (
+    "created_at",
+    "ultima_movimentacao",
+    "data_ajuizamento",
+    "movimentacoes",
+    "numero_processo",
+)
+DEFAULT_CASE_LIST_SORT_FIELD = "created_at"
+
+
+class LegalCaseSummary:
+    """Column-only view of a case used by listings (no movements)."""
+
+    def __init__(
+        self,
+        case_id: str,
+        numero_processo: str,
+        tribunal: Optional[str],
+        classe_processual: Optional[str],
+        assunto: Optional[str],
+        status: Optional[str],
+        prioridade: str,
+        movimentacoes: int,
+        data_ajuizamento: Optional[datetime],
+        ultima_movimentacao: Optional[datetime],
+        ultima_movimentacao_descricao: Optional[str],
+        created_at: datetime,
+    ) -> None:
+        self.case_id = case_id
+        self.numero_processo = numero_processo
+        self.tribunal = tribunal
+        self.classe_processual = classe_processual
+        self.assunto = assunto
+        self.status = status
+        self.prioridade = prioridade
+        self.movimentacoes = movimentacoes
+        self.data_ajuizamento = data_ajuizamento
+        self.ultima_movimentacao = ultima_movimentacao
+        self.ultima_movimentacao_descricao = ultima_movimentacao_descricao
+        self.created_at = created_at
+
+
+class CaseListCursor:
+    """Keyset position in a case listing: sort value (may be null) and id."""
+
+    def __init__(self, sort_value: object, case_id: str) -> None:
+        self.sort_value = sort_value
+        self.case_id = case_id
+
+
+class LegalCaseListPage:
+    """One page of a case listing and the ordering it was read in."""
+
+    def __init__(
+        self,
+        items: List[LegalCaseSummary],
+        next_cursor: Optional[CaseListCursor] = None,
+        sort_field: str = DEFAULT_CASE_LIST_SORT_FIELD,
+        sort_direction: str = "desc",
+    ) -> None:
+        self.items = items
+        self.next_cursor = next_cursor
+        self.sort_field = sort_field
+        self.sort_direction = sort_direction
 
 
 class ProcessDashboardFilters:
@@ -61,7 +178,46 @@ class ILegalCaseRepository(ABC):
 
     @abstractmethod
     def get_by_number(self, numero_processo: str) -> Optional[PersistedLegalCase]:
-        """Return a persisted legal case if it exists."""
+        """Return a persisted legal case if it exists.
+
+        Only the most recent movements are embedded in ``movement_history``;
+        ``movement_count`` carries the size of the full history, which is
+        read page by page through ``list_movements_page``.
+        """
+
+    @abstractmethod
+    def get_by_numbers(
+        self, numeros_processo: List[str]
+    ) -> Dict[str, PersistedLegalCase]:
+        """Stored cases among ``numeros_processo``, keyed by number.
+
+        Same shape as ``get_by_number`` (latest movements embedded), with a
+        constant number of queries whatever the amount of numbers.
+        """
+
+    @abstractmethod
+    def get_case_id(self, numero_processo: str) -> Optional[str]:
+        """Return the id of a persisted case without loading its data."""
+
+    @abstractmethod
+    def list_movements_page(
+        self,
+        case_id: str,
+        limit: int,
+        before: Optional[MovementCursor] = None,
+    ) -> MovementPage:
+        """Return up to ``limit`` movements older than ``before``, newest first.
+
+        ``next_cursor`` is set only when older movements remain.
+        """
+
+    @abstractmethod
+    def lock_case_number(self, numero_processo: str) -> None:
+        """Serialize first-time lookups of a case across replicas.
+
+        Blocks until no other transaction holds the lock for the same number;
+        the lock is released when the current transaction ends.
+        """
 
     @abstractmethod
     def insert_case_with_movements(
@@ -78,7 +234,53 @@ class ILegalCaseRepository(ABC):
         limit: int,
         stale_before: datetime,
     ) -> List[PersistedLegalCase]:
-        """Return a list of persisted cases that require synchronization."""
+        """Return persisted cases due for synchronization, most overdue first.
+
+        A case is due once ``next_sync_at`` has passed; unscheduled cases fall
+        back to ``last_synced_at`` older than ``stale_before``. Movement
+        history is not loaded; callers diff against ``movement_watermark`` and
+        ``movement_digest`` instead.
+        """
+
+    @abstractmethod
+    def count_due_cases(self, stale_before: datetime) -> int:
+        """Return how many cases are currently due for synchronization."""
+
+    @abstractmethod
+    def claim_stale_cases(
+        self,
+        limit: int,
+        stale_before: datetime,
+        owner: str,
+        lease_seconds: int,
+    ) -> List[PersistedLegalCase]:
+        """Lease up to ``limit`` due cases not leased by another worker.
+
+        Cases whose lease has expired are claimable again. The claim only
+        protects other workers once the surrounding transaction commits.
+        """
+
+    @abstractmethod
+    def claim_cases(
+        self,
+        case_ids: List[str],
+        owner: str,
+        lease_seconds: int,
+        previous_owner: Optional[str] = None,
+    ) -> List[PersistedLegalCase]:
+        """Lease specific cases, taking over leases held by ``previous_owner``."""
+
+    @abstractmethod
+    def renew_claims(self, case_ids: List[str], owner: str, lease_seconds: int) -> int:
+        """Extend the leases ``owner`` still holds; returns how many were renewed."""
+
+    @abstractmethod
+    def release_claims(self, case_ids: List[str], owner: str) -> None:
+        """Drop the leases ``owner`` holds on the given cases."""
+
+    @abstractmethod
+    def list_movements_since(self, case_id: str, since: datetime) -> List[Movement]:
+        """Return the stored movements of a case dated at or after ``since``."""
 
     @abstractmethod
     def apply_case_updates(
@@ -86,11 +288,53 @@ class ILegalCaseRepository(ABC):
         persisted: PersistedLegalCase,
         updated_case: LegalCase,
         new_movements: List[Movement],
+        next_sync_at: Optional[datetime] = None,
     ) -> PersistedLegalCase:
-        """Apply case field updates and append new movements."""
+        """Apply case field updates and append new movements.
+
+        Movements already stored are ignored; the watermark and digest are
+        refreshed from ``updated_case.movement_history``.
+        """
+
+    @abstractmethod
+    def rebuild_case(self, case_number: str, case: LegalCase) -> PersistedLegalCase:
+        """Overwrite a case and its whole movement history with ``case``.
+
+        Used to re-derive stored data after a mapping fix; sync scheduling
+        fields are left untouched. Inserts the case when it is not stored.
+        """
+
+    @abstractmethod
+    def reschedule(self, case_id: str, next_sync_at: datetime) -> None:
+        """Set when a case becomes due again without touching its data."""
+
+    @abstractmethod
+    def search_cases(
+        self, query: str, limit: int, offset: int = 0
+    ) -> List[LegalCaseSearchHit]:
+        """Full-text search over case fields and movement descriptions.
+
+        ``query`` uses web search syntax (quoted phrases, ``or``, ``-term``).
+        Hits are ordered by relevance, then by case id, and carry up to a few
+        of the case movements that matched. Cases never synced are left out.
+        """
+
+    @abstractmethod
+    def list_cases(
+        self,
+        filters: ProcessDashboardFilters,
+        limit: int,
+        after: Optional[CaseListCursor] = None,
+    ) -> LegalCaseListPage:
+        """Return a page of synced cases matching ``filters``.
+
+        Ordered by ``filters.sort_field`` (one of ``CASE_LIST_SORT_FIELDS``)
+        in ``filters.sort_direction``, ties broken by id; cases without a
+        value for the sort field come last in both directions.
+        """
 
     @abstractmethod
     def aggregate_dashboard(
         self, filters: ProcessDashboardFilters
     ) -> ProcessDashboardAggregation:
-        """Return aggregated information for the dashboard."""
+        """Return aggregated information for the dashboard (synced cases)."""
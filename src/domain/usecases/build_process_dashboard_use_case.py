@@ -13,6 +13,16 @@ from src.domain.repositories.legal_case_repository import (
 )
 
 
+def parse_filter_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO date filter; empty values mean no bound."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise InvalidInputError(f"Data inválida: {value}") from exc
+
+
 class BuildProcessDashboardUseCase:
     """Assembles dashboard data for legal cases."""
 
@@ -21,12 +31,7 @@ class BuildProcessDashboardUseCase:
 
     @staticmethod
     def _parse_date(value: Optional[str]) -> Optional[datetime]:
-        if not value:
-            return None
-        try:
-            return datetime.fromisoformat(value)
-        except ValueError as exc:
-            raise InvalidInputError(f"Data inválida: {value}") from exc
+        return parse_filter_date(value)
 
     def execute(
         self,
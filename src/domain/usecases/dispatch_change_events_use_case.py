@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+
+from src.domain.core import metrics
+from src.domain.core.either import Either, Left, Right
+from src.domain.core.logger import get_logger
+from src.domain.gateway.change_event_publisher import IChangeEventPublisher
+from src.domain.repositories.legal_case_change_repository import (
+    ILegalCaseChangeRepository,
+)
+
+logger = get_logger(__name__)
+
+
+class DispatchChangeEventsUseCase:
+    """Deliver pending outbox events to the configured webhook.
+
+    Delivery is at-least-once: a batch is marked delivered only after the
+    subscriber accepts it, and a rejected batch is retried with exponential
+    backoff. Subscribers deduplicate by ``event_id``.
+    """
+
+    def __init__(
+        self,
+        repository: ILegalCaseChangeRepository,
+        publisher: IChangeEventPublisher,
+        batch_size: int = 100,
+        retry_base_seconds: int = 30,
+        retry_max_seconds: int = 3600,
+    ) -> None:
+        self._repository = repository
+        self._publisher = publisher
+        self._batch_size = batch_size
+        self._retry_base_seconds = retry_base_seconds
+        self._retry_max_seconds = retry_max_seconds
+
+    def retry_delay(self, attempts: int) -> timedelta:
+        """Backoff after the ``attempts``-th failed delivery."""
+        seconds = self._retry_base_seconds * (2 ** max(0, attempts - 1))
+        return timedelta(seconds=min(seconds, self._retry_max_seconds))
+
+    def execute(self) -> Either[Exception, Dict[str, int]]:
+        now = datetime.now(timezone.utc)
+        try:
+            events = self._repository.claim_undelivered(self._batch_size, now)
+        except Exception as exc:  # pylint: disable=broad-except
+            return Left(exc)
+        if not events:
+            return Right({"delivered": 0, "failed": 0})
+
+        event_ids = [event.event_id for event in events]
+        try:
+            self._publisher.publish(events)
+        except Exception as exc:  # pylint: disable=broad-except
+            attempts = max(event.delivery_attempts for event in events) + 1
+            self._repository.mark_failed(event_ids, now + self.retry_delay(attempts))
+            metrics.increment("change_event_delivery_failures")
+            logger.warning(
+                "Falha ao entregar %s evento(s) ao webhook (tentativa %s): %s",
+                len(events),
+                attempts,
+                exc,
+            )
+            return Right({"delivered": 0, "failed": len(events)})
+
+        self._repository.mark_delivered(event_ids)
+        metrics.increment("change_events_delivered", len(events))
+        return Right({"delivered": len(events), "failed": 0})
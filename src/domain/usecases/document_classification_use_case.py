@@ -33,6 +33,20 @@ ALLOWED_CONTENT_TYPES: Sequence[str] = (
 )
 
 
+def document_storage_prefix(solicitation_id: str) -> str:
+    """Return the storage prefix under which solicitation documents live."""
+    return f"solicitacoes/{solicitation_id}/docs/"
+
+
+def build_document_storage_key(solicitation_id: str, filename: str) -> str:
+    """Build a unique storage key for a document of the solicitation."""
+    extension = ""
+    if "." in filename:
+        extension = filename[filename.rfind(".") :]
+    unique_id = uuid4().hex
+    return f"{document_storage_prefix(solicitation_id)}{unique_id}{extension}"
+
+
 @dataclass
 class ClassificationResultDocument:
     document_id: str
@@ -166,8 +180,77 @@ class ClassificarDocumentosUseCase:
 
     @staticmethod
     def _build_storage_key(solicitation_id: str, filename: str) -> str:
-        extension = ""
-        if "." in filename:
-            extension = filename[filename.rfind(".") :]
-        unique_id = uuid4().hex
-        return f"solicitacoes/{solicitation_id}/docs/{unique_id}{extension}"
+        return build_document_storage_key(solicitation_id, filename)
+
+
+class ClassifyStoredDocumentsUseCase:
+    """Classifies documents that are already stored and registered."""
+
+    def __init__(
+        self,
+        classificador_gateway: IAGateway,
+        storage_gateway: IObjectStorageGateway,
+        document_repository: IDocumentRepository,
+    ) -> None:
+        self._classificador_gateway = classificador_gateway
+        self._storage_gateway = storage_gateway
+        self._document_repository = document_repository
+        self._logger = get_logger(__name__)
+
+    def execute(
+        self, document_ids: List[str]
+    ) -> Either[Exception, List[ClassificationResultDocument]]:
+        if not document_ids:
+            return Left(InvalidInputError("Nenhum documento fornecido."))
+
+        results: List[ClassificationResultDocument] = []
+        for document_id in document_ids:
+            metadata = self._document_repository.get_document(document_id)
+            if metadata is None:
+                metrics.increment("document_classification_errors")
+                self._logger.warning("Documento '%s' não encontrado.", document_id)
+                continue
+
+            try:
+                data = self._storage_gateway.download(metadata.s3_key)
+            except Exception as exc:  # pylint: disable=broad-except
+                metrics.increment("document_storage_errors")
+                return Left(StorageError(str(exc)))
+
+            document = ClassificationDocument(
+                data=data,
+                mimetype=metadata.mimetype,
+                name=metadata.file_name or metadata.document_id,
+            )
+            try:
+                classification = self._classificador_gateway.classificar(document)
+            except Exception as exc:  # pylint: disable=broad-except
+                metrics.increment("document_classification_errors")
+                self._logger.warning(
+                    "Falha ao classificar '%s': %s",
+                    document.name,
+                    exc,
+                    exc_info=True,
+                )
+                continue
+
+            self._document_repository.update_classification(
+                metadata.document_id, classification.value
+            )
+            results.append(
+                ClassificationResultDocument(
+                    document_id=metadata.document_id,
+                    classification=classification,
+                )
+            )
+
+        if not results:
+            metrics.increment("document_classification_errors")
+            return Left(
+                ClassificationError(
+                    "Não foi possível classificar os documentos enviados."
+                )
+            )
+
+        metrics.increment("documents_classified", len(results))
+        return Right(results)
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from src.domain.core import metrics
+from src.domain.core.either import Either, Left, Right
+from src.domain.core.errors import (
+    DocumentNotFoundError,
+    InvalidInputError,
+    SolicitationNotFoundError,
+    StorageError,
+    UploadError,
+)
+from src.domain.core.logger import get_logger
+from src.domain.entities.document import (
+    DocumentMetadata,
+    PresignedUpload,
+    UploadedDocument,
+    UploadIntent,
+)
+from src.domain.gateway.object_storage_gateway import IObjectStorageGateway
+from src.domain.repositories.document_repository import IDocumentRepository
+from src.domain.repositories.solicitation_repository import ISolicitationRepository
+from src.domain.usecases.document_classification_use_case import (
+    ALLOWED_CONTENT_TYPES,
+    MAX_DOCUMENTS_PER_REQUEST,
+    build_document_storage_key,
+    document_storage_prefix,
+)
+
+DEFAULT_MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+DEFAULT_UPLOAD_URL_TTL_SECONDS = 900
+
+
+@dataclass
+class UploadTicket:
+    solicitation_id: str
+    uploads: List[PresignedUpload]
+
+
+class RequestDocumentUploadUseCase:
+    """Issues presigned URLs so clients upload documents straight to storage."""
+
+    def __init__(
+        self,
+        storage_gateway: IObjectStorageGateway,
+        solicitation_repository: ISolicitationRepository,
+        max_upload_bytes: int = DEFAULT_MAX_UPLOAD_BYTES,
+        url_ttl_seconds: int = DEFAULT_UPLOAD_URL_TTL_SECONDS,
+    ) -> None:
+        self._storage_gateway = storage_gateway
+        self._solicitation_repository = solicitation_repository
+        self._max_upload_bytes = max_upload_bytes
+        self._url_ttl_seconds = url_ttl_seconds
+
+    def execute(
+        self,
+        files: List[UploadIntent],
+        solicitation_id: Optional[str] = None,
+    ) -> Either[Exception, UploadTicket]:
+        if not files:
+            return Left(InvalidInputError("Nenhum documento fornecido."))
+        if len(files) > MAX_DOCUMENTS_PER_REQUEST:
+            metrics.increment("document_upload_errors")
+            return Left(
+                InvalidInputError("Quantidade máxima de 15 documentos excedida.")
+            )
+
+        for intent in files:
+            if intent.mimetype not in ALLOWED_CONTENT_TYPES:
+                metrics.increment("document_upload_errors")
+                return Left(
+                    InvalidInputError(f"Formato não suportado para '{intent.name}'.")
+                )
+            if intent.size <= 0 or intent.size > self._max_upload_bytes:
+                metrics.increment("document_upload_errors")
+                megabytes = self._max_upload_bytes // (1024 * 1024)
+                return Left(
+                    InvalidInputError(
+                        f"Arquivo '{intent.name}' excede o tamanho máximo "
+                        f"permitido de {megabytes}MB."
+                    )
+                )
+
+        if solicitation_id:
+            try:
+                self._solicitation_repository.ensure_exists(solicitation_id)
+            except (SolicitationNotFoundError, ValueError):
+                return Left(SolicitationNotFoundError(solicitation_id))
+        else:
+            solicitation_id = self._solicitation_repository.create().solicitation_id
+
+        uploads: List[PresignedUpload] = []
+        for intent in files:
+            key = build_document_storage_key(solicitation_id, intent.name)
+            try:
+                url = self._storage_gateway.generate_upload_url(
+                    key, intent.mimetype, self._url_ttl_seconds
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                metrics.increment("document_upload_errors")
+                return Left(UploadError(str(exc)))
+            uploads.append(
+                PresignedUpload(
+                    name=intent.name,
+                    mimetype=intent.mimetype,
+                    key=key,
+                    url=url,
+                    expires_in=self._url_ttl_seconds,
+                )
+            )
+
+        metrics.increment("document_upload_urls_issued", len(uploads))
+        return Right(UploadTicket(solicitation_id=solicitation_id, uploads=uploads))
+
+
+class RegisterUploadedDocumentsUseCase:
+    """Registers documents uploaded directly to storage by the client."""
+
+    def __init__(
+        self,
+        storage_gateway: IObjectStorageGateway,
+        document_repository: IDocumentRepository,
+        solicitation_repository: ISolicitationRepository,
+        max_upload_bytes: int = DEFAULT_MAX_UPLOAD_BYTES,
+    ) -> None:
+        self._storage_gateway = storage_gateway
+        self._document_repository = document_repository
+        self._solicitation_repository = solicitation_repository
+        self._max_upload_bytes = max_upload_bytes
+        self._logger = get_logger(__name__)
+
+    def execute(
+        self,
+        user_id: str,
+        solicitation_id: str,
+        documents: List[UploadedDocument],
+    ) -> Either[Exception, List[DocumentMetadata]]:
+        if not documents:
+            return Left(InvalidInputError("Nenhum documento informado para registro."))
+        if len(documents) > MAX_DOCUMENTS_PER_REQUEST:
+            return Left(
+                InvalidInputError("Quantidade máxima de 15 documentos excedida.")
+            )
+
+        try:
+            self._solicitation_repository.ensure_exists(solicitation_id)
+        except (SolicitationNotFoundError, ValueError):
+            return Left(SolicitationNotFoundError(solicitation_id))
+
+        prefix = document_storage_prefix(solicitation_id)
+        registered: List[DocumentMetadata] = []
+        for document in documents:
+            if not document.key.startswith(prefix) or ".." in document.key:
+                metrics.increment("document_upload_errors")
+                return Left(
+                    InvalidInputError(
+                        f"Chave '{document.key}' não pertence à solicitação."
+                    )
+                )
+
+            existing = self._document_repository.get_by_storage_key(document.key)
+            if existing is not None:
+                registered.append(existing)
+                continue
+
+            try:
+                stored = self._storage_gateway.head(document.key)
+            except Exception as exc:  # pylint: disable=broad-except
+                metrics.increment("document_upload_errors")
+                return Left(UploadError(str(exc)))
+            if stored is None:
+                metrics.increment("document_upload_errors")
+                return Left(DocumentNotFoundError(document.key))
+
+            mimetype = stored.content_type or document.mimetype
+            if mimetype not in ALLOWED_CONTENT_TYPES:
+                metrics.increment("document_upload_errors")
+                return Left(
+                    InvalidInputError(f"Formato não suportado para '{document.name}'.")
+                )
+            if stored.size > self._max_upload_bytes:
+                metrics.increment("document_upload_errors")
+                self._discard(document.key)
+                megabytes = self._max_upload_bytes // (1024 * 1024)
+                return Left(
+                    InvalidInputError(
+                        f"Arquivo '{document.name}' excede o tamanho máximo "
+                        f"permitido de {megabytes}MB."
+                    )
+                )
+
+            try:
+                metadata = self._document_repository.create_document(
+                    {
+                        "solicitacao_id": solicitation_id,
+                        "nome_arquivo": document.name,
+                        "mimetype": mimetype,
+                        "s3_key": document.key,
+                        "uploaded_by": user_id,
+                    }
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                metrics.increment("document_storage_errors")
+                return Left(StorageError(str(exc)))
+            registered.append(metadata)
+
+        metrics.increment("documents_registered", len(registered))
+        return Right(registered)
+
+    def _discard(self, key: str) -> None:
+        try:
+            self._storage_gateway.delete(key)
+        except Exception as exc:  # pylint: disable=broad-except
+            self._logger.warning("Falha ao remover '%s' do armazenamento: %s", key, exc)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import re
+from typing import Optional
+
+from src.domain.core import metrics
+from src.domain.core.either import Either, Left, Right
+from src.domain.core.errors import (
+    DocumentNotFoundError,
+    InvalidInputError,
+    RangeNotSatisfiableError,
+    StorageError,
+)
+from src.domain.entities.document import DocumentMetadata, ObjectStream
+from src.domain.gateway.object_storage_gateway import IObjectStorageGateway
+from src.domain.repositories.document_repository import IDocumentRepository
+
+DOWNLOAD_MODES = ("redirect", "stream")
+DEFAULT_DOWNLOAD_URL_TTL_SECONDS = 120
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+@dataclass
+class DocumentDownload:
+    metadata: DocumentMetadata
+    url: Optional[str] = None
+    stream: Optional[ObjectStream] = None
+
+
+class DownloadDocumentUseCase:
+    """Serve a stored document without buffering it in the API process."""
+
+    def __init__(
+        self,
+        storage_gateway: IObjectStorageGateway,
+        document_repository: IDocumentRepository,
+        url_ttl_seconds: int = DEFAULT_DOWNLOAD_URL_TTL_SECONDS,
+    ) -> None:
+        self._storage_gateway = storage_gateway
+        self._document_repository = document_repository
+        self._url_ttl_seconds = url_ttl_seconds
+
+    def execute(
+        self,
+        document_id: str,
+        mode: str = "redirect",
+        byte_range: Optional[str] = None,
+    ) -> Either[Exception, DocumentDownload]:
+        if mode not in DOWNLOAD_MODES:
+            return Left(
+                InvalidInputError("Modo de download deve ser 'redirect' ou 'stream'.")
+            )
+        if byte_range is not None and "," in byte_range:
+            # Multipart ranges are not served; the full body is sent instead.
+            byte_range = None
+        if byte_range is not None and not self._is_valid_range(byte_range):
+            return Left(RangeNotSatisfiableError())
+
+        try:
+            metadata = self._document_repository.get_document(document_id)
+        except ValueError:
+            return Left(InvalidInputError("Identificador de documento inválido."))
+        if metadata is None:
+            return Left(DocumentNotFoundError(document_id))
+
+        metrics.increment(f"document_downloads_{mode}")
+        if mode == "redirect":
+            try:
+                url = self._storage_gateway.generate_download_url(
+                    metadata.s3_key,
+                    self._url_ttl_seconds,
+                    file_name=metadata.file_name,
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                metrics.increment("document_download_errors")
+                return Left(StorageError(str(exc)))
+            return Right(DocumentDownload(metadata=metadata, url=url))
+
+        try:
+            stream = self._storage_gateway.open_stream(metadata.s3_key, byte_range)
+        except RangeNotSatisfiableError as exc:
+            return Left(exc)
+        except Exception as exc:  # pylint: disable=broad-except
+            metrics.increment("document_download_errors")
+            return Left(StorageError(str(exc)))
+        return Right(DocumentDownload(metadata=metadata, stream=stream))
+
+    @staticmethod
+    def _is_valid_range(byte_range: str) -> bool:
+        match = _RANGE_PATTERN.match(byte_range.strip())
+        if not match:
+            return False
+        start, end = match.groups()
+        if not start and not end:
+            return False
+        if start and end and int(end) < int(start):
+            return False
+        return True
@@ -1,5 +1,9 @@
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from src.domain.core.errors import (
+    ExternalRateLimitError,
+    ExternalServiceUnavailableError,
+)
 from src.domain.core.logger import get_logger
 from src.domain.entities.case import CNJNumber, LegalCase
 from src.domain.gateway.legal_case_gateway import LegalCaseGateway
@@ -76,6 +80,17 @@ COURT_CODE_MAP: Dict[Tuple[str, str], str] = {
 }
 
 
+def resolve_court_acronym(raw_case_number: str) -> Optional[str]:
+    """Return the DataJud court acronym for a raw 20-digit CNJ number."""
+    try:
+        cnj_identifier = CNJNumber.from_raw(raw_case_number)
+    except ValueError:
+        return None
+    return COURT_CODE_MAP.get(
+        (cnj_identifier.judiciary_branch_code, cnj_identifier.court_code)
+    )
+
+
 class FindLegalCaseUseCase:
     def __init__(self, gateway: LegalCaseGateway):
         self.gateway = gateway
@@ -107,6 +122,8 @@ class FindLegalCaseUseCase:
                 case_number=cnj_identifier, court_acronym=court_acronym
             )
 
+        except (ExternalRateLimitError, ExternalServiceUnavailableError):
+            raise
         except ValueError as e:
             logger.error(
                 "Falha na validação do número '%s'. details: %s", raw_case_number, e
@@ -115,3 +132,45 @@ class FindLegalCaseUseCase:
         except Exception as e:
             logger.error("Ocorreu um erro inesperado: %s", e)
             return None
+
+    def execute_batch(
+        self, court_acronym: str, raw_case_numbers: List[str]
+    ) -> Dict[str, Optional[LegalCase]]:
+        """Look up several cases of the same court in one provider round-trip.
+
+        Returns every requested number mapped to its case, or ``None`` when it
+        was invalid or not found.
+        """
+        results: Dict[str, Optional[LegalCase]] = {
+            raw: None for raw in raw_case_numbers
+        }
+        identifiers: List[CNJNumber] = []
+        for raw_case_number in raw_case_numbers:
+            try:
+                identifiers.append(CNJNumber.from_raw(raw_case_number))
+            except ValueError as e:
+                logger.error(
+                    "Falha na validação do número '%s'. details: %s",
+                    raw_case_number,
+                    e,
+                )
+        if not identifiers:
+            return results
+
+        logger.info(
+            "Consultando %s processos em lote no tribunal %s.",
+            len(identifiers),
+            court_acronym.upper(),
+        )
+        try:
+            found = self.gateway.find_cases_by_numbers(
+                case_numbers=identifiers, court_acronym=court_acronym
+            )
+        except (ExternalRateLimitError, ExternalServiceUnavailableError):
+            raise
+        except Exception as e:
+            logger.error("Ocorreu um erro inesperado: %s", e)
+            return results
+        for identifier in identifiers:
+            results[identifier.clean_number] = found.get(identifier.clean_number)
+        return results
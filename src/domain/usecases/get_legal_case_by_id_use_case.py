@@ -1,38 +1,108 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from datetime import datetime, timezone, timedelta
-from typing import List, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import math
 import time
 
 from src.domain.core.either import Either, Left, Right
 from src.domain.core.errors import (
     ExternalRateLimitError,
+    ExternalServiceUnavailableError,
     InvalidInputError,
     LegalCaseNotFoundError,
     LegalCasePersistenceError,
 )
-from src.domain.entities.case import LegalCase, Movement
+from src.domain.entities.case import (
+    LegalCase,
+    Movement,
+    as_utc,
+    changed_fields,
+    movement_history_digest,
+)
+from src.domain.gateway.legal_case_revalidator import ILegalCaseRevalidator
 from src.domain.repositories.legal_case_repository import (
     ILegalCaseRepository,
     PersistedLegalCase,
 )
-from src.domain.usecases.find_legal_case_use_case import FindLegalCaseUseCase
+from src.domain.usecases.find_legal_case_use_case import (
+    FindLegalCaseUseCase,
+    resolve_court_acronym,
+)
 from src.domain.core import metrics
+from src.domain.core.rate_limit import TokenBucketRegistry
+from src.domain.core.refresh_policy import RefreshPolicy
+from src.domain.core.single_flight import SingleFlight
+
+
+# Most numbers accepted by one multi-get call.
+MAX_LOOKUP_NUMBERS = 50
+# Concurrent provider requests (one per tribunal) of one multi-get call.
+DEFAULT_LOOKUP_WORKERS = 4
+
+_LookupOutcome = Tuple[Optional[PersistedLegalCase], Optional[Exception]]
+
+
+class LegalCaseLookupResult:
+    """Outcome of one number of a multi-get: the case or the error."""
+
+    def __init__(
+        self,
+        case_number: str,
+        case: Optional[PersistedLegalCase] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.case_number = case_number
+        self.case = case
+        self.error = error
 
 
 class GetLegalCaseByIdUseCase:
-    """Retrieve a legal case from persistence or external provider."""
+    """Retrieve a legal case from persistence or external provider.
+
+    Concurrent first-time lookups of the same CNJ are coalesced: in-process
+    through ``single_flight`` and across replicas through a database lock, so
+    the provider is called and the case inserted exactly once.
+
+    With a ``revalidator``, persisted cases last synced more than
+    ``revalidate_after`` ago are returned as they are and refreshed in the
+    background (stale-while-revalidate).
+
+    ``execute_many`` resolves several numbers at once: one repository read
+    for every stored case, then one provider request per tribunal for the
+    misses, run concurrently and throttled by ``lookup_buckets``.
+
+    A stored case never synced (an import placeholder) counts as a miss: it
+    is fetched and filled in under the per-number lock.
+    """
 
     def __init__(
         self,
         repository: ILegalCaseRepository,
         find_use_case: FindLegalCaseUseCase,
         max_requests_per_minute: int = 60,
+        single_flight: Optional[SingleFlight] = None,
+        revalidator: Optional[ILegalCaseRevalidator] = None,
+        revalidate_after: Optional[timedelta] = None,
+        lookup_buckets: Optional[TokenBucketRegistry] = None,
+        max_workers: int = DEFAULT_LOOKUP_WORKERS,
     ) -> None:
         self._repository = repository
         self._find_use_case = find_use_case
         self._min_interval = 60.0 / max(1, max_requests_per_minute)
         self._last_request_ts: float = 0.0
+        self._single_flight = single_flight or SingleFlight(
+            metric_name="legal_case_lookups_coalesced"
+        )
+        self._revalidator = revalidator
+        self._revalidate_after = revalidate_after
+        self._lookup_buckets = lookup_buckets or TokenBucketRegistry(
+            max_requests_per_minute
+        )
+        self._max_workers = max(1, max_workers)
 
     @staticmethod
     def _validate_case_number(case_number: str) -> Either[InvalidInputError, str]:
@@ -50,21 +120,190 @@ class GetLegalCaseByIdUseCase:
         normalized = validation.get_right()
 
         existing = self._repository.get_by_number(normalized)
-        if existing:
+        if existing and self._is_synced(existing):
+            self._revalidate_if_stale(existing)
+            return Right(existing)
+
+        return self._single_flight.do(
+            normalized, lambda: self._fetch_and_insert(normalized)
+        )
+
+    def execute_many(
+        self, case_numbers: List[str]
+    ) -> Either[InvalidInputError, List[LegalCaseLookupResult]]:
+        """Look up several cases; results come back in the input order.
+
+        Invalid, unknown or unavailable numbers get their own error instead of
+        failing the whole call. Repeated numbers are resolved once.
+        """
+        if not case_numbers:
+            return Left(InvalidInputError("Informe ao menos um número de processo."))
+        if len(case_numbers) > MAX_LOOKUP_NUMBERS:
+            return Left(
+                InvalidInputError(
+                    f"Informe no máximo {MAX_LOOKUP_NUMBERS} números por consulta."
+                )
+            )
+
+        validations = [self._validate_case_number(number) for number in case_numbers]
+        wanted = list(
+            dict.fromkeys(
+                validation.get_right()
+                for validation in validations
+                if validation.is_right()
+            )
+        )
+        outcomes: Dict[str, _LookupOutcome] = {}
+        if wanted:
+            stored = {
+                number: case
+                for number, case in self._repository.get_by_numbers(wanted).items()
+                if self._is_synced(case)
+            }
+            for number, case in stored.items():
+                self._revalidate_if_stale(case)
+                outcomes[number] = (case, None)
+            outcomes.update(
+                self._fetch_misses(
+                    [number for number in wanted if number not in stored]
+                )
+            )
+
+        results: List[LegalCaseLookupResult] = []
+        for number, validation in zip(case_numbers, validations):
+            if validation.is_left():
+                results.append(
+                    LegalCaseLookupResult(number, error=validation.get_left())
+                )
+                continue
+            case, error = outcomes[validation.get_right()]
+            results.append(LegalCaseLookupResult(number, case=case, error=error))
+        return Right(results)
+
+    def _fetch_tribunal(
+        self, tribunal: str, numbers: List[str]
+    ) -> Dict[str, Tuple[Optional[LegalCase], Optional[Exception]]]:
+        if not self._lookup_buckets.get(tribunal).try_acquire():
+            # An interactive call must not queue behind the budget: the caller
+            # retries these numbers later.
+            metrics.increment("legal_case_lookups_throttled", len(numbers))
+            return {number: (None, ExternalRateLimitError()) for number in numbers}
+        try:
+            found = self._find_use_case.execute_batch(tribunal, numbers)
+        except (ExternalRateLimitError, ExternalServiceUnavailableError) as error:
+            return {number: (None, error) for number in numbers}
+        return {number: (found.get(number), None) for number in numbers}
+
+    def _fetch_misses(self, misses: List[str]) -> Dict[str, _LookupOutcome]:
+        outcomes: Dict[str, _LookupOutcome] = {}
+        by_tribunal: Dict[str, List[str]] = defaultdict(list)
+        for number in misses:
+            tribunal = resolve_court_acronym(number)
+            if tribunal is None:
+                outcomes[number] = (None, LegalCaseNotFoundError(number))
+            else:
+                by_tribunal[tribunal].append(number)
+        if not by_tribunal:
+            return outcomes
+
+        fetched: Dict[str, Tuple[Optional[LegalCase], Optional[Exception]]] = {}
+        if self._max_workers == 1 or len(by_tribunal) == 1:
+            for tribunal, numbers in by_tribunal.items():
+                fetched.update(self._fetch_tribunal(tribunal, numbers))
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_workers, len(by_tribunal)),
+                thread_name_prefix="datajud-lookup",
+            ) as executor:
+                futures = [
+                    executor.submit(self._fetch_tribunal, tribunal, numbers)
+                    for tribunal, numbers in by_tribunal.items()
+                ]
+                for future in as_completed(futures):
+                    fetched.update(future.result())
+
+        # Persist on the calling thread, in a fixed order so concurrent calls
+        # take the per-number locks without deadlocking each other.
+        for number in sorted(fetched):
+            domain_case, error = fetched[number]
+            if error is not None:
+                outcomes[number] = (None, error)
+            elif domain_case is None:
+                outcomes[number] = (None, LegalCaseNotFoundError(number))
+            else:
+                outcomes[number] = self._store_fetched(number, domain_case)
+        return outcomes
+
+    @staticmethod
+    def _is_synced(case: PersistedLegalCase) -> bool:
+        return case.last_synced_at is not None
+
+    def _save_fetched(
+        self,
+        normalized: str,
+        existing: Optional[PersistedLegalCase],
+        domain_case: LegalCase,
+    ) -> PersistedLegalCase:
+        """Insert the fetched case, or fill in its unsynced placeholder.
+
+        Must run under the per-number lock.
+        """
+        movements = domain_case.movement_history or []
+        if existing is None:
+            return self._repository.insert_case_with_movements(
+                case_number=normalized, case=domain_case, movements=movements
+            )
+        self._repository.apply_case_updates(existing, domain_case, movements)
+        return self._repository.get_by_number(normalized) or existing
+
+    def _store_fetched(self, normalized: str, domain_case: LegalCase) -> _LookupOutcome:
+        try:
+            self._repository.lock_case_number(normalized)
+            existing = self._repository.get_by_number(normalized)
+            if existing and self._is_synced(existing):
+                return existing, None
+            return self._save_fetched(normalized, existing, domain_case), None
+        except LegalCasePersistenceError as error:
+            return None, error
+        except Exception as exc:  # pylint: disable=broad-except
+            return None, LegalCasePersistenceError(str(exc))
+
+    def _revalidate_if_stale(self, case: PersistedLegalCase) -> None:
+        if self._revalidator is None or self._revalidate_after is None:
+            return
+        last_synced_at = case.last_synced_at
+        if last_synced_at is not None:
+            if last_synced_at.tzinfo is None:
+                last_synced_at = last_synced_at.replace(tzinfo=timezone.utc)
+            if datetime.now(timezone.utc) - last_synced_at < self._revalidate_after:
+                return
+        try:
+            self._revalidator.schedule(case)
+        except Exception:  # pylint: disable=broad-except
+            # A failed refresh must never fail the read.
+            metrics.increment("legal_case_revalidation_errors")
+
+    def _fetch_and_insert(
+        self, normalized: str
+    ) -> Either[Exception, PersistedLegalCase]:
+        try:
+            self._repository.lock_case_number(normalized)
+        except Exception as exc:  # pylint: disable=broad-except
+            return Left(LegalCasePersistenceError(str(exc)))
+        # Another replica may have inserted or synced it while we waited.
+        existing = self._repository.get_by_number(normalized)
+        if existing and self._is_synced(existing):
             return Right(existing)
 
-        domain_case = self._find_use_case.execute(normalized)
+        try:
+            domain_case = self._find_use_case.execute(normalized)
+        except (ExternalRateLimitError, ExternalServiceUnavailableError) as error:
+            return Left(error)
         if domain_case is None:
             return Left(LegalCaseNotFoundError(normalized))
 
-        movements = domain_case.movement_history or []
         try:
-            persisted = self._repository.insert_case_with_movements(
-                case_number=normalized,
-                case=domain_case,
-                movements=movements,
-            )
-            return Right(persisted)
+            return Right(self._save_fetched(normalized, existing, domain_case))
         except LegalCasePersistenceError as error:
             return Left(error)
         except ExternalRateLimitError as error:
@@ -73,69 +312,281 @@ class GetLegalCaseByIdUseCase:
             return Left(LegalCasePersistenceError(str(exc)))
 
 
+class CaseFetchOutcome:
+    """Result of fetching one stale case from the external provider."""
+
+    def __init__(
+        self,
+        case: PersistedLegalCase,
+        tribunal: str,
+        domain_case: Optional[LegalCase] = None,
+        error: Optional[Exception] = None,
+        latency_seconds: float = 0.0,
+    ) -> None:
+        self.case = case
+        self.tribunal = tribunal
+        self.domain_case = domain_case
+        self.error = error
+        self.latency_seconds = latency_seconds
+
+
 class UpdateStaleLegalCasesUseCase:
-    """Synchronize stale legal cases with the external provider."""
+    """Synchronize stale legal cases with the external provider.
+
+    Stale cases are grouped by tribunal and looked up ``lookup_batch_size`` at
+    a time, one provider request per chunk. Chunks run on up to
+    ``max_workers`` threads, throttled by one token bucket per tribunal;
+    persistence stays on the calling thread so the repository session is
+    never shared.
+    """
 
     def __init__(
         self,
         repository: ILegalCaseRepository,
         find_use_case: FindLegalCaseUseCase,
         max_requests_per_minute: int = 60,
+        max_workers: int = 1,
+        lookup_batch_size: int = 50,
+        refresh_policy: Optional[RefreshPolicy] = None,
     ) -> None:
         self._repository = repository
         self._find_use_case = find_use_case
-        self._min_interval = 60.0 / max(1, max_requests_per_minute)
-        self._last_request_ts: float = 0.0
+        self._max_workers = max(1, max_workers)
+        self._lookup_batch_size = max(1, lookup_batch_size)
+        self._max_requests_per_minute = max(1, max_requests_per_minute)
+        self._buckets = TokenBucketRegistry(max_requests_per_minute)
+        self._refresh_policy = refresh_policy or RefreshPolicy()
 
     @staticmethod
     def _movement_signature(movement: Movement) -> Tuple[float, str]:
         return (movement.date.timestamp(), movement.description)
 
+    @staticmethod
+    def _clean_number(case: PersistedLegalCase) -> str:
+        return "".join(
+            filter(str.isdigit, case.case.case_number or case.numero_processo)
+        )
+
+    def _chunk_by_tribunal(
+        self, cases: List[PersistedLegalCase]
+    ) -> List[Tuple[Optional[str], List[PersistedLegalCase]]]:
+        grouped: Dict[Optional[str], List[PersistedLegalCase]] = defaultdict(list)
+        for case in cases:
+            grouped[resolve_court_acronym(self._clean_number(case))].append(case)
+        chunks: List[Tuple[Optional[str], List[PersistedLegalCase]]] = []
+        for tribunal, members in grouped.items():
+            size = self._lookup_batch_size if tribunal else len(members)
+            for start in range(0, len(members), size):
+                chunks.append((tribunal, members[start : start + size]))
+        return chunks
+
+    def _fetch_chunk(
+        self, tribunal: Optional[str], cases: List[PersistedLegalCase]
+    ) -> List[CaseFetchOutcome]:
+        if tribunal is None:
+            # Unmapped courts cannot be queried; report them as not found.
+            return [
+                CaseFetchOutcome(case=case, tribunal="desconhecido") for case in cases
+            ]
+
+        self._buckets.get(tribunal).acquire()
+        started = time.monotonic()
+        numbers = [self._clean_number(case) for case in cases]
+        try:
+            found = self._find_use_case.execute_batch(tribunal, numbers)
+            error = None
+        except (ExternalRateLimitError, ExternalServiceUnavailableError) as exc:
+            found = {}
+            error = exc
+        latency = time.monotonic() - started
+        return [
+            CaseFetchOutcome(
+                case=case,
+                tribunal=tribunal,
+                domain_case=found.get(number),
+                error=error,
+                latency_seconds=latency,
+            )
+            for case, number in zip(cases, numbers)
+        ]
+
+    def _fetch_all(
+        self, cases: List[PersistedLegalCase]
+    ) -> Iterator[List[CaseFetchOutcome]]:
+        chunks = self._chunk_by_tribunal(cases)
+        if self._max_workers == 1 or len(chunks) <= 1:
+            for tribunal, members in chunks:
+                yield self._fetch_chunk(tribunal, members)
+            return
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="datajud-sync"
+        ) as executor:
+            futures = [
+                executor.submit(self._fetch_chunk, tribunal, members)
+                for tribunal, members in chunks
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _iter_outcomes(
+        self,
+        cases: List[PersistedLegalCase],
+        latencies: Dict[str, List[float]],
+        case_counts: Dict[str, int],
+    ) -> Iterator[CaseFetchOutcome]:
+        for chunk in self._fetch_all(cases):
+            for outcome in chunk:
+                case_counts[outcome.tribunal] += 1
+            if chunk and chunk[0].tribunal != "desconhecido":
+                # One provider request per chunk.
+                latencies[chunk[0].tribunal].append(chunk[0].latency_seconds)
+            yield from chunk
+
+    @staticmethod
+    def _stale_before(stale_after_days: int) -> datetime:
+        return datetime.now(timezone.utc) - timedelta(days=stale_after_days)
+
     def execute(
         self,
         batch_size: int,
         stale_after_days: int = 3,
     ) -> Either[Exception, dict]:
-        stale_before = datetime.now(timezone.utc) - timedelta(days=stale_after_days)
         cases = self._repository.list_stale_cases(
-            limit=batch_size, stale_before=stale_before
+            limit=batch_size, stale_before=self._stale_before(stale_after_days)
+        )
+        return self.sync_cases(cases)
+
+    def plan_batch_size(
+        self,
+        tick_seconds: int,
+        max_batch_size: int,
+        budget_share: float = 0.5,
+        stale_after_days: int = 3,
+    ) -> int:
+        """Size one scheduler tick to work through the due cases in time.
+
+        Each tick takes its share of the backlog so that it is drained within
+        the policy's ``freshness_target``, capped by ``budget_share`` of the
+        external RPM over ``tick_seconds``; the rest of the budget is left for
+        interactive lookups. Also publishes the number of due cases as
+        ``legal_case_sync_backlog``.
+        """
+        backlog = self._repository.count_due_cases(
+            stale_before=self._stale_before(stale_after_days)
+        )
+        metrics.set_metric("legal_case_sync_backlog", backlog)
+        if backlog <= 0:
+            return 0
+        target_seconds = max(1.0, self._refresh_policy.freshness_target.total_seconds())
+        needed = math.ceil(backlog * tick_seconds / target_seconds)
+        requests = max(
+            1, int(self._max_requests_per_minute * tick_seconds / 60 * budget_share)
+        )
+        return min(backlog, needed, max_batch_size, requests * self._lookup_batch_size)
+
+    def claim_batch(
+        self,
+        batch_size: int,
+        owner: str,
+        lease_seconds: int,
+        stale_after_days: int = 3,
+    ) -> List[PersistedLegalCase]:
+        """Lease a slice of stale cases for this worker."""
+        cases = self._repository.claim_stale_cases(
+            limit=batch_size,
+            stale_before=self._stale_before(stale_after_days),
+            owner=owner,
+            lease_seconds=lease_seconds,
+        )
+        metrics.increment("legal_cases_claimed", len(cases))
+        return cases
+
+    def claim_cases(
+        self,
+        case_ids: List[str],
+        owner: str,
+        lease_seconds: int,
+        previous_owner: Optional[str] = None,
+    ) -> List[PersistedLegalCase]:
+        """Lease specific cases, e.g. those an interrupted run left pending."""
+        cases = self._repository.claim_cases(
+            case_ids, owner, lease_seconds, previous_owner=previous_owner
         )
+        metrics.increment("legal_cases_claimed", len(cases))
+        return cases
+
+    def renew_batch(self, case_ids: List[str], owner: str, lease_seconds: int) -> int:
+        return self._repository.renew_claims(case_ids, owner, lease_seconds)
+
+    def release_batch(self, cases: List[PersistedLegalCase], owner: str) -> None:
+        self._repository.release_claims([case.case_id for case in cases], owner)
+
+    def sync_cases(
+        self,
+        cases: List[PersistedLegalCase],
+        on_case_done: Optional[Callable[[PersistedLegalCase, str], None]] = None,
+    ) -> Either[Exception, dict]:
+        """Sync the given cases with the provider.
 
+        ``on_case_done`` is called after each case with ``"updated"``,
+        ``"skipped"``, ``"error"`` (provider failure) or ``"failed"``
+        (persistence failure, the transaction must be rolled back) so callers
+        can commit per case and record progress.
+        """
         updated = 0
         skipped = 0
         new_movements_count = 0
         field_changes_count = 0
         errors: List[str] = []
+        latencies: Dict[str, List[float]] = defaultdict(list)
+        case_counts: Dict[str, int] = defaultdict(int)
+        started = time.monotonic()
 
-        for case in cases:
-            self._respect_rate_limit()
-            clean_number = "".join(
-                filter(str.isdigit, case.case.case_number or case.numero_processo)
-            )
-            domain_case = self._find_use_case.execute(clean_number)
-            if domain_case is None:
+        for outcome in self._iter_outcomes(cases, latencies, case_counts):
+            case = outcome.case
+            if outcome.error is not None:
+                errors.append(f"{self._clean_number(case)}: {outcome.error}")
+                result = self._reschedule(
+                    case, self._refresh_policy.error_retry_at(), "error", errors
+                )
+            elif outcome.domain_case is None:
                 skipped += 1
-                continue
-
-            existing_signatures = {
-                self._movement_signature(movement)
-                for movement in (case.case.movement_history or [])
-            }
-            incoming_movements = domain_case.movement_history or []
-            new_movements = [
-                movement
-                for movement in incoming_movements
-                if self._movement_signature(movement) not in existing_signatures
-            ]
-            field_changes_count += self._count_field_changes(case.case, domain_case)
-
-            try:
-                self._repository.apply_case_updates(case, domain_case, new_movements)
-                updated += 1
-                new_movements_count += len(new_movements)
-            except Exception as exc:  # pylint: disable=broad-except
-                errors.append(str(exc))
+                result = self._reschedule(
+                    case, self._refresh_policy.not_found_retry_at(), "skipped", errors
+                )
+            else:
+                # Provider dates may be naive (``dataHora`` without an offset,
+                # the ``datetime.min`` fallback); the watermark is aware.
+                incoming_movements = [
+                    Movement(as_utc(movement.date), movement.description)
+                    for movement in outcome.domain_case.movement_history or []
+                ]
+                domain_case = replace(
+                    outcome.domain_case, movement_history=incoming_movements
+                )
+                try:
+                    new_movements = self._detect_new_movements(case, incoming_movements)
+                    self._repository.apply_case_updates(
+                        case,
+                        domain_case,
+                        new_movements,
+                        next_sync_at=self._refresh_policy.next_sync_at(
+                            incoming_movements, case.prioridade
+                        ),
+                    )
+                    updated += 1
+                    new_movements_count += len(new_movements)
+                    field_changes_count += self._count_field_changes(
+                        case.case, domain_case
+                    )
+                    result = "updated"
+                except Exception as exc:  # pylint: disable=broad-except
+                    errors.append(str(exc))
+                    result = "failed"
+            if on_case_done is not None:
+                on_case_done(case, result)
 
+        elapsed = time.monotonic() - started
         summary = {
             "total_candidates": len(cases),
             "updated": updated,
@@ -143,6 +594,8 @@ class UpdateStaleLegalCasesUseCase:
             "new_movements": new_movements_count,
             "field_changes": field_changes_count,
             "errors": errors,
+            "elapsed_seconds": round(elapsed, 3),
+            "by_tribunal": self._tribunal_stats(latencies, case_counts, elapsed),
         }
         metrics.increment("legal_cases_checked", len(cases))
         metrics.increment("legal_cases_updated", updated)
@@ -150,26 +603,73 @@ class UpdateStaleLegalCasesUseCase:
         metrics.increment("legal_case_update_errors", len(errors))
         return Right(summary)
 
-    def _respect_rate_limit(self) -> None:
-        now = time.monotonic()
-        elapsed = now - self._last_request_ts
-        if self._last_request_ts and elapsed < self._min_interval:
-            time.sleep(self._min_interval - elapsed)
-        self._last_request_ts = time.monotonic()
+    def _reschedule(
+        self,
+        case: PersistedLegalCase,
+        next_sync_at: datetime,
+        result: str,
+        errors: List[str],
+    ) -> str:
+        try:
+            self._repository.reschedule(case.case_id, next_sync_at)
+            return result
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(str(exc))
+            return "failed"
+
+    def _detect_new_movements(
+        self, case: PersistedLegalCase, incoming: List[Movement]
+    ) -> List[Movement]:
+        """Return incoming movements not yet stored, without loading history.
+
+        A matching digest means nothing changed. Otherwise only movements at
+        or after the watermark are candidates, and just the stored rows at
+        that boundary are read to tell them apart.
+        """
+        if case.movement_digest == movement_history_digest(incoming):
+            return []
+        watermark = case.movement_watermark
+        if watermark is None:
+            return list(incoming)
+
+        candidates = [movement for movement in incoming if movement.date >= watermark]
+        boundary = {
+            self._movement_signature(movement)
+            for movement in self._repository.list_movements_since(
+                case.case_id, watermark
+            )
+        }
+        new_movements = [
+            movement
+            for movement in candidates
+            if self._movement_signature(movement) not in boundary
+        ]
+        if not new_movements and case.movement_digest is not None:
+            # Provider history changed below the watermark; nothing to append.
+            metrics.increment("legal_case_history_divergences")
+        return new_movements
+
+    @staticmethod
+    def _tribunal_stats(
+        latencies: Dict[str, List[float]],
+        case_counts: Dict[str, int],
+        elapsed_seconds: float,
+    ) -> Dict[str, Dict[str, float]]:
+        stats: Dict[str, Dict[str, float]] = {}
+        for tribunal, values in sorted(latencies.items()):
+            stats[tribunal] = {
+                "requests": len(values),
+                "cases": case_counts.get(tribunal, 0),
+                "avg_latency_ms": round(sum(values) / len(values) * 1000, 1),
+                "max_latency_ms": round(max(values) * 1000, 1),
+                "throughput_rpm": (
+                    round(len(values) / elapsed_seconds * 60, 2)
+                    if elapsed_seconds > 0
+                    else 0.0
+                ),
+            }
+        return stats
 
     @staticmethod
     def _count_field_changes(existing: LegalCase, updated: LegalCase) -> int:
-        fields = [
-            "court",
-            "judging_body",
-            "procedural_class",
-            "subject",
-            "status",
-            "filing_date",
-            "latest_update",
-        ]
-        return sum(
-            1
-            for field in fields
-            if getattr(existing, field, None) != getattr(updated, field, None)
-        )
+        return len(changed_fields(existing, updated))
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from src.domain.core import metrics
+from src.domain.core.either import Either, Left, Right
+from src.domain.core.errors import (
+    InvalidInputError,
+    LegalCaseImportNotFoundError,
+    LegalCasePersistenceError,
+)
+from src.domain.entities.case import PATTERN, has_valid_cnj_check_digits
+from src.domain.repositories.legal_case_import_repository import (
+    ILegalCaseImportRepository,
+    InvalidImportEntry,
+    LegalCaseImportProgress,
+)
+from src.domain.usecases.find_legal_case_use_case import resolve_court_acronym
+
+IMPORT_FORMATS = ("csv", "json")
+MAX_IMPORT_BYTES = 1024 * 1024
+MAX_IMPORT_NUMBERS = 10000
+# Invalid entries kept in the import record; the rest are only counted.
+MAX_REPORTED_INVALID = 100
+# Header names recognised as the CNJ column of a CSV.
+CSV_NUMBER_COLUMNS = ("numero_processo", "numero", "processo", "cnj")
+
+
+def _detect_format(
+    filename: Optional[str], content_type: Optional[str]
+) -> Optional[str]:
+    extension = (filename or "").rsplit(".", 1)[-1].lower()
+    if extension in IMPORT_FORMATS:
+        return extension
+    content_type = (content_type or "").lower()
+    if "json" in content_type:
+        return "json"
+    if "csv" in content_type or content_type.startswith("text/plain"):
+        return "csv"
+    return None
+
+
+def _parse_json(text: str) -> List[Tuple[int, object]]:
+    data = json.loads(text)
+    if isinstance(data, dict):
+        data = data.get("numeros")
+    if not isinstance(data, list):
+        raise ValueError("JSON deve ser uma lista de números ou {'numeros': [...]}.")
+    return [(position, value) for position, value in enumerate(data, start=1)]
+
+
+def _parse_csv(text: str) -> List[Tuple[int, object]]:
+    try:
+        dialect = csv.Sniffer().sniff(text[:4096], delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    reader = csv.reader(io.StringIO(text), dialect)
+    column = 0
+    entries: List[Tuple[int, object]] = []
+    for row in reader:
+        if not row or not any(cell.strip() for cell in row):
+            continue
+        if reader.line_num == 1:
+            names = [cell.strip().lower() for cell in row]
+            header = next((n for n in CSV_NUMBER_COLUMNS if n in names), None)
+            if header is not None:
+                column = names.index(header)
+                continue
+            if not any(char.isdigit() for char in row[0]):
+                continue
+        entries.append((reader.line_num, row[column] if column < len(row) else ""))
+    return entries
+
+
+def _normalize(value: object) -> Tuple[Optional[str], Optional[str]]:
+    """Return ``(20-digit number, None)`` or ``(None, rejection reason)``."""
+    if not isinstance(value, str):
+        return None, "valor deve ser texto"
+    candidate = value.strip()
+    if PATTERN.match(candidate):
+        candidate = "".join(filter(str.isdigit, candidate))
+    if not (candidate.isdigit() and len(candidate) == 20):
+        return None, "formato inválido"
+    if not has_valid_cnj_check_digits(candidate):
+        return None, "dígito verificador inválido"
+    if resolve_court_acronym(candidate) is None:
+        return None, "tribunal não suportado"
+    return candidate, None
+
+
+class ImportLegalCasesUseCase:
+    """Queue many CNJ numbers at once for a background fetch.
+
+    Every number is validated locally (format, mod-97 check digits, mapped
+    court) and deduplicated against the file and ``legal_cases``. New ones
+    become placeholders that the sync cron fetches within its DataJud budget.
+    """
+
+    def __init__(self, repository: ILegalCaseImportRepository) -> None:
+        self._repository = repository
+
+    def execute(
+        self,
+        content: bytes,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        created_by: Optional[str] = None,
+    ) -> Either[Exception, LegalCaseImportProgress]:
+        source_format = _detect_format(filename, content_type)
+        if source_format is None:
+            return Left(
+                InvalidInputError(
+                    "Formato não suportado. Envie um arquivo CSV ou JSON."
+                )
+            )
+        if len(content) > MAX_IMPORT_BYTES:
+            return Left(
+                InvalidInputError(
+                    f"Arquivo excede o limite de {MAX_IMPORT_BYTES // 1024} KiB."
+                )
+            )
+        try:
+            text = content.decode("utf-8-sig")
+            entries = _parse_json(text) if source_format == "json" else _parse_csv(text)
+        except (UnicodeDecodeError, ValueError, csv.Error) as exc:
+            return Left(InvalidInputError(f"Arquivo inválido: {exc}"))
+        if not entries:
+            return Left(
+                InvalidInputError("Nenhum número de processo encontrado no arquivo.")
+            )
+        if len(entries) > MAX_IMPORT_NUMBERS:
+            return Left(
+                InvalidInputError(
+                    f"Envie no máximo {MAX_IMPORT_NUMBERS} números por importação."
+                )
+            )
+
+        invalid: List[InvalidImportEntry] = []
+        invalid_count = 0
+        duplicate_count = 0
+        courts: Dict[str, str] = {}
+        for line, value in entries:
+            number, reason = _normalize(value)
+            if number is None:
+                invalid_count += 1
+                if len(invalid) < MAX_REPORTED_INVALID:
+                    invalid.append(InvalidImportEntry(line, str(value), reason))
+            elif number in courts:
+                duplicate_count += 1
+            else:
+                courts[number] = resolve_court_acronym(number)
+
+        try:
+            existing = self._repository.find_existing_numbers(list(courts))
+            progress = self._repository.create_import(
+                created_by=created_by,
+                source_format=source_format,
+                total_received=len(entries),
+                invalid_entries=invalid,
+                invalid_count=invalid_count,
+                duplicate_count=duplicate_count,
+                already_tracked_count=len(existing),
+                queued=[
+                    (number, court)
+                    for number, court in courts.items()
+                    if number not in existing
+                ],
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            return Left(LegalCasePersistenceError(str(exc)))
+        metrics.increment("legal_case_imports")
+        metrics.increment("legal_case_import_queued", progress.queued_count)
+        return Right(progress)
+
+
+class GetLegalCaseImportUseCase:
+    """Progress of a bulk import."""
+
+    def __init__(self, repository: ILegalCaseImportRepository) -> None:
+        self._repository = repository
+
+    def execute(self, import_id: str) -> Either[Exception, LegalCaseImportProgress]:
+        try:
+            UUID(import_id)
+        except ValueError:
+            return Left(InvalidInputError("Identificador de importação inválido."))
+        progress = self._repository.get_import(import_id)
+        if progress is None:
+            return Left(LegalCaseImportNotFoundError(import_id))
+        return Right(progress)
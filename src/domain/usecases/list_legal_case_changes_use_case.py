@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import base64
+import binascii
+from typing import Optional
+
+from src.domain.core.either import Either, Left, Right
+from src.domain.core.errors import InvalidInputError
+from src.domain.repositories.legal_case_change_repository import (
+    ChangeCursor,
+    ChangeEventPage,
+    ILegalCaseChangeRepository,
+)
+
+DEFAULT_CHANGES_PAGE_SIZE = 100
+MAX_CHANGES_PAGE_SIZE = 500
+
+
+def encode_change_cursor(cursor: ChangeCursor) -> str:
+    """Serialize a feed position into an opaque, URL-safe token."""
+    raw = f"{cursor.txid}:{cursor.event_id}"
+    return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")
+
+
+def decode_change_cursor(token: str) -> ChangeCursor:
+    """Inverse of :func:`encode_change_cursor`; raises ``ValueError``."""
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii")
+        txid, event_id = raw.split(":", 1)
+        return ChangeCursor(int(txid), int(event_id))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError(token) from exc
+
+
+class ListLegalCaseChangesUseCase:
+    """Cursor-based feed of the changes applied to persisted cases."""
+
+    def __init__(self, repository: ILegalCaseChangeRepository) -> None:
+        self._repository = repository
+
+    def execute(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_CHANGES_PAGE_SIZE,
+        case_number: Optional[str] = None,
+    ) -> Either[InvalidInputError, ChangeEventPage]:
+        if not 1 <= limit <= MAX_CHANGES_PAGE_SIZE:
+            return Left(
+                InvalidInputError(
+                    f"Limite deve estar entre 1 e {MAX_CHANGES_PAGE_SIZE}."
+                )
+            )
+        numero_processo = None
+        if case_number:
+            numero_processo = case_number.strip()
+            if not numero_processo.isdigit() or len(numero_processo) != 20:
+                return Left(
+                    InvalidInputError(
+                        "Identificador do processo deve conter 20 dígitos."
+                    )
+                )
+        after = None
+        if cursor:
+            try:
+                after = decode_change_cursor(cursor)
+            except ValueError:
+                return Left(InvalidInputError("Cursor de paginação inválido."))
+
+        return Right(self._repository.list_changes(limit, after, numero_processo))
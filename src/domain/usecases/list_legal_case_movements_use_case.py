@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from src.domain.core.either import Either, Left, Right
+from src.domain.core.errors import InvalidInputError, LegalCaseNotFoundError
+from src.domain.repositories.legal_case_repository import (
+    ILegalCaseRepository,
+    MovementCursor,
+    MovementPage,
+)
+
+DEFAULT_MOVEMENTS_PAGE_SIZE = 50
+MAX_MOVEMENTS_PAGE_SIZE = 200
+
+
+def encode_movement_cursor(cursor: MovementCursor) -> str:
+    """Serialize a keyset position into an opaque, URL-safe token."""
+    raw = f"{cursor.movement_date.isoformat()}|{cursor.movement_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_movement_cursor(token: str) -> MovementCursor:
+    """Inverse of :func:`encode_movement_cursor`; raises ``ValueError``."""
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        movement_date, movement_id = raw.split("|", 1)
+        return MovementCursor(
+            datetime.fromisoformat(movement_date), str(UUID(movement_id))
+        )
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError(token) from exc
+
+
+class ListLegalCaseMovementsUseCase:
+    """Page through the stored movement history of a case, newest first."""
+
+    def __init__(self, repository: ILegalCaseRepository) -> None:
+        self._repository = repository
+
+    def execute(
+        self,
+        case_number: str,
+        limit: int = DEFAULT_MOVEMENTS_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Either[Exception, MovementPage]:
+        normalized = case_number.strip()
+        if not normalized.isdigit() or len(normalized) != 20:
+            return Left(
+                InvalidInputError("Identificador do processo deve conter 20 dígitos.")
+            )
+        if not 1 <= limit <= MAX_MOVEMENTS_PAGE_SIZE:
+            return Left(
+                InvalidInputError(
+                    f"Limite deve estar entre 1 e {MAX_MOVEMENTS_PAGE_SIZE}."
+                )
+            )
+        before = None
+        if cursor:
+            try:
+                before = decode_movement_cursor(cursor)
+            except ValueError:
+                return Left(InvalidInputError("Cursor de paginação inválido."))
+
+        case_id = self._repository.get_case_id(normalized)
+        if case_id is None:
+            return Left(LegalCaseNotFoundError(normalized))
+        return Right(self._repository.list_movements_page(case_id, limit, before))
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from src.domain.core.either import Either, Left, Right
+from src.domain.core.errors import InvalidInputError
+from src.domain.repositories.legal_case_repository import (
+    CASE_LIST_SORT_FIELDS,
+    DEFAULT_CASE_LIST_SORT_FIELD,
+    CaseListCursor,
+    ILegalCaseRepository,
+    LegalCaseListPage,
+    ProcessDashboardFilters,
+)
+from src.domain.usecases.build_process_dashboard_use_case import parse_filter_date
+
+DEFAULT_CASE_LIST_PAGE_SIZE = 50
+MAX_CASE_LIST_PAGE_SIZE = 200
+SORT_DIRECTIONS = ("asc", "desc")
+_DATETIME_SORT_FIELDS = frozenset(
+    {"created_at", "ultima_movimentacao", "data_ajuizamento"}
+)
+
+
+def encode_case_list_cursor(
+    cursor: CaseListCursor, sort_field: str, sort_direction: str
+) -> str:
+    """Opaque token bound to the ordering it was issued for."""
+    value = cursor.sort_value
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps(
+        {"f": sort_field, "d": sort_direction, "v": value, "id": cursor.case_id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_case_list_cursor(
+    token: str, sort_field: str, sort_direction: str
+) -> CaseListCursor:
+    """Inverse of :func:`encode_case_list_cursor`; raises ``ValueError``."""
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if data["f"] != sort_field or data["d"] != sort_direction:
+            raise ValueError(token)
+        value = data["v"]
+        if value is not None and sort_field in _DATETIME_SORT_FIELDS:
+            value = datetime.fromisoformat(value)
+        elif value is not None and sort_field == "movimentacoes":
+            value = int(value)
+        elif value is not None:
+            value = str(value)
+        return CaseListCursor(value, str(UUID(data["id"])))
+    except (binascii.Error, UnicodeError, KeyError, TypeError, ValueError) as exc:
+        raise ValueError(token) from exc
+
+
+class ListLegalCasesUseCase:
+    """Browse persisted cases with the dashboard filters and keyset pages."""
+
+    def __init__(self, repository: ILegalCaseRepository) -> None:
+        self._repository = repository
+
+    def execute(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        status: Optional[list[str]] = None,
+        priority: Optional[list[str]] = None,
+        tribunal: Optional[list[str]] = None,
+        sort_field: Optional[str] = None,
+        sort_direction: str = "desc",
+        limit: int = DEFAULT_CASE_LIST_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Either[InvalidInputError, LegalCaseListPage]:
+        sort_field = sort_field or DEFAULT_CASE_LIST_SORT_FIELD
+        if sort_field not in CASE_LIST_SORT_FIELDS:
+            return Left(
+                InvalidInputError(
+                    "Campo de ordenação inválido. Use: "
+                    + ", ".join(CASE_LIST_SORT_FIELDS)
+                    + "."
+                )
+            )
+        if sort_direction not in SORT_DIRECTIONS:
+            return Left(InvalidInputError("Direção de ordenação deve ser asc ou desc."))
+        if not 1 <= limit <= MAX_CASE_LIST_PAGE_SIZE:
+            return Left(
+                InvalidInputError(
+                    f"Limite deve estar entre 1 e {MAX_CASE_LIST_PAGE_SIZE}."
+                )
+            )
+        try:
+            filters = ProcessDashboardFilters(
+                date_from=parse_filter_date(date_from),
+                date_to=parse_filter_date(date_to),
+                status=status,
+                priority=priority,
+                tribunal=tribunal,
+                sort_field=sort_field,
+                sort_direction=sort_direction,
+            )
+        except InvalidInputError as error:
+            return Left(error)
+        after = None
+        if cursor:
+            try:
+                after = decode_case_list_cursor(cursor, sort_field, sort_direction)
+            except ValueError:
+                return Left(InvalidInputError("Cursor de paginação inválido."))
+
+        return Right(self._repository.list_cases(filters, limit, after))
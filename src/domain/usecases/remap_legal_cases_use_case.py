@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+import time
+
+from src.domain.core import metrics
+from src.domain.core.either import Either, Left, Right
+from src.domain.core.logger import get_logger
+from src.domain.entities.case import LegalCase
+from src.domain.repositories.legal_case_raw_archive_repository import (
+    ILegalCaseRawArchive,
+)
+from src.domain.repositories.legal_case_repository import ILegalCaseRepository
+
+DEFAULT_REMAP_BATCH_SIZE = 200
+DEFAULT_REMAP_WORKERS = 4
+# Errors kept in the summary; the rest are only counted.
+MAX_REPORTED_ERRORS = 50
+
+logger = get_logger(__name__)
+
+
+class RemapLegalCasesUseCase:
+    """Rebuild stored cases from archived provider payloads, offline.
+
+    Payloads are re-mapped with the current mapper and written through
+    ``ILegalCaseRepository.rebuild_case``; the provider is never called.
+    Batches run in parallel, each case in its own transaction so one bad
+    payload does not roll back its neighbours.
+    """
+
+    def __init__(
+        self,
+        archive: ILegalCaseRawArchive,
+        mapper: Callable[[Dict[str, Any]], LegalCase],
+        repository_scope: Callable[[], AbstractContextManager[ILegalCaseRepository]],
+        max_workers: int = DEFAULT_REMAP_WORKERS,
+        batch_size: int = DEFAULT_REMAP_BATCH_SIZE,
+    ) -> None:
+        self._archive = archive
+        self._mapper = mapper
+        self._repository_scope = repository_scope
+        self._max_workers = max(1, max_workers)
+        self._batch_size = max(1, batch_size)
+
+    def _batches(self, case_numbers: Optional[List[str]]) -> Iterator[List[str]]:
+        if case_numbers is not None:
+            for start in range(0, len(case_numbers), self._batch_size):
+                yield case_numbers[start : start + self._batch_size]
+            return
+        after = None
+        while True:
+            batch = self._archive.list_case_numbers(self._batch_size, after=after)
+            if not batch:
+                return
+            yield batch
+            after = batch[-1]
+
+    def _remap_batch(self, numbers: List[str]) -> Tuple[int, int, List[str]]:
+        sources = self._archive.load(numbers)
+        remapped = 0
+        errors: List[str] = []
+        for archived in sources:
+            try:
+                case = self._mapper(archived.source)
+                with self._repository_scope() as repository:
+                    repository.rebuild_case(archived.numero_processo, case)
+                remapped += 1
+            except Exception as exc:  # pylint: disable=broad-except
+                errors.append(f"{archived.numero_processo}: {exc}")
+        return remapped, len(numbers) - len(sources), errors
+
+    def _run(
+        self, batches: Iterator[List[str]]
+    ) -> Iterator[Tuple[int, int, List[str]]]:
+        if self._max_workers == 1:
+            for batch in batches:
+                yield self._remap_batch(batch)
+            return
+        # Keep a bounded window of batches in flight so the archive is paged
+        # lazily instead of being loaded up front.
+        window = self._max_workers * 2
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="legal-case-remap"
+        ) as executor:
+            pending: Set[Future] = set()
+            for batch in batches:
+                pending.add(executor.submit(self._remap_batch, batch))
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in pending:
+                yield future.result()
+
+    def execute(
+        self, case_numbers: Optional[List[str]] = None
+    ) -> Either[Exception, dict]:
+        """Re-map ``case_numbers``, or every archived case when ``None``."""
+        started = time.monotonic()
+        remapped = 0
+        missing = 0
+        failed = 0
+        errors: List[str] = []
+        try:
+            for batch_remapped, batch_missing, batch_errors in self._run(
+                self._batches(case_numbers)
+            ):
+                remapped += batch_remapped
+                missing += batch_missing
+                failed += len(batch_errors)
+                errors.extend(batch_errors[: MAX_REPORTED_ERRORS - len(errors)])
+                logger.info("Re-mapeamento: %s processos reconstruídos.", remapped)
+        except Exception as exc:  # pylint: disable=broad-except
+            return Left(exc)
+
+        metrics.increment("legal_cases_remapped", remapped)
+        metrics.increment("legal_case_remap_errors", failed)
+        return Right(
+            {
+                "remapped": remapped,
+                "missing": missing,
+                "failed": failed,
+                "errors": errors,
+                "elapsed_seconds": round(time.monotonic() - started, 3),
+            }
+        )
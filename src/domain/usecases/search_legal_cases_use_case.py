@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import List
+
+from src.domain.core.either import Either, Left, Right
+from src.domain.core.errors import InvalidInputError
+from src.domain.repositories.legal_case_repository import (
+    ILegalCaseRepository,
+    LegalCaseSearchHit,
+)
+
+DEFAULT_SEARCH_PAGE_SIZE = 20
+MAX_SEARCH_PAGE_SIZE = 100
+# Deep pages get slower and are rarely useful; refining the terms is cheaper.
+MAX_SEARCH_RESULTS = 1000
+MIN_QUERY_LENGTH = 2
+MAX_QUERY_LENGTH = 200
+
+
+class LegalCaseSearchPage:
+    """One page of ranked search hits."""
+
+    def __init__(
+        self,
+        hits: List[LegalCaseSearchHit],
+        page: int,
+        page_size: int,
+        has_more: bool,
+    ) -> None:
+        self.hits = hits
+        self.page = page
+        self.page_size = page_size
+        self.has_more = has_more
+
+
+class SearchLegalCasesUseCase:
+    """Full-text search over persisted cases and their movement history."""
+
+    def __init__(self, repository: ILegalCaseRepository) -> None:
+        self._repository = repository
+
+    def execute(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = DEFAULT_SEARCH_PAGE_SIZE,
+    ) -> Either[InvalidInputError, LegalCaseSearchPage]:
+        terms = (query or "").strip()
+        if not MIN_QUERY_LENGTH <= len(terms) <= MAX_QUERY_LENGTH:
+            return Left(
+                InvalidInputError(
+                    f"Termo de busca deve ter entre {MIN_QUERY_LENGTH} e "
+                    f"{MAX_QUERY_LENGTH} caracteres."
+                )
+            )
+        if not 1 <= page_size <= MAX_SEARCH_PAGE_SIZE:
+            return Left(
+                InvalidInputError(
+                    f"Tamanho da página deve estar entre 1 e {MAX_SEARCH_PAGE_SIZE}."
+                )
+            )
+        offset = (page - 1) * page_size
+        if page < 1 or offset + page_size > MAX_SEARCH_RESULTS:
+            return Left(
+                InvalidInputError(
+                    f"Apenas os {MAX_SEARCH_RESULTS} primeiros resultados podem "
+                    "ser paginados; refine a busca."
+                )
+            )
+
+        # One extra hit tells whether a next page exists without a count(*).
+        hits = self._repository.search_cases(terms, page_size + 1, offset)
+        return Right(
+            LegalCaseSearchPage(
+                hits=hits[:page_size],
+                page=page,
+                page_size=page_size,
+                has_more=len(hits) > page_size,
+            )
+        )
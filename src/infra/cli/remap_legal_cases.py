@@ -0,0 +1,46 @@
+"""Reconstrói processos e movimentações a partir do arquivo bruto do DataJud.
+
+Uso: ``python -m src.infra.cli.remap_legal_cases [--workers 4] [--batch-size 200]
+[NUMERO ...]``. Sem números, re-mapeia todo o arquivo. Não consulta o DataJud.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from src.domain.core.logger import get_logger
+from src.domain.usecases.remap_legal_cases_use_case import (
+    DEFAULT_REMAP_BATCH_SIZE,
+    DEFAULT_REMAP_WORKERS,
+)
+from src.infra.factories.legal_case_factories import (
+    create_remap_legal_cases_use_case,
+)
+
+logger = get_logger(__name__)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("numbers", nargs="*", help="Números CNJ (20 dígitos)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_REMAP_WORKERS)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_REMAP_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    use_case = create_remap_legal_cases_use_case(
+        max_workers=args.workers, batch_size=args.batch_size
+    )
+    numbers = ["".join(filter(str.isdigit, number)) for number in args.numbers]
+    result = use_case.execute(numbers or None)
+    if result.is_left():
+        logger.error("Falha no re-mapeamento: %s", result.get_left())
+        return 1
+    summary = result.get_right()
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
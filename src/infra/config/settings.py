@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from functools import lru_cache
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -11,6 +12,9 @@ from dotenv import load_dotenv
 class AWSSettings:
     region: str
     bucket: str
+    endpoint_url: Optional[str] = None
+    presigned_url_ttl_seconds: int = 900
+    download_url_ttl_seconds: int = 120
 
 
 @dataclass(frozen=True)
@@ -18,6 +22,44 @@ class SchedulerSettings:
     timezone: str
     batch_size: int
     external_rpm: int
+    sync_max_workers: int = 1
+    lookup_batch_size: int = 50
+    sync_lease_seconds: int = 300
+    sync_heartbeat_seconds: int = 60
+    sync_tick_seconds: int = 300
+    sync_budget_share: float = 0.5
+    sync_freshness_target_hours: int = 72
+    revalidate_after_seconds: int = 86400
+    revalidate_rpm: int = 10
+    lookup_burst: int = 5
+    lookup_max_workers: int = 4
+    movement_partition_years_ahead: int = 2
+    import_not_found_max_attempts: int = 8
+    import_not_found_max_age_days: int = 30
+    replica_count: int = 1
+
+
+@dataclass(frozen=True)
+class DataJudCacheSettings:
+    positive_ttl_seconds: int
+    negative_ttl_seconds: int
+    max_entries: int
+    postgres_tier: bool = False
+
+
+@dataclass(frozen=True)
+class DataJudArchiveSettings:
+    enabled: bool = True
+    compression_level: int = 3
+
+
+@dataclass(frozen=True)
+class ChangeFeedSettings:
+    webhook_url: Optional[str] = None
+    webhook_secret: Optional[str] = None
+    dispatch_interval_seconds: int = 30
+    dispatch_batch_size: int = 100
+    retention_days: int = 7
 
 
 @lru_cache(maxsize=1)
@@ -29,7 +71,16 @@ def get_aws_settings() -> AWSSettings:
         raise RuntimeError(
             "S3_BUCKET environment variable is required for document storage."
         )
-    return AWSSettings(region=region, bucket=bucket)
+    endpoint_url = os.getenv("S3_ENDPOINT_URL") or None
+    presigned_url_ttl_seconds = int(os.getenv("S3_PRESIGNED_URL_TTL", "900"))
+    download_url_ttl_seconds = int(os.getenv("S3_DOWNLOAD_URL_TTL", "120"))
+    return AWSSettings(
+        region=region,
+        bucket=bucket,
+        endpoint_url=endpoint_url,
+        presigned_url_ttl_seconds=presigned_url_ttl_seconds,
+        download_url_ttl_seconds=download_url_ttl_seconds,
+    )
 
 
 @lru_cache(maxsize=1)
@@ -38,6 +89,78 @@ def get_scheduler_settings() -> SchedulerSettings:
     timezone = os.getenv("SCHED_TIMEZONE", "America/Sao_Paulo")
     batch_size = int(os.getenv("CRON_BATCH_SIZE", "20"))
     external_rpm = int(os.getenv("EXTERNAL_RPM", "60"))
+    sync_max_workers = int(os.getenv("SYNC_MAX_WORKERS", "4"))
+    lookup_batch_size = int(os.getenv("DATAJUD_BATCH_SIZE", "50"))
+    sync_lease_seconds = int(os.getenv("SYNC_LEASE_SECONDS", "300"))
+    sync_heartbeat_seconds = int(os.getenv("SYNC_HEARTBEAT_SECONDS", "60"))
+    sync_tick_seconds = int(os.getenv("SYNC_TICK_SECONDS", "300"))
+    sync_budget_share = float(os.getenv("SYNC_BUDGET_SHARE", "0.5"))
+    sync_freshness_target_hours = int(os.getenv("SYNC_FRESHNESS_TARGET_HOURS", "72"))
+    revalidate_after_seconds = int(os.getenv("CASE_REVALIDATE_AFTER_SECONDS", "86400"))
+    revalidate_rpm = int(os.getenv("CASE_REVALIDATE_RPM", "10"))
+    lookup_burst = int(os.getenv("CASE_LOOKUP_BURST", "5"))
+    lookup_max_workers = int(os.getenv("CASE_LOOKUP_MAX_WORKERS", "4"))
+    movement_partition_years_ahead = int(
+        os.getenv("MOVEMENT_PARTITION_YEARS_AHEAD", "2")
+    )
+    import_not_found_max_attempts = int(os.getenv("IMPORT_NOT_FOUND_MAX_ATTEMPTS", "8"))
+    import_not_found_max_age_days = int(
+        os.getenv("IMPORT_NOT_FOUND_MAX_AGE_DAYS", "30")
+    )
+    replica_count = int(os.getenv("REPLICA_COUNT", "1"))
     return SchedulerSettings(
-        timezone=timezone, batch_size=batch_size, external_rpm=external_rpm
+        timezone=timezone,
+        batch_size=batch_size,
+        external_rpm=external_rpm,
+        sync_max_workers=sync_max_workers,
+        lookup_batch_size=lookup_batch_size,
+        sync_lease_seconds=sync_lease_seconds,
+        sync_heartbeat_seconds=sync_heartbeat_seconds,
+        sync_tick_seconds=sync_tick_seconds,
+        sync_budget_share=sync_budget_share,
+        sync_freshness_target_hours=sync_freshness_target_hours,
+        revalidate_after_seconds=revalidate_after_seconds,
+        revalidate_rpm=revalidate_rpm,
+        lookup_burst=lookup_burst,
+        lookup_max_workers=lookup_max_workers,
+        movement_partition_years_ahead=movement_partition_years_ahead,
+        import_not_found_max_attempts=import_not_found_max_attempts,
+        import_not_found_max_age_days=import_not_found_max_age_days,
+        replica_count=replica_count,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_datajud_cache_settings() -> DataJudCacheSettings:
+    load_dotenv()
+    return DataJudCacheSettings(
+        positive_ttl_seconds=int(os.getenv("DATAJUD_CACHE_TTL", "600")),
+        negative_ttl_seconds=int(os.getenv("DATAJUD_CACHE_NEGATIVE_TTL", "3600")),
+        max_entries=int(os.getenv("DATAJUD_CACHE_MAX_ENTRIES", "2048")),
+        postgres_tier=os.getenv("DATAJUD_CACHE_POSTGRES", "false").lower()
+        in ("1", "true", "yes"),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_datajud_archive_settings() -> DataJudArchiveSettings:
+    load_dotenv()
+    return DataJudArchiveSettings(
+        enabled=os.getenv("DATAJUD_RAW_ARCHIVE", "true").lower()
+        in ("1", "true", "yes"),
+        compression_level=int(os.getenv("DATAJUD_RAW_ARCHIVE_LEVEL", "3")),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_change_feed_settings() -> ChangeFeedSettings:
+    load_dotenv()
+    return ChangeFeedSettings(
+        webhook_url=os.getenv("CHANGE_WEBHOOK_URL") or None,
+        webhook_secret=os.getenv("CHANGE_WEBHOOK_SECRET") or None,
+        dispatch_interval_seconds=int(
+            os.getenv("CHANGE_WEBHOOK_INTERVAL_SECONDS", "30")
+        ),
+        dispatch_batch_size=int(os.getenv("CHANGE_WEBHOOK_BATCH_SIZE", "100")),
+        retention_days=int(os.getenv("CHANGE_EVENTS_RETENTION_DAYS", "7")),
     )
@@ -0,0 +1,333 @@
+"""Daily rollups read by the dashboards.
+
+``legal_case_daily_rollups`` and ``solicitation_daily_rollups`` hold, per
+creation day and filterable dimension, the additive counters the dashboards
+need. Statement-level triggers on ``solicitacoes`` apply the delta of every
+INSERT, UPDATE and DELETE in the writing transaction, so that rollup is
+always exact and no writer has to know about it.
+
+Almost every case sync changes the interval measure, and all cases created
+on one day with the same status, priority and tribunal share a rollup row,
+so applying deltas in the writing transaction would serialize sync workers
+on that row. The triggers on ``legal_cases`` therefore only append the
+changed days to ``legal_case_rollup_dirty_days`` (insert-only, never
+contended) and ``refresh_logged_days``, run periodically, recomputes them.
+
+Days and months are taken in ``DASHBOARD_TIME_ZONE`` whatever the session
+time zone is, so writers and readers in different zones agree on them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    case,
+    cast,
+    func,
+    literal,
+    literal_column,
+    or_,
+    text,
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql.elements import ColumnElement
+
+
+DASHBOARD_TIME_ZONE = "America/Sao_Paulo"
+
+_DAY = f"CAST(r.created_at AT TIME ZONE '{DASHBOARD_TIME_ZONE}' AS date)"
+
+# First key of the two-int advisory lock serializing rollup refreshes.
+ROLLUP_LOCK_NAMESPACE = 4050
+
+
+@dataclass(frozen=True)
+class RollupSpec:
+    """How a source table folds into its rollup.
+
+    ``keys`` and ``measures`` map rollup columns to expressions over the
+    source row aliased ``r``; only rows matching ``condition`` are counted.
+    With a ``dirty_log`` the triggers record the changed days there instead
+    of applying the delta, and ``refresh_logged_days`` recomputes them.
+    """
+
+    table: str
+    source: str
+    constraint: str
+    keys: Tuple[Tuple[str, str], ...]
+    measures: Tuple[Tuple[str, str], ...]
+    condition: Optional[str] = None
+    dirty_log: Optional[str] = None
+
+
+_CASE_INTERVAL = (
+    "EXTRACT(EPOCH FROM r.ultima_movimentacao - r.data_ajuizamento)"
+    " / CAST(NULLIF(r.movimentacoes, 0) AS numeric)"
+)
+
+LEGAL_CASE_ROLLUP = RollupSpec(
+    table="legal_case_daily_rollups",
+    source="legal_cases",
+    constraint="uq_legal_case_daily_rollup",
+    keys=(
+        ("day", _DAY),
+        ("status", "r.status"),
+        ("prioridade", "r.prioridade"),
+        ("tribunal", "r.tribunal"),
+    ),
+    measures=(
+        ("case_count", "1"),
+        ("interval_seconds", f"COALESCE({_CASE_INTERVAL}, 0)"),
+        ("interval_count", f"CASE WHEN {_CASE_INTERVAL} IS NULL THEN 0 ELSE 1 END"),
+    ),
+    # Import placeholders are counted from their first sync on.
+    condition="r.last_synced_at IS NOT NULL",
+    dirty_log="legal_case_rollup_dirty_days",
+)
+
+SOLICITATION_ROLLUP = RollupSpec(
+    table="solicitation_daily_rollups",
+    source="solicitacoes",
+    constraint="uq_solicitation_daily_rollup",
+    keys=(
+        ("day", _DAY),
+        ("status", "r.status"),
+        ("prioridade", "r.prioridade"),
+        ("estado", "r.estado"),
+        ("municipio", "r.municipio"),
+    ),
+    measures=(
+        ("solicitation_count", "1"),
+        ("processing_seconds", "EXTRACT(EPOCH FROM r.updated_at - r.created_at)"),
+    ),
+)
+
+ROLLUPS = (LEGAL_CASE_ROLLUP, SOLICITATION_ROLLUP)
+
+
+def _net_delta(spec: RollupSpec, relations: List[Tuple[str, str]]) -> str:
+    """Net delta of ``relations`` (transition table, sign) per rollup key."""
+    keys = ", ".join(name for name, _ in spec.keys)
+    deltas = " UNION ALL ".join(
+        "SELECT "
+        + ", ".join(f"{expr} AS {name}" for name, expr in spec.keys)
+        + ", "
+        + ", ".join(f"{sign}({expr}) AS {name}" for name, expr in spec.measures)
+        + f" FROM {relation} AS r"
+        + (f" WHERE {spec.condition}" if spec.condition else "")
+        for relation, sign in relations
+    )
+    sums = ", ".join(f"sum({name}) AS {name}" for name, _ in spec.measures)
+    changed = " OR ".join(f"sum({name}) <> 0" for name, _ in spec.measures)
+    # Updates that leave keys and measures alone cancel out and are skipped.
+    return (
+        f"SELECT {keys}, {sums} FROM ({deltas}) AS delta "
+        f"GROUP BY {keys} HAVING {changed}"
+    )
+
+
+def _apply_statement(spec: RollupSpec, relations: List[Tuple[str, str]]) -> str:
+    """Upsert the net delta of ``relations`` (transition table, sign)."""
+    keys = ", ".join(name for name, _ in spec.keys)
+    measures = ", ".join(name for name, _ in spec.measures)
+    increments = ", ".join(
+        f"{name} = t.{name} + EXCLUDED.{name}" for name, _ in spec.measures
+    )
+    # The key order keeps concurrent writers from deadlocking on the rollups.
+    return (
+        f"INSERT INTO {spec.table} AS t ({keys}, {measures}) "
+        f"SELECT {keys}, {measures} FROM ({_net_delta(spec, relations)}) AS net "
+        f"ORDER BY {keys} "
+        f"ON CONFLICT ON CONSTRAINT {spec.constraint} DO UPDATE SET {increments}"
+    )
+
+
+def _log_statement(spec: RollupSpec, relations: List[Tuple[str, str]]) -> str:
+    """Append to the dirty log the days whose rollup rows ``relations`` change."""
+    return (
+        f"INSERT INTO {spec.dirty_log} (day) "
+        f"SELECT DISTINCT day FROM ({_net_delta(spec, relations)}) AS net"
+    )
+
+
+def _function_name(spec: RollupSpec) -> str:
+    return f"{spec.table}_apply"
+
+
+def create_statements(spec: RollupSpec) -> List[str]:
+    """DDL of the trigger function and the three statement triggers."""
+    function = _function_name(spec)
+    apply = _log_statement if spec.dirty_log else _apply_statement
+    statements = [
+        f"""
+        CREATE FUNCTION {function}() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {apply(spec, [("new_rows", "+")])};
+            ELSIF TG_OP = 'UPDATE' THEN
+                {apply(spec, [("new_rows", "+"), ("old_rows", "-")])};
+            ELSE
+                {apply(spec, [("old_rows", "-")])};
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """
+    ]
+    transitions = {
+        "INSERT": "NEW TABLE AS new_rows",
+        "UPDATE": "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+        "DELETE": "OLD TABLE AS old_rows",
+    }
+    for event, referencing in transitions.items():
+        statements.append(
+            f"CREATE TRIGGER {spec.table}_{event.lower()} AFTER {event} "
+            f"ON {spec.source} REFERENCING {referencing} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION {function}()"
+        )
+    return statements
+
+
+def backfill_statement(spec: RollupSpec) -> str:
+    """Rebuild the rollup rows from the whole source table."""
+    return _apply_statement(spec, [(spec.source, "+")])
+
+
+def drop_statements(spec: RollupSpec) -> List[str]:
+    return [
+        *(
+            f"DROP TRIGGER IF EXISTS {spec.table}_{event} ON {spec.source}"
+            for event in ("insert", "update", "delete")
+        ),
+        f"DROP FUNCTION IF EXISTS {_function_name(spec)}()",
+    ]
+
+
+def _days_relation(spec: RollupSpec) -> str:
+    """Source rows created on the ``:days`` array, read by ``created_at`` range."""
+    start = f"CAST(d.day AS timestamp) AT TIME ZONE '{DASHBOARD_TIME_ZONE}'"
+    end = f"CAST(d.day + 1 AS timestamp) AT TIME ZONE '{DASHBOARD_TIME_ZONE}'"
+    return (
+        f"(SELECT s.* FROM {spec.source} AS s "
+        "JOIN unnest(CAST(:days AS date[])) AS d(day) "
+        f"ON s.created_at >= {start} AND s.created_at < {end})"
+    )
+
+
+def refresh_logged_days(connection: Connection, spec: RollupSpec, limit: int) -> int:
+    """Recompute the rollup rows of the days in up to ``limit`` log entries.
+
+    Returns how many distinct days were recomputed. Serialized across
+    replicas by a transaction-scoped advisory lock. A write committed after
+    the log entries are taken leaves an entry of its own, so it is picked up
+    by the next refresh.
+    """
+    connection.execute(
+        text("SELECT pg_advisory_xact_lock(:namespace, 0)"),
+        {"namespace": ROLLUP_LOCK_NAMESPACE},
+    )
+    days = sorted(
+        set(
+            connection.execute(
+                text(
+                    f"DELETE FROM {spec.dirty_log} WHERE id IN "
+                    f"(SELECT id FROM {spec.dirty_log} ORDER BY id LIMIT :limit) "
+                    "RETURNING day"
+                ),
+                {"limit": limit},
+            ).scalars()
+        )
+    )
+    if days:
+        connection.execute(
+            text(f"DELETE FROM {spec.table} WHERE day = ANY(CAST(:days AS date[]))"),
+            {"days": days},
+        )
+        connection.execute(
+            text(_apply_statement(spec, [(_days_relation(spec), "+")])),
+            {"days": days},
+        )
+    return len(days)
+
+
+def install(connection: Connection, *specs: RollupSpec) -> None:
+    """Create the triggers and backfill ``specs`` (tables must exist)."""
+    for spec in specs:
+        for statement in create_statements(spec):
+            connection.exec_driver_sql(statement)
+        connection.exec_driver_sql(backfill_statement(spec))
+
+
+def local_time(created_at) -> ColumnElement:
+    """``created_at`` as wall-clock time in ``DASHBOARD_TIME_ZONE``."""
+    return func.timezone(DASHBOARD_TIME_ZONE, created_at, type_=DateTime())
+
+
+def month_period(created_at) -> ColumnElement:
+    """``YYYY-MM`` bucket of ``created_at``, consistent with the rollup days."""
+    return func.to_char(local_time(created_at), "YYYY-MM")
+
+
+def _bounds(
+    created_at, date_from: Optional[datetime], date_to: Optional[datetime]
+) -> Tuple[Optional[ColumnElement], Optional[ColumnElement]]:
+    """Start of the first whole day at or after ``date_from`` and end of the
+    last whole day up to ``date_to`` (inclusive), as wall-clock times in
+    ``DASHBOARD_TIME_ZONE``."""
+    first = end = None
+    if date_from is not None:
+        start = local_time(literal(date_from, created_at.type))
+        day = func.date_trunc("day", start, type_=DateTime())
+        first = case(
+            (day == start, day), else_=day + literal_column("interval '1 day'")
+        )
+    if date_to is not None:
+        end = func.date_trunc(
+            "day",
+            local_time(
+                literal(date_to, created_at.type)
+                + literal_column("interval '1 microsecond'")
+            ),
+            type_=DateTime(),
+        )
+    return first, end
+
+
+def _instant(created_at, wall_clock: ColumnElement) -> ColumnElement:
+    return func.timezone(DASHBOARD_TIME_ZONE, wall_clock, type_=created_at.type)
+
+
+def whole_day_conditions(
+    day, created_at, date_from: Optional[datetime], date_to: Optional[datetime]
+) -> list:
+    """Rollup ``day`` conditions covering the days wholly inside the range."""
+    first, end = _bounds(created_at, date_from, date_to)
+    conditions = []
+    if first is not None:
+        conditions.append(day >= cast(first, Date))
+    if end is not None:
+        conditions.append(day < cast(end, Date))
+    return conditions
+
+
+def partial_day_condition(
+    created_at, date_from: Optional[datetime], date_to: Optional[datetime]
+) -> Optional[ColumnElement]:
+    """Raw-row condition for the partial days at the edges of the range.
+
+    ``None`` when the range is unbounded: then the rollups cover everything.
+    Combined with the range filter itself, it selects only rows created
+    before the first whole day or after the last one.
+    """
+    first, end = _bounds(created_at, date_from, date_to)
+    edges = []
+    if first is not None:
+        edges.append(created_at < _instant(created_at, first))
+    if end is not None:
+        edges.append(created_at >= _instant(created_at, end))
+    return or_(*edges) if edges else None
@@ -1,19 +1,28 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from decimal import Decimal
 from uuid import UUID as UUIDType, uuid4
 from typing import List, Optional
 import random
 
 from sqlalchemy import (
     JSON,
+    BigInteger,
+    Boolean,
+    Computed,
+    Date,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
+    Numeric,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domain.entities.document import DocumentClassification
@@ -35,6 +44,18 @@ def generate_uuid7() -> UUIDType:
     return UUIDType(int=value)
 
 
+# Text search configuration shared by the stored vectors and the queries.
+TEXT_SEARCH_CONFIG = "portuguese"
+CASE_SEARCH_EXPRESSION = (
+    f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', "
+    "coalesce(assunto, '') || ' ' || coalesce(classe_processual, '')), 'A') || "
+    f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', "
+    "coalesce(orgao_julgador, '') || ' ' || coalesce(tribunal, '') || ' ' || "
+    "coalesce(ultima_movimentacao_descricao, '')), 'C')"
+)
+MOVEMENT_SEARCH_EXPRESSION = f"to_tsvector('{TEXT_SEARCH_CONFIG}', description)"
+
+
 class TimestampMixin:
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -51,6 +72,26 @@ class TimestampMixin:
 
 class LegalCaseModel(Base, TimestampMixin):
     __tablename__ = "legal_cases"
+    __table_args__ = (
+        Index("ix_legal_cases_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_legal_cases_movement_search_vector",
+            "movement_search_vector",
+            postgresql_using="gin",
+        ),
+        # Keyset listing: one (sort column, id) index per sort field, plus the
+        # default sort under each equality filter.
+        Index("ix_legal_cases_created_at_id", "created_at", "id"),
+        Index("ix_legal_cases_ultima_movimentacao_id", "ultima_movimentacao", "id"),
+        Index("ix_legal_cases_data_ajuizamento_id", "data_ajuizamento", "id"),
+        Index("ix_legal_cases_movimentacoes_id", "movimentacoes", "id"),
+        Index("ix_legal_cases_numero_processo_id", "numero_processo", "id"),
+        Index("ix_legal_cases_status_created_at_id", "status", "created_at", "id"),
+        Index(
+            "ix_legal_cases_prioridade_created_at_id", "prioridade", "created_at", "id"
+        ),
+        Index("ix_legal_cases_tribunal_created_at_id", "tribunal", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     numero_processo: Mapped[str] = mapped_column(
@@ -78,11 +119,51 @@ class LegalCaseModel(Base, TimestampMixin):
     last_synced_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), index=True
     )
+    movement_watermark: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True)
+    )
+    movement_digest: Mapped[Optional[str]] = mapped_column(String(64))
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, Computed(CASE_SEARCH_EXPRESSION, persisted=True)
+    )
+    # Appended to by the repository as movements are stored (weight B).
+    movement_search_vector: Mapped[Optional[str]] = mapped_column(TSVECTOR)
+    next_sync_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), index=True
+    )
+    sync_lease_owner: Mapped[Optional[str]] = mapped_column(String(100))
+    sync_lease_expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True)
+    )
 
     movements: Mapped[List["LegalCaseMovementModel"]] = relationship(
         back_populates="legal_case",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        # Histories can be large: read them through the repository pages.
+        lazy="raise_on_sql",
+    )
+
+
+class LegalCaseMovementTypeModel(Base):
+    """Dictionary of movement descriptions; rows are never updated."""
+
+    __tablename__ = "legal_case_movement_types"
+    __table_args__ = (
+        UniqueConstraint("description_hash", name="uq_legal_case_movement_type"),
+        Index(
+            "ix_legal_case_movement_types_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    # md5 of the UTF-8 description: a fixed 16-byte key whatever its length.
+    description_hash: Mapped[bytes] = mapped_column(LargeBinary(16), nullable=False)
+    description: Mapped[str] = mapped_column(Text, nullable=False)
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, Computed(MOVEMENT_SEARCH_EXPRESSION, persisted=True)
     )
 
 
@@ -92,9 +173,17 @@ class LegalCaseMovementModel(Base):
         UniqueConstraint(
             "legal_case_id",
             "movement_date",
-            "description",
+            "movement_type_id",
             name="uq_legal_case_movement",
         ),
+        Index(
+            "ix_legal_case_movements_case_date_id",
+            "legal_case_id",
+            "movement_date",
+            "id",
+        ),
+        # Yearly partitions, maintained by LegalCaseMovementPartitionRepository.
+        {"postgresql_partition_by": "RANGE (movement_date)"},
     )
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
@@ -103,10 +192,18 @@ class LegalCaseMovementModel(Base):
         ForeignKey("legal_cases.id", ondelete="CASCADE"),
         nullable=False,
     )
+    # Part of the primary key: unique constraints must include the partition key.
     movement_date: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), index=True, nullable=False
+        DateTime(timezone=True), primary_key=True
+    )
+    movement_type_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey(
+            "legal_case_movement_types.id",
+            name="fk_legal_case_movements_movement_type_id",
+        ),
+        nullable=False,
     )
-    description: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
@@ -118,6 +215,9 @@ class LegalCaseMovementModel(Base):
 
 class SolicitationModel(Base, TimestampMixin):
     __tablename__ = "solicitacoes"
+    # Dashboard date ranges read whole days from the rollups and only the
+    # partial days at their edges from this table.
+    __table_args__ = (Index("ix_solicitacoes_created_at", "created_at"),)
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     status: Mapped[str] = mapped_column(
@@ -257,3 +357,278 @@ class SchedulerLockModel(Base):
         DateTime(timezone=True),
         nullable=False,
     )
+
+
+class SyncRunModel(Base):
+    __tablename__ = "sync_runs"
+
+    id: Mapped[str] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    owner: Mapped[str] = mapped_column(String(100), nullable=False)
+    status: Mapped[str] = mapped_column(
+        Enum(
+            "running",
+            "completed",
+            "failed",
+            "interrupted",
+            name="sync_run_status",
+        ),
+        default="running",
+        nullable=False,
+        index=True,
+    )
+    resumed_from: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=True))
+    pending_case_ids: Mapped[List[str]] = mapped_column(JSON, default=list)
+    total_cases: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_cases: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    skipped_cases: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    failed_cases: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    heartbeat_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
+
+# xid8 of the writing transaction; bigint keeps it comparable from SQLAlchemy.
+CURRENT_TXID = "(pg_current_xact_id()::text)::bigint"
+
+
+class LegalCaseChangeEventModel(Base):
+    """Transactional outbox of changes applied to legal cases."""
+
+    __tablename__ = "legal_case_change_events"
+    __table_args__ = (
+        Index("ix_legal_case_change_events_feed", "txid", "id"),
+        Index("ix_legal_case_change_events_case_feed", "numero_processo", "txid", "id"),
+        Index(
+            "ix_legal_case_change_events_undelivered",
+            "next_attempt_at",
+            postgresql_where=text("delivered_at IS NULL"),
+        ),
+        Index("ix_legal_case_change_events_created_at", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    txid: Mapped[int] = mapped_column(
+        BigInteger, server_default=text(CURRENT_TXID), nullable=False
+    )
+    legal_case_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("legal_cases.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    numero_processo: Mapped[str] = mapped_column(String(25), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    delivered_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    delivery_attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+class DataJudLookupCacheModel(Base):
+    __tablename__ = "datajud_lookup_cache"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    found: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    payload: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+
+class DataJudRawPayloadModel(Base):
+    """Compressed DataJud ``_source`` documents, deduplicated by content hash."""
+
+    __tablename__ = "datajud_raw_payloads"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    codec: Mapped[str] = mapped_column(String(16), nullable=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    raw_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+class LegalCaseRawSourceModel(Base):
+    """Latest archived ``_source`` of each case number."""
+
+    __tablename__ = "legal_case_raw_sources"
+
+    numero_processo: Mapped[str] = mapped_column(String(25), primary_key=True)
+    court_acronym: Mapped[str] = mapped_column(String(16), nullable=False)
+    content_hash: Mapped[str] = mapped_column(
+        String(64),
+        ForeignKey("datajud_raw_payloads.content_hash"),
+        nullable=False,
+        index=True,
+    )
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+
+class LegalCaseImportModel(Base):
+    """One bulk CNJ import and what happened to each received number."""
+
+    __tablename__ = "legal_case_imports"
+
+    id: Mapped[str] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    created_by: Mapped[Optional[str]] = mapped_column(String(100))
+    source_format: Mapped[str] = mapped_column(String(10), nullable=False)
+    total_received: Mapped[int] = mapped_column(Integer, nullable=False)
+    invalid_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    duplicate_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    already_tracked_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    queued_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    invalid_entries: Mapped[list] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+class LegalCaseImportItemModel(Base):
+    """Placeholder case queued by an import, with its last fetch outcome."""
+
+    __tablename__ = "legal_case_import_items"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    import_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("legal_case_imports.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    # NULL once a placeholder the provider kept not finding has been dropped.
+    legal_case_id: Mapped[Optional[str]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("legal_cases.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+    numero_processo: Mapped[str] = mapped_column(String(25), nullable=False)
+    # pending | found | not_found | error
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
+    # Lookups the provider answered without the case; bounds the retries.
+    not_found_attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+class LegalCaseDailyRollupModel(Base):
+    """Process dashboard counters per creation day and filterable dimension.
+
+    Recomputed per day by the dashboard rollup job from the days logged in
+    ``legal_case_rollup_dirty_days`` (see
+    ``src.infra.database.dashboard_rollups``).
+    """
+
+    __tablename__ = "legal_case_daily_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "day",
+            "status",
+            "prioridade",
+            "tribunal",
+            name="uq_legal_case_daily_rollup",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    status: Mapped[Optional[str]] = mapped_column(String(50))
+    prioridade: Mapped[str] = mapped_column(
+        Enum("baixa", "media", "alta", name="process_priority"), nullable=False
+    )
+    tribunal: Mapped[Optional[str]] = mapped_column(String(100))
+    case_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    # Sum and count of the per-case average interval between movements.
+    interval_seconds: Mapped[Decimal] = mapped_column(
+        Numeric, nullable=False, default=0
+    )
+    interval_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class LegalCaseRollupDirtyDayModel(Base):
+    """Creation days whose legal case rollup rows are due for recomputation.
+
+    Appended to by statement-level triggers on ``legal_cases``; insert-only
+    so concurrent writers never wait on each other, drained by the job.
+    """
+
+    __tablename__ = "legal_case_rollup_dirty_days"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+
+
+class SolicitationDailyRollupModel(Base):
+    """Solicitation dashboard counters per creation day and dimension.
+
+    Maintained by statement-level triggers on ``solicitacoes`` (see
+    ``src.infra.database.dashboard_rollups``); never written by the app.
+    """
+
+    __tablename__ = "solicitation_daily_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "day",
+            "status",
+            "prioridade",
+            "estado",
+            "municipio",
+            name="uq_solicitation_daily_rollup",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    status: Mapped[str] = mapped_column(
+        Enum(
+            "pendente",
+            "em_analise",
+            "aprovada",
+            "reprovada",
+            "documentacao_incompleta",
+            name="solicitacao_status",
+        ),
+        nullable=False,
+    )
+    prioridade: Mapped[str] = mapped_column(
+        Enum("baixa", "media", "alta", name="solicitacao_priority"), nullable=False
+    )
+    estado: Mapped[Optional[str]] = mapped_column(String(2))
+    municipio: Mapped[Optional[str]] = mapped_column(String(120))
+    solicitation_count: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0
+    )
+    # Sum of ``updated_at - created_at`` in seconds.
+    processing_seconds: Mapped[Decimal] = mapped_column(
+        Numeric, nullable=False, default=0
+    )
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from contextlib import AbstractContextManager
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from src.infra.database.models import DataJudLookupCacheModel
+
+
+class DataJudLookupCacheRepository:
+    """Postgres tier of the DataJud lookup cache, shared by every replica.
+
+    Each call runs in its own short transaction so the cache can be used
+    from sync worker threads and outside request sessions.
+    """
+
+    def __init__(
+        self, session_factory: Callable[[], AbstractContextManager[Session]]
+    ) -> None:
+        self._session_factory = session_factory
+
+    def get(self, cache_key: str) -> Tuple[bool, Optional[dict], float]:
+        """Return ``(hit, payload, remaining_ttl_seconds)``."""
+        now = datetime.now(timezone.utc)
+        with self._session_factory() as session:
+            row = session.execute(
+                select(
+                    DataJudLookupCacheModel.found,
+                    DataJudLookupCacheModel.payload,
+                    DataJudLookupCacheModel.expires_at,
+                ).where(
+                    DataJudLookupCacheModel.cache_key == cache_key,
+                    DataJudLookupCacheModel.expires_at > now,
+                )
+            ).one_or_none()
+        if row is None:
+            return False, None, 0.0
+        payload = row.payload if row.found else None
+        return True, payload, (row.expires_at - now).total_seconds()
+
+    def set(self, cache_key: str, payload: Optional[dict], ttl_seconds: int) -> None:
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+        values = {
+            "cache_key": cache_key,
+            "found": payload is not None,
+            "payload": payload,
+            "expires_at": expires_at,
+        }
+        stmt = pg_insert(DataJudLookupCacheModel).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DataJudLookupCacheModel.cache_key],
+            set_={
+                "found": stmt.excluded.found,
+                "payload": stmt.excluded.payload,
+                "expires_at": stmt.excluded.expires_at,
+            },
+        )
+        with self._session_factory() as session:
+            session.execute(stmt)
+
+    def purge_expired(self, limit: int) -> int:
+        expired = (
+            select(DataJudLookupCacheModel.cache_key)
+            .where(DataJudLookupCacheModel.expires_at <= datetime.now(timezone.utc))
+            .limit(limit)
+            .scalar_subquery()
+        )
+        with self._session_factory() as session:
+            result = session.execute(
+                delete(DataJudLookupCacheModel)
+                .where(DataJudLookupCacheModel.cache_key.in_(expired))
+                .execution_options(synchronize_session=False)
+            )
+            return int(result.rowcount or 0)
@@ -53,6 +53,13 @@ class DocumentRepository(IDocumentRepository):
             return None
         return self._model_to_metadata(model)
 
+    def get_by_storage_key(self, s3_key: str) -> Optional[DocumentMetadata]:
+        stmt = select(DocumentModel).where(DocumentModel.s3_key == s3_key)
+        model = self._session.execute(stmt).scalar_one_or_none()
+        if model is None:
+            return None
+        return self._model_to_metadata(model)
+
     def update_classification(
         self,
         document_id: str,
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import (
+    BigInteger,
+    delete,
+    func,
+    literal,
+    literal_column,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.orm import Session
+
+from src.domain.entities.case import LegalCaseChangeEvent
+from src.domain.repositories.legal_case_change_repository import (
+    ChangeCursor,
+    ChangeEventPage,
+    ILegalCaseChangeRepository,
+)
+from src.infra.database.models import LegalCaseChangeEventModel
+
+# Oldest transaction still running; every txid below it has finished.
+_VISIBLE_HORIZON = literal_column(
+    "(pg_snapshot_xmin(pg_current_snapshot())::text)::bigint"
+)
+
+
+def _to_event(model: LegalCaseChangeEventModel) -> LegalCaseChangeEvent:
+    return LegalCaseChangeEvent(
+        event_id=model.id,
+        txid=model.txid,
+        case_id=str(model.legal_case_id),
+        numero_processo=model.numero_processo,
+        event_type=model.event_type,
+        payload=model.payload,
+        created_at=model.created_at,
+        delivery_attempts=model.delivery_attempts,
+    )
+
+
+class LegalCaseChangeRepository(ILegalCaseChangeRepository):
+    """SQLAlchemy implementation of the legal case change outbox."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def list_changes(
+        self,
+        limit: int,
+        after: Optional[ChangeCursor] = None,
+        numero_processo: Optional[str] = None,
+    ) -> ChangeEventPage:
+        event = LegalCaseChangeEventModel
+        stmt = (
+            select(event)
+            .where(event.txid < _VISIBLE_HORIZON)
+            .order_by(event.txid, event.id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(event.txid, event.id)
+                > tuple_(
+                    literal(after.txid, BigInteger()),
+                    literal(after.event_id, BigInteger()),
+                )
+            )
+        if numero_processo is not None:
+            stmt = stmt.where(event.numero_processo == numero_processo)
+        events = [_to_event(model) for model in self._session.scalars(stmt)]
+        next_cursor = (
+            ChangeCursor(events[-1].txid, events[-1].event_id) if events else after
+        )
+        return ChangeEventPage(events=events, next_cursor=next_cursor)
+
+    def claim_undelivered(
+        self, limit: int, now: datetime
+    ) -> List[LegalCaseChangeEvent]:
+        event = LegalCaseChangeEventModel
+        stmt = (
+            select(event)
+            .where(event.delivered_at.is_(None), event.next_attempt_at <= now)
+            .order_by(event.txid, event.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return [_to_event(model) for model in self._session.scalars(stmt)]
+
+    def mark_delivered(self, event_ids: List[int]) -> None:
+        if not event_ids:
+            return
+        self._session.execute(
+            update(LegalCaseChangeEventModel)
+            .where(LegalCaseChangeEventModel.id.in_(event_ids))
+            .values(delivered_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+
+    def mark_failed(self, event_ids: List[int], retry_at: datetime) -> None:
+        if not event_ids:
+            return
+        self._session.execute(
+            update(LegalCaseChangeEventModel)
+            .where(LegalCaseChangeEventModel.id.in_(event_ids))
+            .values(
+                delivery_attempts=LegalCaseChangeEventModel.delivery_attempts + 1,
+                next_attempt_at=retry_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def purge(self, created_before: datetime, limit: int) -> int:
+        expired = (
+            select(LegalCaseChangeEventModel.id)
+            .where(LegalCaseChangeEventModel.created_at < created_before)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        result = self._session.execute(
+            delete(LegalCaseChangeEventModel)
+            .where(LegalCaseChangeEventModel.id.in_(expired))
+            .execution_options(synchronize_session=False)
+        )
+        return int(result.rowcount or 0)
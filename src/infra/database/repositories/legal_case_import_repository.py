@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Set, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from src.domain.repositories.legal_case_import_repository import (
+    ILegalCaseImportRepository,
+    InvalidImportEntry,
+    LegalCaseImportProgress,
+)
+from src.infra.database.models import (
+    LegalCaseImportItemModel,
+    LegalCaseImportModel,
+    LegalCaseModel,
+)
+
+# Rows per multi-row INSERT, well below the 65535 bind parameters limit.
+INSERT_CHUNK_SIZE = 1000
+
+_OUTCOME_STATUS = {
+    "updated": "found",
+    "skipped": "not_found",
+    "error": "error",
+    "failed": "error",
+}
+
+
+class LegalCaseImportRepository(ILegalCaseImportRepository):
+    """SQLAlchemy implementation for bulk imports."""
+
+    def __init__(
+        self,
+        session: Session,
+        max_not_found_attempts: int = 8,
+        max_placeholder_age: timedelta = timedelta(days=30),
+    ) -> None:
+        self._session = session
+        self._max_not_found_attempts = max_not_found_attempts
+        self._max_placeholder_age = max_placeholder_age
+
+    @staticmethod
+    def _to_progress(
+        model: LegalCaseImportModel, **counters
+    ) -> LegalCaseImportProgress:
+        return LegalCaseImportProgress(
+            import_id=str(model.id),
+            source_format=model.source_format,
+            created_at=model.created_at,
+            total_received=model.total_received,
+            invalid_count=model.invalid_count,
+            duplicate_count=model.duplicate_count,
+            already_tracked_count=model.already_tracked_count,
+            queued_count=model.queued_count,
+            invalid_entries=[
+                InvalidImportEntry(entry["line"], entry["value"], entry["reason"])
+                for entry in model.invalid_entries
+            ],
+            **counters,
+        )
+
+    def find_existing_numbers(self, numeros_processo: List[str]) -> Set[str]:
+        existing: Set[str] = set()
+        for start in range(0, len(numeros_processo), INSERT_CHUNK_SIZE):
+            chunk = numeros_processo[start : start + INSERT_CHUNK_SIZE]
+            existing.update(
+                self._session.execute(
+                    select(LegalCaseModel.numero_processo).where(
+                        LegalCaseModel.numero_processo.in_(chunk)
+                    )
+                ).scalars()
+            )
+        return existing
+
+    def create_import(
+        self,
+        created_by: Optional[str],
+        source_format: str,
+        total_received: int,
+        invalid_entries: List[InvalidImportEntry],
+        invalid_count: int,
+        duplicate_count: int,
+        already_tracked_count: int,
+        queued: List[Tuple[str, str]],
+    ) -> LegalCaseImportProgress:
+        now = datetime.now(timezone.utc)
+        model = LegalCaseImportModel(
+            id=uuid4(),
+            created_by=created_by,
+            source_format=source_format,
+            total_received=total_received,
+            invalid_count=invalid_count,
+            duplicate_count=duplicate_count,
+            already_tracked_count=already_tracked_count,
+            queued_count=0,
+            invalid_entries=[
+                {"line": entry.line, "value": entry.value, "reason": entry.reason}
+                for entry in invalid_entries
+            ],
+            created_at=now,
+        )
+        self._session.add(model)
+        self._session.flush()
+
+        inserted = 0
+        for start in range(0, len(queued), INSERT_CHUNK_SIZE):
+            chunk = queued[start : start + INSERT_CHUNK_SIZE]
+            # Never synced and unscheduled: the cron treats them as most overdue.
+            rows = self._session.execute(
+                pg_insert(LegalCaseModel)
+                .values(
+                    [
+                        {
+                            "id": uuid4(),
+                            "numero_processo": numero,
+                            "tribunal": court_acronym.upper(),
+                            "movimentacoes": 0,
+                            "prioridade": "baixa",
+                            "created_at": now,
+                            "updated_at": now,
+                        }
+                        for numero, court_acronym in chunk
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=[LegalCaseModel.numero_processo])
+                .returning(LegalCaseModel.id, LegalCaseModel.numero_processo)
+            ).all()
+            if rows:
+                self._session.execute(
+                    pg_insert(LegalCaseImportItemModel).values(
+                        [
+                            {
+                                "import_id": model.id,
+                                "legal_case_id": row.id,
+                                "numero_processo": row.numero_processo,
+                                "status": "pending",
+                                "updated_at": now,
+                            }
+                            for row in rows
+                        ]
+                    )
+                )
+            inserted += len(rows)
+
+        model.queued_count = inserted
+        model.already_tracked_count = already_tracked_count + len(queued) - inserted
+        self._session.flush()
+        return self._to_progress(model)
+
+    def get_import(self, import_id: str) -> Optional[LegalCaseImportProgress]:
+        model = self._session.get(LegalCaseImportModel, UUID(import_id))
+        if model is None:
+            return None
+        # A case synced by any path (cron, consult, revalidation) counts as found;
+        # items whose placeholder was dropped keep their own status.
+        synced = LegalCaseModel.last_synced_at.is_not(None)
+        status = LegalCaseImportItemModel.status
+        counters = self._session.execute(
+            select(
+                func.count().filter(synced | (status == "found")).label("found"),
+                func.count()
+                .filter(~synced & (status == "not_found"))
+                .label("not_found"),
+                func.count().filter(~synced & (status == "error")).label("error"),
+                func.count().filter(~synced & (status == "pending")).label("pending"),
+            )
+            .select_from(LegalCaseImportItemModel)
+            .outerjoin(
+                LegalCaseModel,
+                LegalCaseModel.id == LegalCaseImportItemModel.legal_case_id,
+            )
+            .where(LegalCaseImportItemModel.import_id == model.id)
+        ).one()
+        return self._to_progress(
+            model,
+            found_count=counters.found,
+            not_found_count=counters.not_found,
+            error_count=counters.error,
+            pending_count=counters.pending,
+        )
+
+    def record_outcome(self, case_id: str, result: str) -> None:
+        status = _OUTCOME_STATUS.get(result)
+        if status is None:
+            return
+        now = datetime.now(timezone.utc)
+        item = LegalCaseImportItemModel
+        attempts = self._session.execute(
+            update(item)
+            .where(item.legal_case_id == case_id, item.status != "found")
+            .values(
+                status=status,
+                updated_at=now,
+                not_found_attempts=item.not_found_attempts
+                + (1 if result == "skipped" else 0),
+            )
+            .returning(item.not_found_attempts)
+            .execution_options(synchronize_session=False)
+        ).scalars()
+        if result != "skipped":
+            return
+        # The sync already rescheduled the placeholder: numbers DataJud has
+        # not indexed yet are looked up again until the attempts or the age
+        # limit run out. Only then is the placeholder dropped; its item keeps
+        # the not_found status.
+        conditions = [
+            LegalCaseModel.id == case_id,
+            LegalCaseModel.last_synced_at.is_(None),
+        ]
+        if max(attempts, default=0) < self._max_not_found_attempts:
+            conditions.append(
+                LegalCaseModel.created_at < now - self._max_placeholder_age
+            )
+        self._session.execute(
+            delete(LegalCaseModel)
+            .where(*conditions)
+            .execution_options(synchronize_session=False)
+        )
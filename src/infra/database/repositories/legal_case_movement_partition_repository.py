@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+MOVEMENTS_TABLE = "legal_case_movements"
+PARTITION_PREFIX = f"{MOVEMENTS_TABLE}_p"
+DEFAULT_PARTITION = f"{MOVEMENTS_TABLE}_default"
+# Dates before this (e.g. unparseable ones mapped to datetime.min) stay in the
+# default partition instead of getting a partition per bogus year.
+MIN_PARTITION_YEAR = 1900
+# First key of the two-int advisory lock serializing partition maintenance.
+PARTITION_LOCK_NAMESPACE = 4022
+
+
+def partition_name(year: int) -> str:
+    return f"{PARTITION_PREFIX}{year:04d}"
+
+
+def partition_bounds(year: int) -> Tuple[datetime, datetime]:
+    """Yearly range ``[Jan 1st, Jan 1st next year)`` in UTC."""
+    return (
+        datetime(year, 1, 1, tzinfo=timezone.utc),
+        datetime(year + 1, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def plan_partition_years(
+    existing: Iterable[int],
+    default_years: Iterable[int],
+    current_year: int,
+    years_ahead: int,
+) -> List[int]:
+    """Years still missing a partition, oldest first.
+
+    Covers the current year plus ``years_ahead`` and every year that has
+    rows parked in the default partition.
+    """
+    wanted = set(range(current_year, current_year + max(0, years_ahead) + 1))
+    wanted.update(year for year in default_years if year >= MIN_PARTITION_YEAR)
+    return sorted(wanted - set(existing))
+
+
+class LegalCaseMovementPartitionRepository:
+    """Maintains the yearly range partitions of ``legal_case_movements``."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def list_partition_years(self) -> Set[int]:
+        rows = self._session.execute(
+            text(
+                """
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+                WHERE pg_inherits.inhparent = CAST(:parent AS regclass)
+                """
+            ),
+            {"parent": MOVEMENTS_TABLE},
+        ).scalars()
+        return {
+            int(name[len(PARTITION_PREFIX) :])
+            for name in rows
+            if name.startswith(PARTITION_PREFIX)
+            and name[len(PARTITION_PREFIX) :].isdigit()
+        }
+
+    def default_partition_years(self) -> Set[int]:
+        rows = self._session.execute(
+            text(
+                f"""
+                SELECT DISTINCT
+                    CAST(EXTRACT(YEAR FROM movement_date AT TIME ZONE 'UTC') AS int)
+                FROM {DEFAULT_PARTITION}
+                WHERE movement_date >= :floor
+                """
+            ),
+            {"floor": partition_bounds(MIN_PARTITION_YEAR)[0]},
+        ).scalars()
+        return set(rows)
+
+    def create_partition(self, year: int) -> None:
+        """Create the partition of ``year``, moving its rows out of the default.
+
+        Postgres refuses to add a partition while the default one holds rows
+        of its range, so those rows are moved into a standalone table that is
+        then attached.
+        """
+        name = partition_name(year)
+        start, end = partition_bounds(year)
+        bounds = {"start": start, "end": end}
+        parked = self._session.execute(
+            text(
+                f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} "
+                "WHERE movement_date >= :start AND movement_date < :end)"
+            ),
+            bounds,
+        ).scalar()
+        literal_bounds = f"FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        if not parked:
+            self._session.execute(
+                text(
+                    f"CREATE TABLE {name} PARTITION OF {MOVEMENTS_TABLE} "
+                    f"FOR VALUES {literal_bounds}"
+                )
+            )
+            return
+        self._session.execute(
+            text(
+                f"CREATE TABLE {name} "
+                f"(LIKE {MOVEMENTS_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        self._session.execute(
+            text(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {DEFAULT_PARTITION}
+                    WHERE movement_date >= :start AND movement_date < :end
+                    RETURNING *
+                )
+                INSERT INTO {name} SELECT * FROM moved
+                """
+            ),
+            bounds,
+        )
+        # Attaching builds the partitioned indexes and constraints on it.
+        self._session.execute(
+            text(
+                f"ALTER TABLE {MOVEMENTS_TABLE} ATTACH PARTITION {name} "
+                f"FOR VALUES {literal_bounds}"
+            )
+        )
+
+    def ensure_partitions(
+        self, years_ahead: int, now: Optional[datetime] = None
+    ) -> List[int]:
+        """Create the partitions still missing; returns the years created.
+
+        Serialized across replicas by a transaction-scoped advisory lock.
+        """
+        now = now or datetime.now(timezone.utc)
+        self._session.execute(
+            text("SELECT pg_advisory_xact_lock(:namespace, 0)"),
+            {"namespace": PARTITION_LOCK_NAMESPACE},
+        )
+        missing = plan_partition_years(
+            self.list_partition_years(),
+            self.default_partition_years(),
+            now.year,
+            years_ahead,
+        )
+        for year in missing:
+            self.create_partition(year)
+        return missing
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import zlib
+from contextlib import AbstractContextManager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, exists, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from src.domain.repositories.legal_case_raw_archive_repository import (
+    ArchivedSource,
+    ILegalCaseRawArchive,
+)
+from src.infra.database.models import DataJudRawPayloadModel, LegalCaseRawSourceModel
+
+try:  # zstandard é opcional; sem ele os payloads são gravados com zlib.
+    import zstandard
+except ImportError:  # pragma: no cover - depende do ambiente
+    zstandard = None
+
+DEFAULT_COMPRESSION_LEVEL = 3
+
+
+def encode_source(
+    source: Dict[str, Any], level: int = DEFAULT_COMPRESSION_LEVEL
+) -> Tuple[str, str, bytes, int]:
+    """Return ``(content_hash, codec, blob, raw_size)`` for a ``_source``.
+
+    The hash is taken over canonical JSON, so identical payloads share a blob
+    whatever the key order or codec.
+    """
+    raw = json.dumps(
+        source, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+    content_hash = hashlib.sha256(raw).hexdigest()
+    if zstandard is not None:
+        return content_hash, "zstd", zstandard.compress(raw, level), len(raw)
+    return content_hash, "zlib", zlib.compress(raw, min(level, 9)), len(raw)
+
+
+def decode_source(codec: str, blob: bytes) -> Dict[str, Any]:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Payload zstd arquivado, mas zstandard não instalado.")
+        raw = zstandard.decompress(blob)
+    elif codec == "zlib":
+        raw = zlib.decompress(blob)
+    else:
+        raise ValueError(f"Codec de arquivo desconhecido: {codec}")
+    return json.loads(raw)
+
+
+class LegalCaseRawArchiveRepository(ILegalCaseRawArchive):
+    """Postgres archive of compressed DataJud payloads.
+
+    Each call runs in its own short transaction so the gateway can archive
+    from sync worker threads without touching the caller's session.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractContextManager[Session]],
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+    ) -> None:
+        self._session_factory = session_factory
+        self._compression_level = compression_level
+
+    def store(
+        self, numero_processo: str, court_acronym: str, source: Dict[str, Any]
+    ) -> None:
+        content_hash, codec, blob, raw_size = encode_source(
+            source, self._compression_level
+        )
+        now = datetime.now(timezone.utc)
+        with self._session_factory() as session:
+            previous = session.execute(
+                select(LegalCaseRawSourceModel.content_hash)
+                .where(LegalCaseRawSourceModel.numero_processo == numero_processo)
+                .with_for_update()
+            ).scalar_one_or_none()
+            if previous != content_hash:
+                session.execute(
+                    pg_insert(DataJudRawPayloadModel)
+                    .values(
+                        content_hash=content_hash,
+                        codec=codec,
+                        payload=blob,
+                        raw_size=raw_size,
+                        created_at=now,
+                    )
+                    .on_conflict_do_nothing(
+                        index_elements=[DataJudRawPayloadModel.content_hash]
+                    )
+                )
+            stmt = pg_insert(LegalCaseRawSourceModel).values(
+                numero_processo=numero_processo,
+                court_acronym=court_acronym,
+                content_hash=content_hash,
+                fetched_at=now,
+            )
+            session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[LegalCaseRawSourceModel.numero_processo],
+                    set_={
+                        "court_acronym": stmt.excluded.court_acronym,
+                        "content_hash": stmt.excluded.content_hash,
+                        "fetched_at": stmt.excluded.fetched_at,
+                    },
+                )
+            )
+            if previous is not None and previous != content_hash:
+                # The replaced blob goes away once no other case points to it.
+                session.execute(
+                    delete(DataJudRawPayloadModel).where(
+                        DataJudRawPayloadModel.content_hash == previous,
+                        ~exists().where(
+                            LegalCaseRawSourceModel.content_hash == previous
+                        ),
+                    )
+                )
+
+    def list_case_numbers(self, limit: int, after: Optional[str] = None) -> List[str]:
+        stmt = (
+            select(LegalCaseRawSourceModel.numero_processo)
+            .order_by(LegalCaseRawSourceModel.numero_processo)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(LegalCaseRawSourceModel.numero_processo > after)
+        with self._session_factory() as session:
+            return list(session.execute(stmt).scalars())
+
+    def load(self, numeros_processo: List[str]) -> List[ArchivedSource]:
+        if not numeros_processo:
+            return []
+        stmt = (
+            select(
+                LegalCaseRawSourceModel.numero_processo,
+                LegalCaseRawSourceModel.court_acronym,
+                LegalCaseRawSourceModel.fetched_at,
+                DataJudRawPayloadModel.codec,
+                DataJudRawPayloadModel.payload,
+            )
+            .join(
+                DataJudRawPayloadModel,
+                DataJudRawPayloadModel.content_hash
+                == LegalCaseRawSourceModel.content_hash,
+            )
+            .where(LegalCaseRawSourceModel.numero_processo.in_(numeros_processo))
+            .order_by(LegalCaseRawSourceModel.numero_processo)
+        )
+        with self._session_factory() as session:
+            rows = session.execute(stmt).all()
+        return [
+            ArchivedSource(
+                numero_processo=row.numero_processo,
+                court_acronym=row.court_acronym,
+                source=decode_source(row.codec, row.payload),
+                fetched_at=row.fetched_at,
+            )
+            for row in rows
+        ]
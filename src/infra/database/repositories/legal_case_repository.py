@@ -1,38 +1,136 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from uuid import UUID, uuid4
 
-from sqlalchemy import desc, func, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import (
+    case,
+    delete,
+    desc,
+    func,
+    literal,
+    literal_column,
+    null,
+    or_,
+    select,
+    true,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, noload
 
 from src.domain.core.errors import LegalCasePersistenceError
-from src.domain.entities.case import CNJNumber, LegalCase, Movement
+from src.domain.entities.case import (
+    CNJNumber,
+    LegalCase,
+    Movement,
+    changed_fields,
+    movement_history_digest,
+)
 from src.domain.repositories.legal_case_repository import (
+    DEFAULT_CASE_LIST_SORT_FIELD,
+    CaseListCursor,
     ILegalCaseRepository,
+    LegalCaseListPage,
+    LegalCaseSearchHit,
+    LegalCaseSummary,
+    MovementCursor,
+    MovementPage,
     PersistedLegalCase,
     ProcessDashboardAggregation,
     ProcessDashboardFilters,
 )
-from src.infra.database.models import LegalCaseModel, LegalCaseMovementModel
+from src.infra.database.dashboard_rollups import (
+    month_period,
+    partial_day_condition,
+    whole_day_conditions,
+)
+from src.infra.database.models import (
+    TEXT_SEARCH_CONFIG,
+    LegalCaseChangeEventModel,
+    LegalCaseDailyRollupModel,
+    LegalCaseModel,
+    LegalCaseMovementModel,
+    LegalCaseMovementTypeModel,
+)
+from src.infra.database.repositories.movement_type_dictionary import (
+    MovementTypeDictionary,
+    get_movement_type_dictionary,
+)
+
+
+# First key of the two-int advisory locks taken for first-time case lookups.
+CASE_LOOKUP_LOCK_NAMESPACE = 4021
+# Movements embedded in a case read; the full history is paginated.
+EMBEDDED_MOVEMENTS_LIMIT = 20
+# Matching movements returned with each search hit.
+SEARCH_MATCHED_MOVEMENTS = 3
+# Movement rows per INSERT; five bind parameters each keeps a statement well
+# below Postgres' 65535 parameter limit.
+MOVEMENT_INSERT_CHUNK_SIZE = 1000
+
+_SEARCH_CONFIG = literal_column(f"'{TEXT_SEARCH_CONFIG}'::regconfig")
+_EMPTY_TSVECTOR = literal_column("''::tsvector")
+
+
+# Change event field names, as exposed by the case DTO.
+CHANGE_FIELD_NAMES = {
+    "court": "tribunal",
+    "judging_body": "orgao_julgador",
+    "procedural_class": "classe_processual",
+    "subject": "assunto",
+    "status": "situacao",
+    "filing_date": "data_ajuizamento",
+    "latest_update": "ultima_movimentacao_descricao",
+}
+
+
+def _json_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _movement_search_vector(movements: List[Movement]):
+    """tsvector (weight B) of the given descriptions, or ``None`` if empty."""
+    if not movements:
+        return None
+    text = "\n".join(movement.description for movement in movements)
+    return func.setweight(func.to_tsvector(_SEARCH_CONFIG, text), literal_column("'B'"))
 
 
 class LegalCaseRepository(ILegalCaseRepository):
     """SQLAlchemy implementation for legal case persistence."""
 
-    def __init__(self, session: Session) -> None:
+    def __init__(
+        self,
+        session: Session,
+        embedded_movements: int = EMBEDDED_MOVEMENTS_LIMIT,
+        movement_types: Optional[MovementTypeDictionary] = None,
+    ) -> None:
         self._session = session
+        self._embedded_movements = embedded_movements
+        self._movement_types = movement_types or get_movement_type_dictionary()
 
-    def _model_to_persisted(self, model: LegalCaseModel) -> PersistedLegalCase:
-        movements = (
-            sorted(model.movements, key=lambda mv: mv.movement_date)
-            if model.movements
-            else []
+    def _rows_to_movements(self, rows) -> List[Movement]:
+        """Movements of rows carrying ``movement_date`` and ``movement_type_id``."""
+        rows = list(rows)
+        descriptions = self._movement_types.describe(
+            self._session, (row.movement_type_id for row in rows)
         )
-        domain_movements = [
-            Movement(date=movement.movement_date, description=movement.description)
-            for movement in movements
+        return [
+            Movement(
+                date=row.movement_date,
+                description=descriptions[row.movement_type_id],
+            )
+            for row in rows
         ]
+
+    def _model_to_persisted(
+        self, model: LegalCaseModel, movements: Optional[List[Movement]] = None
+    ) -> PersistedLegalCase:
+        domain_movements = sorted(movements or [], key=lambda mv: mv.date)
         numero_processo = model.numero_processo
         if numero_processo and numero_processo.isdigit() and len(numero_processo) == 20:
             try:
@@ -58,18 +156,230 @@ class LegalCaseRepository(ILegalCaseRepository):
             last_synced_at=model.last_synced_at,
             prioridade=model.prioridade,
             status=model.status,
+            movement_watermark=model.movement_watermark,
+            movement_digest=model.movement_digest,
+            movement_count=model.movimentacoes,
+        )
+
+    def _insert_movements(
+        self, legal_case_id, movements: List[Movement]
+    ) -> List[Movement]:
+        """Bulk insert movements, skipping rows already stored for the case.
+
+        Returns the movements actually inserted.
+        """
+        if not movements:
+            return []
+        type_ids = self._movement_types.encode(
+            self._session, (movement.description for movement in movements)
+        )
+        descriptions = {type_id: text for text, type_id in type_ids.items()}
+        now = datetime.now(timezone.utc)
+        inserted: List[Movement] = []
+        for start in range(0, len(movements), MOVEMENT_INSERT_CHUNK_SIZE):
+            chunk = movements[start : start + MOVEMENT_INSERT_CHUNK_SIZE]
+            stmt = (
+                pg_insert(LegalCaseMovementModel)
+                .values(
+                    [
+                        {
+                            "id": uuid4(),
+                            "legal_case_id": legal_case_id,
+                            "movement_date": movement.date,
+                            "movement_type_id": type_ids[movement.description],
+                            "created_at": now,
+                        }
+                        for movement in chunk
+                    ]
+                )
+                .on_conflict_do_nothing(constraint="uq_legal_case_movement")
+                .returning(
+                    LegalCaseMovementModel.movement_date,
+                    LegalCaseMovementModel.movement_type_id,
+                )
+            )
+            inserted.extend(
+                Movement(
+                    date=row.movement_date,
+                    description=descriptions[row.movement_type_id],
+                )
+                for row in self._session.execute(stmt)
+            )
+        return inserted
+
+    def _record_changes(
+        self,
+        model: LegalCaseModel,
+        previous: LegalCase,
+        updated: LegalCase,
+        inserted: List[Movement],
+    ) -> None:
+        """Write outbox events in the transaction applying the change."""
+        events = []
+        if inserted:
+            events.append(
+                (
+                    "movements_added",
+                    {
+                        "movements": [
+                            {
+                                "date": movement.date.isoformat(),
+                                "description": movement.description,
+                            }
+                            for movement in sorted(inserted, key=lambda m: m.date)
+                        ]
+                    },
+                )
+            )
+        fields = changed_fields(previous, updated)
+        if fields:
+            events.append(
+                (
+                    "fields_changed",
+                    {
+                        "fields": {
+                            CHANGE_FIELD_NAMES[name]: {
+                                "before": _json_value(getattr(previous, name)),
+                                "after": _json_value(getattr(updated, name)),
+                            }
+                            for name in fields
+                        }
+                    },
+                )
+            )
+        now = datetime.now(timezone.utc)
+        self._session.add_all(
+            LegalCaseChangeEventModel(
+                legal_case_id=model.id,
+                numero_processo=model.numero_processo,
+                event_type=event_type,
+                payload=payload,
+                created_at=now,
+                next_attempt_at=now,
+            )
+            for event_type, payload in events
         )
 
     def get_by_number(self, numero_processo: str) -> Optional[PersistedLegalCase]:
         stmt = (
             select(LegalCaseModel)
-            .options(selectinload(LegalCaseModel.movements))
+            .options(noload(LegalCaseModel.movements))
             .where(LegalCaseModel.numero_processo == numero_processo)
         )
         model = self._session.execute(stmt).scalar_one_or_none()
         if model is None:
             return None
-        return self._model_to_persisted(model)
+        latest = self.list_movements_page(str(model.id), self._embedded_movements)
+        return self._model_to_persisted(model, latest.movements)
+
+    def get_by_numbers(
+        self, numeros_processo: List[str]
+    ) -> Dict[str, PersistedLegalCase]:
+        if not numeros_processo:
+            return {}
+        stmt = (
+            select(LegalCaseModel)
+            .options(noload(LegalCaseModel.movements))
+            .where(LegalCaseModel.numero_processo.in_(set(numeros_processo)))
+        )
+        models = self._session.execute(stmt).scalars().all()
+        if not models:
+            return {}
+        latest = self._latest_movements([model.id for model in models])
+        return {
+            model.numero_processo: self._model_to_persisted(
+                model, latest.get(model.id, [])
+            )
+            for model in models
+        }
+
+    def _latest_movements(self, case_ids) -> Dict[object, List[Movement]]:
+        """Latest embedded movements of several cases in one query.
+
+        A LATERAL top-N per case walks ix_legal_case_movements_case_date_id
+        and stops after ``embedded_movements`` rows, whatever the history size.
+        """
+        movement = LegalCaseMovementModel
+        cases = (
+            select(LegalCaseModel.id.label("case_id"))
+            .where(LegalCaseModel.id.in_(case_ids))
+            .subquery()
+        )
+        latest_rows = (
+            select(movement.movement_date, movement.movement_type_id)
+            .where(movement.legal_case_id == cases.c.case_id)
+            .order_by(desc(movement.movement_date), desc(movement.id))
+            .limit(self._embedded_movements)
+            .lateral()
+        )
+        stmt = select(
+            cases.c.case_id,
+            latest_rows.c.movement_date,
+            latest_rows.c.movement_type_id,
+        ).select_from(cases.join(latest_rows, true()))
+        rows = self._session.execute(stmt).all()
+        latest: Dict[object, List[Movement]] = {}
+        for row, movement in zip(rows, self._rows_to_movements(rows)):
+            latest.setdefault(row.case_id, []).append(movement)
+        return latest
+
+    def get_case_id(self, numero_processo: str) -> Optional[str]:
+        case_id = self._session.execute(
+            select(LegalCaseModel.id).where(
+                LegalCaseModel.numero_processo == numero_processo
+            )
+        ).scalar_one_or_none()
+        return str(case_id) if case_id is not None else None
+
+    def list_movements_page(
+        self,
+        case_id: str,
+        limit: int,
+        before: Optional[MovementCursor] = None,
+    ) -> MovementPage:
+        # Served by ix_legal_case_movements_case_date_id; fetches one extra row
+        # to know whether an older page exists. The DEFAULT partition keeps
+        # Postgres from proving the partition order, so it merges one ordered
+        # index scan per partition (Merge Append); each partition yields at
+        # most limit + 1 rows, and a cursor prunes the years after it.
+        stmt = (
+            select(
+                LegalCaseMovementModel.id,
+                LegalCaseMovementModel.movement_date,
+                LegalCaseMovementModel.movement_type_id,
+            )
+            .where(LegalCaseMovementModel.legal_case_id == case_id)
+            .order_by(
+                desc(LegalCaseMovementModel.movement_date),
+                desc(LegalCaseMovementModel.id),
+            )
+            .limit(limit + 1)
+        )
+        if before is not None:
+            stmt = stmt.where(
+                # Row comparisons do not prune partitions; the plain bound on
+                # the partition key skips every year after the cursor.
+                LegalCaseMovementModel.movement_date <= before.movement_date,
+                tuple_(LegalCaseMovementModel.movement_date, LegalCaseMovementModel.id)
+                < tuple_(before.movement_date, UUID(before.movement_id)),
+            )
+        rows = self._session.execute(stmt).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = MovementCursor(rows[-1].movement_date, str(rows[-1].id))
+        return MovementPage(
+            movements=self._rows_to_movements(rows), next_cursor=next_cursor
+        )
+
+    def lock_case_number(self, numero_processo: str) -> None:
+        self._session.execute(
+            select(
+                func.pg_advisory_xact_lock(
+                    CASE_LOOKUP_LOCK_NAMESPACE, func.hashtext(numero_processo)
+                )
+            )
+        )
 
     def insert_case_with_movements(
         self,
@@ -77,37 +387,62 @@ class LegalCaseRepository(ILegalCaseRepository):
         case: LegalCase,
         movements: List[Movement],
     ) -> PersistedLegalCase:
+        # A savepoint keeps the caller's transaction usable after a failed
+        # insert, e.g. for the next case of a multi-get.
         try:
-            legal_case_model = LegalCaseModel(
-                numero_processo=case_number,
-                tribunal=case.court,
-                orgao_julgador=case.judging_body,
-                classe_processual=case.procedural_class,
-                assunto=case.subject,
-                situacao=case.status,
-                data_ajuizamento=case.filing_date,
-                movimentacoes=len(movements),
-                ultima_movimentacao=(movements[-1].date if movements else None),
-                ultima_movimentacao_descricao=case.latest_update,
-                status=case.status,
-                last_synced_at=datetime.now(timezone.utc),
-            )
-            self._session.add(legal_case_model)
-            self._session.flush()
-
-            for movement in movements:
-                movement_model = LegalCaseMovementModel(
-                    legal_case_id=legal_case_model.id,
-                    movement_date=movement.date,
-                    description=movement.description,
-                )
-                self._session.add(movement_model)
-
-            self._session.flush()
-            return self._model_to_persisted(legal_case_model)
+            with self._session.begin_nested():
+                return self._insert_case(case_number, case, movements)
         except Exception as exc:  # pylint: disable=broad-except
             raise LegalCasePersistenceError(str(exc)) from exc
 
+    def _insert_case(
+        self,
+        case_number: str,
+        case: LegalCase,
+        movements: List[Movement],
+    ) -> PersistedLegalCase:
+        legal_case_model = LegalCaseModel(
+            numero_processo=case_number,
+            tribunal=case.court,
+            orgao_julgador=case.judging_body,
+            classe_processual=case.procedural_class,
+            assunto=case.subject,
+            situacao=case.status,
+            data_ajuizamento=case.filing_date,
+            movimentacoes=len(movements),
+            ultima_movimentacao=(movements[-1].date if movements else None),
+            ultima_movimentacao_descricao=case.latest_update,
+            status=case.status,
+            last_synced_at=datetime.now(timezone.utc),
+            movement_watermark=max(
+                (movement.date for movement in movements), default=None
+            ),
+            movement_digest=movement_history_digest(movements),
+            movement_search_vector=_movement_search_vector(movements),
+        )
+        self._session.add(legal_case_model)
+        self._session.flush()
+
+        self._insert_movements(legal_case_model.id, movements)
+        latest = sorted(movements, key=lambda mv: mv.date)
+        return self._model_to_persisted(
+            legal_case_model, latest[-self._embedded_movements :]
+        )
+
+    @staticmethod
+    def _due_condition(stale_before: datetime, now: datetime):
+        return (LegalCaseModel.next_sync_at <= now) | (
+            LegalCaseModel.next_sync_at.is_(None)
+            & (
+                (LegalCaseModel.last_synced_at.is_(None))
+                | (LegalCaseModel.last_synced_at < stale_before)
+            )
+        )
+
+    @staticmethod
+    def _due_order():
+        return LegalCaseModel.next_sync_at.asc().nulls_first()
+
     def list_stale_cases(
         self,
         limit: int,
@@ -115,181 +450,605 @@ class LegalCaseRepository(ILegalCaseRepository):
     ) -> List[PersistedLegalCase]:
         stmt = (
             select(LegalCaseModel)
-            .options(selectinload(LegalCaseModel.movements))
-            .where(
-                (LegalCaseModel.last_synced_at.is_(None))
-                | (LegalCaseModel.last_synced_at < stale_before)
+            .options(noload(LegalCaseModel.movements))
+            .where(self._due_condition(stale_before, datetime.now(timezone.utc)))
+            .order_by(self._due_order())
+            .limit(limit)
+        )
+        models = self._session.execute(stmt).scalars().all()
+        return [self._model_to_persisted(model) for model in models]
+
+    def count_due_cases(self, stale_before: datetime) -> int:
+        stmt = select(func.count(LegalCaseModel.id)).where(
+            self._due_condition(stale_before, datetime.now(timezone.utc))
+        )
+        return int(self._session.execute(stmt).scalar_one())
+
+    def _lease(
+        self,
+        conditions: list,
+        limit: Optional[int],
+        owner: str,
+        lease_seconds: int,
+        previous_owner: Optional[str] = None,
+    ) -> List[PersistedLegalCase]:
+        now = datetime.now(timezone.utc)
+        lease_free = (
+            (LegalCaseModel.sync_lease_expires_at.is_(None))
+            | (LegalCaseModel.sync_lease_expires_at < now)
+            | (LegalCaseModel.sync_lease_owner == owner)
+        )
+        if previous_owner:
+            # An abandoned run's lease may still be valid; take it over.
+            lease_free = lease_free | (
+                LegalCaseModel.sync_lease_owner == previous_owner
             )
+        claimable = (
+            select(LegalCaseModel.id)
+            .where(*conditions, lease_free)
+            .order_by(self._due_order())
             .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        claim_stmt = (
+            update(LegalCaseModel)
+            .where(LegalCaseModel.id.in_(claimable))
+            .values(
+                sync_lease_owner=owner,
+                sync_lease_expires_at=now + timedelta(seconds=lease_seconds),
+            )
+            .returning(LegalCaseModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        claimed_ids = list(self._session.execute(claim_stmt).scalars())
+        if not claimed_ids:
+            return []
+        stmt = (
+            select(LegalCaseModel)
+            .options(noload(LegalCaseModel.movements))
+            .where(LegalCaseModel.id.in_(claimed_ids))
+            .order_by(self._due_order())
         )
         models = self._session.execute(stmt).scalars().all()
         return [self._model_to_persisted(model) for model in models]
 
+    def claim_stale_cases(
+        self,
+        limit: int,
+        stale_before: datetime,
+        owner: str,
+        lease_seconds: int,
+    ) -> List[PersistedLegalCase]:
+        due = self._due_condition(stale_before, datetime.now(timezone.utc))
+        return self._lease([due], limit, owner, lease_seconds)
+
+    def claim_cases(
+        self,
+        case_ids: List[str],
+        owner: str,
+        lease_seconds: int,
+        previous_owner: Optional[str] = None,
+    ) -> List[PersistedLegalCase]:
+        if not case_ids:
+            return []
+        return self._lease(
+            [LegalCaseModel.id.in_(case_ids)],
+            None,
+            owner,
+            lease_seconds,
+            previous_owner=previous_owner,
+        )
+
+    def renew_claims(self, case_ids: List[str], owner: str, lease_seconds: int) -> int:
+        if not case_ids:
+            return 0
+        result = self._session.execute(
+            update(LegalCaseModel)
+            .where(
+                LegalCaseModel.id.in_(case_ids),
+                LegalCaseModel.sync_lease_owner == owner,
+            )
+            .values(
+                sync_lease_expires_at=datetime.now(timezone.utc)
+                + timedelta(seconds=lease_seconds)
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self._session.flush()
+        return int(result.rowcount or 0)
+
+    def release_claims(self, case_ids: List[str], owner: str) -> None:
+        if not case_ids:
+            return
+        self._session.execute(
+            update(LegalCaseModel)
+            .where(
+                LegalCaseModel.id.in_(case_ids),
+                LegalCaseModel.sync_lease_owner == owner,
+            )
+            .values(sync_lease_owner=None, sync_lease_expires_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        self._session.flush()
+
+    def list_movements_since(self, case_id: str, since: datetime) -> List[Movement]:
+        stmt = (
+            select(
+                LegalCaseMovementModel.movement_date,
+                LegalCaseMovementModel.movement_type_id,
+            )
+            .where(
+                LegalCaseMovementModel.legal_case_id == case_id,
+                LegalCaseMovementModel.movement_date >= since,
+            )
+            .order_by(LegalCaseMovementModel.movement_date)
+        )
+        return self._rows_to_movements(self._session.execute(stmt))
+
     def apply_case_updates(
         self,
         persisted: PersistedLegalCase,
         updated_case: LegalCase,
         new_movements: List[Movement],
+        next_sync_at: Optional[datetime] = None,
     ) -> PersistedLegalCase:
         try:
-            model = self._session.get(LegalCaseModel, persisted.case_id)
-            if model is None:
-                raise LegalCasePersistenceError(
-                    "Processo não localizado para atualização."
+            with self._session.begin_nested():
+                model = self._session.get(
+                    LegalCaseModel,
+                    persisted.case_id,
+                    options=[noload(LegalCaseModel.movements)],
                 )
+                if model is None:
+                    raise LegalCasePersistenceError(
+                        "Processo não localizado para atualização."
+                    )
 
-            model.tribunal = updated_case.court
-            model.orgao_julgador = updated_case.judging_body
-            model.classe_processual = updated_case.procedural_class
-            model.assunto = updated_case.subject
-            model.situacao = updated_case.status
-            model.status = updated_case.status
-            model.data_ajuizamento = updated_case.filing_date
-            ordered_movements = sorted(
-                updated_case.movement_history or [], key=lambda m: m.date
-            )
-            model.ultima_movimentacao = (
-                ordered_movements[-1].date if ordered_movements else None
-            )
-            model.ultima_movimentacao_descricao = updated_case.latest_update
-            model.movimentacoes = len(ordered_movements)
-            model.last_synced_at = datetime.now(timezone.utc)
-
-            for movement in new_movements:
-                movement_model = LegalCaseMovementModel(
-                    legal_case_id=model.id,
-                    movement_date=movement.date,
-                    description=movement.description,
+                model.tribunal = updated_case.court
+                model.orgao_julgador = updated_case.judging_body
+                model.classe_processual = updated_case.procedural_class
+                model.assunto = updated_case.subject
+                model.situacao = updated_case.status
+                model.status = updated_case.status
+                model.data_ajuizamento = updated_case.filing_date
+                ordered_movements = sorted(
+                    updated_case.movement_history or [], key=lambda m: m.date
+                )
+                model.ultima_movimentacao = (
+                    ordered_movements[-1].date if ordered_movements else None
                 )
-                self._session.add(movement_model)
+                model.ultima_movimentacao_descricao = updated_case.latest_update
+                model.movimentacoes = len(ordered_movements)
+                model.last_synced_at = datetime.now(timezone.utc)
+                model.next_sync_at = next_sync_at
+                if ordered_movements:
+                    model.movement_watermark = max(
+                        ordered_movements[-1].date,
+                        model.movement_watermark or ordered_movements[-1].date,
+                    )
+                model.movement_digest = movement_history_digest(ordered_movements)
+                if new_movements:
+                    # Incremental: only the new descriptions are tokenized.
+                    model.movement_search_vector = func.coalesce(
+                        LegalCaseModel.movement_search_vector, _EMPTY_TSVECTOR
+                    ).op("||")(_movement_search_vector(new_movements))
 
-            self._session.flush()
-            return self._model_to_persisted(model)
+                inserted = self._insert_movements(model.id, new_movements)
+                self._record_changes(model, persisted.case, updated_case, inserted)
+                self._session.flush()
+                return self._model_to_persisted(model)
         except LegalCasePersistenceError:
             raise
         except Exception as exc:  # pylint: disable=broad-except
             raise LegalCasePersistenceError(str(exc)) from exc
 
-    def aggregate_dashboard(
-        self, filters: ProcessDashboardFilters
-    ) -> ProcessDashboardAggregation:
-        base_query = select(
+    def rebuild_case(self, case_number: str, case: LegalCase) -> PersistedLegalCase:
+        movements = sorted(case.movement_history or [], key=lambda m: m.date)
+        self.lock_case_number(case_number)
+        model = self._session.execute(
+            select(LegalCaseModel)
+            .options(noload(LegalCaseModel.movements))
+            .where(LegalCaseModel.numero_processo == case_number)
+        ).scalar_one_or_none()
+        if model is None:
+            return self.insert_case_with_movements(case_number, case, movements)
+        try:
+            previous = self._model_to_persisted(model).case
+            model.tribunal = case.court
+            model.orgao_julgador = case.judging_body
+            model.classe_processual = case.procedural_class
+            model.assunto = case.subject
+            model.situacao = case.status
+            model.status = case.status
+            model.data_ajuizamento = case.filing_date
+            model.ultima_movimentacao = movements[-1].date if movements else None
+            model.ultima_movimentacao_descricao = case.latest_update
+            model.movimentacoes = len(movements)
+            model.movement_watermark = movements[-1].date if movements else None
+            model.movement_digest = movement_history_digest(movements)
+            model.movement_search_vector = _movement_search_vector(movements)
+
+            self._session.execute(
+                delete(LegalCaseMovementModel).where(
+                    LegalCaseMovementModel.legal_case_id == model.id
+                )
+            )
+            self._insert_movements(model.id, movements)
+            self._record_changes(model, previous, case, [])
+            self._session.flush()
+            return self._model_to_persisted(
+                model, movements[-self._embedded_movements :]
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            raise LegalCasePersistenceError(str(exc)) from exc
+
+    def reschedule(self, case_id: str, next_sync_at: datetime) -> None:
+        self._session.execute(
+            update(LegalCaseModel)
+            .where(LegalCaseModel.id == case_id)
+            .values(next_sync_at=next_sync_at)
+            .execution_options(synchronize_session=False)
+        )
+        self._session.flush()
+
+    def search_cases(
+        self, query: str, limit: int, offset: int = 0
+    ) -> List[LegalCaseSearchHit]:
+        tsquery = func.websearch_to_tsquery(_SEARCH_CONFIG, query)
+        document = func.coalesce(LegalCaseModel.search_vector, _EMPTY_TSVECTOR).op(
+            "||"
+        )(func.coalesce(LegalCaseModel.movement_search_vector, _EMPTY_TSVECTOR))
+        rank = func.ts_rank_cd(document, tsquery).label("rank")
+        # Each side of the OR is answered by its own GIN index (bitmap OR);
+        # only matching cases are ranked, never the movement rows.
+        stmt = (
+            select(
+                LegalCaseModel.id,
+                LegalCaseModel.numero_processo,
+                LegalCaseModel.tribunal,
+                LegalCaseModel.classe_processual,
+                LegalCaseModel.assunto,
+                LegalCaseModel.ultima_movimentacao,
+                rank,
+            )
+            .where(
+                LegalCaseModel.last_synced_at.is_not(None),
+                or_(
+                    LegalCaseModel.search_vector.bool_op("@@")(tsquery),
+                    LegalCaseModel.movement_search_vector.bool_op("@@")(tsquery),
+                ),
+            )
+            .order_by(desc(rank), LegalCaseModel.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = self._session.execute(stmt).all()
+        matched = self._matched_movements([row.id for row in rows], tsquery)
+        return [
+            LegalCaseSearchHit(
+                case_id=str(row.id),
+                numero_processo=row.numero_processo,
+                tribunal=row.tribunal,
+                classe_processual=row.classe_processual,
+                assunto=row.assunto,
+                ultima_movimentacao=row.ultima_movimentacao,
+                rank=float(row.rank),
+                matched_movements=matched.get(row.id, []),
+            )
+            for row in rows
+        ]
+
+    def _matched_movements(self, case_ids, tsquery) -> Dict[object, List[Movement]]:
+        if not case_ids:
+            return {}
+        movement = LegalCaseMovementModel
+        movement_type = LegalCaseMovementTypeModel
+        # The dictionary's GIN index finds the matching descriptions once; the
+        # movements of the page's cases are then filtered by type id.
+        ranked = (
+            select(
+                movement.legal_case_id,
+                movement.movement_date,
+                movement_type.description,
+                func.row_number()
+                .over(
+                    partition_by=movement.legal_case_id,
+                    order_by=(
+                        desc(func.ts_rank_cd(movement_type.search_vector, tsquery)),
+                        desc(movement.movement_date),
+                    ),
+                )
+                .label("position"),
+            )
+            .join(movement_type, movement_type.id == movement.movement_type_id)
+            .where(
+                movement.legal_case_id.in_(case_ids),
+                movement_type.search_vector.bool_op("@@")(tsquery),
+            )
+            .subquery()
+        )
+        stmt = (
+            select(ranked.c.legal_case_id, ranked.c.movement_date, ranked.c.description)
+            .where(ranked.c.position <= SEARCH_MATCHED_MOVEMENTS)
+            .order_by(ranked.c.legal_case_id, ranked.c.position)
+        )
+        matched: Dict[object, List[Movement]] = {}
+        for row in self._session.execute(stmt):
+            matched.setdefault(row.legal_case_id, []).append(
+                Movement(date=row.movement_date, description=row.description)
+            )
+        return matched
+
+    @staticmethod
+    def _dimension_conditions(filters: ProcessDashboardFilters, model) -> list:
+        """Non-date filters; ``model`` is ``legal_cases`` or its daily rollup."""
+        conditions = []
+        if filters.status:
+            conditions.append(model.status.in_(filters.status))
+        if filters.priority:
+            conditions.append(model.prioridade.in_(filters.priority))
+        if filters.tribunal:
+            conditions.append(model.tribunal.in_(filters.tribunal))
+        return conditions
+
+    @classmethod
+    def _filter_conditions(cls, filters: ProcessDashboardFilters) -> list:
+        # Import placeholders stay out of listings until their first sync.
+        conditions = [LegalCaseModel.last_synced_at.is_not(None)]
+        if filters.date_from:
+            conditions.append(LegalCaseModel.created_at >= filters.date_from)
+        if filters.date_to:
+            conditions.append(LegalCaseModel.created_at <= filters.date_to)
+        return conditions + cls._dimension_conditions(filters, LegalCaseModel)
+
+    def list_cases(
+        self,
+        filters: ProcessDashboardFilters,
+        limit: int,
+        after: Optional[CaseListCursor] = None,
+    ) -> LegalCaseListPage:
+        sort_field = filters.sort_field or DEFAULT_CASE_LIST_SORT_FIELD
+        column = getattr(LegalCaseModel, sort_field)
+        descending = filters.sort_direction == "desc"
+        conditions = self._filter_conditions(filters)
+        projection = select(
             LegalCaseModel.id,
             LegalCaseModel.numero_processo,
             LegalCaseModel.tribunal,
+            LegalCaseModel.classe_processual,
+            LegalCaseModel.assunto,
             LegalCaseModel.status,
             LegalCaseModel.prioridade,
             LegalCaseModel.movimentacoes,
             LegalCaseModel.data_ajuizamento,
             LegalCaseModel.ultima_movimentacao,
+            LegalCaseModel.ultima_movimentacao_descricao,
             LegalCaseModel.created_at,
+        ).where(*conditions)
+        after_id = (
+            literal(UUID(after.case_id), LegalCaseModel.id.type) if after else None
         )
 
-        conditions = []
-        if filters.date_from:
-            conditions.append(LegalCaseModel.created_at >= filters.date_from)
-        if filters.date_to:
-            conditions.append(LegalCaseModel.created_at <= filters.date_to)
-        if filters.status:
-            conditions.append(LegalCaseModel.status.in_(filters.status))
-        if filters.priority:
-            conditions.append(LegalCaseModel.prioridade.in_(filters.priority))
-        if filters.tribunal:
-            conditions.append(LegalCaseModel.tribunal.in_(filters.tribunal))
-
-        if conditions:
-            base_query = base_query.where(*conditions)
-
-        filtered = base_query.subquery()
+        # Rows with a value first, then rows without one; each phase keeps a
+        # plain ORDER BY that a (column, id) index scan answers directly.
+        rows = []
+        if after is None or after.sort_value is not None:
+            stmt = projection.where(column.is_not(None))
+            if after is not None:
+                key = tuple_(column, LegalCaseModel.id)
+                position = tuple_(literal(after.sort_value, column.type), after_id)
+                stmt = stmt.where(key < position if descending else key > position)
+            order = (
+                (desc(column), desc(LegalCaseModel.id))
+                if descending
+                else (column, LegalCaseModel.id)
+            )
+            rows = self._session.execute(stmt.order_by(*order).limit(limit + 1)).all()
+        if len(rows) <= limit and LegalCaseModel.__table__.c[sort_field].nullable:
+            stmt = projection.where(column.is_(None))
+            if after is not None and after.sort_value is None:
+                stmt = stmt.where(
+                    LegalCaseModel.id < after_id
+                    if descending
+                    else LegalCaseModel.id > after_id
+                )
+            order = desc(LegalCaseModel.id) if descending else LegalCaseModel.id
+            rows += self._session.execute(
+                stmt.order_by(order).limit(limit + 1 - len(rows))
+            ).all()
 
-        status_counts_stmt = select(filtered.c.status, func.count()).group_by(
-            filtered.c.status
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = CaseListCursor(
+                getattr(rows[-1], sort_field), str(rows[-1].id)
+            )
+        items = [
+            LegalCaseSummary(
+                case_id=str(row.id),
+                numero_processo=row.numero_processo,
+                tribunal=row.tribunal,
+                classe_processual=row.classe_processual,
+                assunto=row.assunto,
+                status=row.status,
+                prioridade=row.prioridade,
+                movimentacoes=int(row.movimentacoes or 0),
+                data_ajuizamento=row.data_ajuizamento,
+                ultima_movimentacao=row.ultima_movimentacao,
+                ultima_movimentacao_descricao=row.ultima_movimentacao_descricao,
+                created_at=row.created_at,
+            )
+            for row in rows
+        ]
+        return LegalCaseListPage(
+            items=items,
+            next_cursor=next_cursor,
+            sort_field=sort_field,
+            sort_direction="desc" if descending else "asc",
         )
-        status_count = {
-            row[0] or "desconhecido": int(row[1])
-            for row in self._session.execute(status_counts_stmt)
-        }
 
-        by_court_stmt = (
-            select(filtered.c.tribunal, func.count())
-            .group_by(filtered.c.tribunal)
-            .order_by(desc(func.count()))
-        )
-        by_court = [
-            {"tribunal": row[0] or "desconhecido", "count": int(row[1])}
-            for row in self._session.execute(by_court_stmt)
+    def aggregate_dashboard(
+        self, filters: ProcessDashboardFilters
+    ) -> ProcessDashboardAggregation:
+        # One round trip. The counters come from the daily rollups for the
+        # days wholly inside the date range and from legal_cases only for the
+        # partial days at its edges; one GROUPING SETS pass folds them. The
+        # top-5 lists read legal_cases directly, where the (column, id)
+        # indexes can answer them, and are appended to the same result, each
+        # row tagged with its dashboard section.
+        rollup = LegalCaseDailyRollupModel
+        interval_seconds = func.extract(
+            "epoch",
+            LegalCaseModel.ultima_movimentacao - LegalCaseModel.data_ajuizamento,
+        ) / func.nullif(LegalCaseModel.movimentacoes, 0)
+        sources = [
+            select(
+                rollup.status,
+                rollup.tribunal,
+                func.to_char(rollup.day, "YYYY-MM").label("period"),
+                rollup.case_count.label("cases"),
+                rollup.interval_seconds,
+                rollup.interval_count,
+            ).where(
+                rollup.case_count > 0,
+                *self._dimension_conditions(filters, rollup),
+                *whole_day_conditions(
+                    rollup.day,
+                    LegalCaseModel.created_at,
+                    filters.date_from,
+                    filters.date_to,
+                ),
+            )
         ]
+        partial_days = partial_day_condition(
+            LegalCaseModel.created_at, filters.date_from, filters.date_to
+        )
+        if partial_days is not None:
+            sources.append(
+                select(
+                    LegalCaseModel.status,
+                    LegalCaseModel.tribunal,
+                    month_period(LegalCaseModel.created_at).label("period"),
+                    literal(1).label("cases"),
+                    func.coalesce(interval_seconds, 0).label("interval_seconds"),
+                    case((interval_seconds.is_(None), 0), else_=1).label(
+                        "interval_count"
+                    ),
+                ).where(*self._filter_conditions(filters), partial_days)
+            )
+        counted = union_all(*sources).cte("counted")
 
-        date_trunc = func.date_trunc("month", filtered.c.created_at)
-        by_period_stmt = (
-            select(func.to_char(date_trunc, "YYYY-MM"), func.count())
-            .group_by(func.to_char(date_trunc, "YYYY-MM"))
-            .order_by(func.to_char(date_trunc, "YYYY-MM"))
+        by_status = func.grouping(counted.c.status) == 0
+        by_court = func.grouping(counted.c.tribunal) == 0
+        by_period = func.grouping(counted.c.period) == 0
+        counters = select(
+            case(
+                (by_status, literal("status_count")),
+                (by_court, literal("by_court")),
+                (by_period, literal("by_period")),
+                else_=literal("total"),
+            ).label("section"),
+            case(
+                (by_status, counted.c.status),
+                (by_court, counted.c.tribunal),
+                (by_period, counted.c.period),
+            ).label("label"),
+            func.sum(counted.c.cases).label("count"),
+            (
+                func.sum(counted.c.interval_seconds)
+                / func.nullif(func.sum(counted.c.interval_count), 0)
+            ).label("avg_seconds"),
+            null().label("tribunal"),
+            null().label("movimentacoes"),
+            null().label("ultima_movimentacao"),
+        ).group_by(
+            func.grouping_sets(
+                tuple_(counted.c.status),
+                tuple_(counted.c.tribunal),
+                tuple_(counted.c.period),
+                tuple_(),
+            )
         )
-        by_period = [
-            {"period": row[0], "count": int(row[1])}
-            for row in self._session.execute(by_period_stmt)
-        ]
 
-        avg_time_expr = func.avg(
-            func.extract(
-                "epoch",
-                filtered.c.ultima_movimentacao - filtered.c.data_ajuizamento,
+        def top_cases(section: str, order_by):
+            return (
+                select(
+                    literal(section).label("section"),
+                    LegalCaseModel.numero_processo.label("label"),
+                    null().label("count"),
+                    null().label("avg_seconds"),
+                    LegalCaseModel.tribunal,
+                    LegalCaseModel.movimentacoes,
+                    LegalCaseModel.ultima_movimentacao,
+                )
+                .where(*self._filter_conditions(filters))
+                .order_by(order_by)
+                .limit(5)
             )
-            / func.nullif(filtered.c.movimentacoes, 0)
+
+        stmt = union_all(
+            counters,
+            top_cases("top_by_movements", desc(LegalCaseModel.movimentacoes)),
+            top_cases("last_updated_list", desc(LegalCaseModel.ultima_movimentacao)),
         )
-        avg_time_seconds = (
-            self._session.execute(select(avg_time_expr)).scalar_one_or_none() or 0.0
+
+        sections: Dict[str, list] = {}
+        for row in self._session.execute(stmt):
+            sections.setdefault(row.section, []).append(row)
+
+        status_count = {
+            row.label or "desconhecido": int(row.count)
+            for row in sections.get("status_count", [])
+        }
+        by_court_rows = sorted(
+            sections.get("by_court", []), key=lambda row: -int(row.count)
+        )
+        by_period_rows = sorted(
+            sections.get("by_period", []), key=lambda row: row.label or ""
         )
+        total = sections.get("total")
+        avg_time_seconds = (total[0].avg_seconds if total else None) or 0.0
         avg_time_days = float(avg_time_seconds) / 86400.0 if avg_time_seconds else 0.0
 
-        top_by_movements_stmt = (
-            select(
-                filtered.c.numero_processo,
-                filtered.c.tribunal,
-                filtered.c.movimentacoes,
-                filtered.c.ultima_movimentacao,
-            )
-            .order_by(desc(filtered.c.movimentacoes))
-            .limit(5)
-        )
-        top_by_movements = [
-            {
-                "numero_processo": row[0],
-                "tribunal": row[1],
-                "movimentacoes": int(row[2] or 0),
-                "ultima_movimentacao": row[3],
-            }
-            for row in self._session.execute(top_by_movements_stmt)
-        ]
-
-        last_updated_stmt = (
-            select(
-                filtered.c.numero_processo,
-                filtered.c.tribunal,
-                filtered.c.movimentacoes,
-                filtered.c.ultima_movimentacao,
-            )
-            .order_by(desc(filtered.c.ultima_movimentacao))
-            .limit(5)
-        )
-        last_updated = [
-            {
-                "numero_processo": row[0],
-                "tribunal": row[1],
-                "movimentacoes": int(row[2] or 0),
-                "ultima_movimentacao": row[3],
-            }
-            for row in self._session.execute(last_updated_stmt)
-        ]
+        def cases(rows) -> List[Dict[str, object]]:
+            return [
+                {
+                    "numero_processo": row.label,
+                    "tribunal": row.tribunal,
+                    "movimentacoes": int(row.movimentacoes or 0),
+                    "ultima_movimentacao": row.ultima_movimentacao,
+                }
+                for row in rows
+            ]
 
         data = {
             "status_count": status_count,
-            "by_court": by_court,
-            "by_period": by_period,
+            "by_court": [
+                {"tribunal": row.label or "desconhecido", "count": int(row.count)}
+                for row in by_court_rows
+            ],
+            "by_period": [
+                {"period": row.label, "count": int(row.count)} for row in by_period_rows
+            ],
             "period_granularity": "monthly",
             "avg_time_between_movements_days": round(avg_time_days, 2),
-            "top_by_movements": top_by_movements,
-            "last_updated_list": last_updated,
+            # UNION ALL does not promise to keep each branch's order: sort the
+            # lists again as the database did (NULLs first when descending).
+            "top_by_movements": cases(
+                sorted(
+                    sections.get("top_by_movements", []),
+                    key=lambda row: -row.movimentacoes,
+                )
+            ),
+            "last_updated_list": cases(
+                sorted(
+                    sections.get("last_updated_list", []),
+                    key=lambda row: (
+                        row.ultima_movimentacao is None,
+                        row.ultima_movimentacao or datetime.min,
+                    ),
+                    reverse=True,
+                )
+            ),
         }
         return ProcessDashboardAggregation(data=data)
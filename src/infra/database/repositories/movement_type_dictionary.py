@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from src.domain.core import metrics
+from src.infra.database.models import LegalCaseMovementTypeModel
+
+DEFAULT_MOVEMENT_TYPE_CACHE_ENTRIES = 100_000
+
+
+def description_hash(description: str) -> bytes:
+    """Dictionary key of a description; matches ``decode(md5(...), 'hex')``."""
+    return hashlib.md5(description.encode("utf-8")).digest()
+
+
+class MovementTypeDictionary:
+    """Encodes movement descriptions as ``legal_case_movement_types`` ids.
+
+    Reads resolve ids through a process-wide LRU cache: ids come from a
+    sequence and rows are never updated, so a cached id can never map to
+    another description, even if the transaction that created it rolled back.
+    Descriptions are not cached the other way round (description -> id),
+    since an id created by a rolled-back transaction would then be reused.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MOVEMENT_TYPE_CACHE_ENTRIES) -> None:
+        self._max_entries = max(1, max_entries)
+        self._descriptions: "OrderedDict[int, str]" = OrderedDict()
+        self._lock = Lock()
+
+    def _remember(self, descriptions: Dict[int, str]) -> None:
+        with self._lock:
+            for type_id, description in descriptions.items():
+                self._descriptions[type_id] = description
+                self._descriptions.move_to_end(type_id)
+            while len(self._descriptions) > self._max_entries:
+                self._descriptions.popitem(last=False)
+
+    def describe(self, session: Session, type_ids: Iterable[int]) -> Dict[int, str]:
+        """Descriptions of ``type_ids``; only uncached ids hit the database."""
+        found: Dict[int, str] = {}
+        missing = []
+        with self._lock:
+            for type_id in set(type_ids):
+                description = self._descriptions.get(type_id)
+                if description is None:
+                    missing.append(type_id)
+                else:
+                    self._descriptions.move_to_end(type_id)
+                    found[type_id] = description
+        if missing:
+            metrics.increment("movement_type_cache_misses", len(missing))
+            loaded = {
+                row.id: row.description
+                for row in session.execute(
+                    select(
+                        LegalCaseMovementTypeModel.id,
+                        LegalCaseMovementTypeModel.description,
+                    ).where(LegalCaseMovementTypeModel.id.in_(missing))
+                )
+            }
+            self._remember(loaded)
+            found.update(loaded)
+        return found
+
+    def _select_ids(self, session: Session, hashes: Iterable[bytes]) -> Dict[str, int]:
+        rows = session.execute(
+            select(
+                LegalCaseMovementTypeModel.id, LegalCaseMovementTypeModel.description
+            ).where(LegalCaseMovementTypeModel.description_hash.in_(list(hashes)))
+        )
+        return {row.description: row.id for row in rows}
+
+    def encode(self, session: Session, descriptions: Iterable[str]) -> Dict[str, int]:
+        """Ids of ``descriptions``, inserting the ones not in the dictionary."""
+        wanted = {description_hash(text): text for text in set(descriptions)}
+        if not wanted:
+            return {}
+        ids = self._select_ids(session, wanted)
+        missing = sorted(text for text in wanted.values() if text not in ids)
+        if missing:
+            # Only new descriptions are inserted, so existing ones never burn
+            # sequence values; the sorted order keeps concurrent writers from
+            # deadlocking on the unique index.
+            inserted = session.execute(
+                pg_insert(LegalCaseMovementTypeModel)
+                .values(
+                    [
+                        {
+                            "description_hash": description_hash(text),
+                            "description": text,
+                        }
+                        for text in missing
+                    ]
+                )
+                .on_conflict_do_nothing(constraint="uq_legal_case_movement_type")
+                .returning(
+                    LegalCaseMovementTypeModel.id,
+                    LegalCaseMovementTypeModel.description,
+                )
+            )
+            ids.update({row.description: row.id for row in inserted})
+            raced = [description_hash(text) for text in missing if text not in ids]
+            if raced:
+                # Committed meanwhile by another transaction.
+                ids.update(self._select_ids(session, raced))
+        self._remember({type_id: text for text, type_id in ids.items()})
+        return ids
+
+
+@lru_cache(maxsize=1)
+def get_movement_type_dictionary() -> MovementTypeDictionary:
+    """Process-wide dictionary shared by every repository session."""
+    return MovementTypeDictionary()
@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from typing import Dict, List
 from uuid import UUID
 
-from sqlalchemy import case, func, select
+from sqlalchemy import func, literal, select, union_all
 from sqlalchemy.orm import Session
 
 from src.domain.core.errors import SolicitationNotFoundError
@@ -14,7 +14,14 @@ from src.domain.repositories.solicitation_repository import (
     SolicitationDashboardFilters,
     SolicitationRecord,
 )
-from src.infra.database.models import SolicitationModel
+from src.infra.database.dashboard_rollups import (
+    month_period,
+    partial_day_condition,
+    whole_day_conditions,
+)
+from src.infra.database.models import SolicitationDailyRollupModel, SolicitationModel
+
+SOLICITATION_STATUSES = tuple(SolicitationModel.__table__.c.status.type.enums)
 
 
 class SolicitationRepository(ISolicitationRepository):
@@ -59,85 +66,118 @@ class SolicitationRepository(ISolicitationRepository):
         self._session.add(model)
         self._session.flush()
 
-    def dashboard(
-        self, filters: SolicitationDashboardFilters
-    ) -> SolicitationDashboardAggregation:
-        base_query = select(
-            SolicitationModel.id,
-            SolicitationModel.status,
-            SolicitationModel.created_at,
-            SolicitationModel.updated_at,
-            SolicitationModel.prioridade,
-            SolicitationModel.estado,
-            SolicitationModel.municipio,
-        )
+    @staticmethod
+    def _dimension_conditions(filters: SolicitationDashboardFilters, model) -> list:
+        """Non-date filters; ``model`` is ``solicitacoes`` or its daily rollup."""
+        conditions = []
+        if filters.status:
+            conditions.append(model.status.in_(filters.status))
+        if filters.priority:
+            conditions.append(model.prioridade.in_(filters.priority))
+        if filters.state:
+            conditions.append(model.estado.in_(filters.state))
+        if filters.city:
+            conditions.append(model.municipio.in_(filters.city))
+        return conditions
 
+    @classmethod
+    def _filter_conditions(cls, filters: SolicitationDashboardFilters) -> list:
         conditions = []
         if filters.date_from:
             conditions.append(SolicitationModel.created_at >= filters.date_from)
         if filters.date_to:
             conditions.append(SolicitationModel.created_at <= filters.date_to)
-        if filters.status:
-            conditions.append(SolicitationModel.status.in_(filters.status))
-        if filters.priority:
-            conditions.append(SolicitationModel.prioridade.in_(filters.priority))
-        if filters.state:
-            conditions.append(SolicitationModel.estado.in_(filters.state))
-        if filters.city:
-            conditions.append(SolicitationModel.municipio.in_(filters.city))
+        return conditions + cls._dimension_conditions(filters, SolicitationModel)
 
-        if conditions:
-            base_query = base_query.where(*conditions)
+    def dashboard(
+        self, filters: SolicitationDashboardFilters
+    ) -> SolicitationDashboardAggregation:
+        # Whole days inside the date range come from the daily rollups and
+        # only the partial days at its edges from solicitacoes. One GROUP BY
+        # folds them into a row per month (default granularity) carrying a
+        # FILTERed count per status and the processing time partial sums;
+        # every section is then folded from these rows.
+        rollup = SolicitationDailyRollupModel
+        sources = [
+            select(
+                rollup.status,
+                func.to_char(rollup.day, "YYYY-MM").label("period"),
+                rollup.solicitation_count.label("solicitations"),
+                rollup.processing_seconds.label("seconds"),
+            ).where(
+                rollup.solicitation_count > 0,
+                *self._dimension_conditions(filters, rollup),
+                *whole_day_conditions(
+                    rollup.day,
+                    SolicitationModel.created_at,
+                    filters.date_from,
+                    filters.date_to,
+                ),
+            )
+        ]
+        partial_days = partial_day_condition(
+            SolicitationModel.created_at, filters.date_from, filters.date_to
+        )
+        if partial_days is not None:
+            sources.append(
+                select(
+                    SolicitationModel.status,
+                    month_period(SolicitationModel.created_at).label("period"),
+                    literal(1).label("solicitations"),
+                    func.extract(
+                        "epoch",
+                        SolicitationModel.updated_at - SolicitationModel.created_at,
+                    ).label("seconds"),
+                ).where(*self._filter_conditions(filters), partial_days)
+            )
+        counted = union_all(*sources).cte("counted")
 
-        filtered = base_query.subquery()
+        status = counted.c.status
+        processed = status != "pendente"
 
-        status_counts_stmt = (
-            select(filtered.c.status, func.count())
-            .select_from(filtered)
-            .group_by(filtered.c.status)
-        )
-        status_counts = {
-            row[0]: int(row[1]) for row in self._session.execute(status_counts_stmt)
-        }
+        def total(column, condition=None):
+            aggregate = func.sum(column)
+            if condition is not None:
+                aggregate = aggregate.filter(condition)
+            return func.coalesce(aggregate, 0)
 
-        # Aggregation by period (default monthly)
-        date_trunc_expr = func.date_trunc("month", filtered.c.created_at)
-        by_period_stmt = (
-            select(func.to_char(date_trunc_expr, "YYYY-MM"), func.count())
-            .select_from(filtered)
-            .group_by(func.to_char(date_trunc_expr, "YYYY-MM"))
-            .order_by(func.to_char(date_trunc_expr, "YYYY-MM"))
+        stmt = (
+            select(
+                counted.c.period,
+                total(counted.c.solicitations).label("count"),
+                *(
+                    total(counted.c.solicitations, status == value).label(value)
+                    for value in SOLICITATION_STATUSES
+                ),
+                total(counted.c.seconds, processed).label("seconds"),
+                total(counted.c.solicitations, processed).label("processed"),
+            )
+            .group_by(counted.c.period)
+            .order_by(counted.c.period)
         )
-        by_period = [
-            {"period": row[0], "count": int(row[1])}
-            for row in self._session.execute(by_period_stmt)
-        ]
+        rows = self._session.execute(stmt).all()
+
+        status_counts: Dict[str, int] = {}
+        for value in SOLICITATION_STATUSES:
+            total = sum(int(getattr(row, value)) for row in rows)
+            if total:
+                status_counts[value] = total
+        by_period = [{"period": row.period, "count": int(row.count)} for row in rows]
 
         # Average processing time (in days) for solicitations that are not pending
-        processing_query = (
-            select(
-                func.avg(
-                    func.extract("epoch", filtered.c.updated_at - filtered.c.created_at)
-                )
-            )
-            .select_from(filtered)
-            .where(filtered.c.status != "pendente")
+        processed_count = sum(int(row.processed) for row in rows)
+        avg_processing_seconds = (
+            sum(row.seconds for row in rows) / processed_count
+            if processed_count
+            else None
         )
-        avg_processing_seconds = self._session.execute(
-            processing_query
-        ).scalar_one_or_none()
         avg_processing_time_days = (
             float(avg_processing_seconds) / 86400.0 if avg_processing_seconds else 0.0
         )
 
         # Approval rate
-        approval_counts_stmt = select(
-            func.sum(case((filtered.c.status == "aprovada", 1), else_=0)),
-            func.sum(
-                case((filtered.c.status.in_(["aprovada", "reprovada"]), 1), else_=0)
-            ),
-        ).select_from(filtered)
-        approved, total_closed = self._session.execute(approval_counts_stmt).one()
+        approved = status_counts.get("aprovada", 0)
+        total_closed = approved + status_counts.get("reprovada", 0)
         approval_rate = (float(approved) / float(total_closed)) if total_closed else 0.0
 
         # Placeholder for most missing documents - requires business rules to determine missing docs
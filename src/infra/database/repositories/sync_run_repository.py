@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from src.infra.database.models import SyncRunModel
+
+RESULT_COUNTERS = {
+    "updated": "updated_cases",
+    "skipped": "skipped_cases",
+    "error": "failed_cases",
+    "failed": "failed_cases",
+}
+
+
+class SyncRunRepository:
+    """Progress records for legal case sync runs, used to resume interrupted runs."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def start(
+        self, owner: str, case_ids: List[str], resumed_from: Optional[str] = None
+    ) -> SyncRunModel:
+        run = SyncRunModel(
+            owner=owner,
+            status="running",
+            resumed_from=resumed_from,
+            pending_case_ids=[str(case_id) for case_id in case_ids],
+            total_cases=len(case_ids),
+        )
+        self._session.add(run)
+        self._session.flush()
+        return run
+
+    def find_abandoned(self, heartbeat_before: datetime) -> Optional[SyncRunModel]:
+        """Return a running record whose worker stopped sending heartbeats.
+
+        The row is locked with ``SKIP LOCKED`` so only one replica resumes it.
+        """
+        stmt = (
+            select(SyncRunModel)
+            .where(
+                SyncRunModel.status == "running",
+                SyncRunModel.heartbeat_at < heartbeat_before,
+            )
+            .order_by(SyncRunModel.started_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        return self._session.execute(stmt).scalar_one_or_none()
+
+    def record_case(self, run_id: str, case_id: str, result: str) -> None:
+        run = self._session.get(SyncRunModel, run_id)
+        if run is None:
+            return
+        run.pending_case_ids = [
+            pending for pending in run.pending_case_ids or [] if pending != str(case_id)
+        ]
+        counter = RESULT_COUNTERS.get(result)
+        if counter:
+            setattr(run, counter, getattr(run, counter) + 1)
+        run.heartbeat_at = datetime.now(timezone.utc)
+        self._session.flush()
+
+    def heartbeat(self, run_id: str) -> None:
+        self._session.execute(
+            update(SyncRunModel)
+            .where(SyncRunModel.id == run_id, SyncRunModel.status == "running")
+            .values(heartbeat_at=datetime.now(timezone.utc))
+        )
+        self._session.flush()
+
+    def finish(self, run_id: str, status: str) -> None:
+        now = datetime.now(timezone.utc)
+        self._session.execute(
+            update(SyncRunModel)
+            .where(SyncRunModel.id == run_id)
+            .values(status=status, finished_at=now, heartbeat_at=now)
+        )
+        self._session.flush()
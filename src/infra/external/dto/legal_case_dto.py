@@ -2,6 +2,22 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
 
+# Campos de `_source` lidos por `LegalCaseRawDTO.from_dict`; usados para que a
+# consulta ao DataJud traga apenas o necessário.
+SOURCE_FIELDS: List[str] = [
+    "numeroProcesso",
+    "tribunal",
+    "classe.nome",
+    "orgaoJulgador.nome",
+    "dataAjuizamento",
+    "grau",
+    "assuntos.nome",
+    "movimentos.dataHora",
+    "movimentos.nome",
+    "movimentos.complementosTabelados.nome",
+]
+
+
 @dataclass
 class ClasseDTO:
     nome: Optional[str] = None
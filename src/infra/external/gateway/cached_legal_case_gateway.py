@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.domain.core import metrics
+from src.domain.core.cache import TTLCache
+from src.domain.core.logger import get_logger
+from src.domain.entities.case import CNJNumber, LegalCase, Movement
+from src.domain.gateway.legal_case_gateway import LegalCaseGateway
+from src.infra.database.repositories.datajud_lookup_cache_repository import (
+    DataJudLookupCacheRepository,
+)
+
+logger = get_logger(__name__)
+
+
+def legal_case_to_payload(case: LegalCase) -> Dict[str, Any]:
+    def iso(value: Optional[datetime]) -> Optional[str]:
+        return value.isoformat() if value else None
+
+    return {
+        "case_number": case.case_number,
+        "court": case.court,
+        "judging_body": case.judging_body,
+        "procedural_class": case.procedural_class,
+        "subject": case.subject,
+        "status": case.status,
+        "filing_date": iso(case.filing_date),
+        "latest_update": case.latest_update,
+        "movement_history": (
+            [
+                {"date": iso(movement.date), "description": movement.description}
+                for movement in case.movement_history
+            ]
+            if case.movement_history is not None
+            else None
+        ),
+    }
+
+
+def legal_case_from_payload(payload: Dict[str, Any]) -> LegalCase:
+    def parse(value: Optional[str]) -> Optional[datetime]:
+        return datetime.fromisoformat(value) if value else None
+
+    history = payload.get("movement_history")
+    return LegalCase(
+        case_number=payload.get("case_number"),
+        court=payload.get("court"),
+        judging_body=payload.get("judging_body"),
+        procedural_class=payload.get("procedural_class"),
+        subject=payload.get("subject"),
+        status=payload.get("status"),
+        filing_date=parse(payload.get("filing_date")),
+        latest_update=payload.get("latest_update"),
+        movement_history=(
+            [
+                Movement(date=parse(item["date"]), description=item["description"])
+                for item in history
+            ]
+            if history is not None
+            else None
+        ),
+    )
+
+
+def publish_hit_ratio() -> Optional[int]:
+    """Refresh ``datajud_cache_hit_ratio_pct``; ``None`` before any lookup."""
+    counters = metrics.snapshot()
+    hits = counters.get("datajud_cache_hits", 0)
+    total = hits + counters.get("datajud_cache_misses", 0)
+    if not total:
+        return None
+    ratio = round(hits * 100 / total)
+    metrics.set_metric("datajud_cache_hit_ratio_pct", ratio)
+    return ratio
+
+
+class CachedLegalCaseGateway(LegalCaseGateway):
+    """Caches provider lookups, including "not found" answers.
+
+    Found cases live for ``positive_ttl_seconds`` and misses for
+    ``negative_ttl_seconds`` in a bounded in-memory tier, optionally backed by
+    a Postgres tier shared across replicas. Provider errors are never cached.
+    Cached cases are shared objects and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        inner: LegalCaseGateway,
+        memory: TTLCache[str, LegalCase],
+        positive_ttl_seconds: int,
+        negative_ttl_seconds: int,
+        store: Optional[DataJudLookupCacheRepository] = None,
+    ) -> None:
+        self._inner = inner
+        self._memory = memory
+        self._positive_ttl = positive_ttl_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._store = store
+
+    @staticmethod
+    def _key(case_number: CNJNumber, court_acronym: str) -> str:
+        return f"{court_acronym}:{case_number.clean_number}"
+
+    @staticmethod
+    def _record(hit: bool, value: Optional[LegalCase] = None) -> None:
+        if hit:
+            metrics.increment("datajud_cache_hits")
+            if value is None:
+                metrics.increment("datajud_cache_negative_hits")
+        else:
+            metrics.increment("datajud_cache_misses")
+
+    def _lookup(self, key: str) -> Tuple[bool, Optional[LegalCase]]:
+        hit, value = self._memory.lookup(key)
+        if hit:
+            return True, value
+        if self._store is None:
+            return False, None
+        try:
+            hit, payload, remaining = self._store.get(key)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Cache do DataJud no banco indisponível: %s", exc)
+            return False, None
+        if not hit:
+            return False, None
+        value = legal_case_from_payload(payload) if payload is not None else None
+        self._memory.set(key, value, remaining)
+        return True, value
+
+    def _remember(self, key: str, value: Optional[LegalCase]) -> None:
+        ttl = self._positive_ttl if value is not None else self._negative_ttl
+        self._memory.set(key, value, ttl)
+        if self._store is None or ttl <= 0:
+            return
+        try:
+            payload = legal_case_to_payload(value) if value is not None else None
+            self._store.set(key, payload, ttl)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Falha ao gravar cache do DataJud no banco: %s", exc)
+
+    def find_case_by_number(
+        self, case_number: CNJNumber, court_acronym: str
+    ) -> Optional[LegalCase]:
+        key = self._key(case_number, court_acronym)
+        hit, value = self._lookup(key)
+        self._record(hit, value)
+        if hit:
+            return value
+        value = self._inner.find_case_by_number(case_number, court_acronym)
+        self._remember(key, value)
+        return value
+
+    def find_cases_by_numbers(
+        self, case_numbers: List[CNJNumber], court_acronym: str
+    ) -> Dict[str, LegalCase]:
+        found: Dict[str, LegalCase] = {}
+        misses: List[CNJNumber] = []
+        for case_number in case_numbers:
+            hit, value = self._lookup(self._key(case_number, court_acronym))
+            self._record(hit, value)
+            if not hit:
+                misses.append(case_number)
+            elif value is not None:
+                found[case_number.clean_number] = value
+        if not misses:
+            return found
+
+        fetched = self._inner.find_cases_by_numbers(misses, court_acronym)
+        for case_number in misses:
+            value = fetched.get(case_number.clean_number)
+            self._remember(self._key(case_number, court_acronym), value)
+            if value is not None:
+                found[case_number.clean_number] = value
+        return found
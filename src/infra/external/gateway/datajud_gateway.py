@@ -1,25 +1,96 @@
+import json
 import os
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
+import backoff
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
+from src.domain.core.errors import (
+    ExternalRateLimitError,
+    ExternalServiceUnavailableError,
+)
+from src.domain.core import metrics
 from src.domain.core.logger import get_logger
 from src.domain.entities.case import CNJNumber, LegalCase
 from src.domain.gateway.legal_case_gateway import LegalCaseGateway
-from src.infra.external.dto.legal_case_dto import LegalCaseRawDTO
+from src.domain.repositories.legal_case_raw_archive_repository import (
+    ILegalCaseRawArchive,
+)
+from src.infra.external.dto.legal_case_dto import SOURCE_FIELDS
 from src.infra.external.mapper.legal_case_mapper import LegalCaseMapper
 
+try:  # orjson é opcional; decodifica payloads grandes bem mais rápido.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depende do ambiente
+    _json_loads = json.loads
+
 load_dotenv()
 DATAJUD_API_KEY = os.getenv("DATAJUD_API_KEY")
 DATAJUD_URL = os.getenv("DATAJUD_URL")
+DATAJUD_POOL_MAXSIZE = int(os.getenv("DATAJUD_POOL_MAXSIZE", "10"))
+DATAJUD_MAX_TRIES = int(os.getenv("DATAJUD_MAX_TRIES", "4"))
+DATAJUD_TIMEOUT_SECONDS = 15
+TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Um mesmo número pode ter um documento por grau no índice do tribunal.
+BULK_HITS_PER_CASE = 5
+MAX_RESULT_WINDOW = 10000
 logger = get_logger(__name__)
 
 
+class TransientDataJudError(Exception):
+    """Retryable failure answered by the DataJud endpoint."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"DataJud respondeu com status {status_code}.")
+        self.status_code = status_code
+
+
+@lru_cache(maxsize=1)
+def get_datajud_session() -> requests.Session:
+    """Shared keep-alive session so every gateway reuses the same pool."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=DATAJUD_POOL_MAXSIZE,
+        pool_maxsize=DATAJUD_POOL_MAXSIZE,
+        pool_block=True,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+            "Content-Type": "application/json",
+        }
+    )
+    return session
+
+
 class DataJudGateway(LegalCaseGateway):
-    def __init__(self):
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        archive: Optional[ILegalCaseRawArchive] = None,
+    ):
         self.api_key = DATAJUD_API_KEY
         self.base_url = DATAJUD_URL
+        self._session = session or get_datajud_session()
+        self._archive = archive
+
+    def _archive_source(
+        self, clean_number: str, court_acronym: str, source: Dict[str, Any]
+    ) -> None:
+        if self._archive is None:
+            return
+        try:
+            self._archive.store(clean_number, court_acronym, source)
+        except Exception as exc:  # pylint: disable=broad-except
+            # Arquivar é acessório: a consulta não pode falhar por isso.
+            metrics.increment("datajud_raw_archive_errors")
+            logger.warning("Falha ao arquivar payload do DataJud: %s", exc)
 
     def _get_headers(self) -> Dict[str, str]:
         return {
@@ -27,26 +98,87 @@ class DataJudGateway(LegalCaseGateway):
             "Content-Type": "application/json",
         }
 
-    def find_case_by_number(
-        self, case_number: CNJNumber, court_acronym: str
-    ) -> Optional[LegalCase]:
-        payload = {"query": {"match": {"numeroProcesso": case_number.clean_number}}}
-        headers = self._get_headers()
+    @staticmethod
+    def _build_query(case_number: CNJNumber) -> Dict[str, Any]:
+        return {
+            "query": {"match": {"numeroProcesso": case_number.clean_number}},
+            "size": 1,
+            "_source": SOURCE_FIELDS,
+        }
+
+    @staticmethod
+    def _build_bulk_query(case_numbers: List[CNJNumber]) -> Dict[str, Any]:
+        return {
+            "query": {
+                "terms": {
+                    "numeroProcesso": [number.clean_number for number in case_numbers]
+                }
+            },
+            "size": min(MAX_RESULT_WINDOW, len(case_numbers) * BULK_HITS_PER_CASE),
+            "_source": SOURCE_FIELDS,
+        }
 
+    @backoff.on_exception(
+        backoff.expo,
+        (requests.ConnectionError, requests.Timeout, TransientDataJudError),
+        max_tries=DATAJUD_MAX_TRIES,
+        max_time=60,
+        jitter=backoff.full_jitter,
+    )
+    def _search(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        response = self._session.post(
+            url,
+            headers=self._get_headers(),
+            json=payload,
+            params={"filter_path": "hits.hits._source"},
+            timeout=DATAJUD_TIMEOUT_SECONDS,
+        )
+        if response.status_code in TRANSIENT_STATUS_CODES:
+            raise TransientDataJudError(response.status_code)
+        response.raise_for_status()
+        # Decodifica os bytes direto, sem passar pela detecção de charset.
+        return _json_loads(response.content)
+
+    def _search_court(
+        self, court_acronym: str, payload: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
         url = f"{self.base_url}/api_publica_{court_acronym}/_search"
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            if hits := data.get("hits", {}).get("hits", []):
-                logger.info(
-                    "Processo encontrado em %s! Mapeando dados...",
-                    court_acronym.upper(),
-                )
-                dto = LegalCaseRawDTO.from_dict(hits[0]["_source"])
-                return LegalCaseMapper.from_dto_to_domain(dto)
-        except requests.exceptions.RequestException as e:
-            logger.error("Erro ao consultar %s: %s", court_acronym.upper(), e)
+            data = self._search(url, payload)
+        except TransientDataJudError as exc:
+            logger.error("DataJud %s indisponível: %s", court_acronym.upper(), exc)
+            if exc.status_code == 429:
+                raise ExternalRateLimitError() from exc
+            raise ExternalServiceUnavailableError() from exc
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            logger.error(
+                "Falha de rede ao consultar %s: %s", court_acronym.upper(), exc
+            )
+            raise ExternalServiceUnavailableError() from exc
+        except requests.exceptions.RequestException as exc:
+            # 4xx (credencial, consulta inválida) e URL inválida não são
+            # "processo não encontrado": não podem virar cache negativo.
+            logger.error("Erro ao consultar %s: %s", court_acronym.upper(), exc)
+            raise ExternalServiceUnavailableError() from exc
+        except ValueError as exc:
+            logger.error(
+                "Resposta inválida do DataJud %s: %s", court_acronym.upper(), exc
+            )
+            raise ExternalServiceUnavailableError() from exc
+        return data.get("hits", {}).get("hits", [])
+
+    def find_case_by_number(
+        self, case_number: CNJNumber, court_acronym: str
+    ) -> Optional[LegalCase]:
+        if hits := self._search_court(court_acronym, self._build_query(case_number)):
+            logger.info(
+                "Processo encontrado em %s! Mapeando dados...",
+                court_acronym.upper(),
+            )
+            source = hits[0]["_source"]
+            legal_case = LegalCaseMapper.from_source(source)
+            self._archive_source(case_number.clean_number, court_acronym, source)
+            return legal_case
 
         logger.warning(
             "Processo não encontrado no tribunal %s para o CNJ '%s'.",
@@ -54,3 +186,29 @@ class DataJudGateway(LegalCaseGateway):
             case_number.number,
         )
         return None
+
+    def find_cases_by_numbers(
+        self, case_numbers: List[CNJNumber], court_acronym: str
+    ) -> Dict[str, LegalCase]:
+        if not case_numbers:
+            return {}
+        hits = self._search_court(court_acronym, self._build_bulk_query(case_numbers))
+        wanted = {number.clean_number for number in case_numbers}
+        found: Dict[str, LegalCase] = {}
+        for hit in hits:
+            source = hit.get("_source") or {}
+            clean_number = "".join(
+                filter(str.isdigit, str(source.get("numeroProcesso") or ""))
+            )
+            # Mantém o primeiro documento por número, como na consulta unitária.
+            if clean_number not in wanted or clean_number in found:
+                continue
+            found[clean_number] = LegalCaseMapper.from_source(source)
+            self._archive_source(clean_number, court_acronym, source)
+        logger.info(
+            "Consulta em lote em %s: %s de %s processos encontrados.",
+            court_acronym.upper(),
+            len(found),
+            len(case_numbers),
+        )
+        return found
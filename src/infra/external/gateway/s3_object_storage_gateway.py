@@ -2,15 +2,21 @@ from __future__ import annotations
 
 import io
 from typing import BinaryIO, Optional
+from urllib.parse import quote
 
 import boto3
 from botocore.client import BaseClient
 from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
+from src.domain.core.errors import RangeNotSatisfiableError
+from src.domain.entities.document import ObjectStream, StoredObject
 from src.domain.gateway.object_storage_gateway import IObjectStorageGateway
 
 
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
 class S3ObjectStorageGateway(IObjectStorageGateway):
     """Object storage gateway backed by Amazon S3."""
 
@@ -20,15 +26,24 @@ class S3ObjectStorageGateway(IObjectStorageGateway):
         bucket: str,
         max_upload_size_mb: int = 25,
         client: Optional[BaseClient] = None,
+        endpoint_url: Optional[str] = None,
     ) -> None:
         self._bucket = bucket
         self._max_upload_bytes = max_upload_size_mb * 1024 * 1024
         self._client = client or boto3.client(
             "s3",
             region_name=region,
-            config=Config(retries={"max_attempts": 5, "mode": "standard"}),
+            endpoint_url=endpoint_url,
+            config=Config(
+                retries={"max_attempts": 5, "mode": "standard"},
+                signature_version="s3v4",
+            ),
         )
 
+    @property
+    def max_upload_bytes(self) -> int:
+        return self._max_upload_bytes
+
     def upload(self, key: str, fileobj: BinaryIO, content_type: str) -> str:
         self._ensure_size_within_limits(fileobj)
         try:
@@ -53,6 +68,90 @@ class S3ObjectStorageGateway(IObjectStorageGateway):
             raise RuntimeError("Resposta do S3 não contém corpo do arquivo.")
         return body.read()
 
+    def generate_upload_url(self, key: str, content_type: str, expires_in: int) -> str:
+        try:
+            return self._client.generate_presigned_url(
+                "put_object",
+                Params={
+                    "Bucket": self._bucket,
+                    "Key": key,
+                    "ContentType": content_type or "application/octet-stream",
+                },
+                ExpiresIn=expires_in,
+                HttpMethod="PUT",
+            )
+        except (BotoCoreError, ClientError) as exc:
+            raise RuntimeError(f"Falha ao gerar URL de upload no S3: {exc}") from exc
+
+    def head(self, key: str) -> Optional[StoredObject]:
+        try:
+            response = self._client.head_object(Bucket=self._bucket, Key=key)
+        except ClientError as exc:
+            error_code = str(exc.response.get("Error", {}).get("Code", ""))
+            if error_code in {"404", "NoSuchKey", "NotFound"}:
+                return None
+            raise RuntimeError(f"Falha ao consultar arquivo no S3: {exc}") from exc
+        except BotoCoreError as exc:
+            raise RuntimeError(f"Falha ao consultar arquivo no S3: {exc}") from exc
+        return StoredObject(
+            key=key,
+            size=int(response.get("ContentLength", 0)),
+            content_type=response.get("ContentType"),
+        )
+
+    def delete(self, key: str) -> None:
+        try:
+            self._client.delete_object(Bucket=self._bucket, Key=key)
+        except (BotoCoreError, ClientError) as exc:
+            raise RuntimeError(f"Falha ao remover arquivo do S3: {exc}") from exc
+
+    def generate_download_url(
+        self, key: str, expires_in: int, file_name: Optional[str] = None
+    ) -> str:
+        params = {"Bucket": self._bucket, "Key": key}
+        if file_name:
+            params["ResponseContentDisposition"] = (
+                f"attachment; filename*=UTF-8''{quote(file_name)}"
+            )
+        try:
+            return self._client.generate_presigned_url(
+                "get_object", Params=params, ExpiresIn=expires_in
+            )
+        except (BotoCoreError, ClientError) as exc:
+            raise RuntimeError(f"Falha ao gerar URL de download no S3: {exc}") from exc
+
+    def open_stream(self, key: str, byte_range: Optional[str] = None) -> ObjectStream:
+        params = {"Bucket": self._bucket, "Key": key}
+        if byte_range:
+            params["Range"] = byte_range
+        try:
+            response = self._client.get_object(**params)
+        except ClientError as exc:
+            error_code = str(exc.response.get("Error", {}).get("Code", ""))
+            if error_code == "InvalidRange":
+                raise RangeNotSatisfiableError() from exc
+            raise RuntimeError(f"Falha ao baixar arquivo do S3: {exc}") from exc
+        except BotoCoreError as exc:
+            raise RuntimeError(f"Falha ao baixar arquivo do S3: {exc}") from exc
+        body = response.get("Body")
+        if body is None:
+            raise RuntimeError("Resposta do S3 não contém corpo do arquivo.")
+
+        content_length = int(response.get("ContentLength", 0))
+        content_range = response.get("ContentRange")
+        total_size = content_length
+        if content_range and "/" in content_range:
+            total = content_range.rsplit("/", 1)[1]
+            if total.isdigit():
+                total_size = int(total)
+        return ObjectStream(
+            chunks=body.iter_chunks(chunk_size=STREAM_CHUNK_SIZE),
+            content_length=content_length,
+            total_size=total_size,
+            content_type=response.get("ContentType"),
+            content_range=content_range,
+        )
+
     def _ensure_size_within_limits(self, fileobj: BinaryIO) -> None:
         current_position = fileobj.tell()
         try:
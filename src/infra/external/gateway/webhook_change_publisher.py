@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from src.domain.entities.case import LegalCaseChangeEvent
+from src.domain.gateway.change_event_publisher import IChangeEventPublisher
+
+WEBHOOK_TIMEOUT_SECONDS = 10
+SIGNATURE_HEADER = "X-Controladoria-Signature"
+
+
+def change_event_to_dict(event: LegalCaseChangeEvent) -> Dict[str, Any]:
+    return {
+        "event_id": event.event_id,
+        "numero_processo": event.numero_processo,
+        "event_type": event.event_type,
+        "payload": event.payload,
+        "created_at": event.created_at.isoformat(),
+    }
+
+
+class WebhookChangePublisher(IChangeEventPublisher):
+    """POSTs event batches as JSON, signed with HMAC-SHA256 when a secret is set."""
+
+    def __init__(
+        self,
+        url: str,
+        secret: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        self._url = url
+        self._secret = secret
+        self._session = session or requests.Session()
+
+    def publish(self, events: List[LegalCaseChangeEvent]) -> None:
+        body = json.dumps(
+            {"events": [change_event_to_dict(event) for event in events]},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if self._secret:
+            signature = hmac.new(
+                self._secret.encode("utf-8"), body, hashlib.sha256
+            ).hexdigest()
+            headers[SIGNATURE_HEADER] = f"sha256={signature}"
+        response = self._session.post(
+            self._url, data=body, headers=headers, timeout=WEBHOOK_TIMEOUT_SECONDS
+        )
+        response.raise_for_status()
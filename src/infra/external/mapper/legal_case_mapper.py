@@ -1,9 +1,27 @@
-from typing import Optional, List
+from functools import lru_cache
+from typing import Any, Dict, Optional, List
 from datetime import datetime
 
 from src.domain.entities.case import CNJNumber, LegalCase, Movement
 from src.infra.external.dto.legal_case_dto import LegalCaseRawDTO, MovimentoDTO
 
+NO_MOVEMENTS_DESCRIPTION = "Nenhuma movimentação encontrada"
+
+
+@lru_cache(maxsize=16384)
+def _parse_timestamp(date_string: str) -> datetime:
+    """Cached ISO parsing; datetimes are immutable, so hits can be shared."""
+    try:
+        if date_string.endswith("Z"):
+            date_string = date_string[:-1] + "+00:00"
+        return datetime.fromisoformat(date_string)
+    except (ValueError, TypeError):
+        return datetime.min
+
+
+def _movement_date(movement: Movement) -> datetime:
+    return movement.date
+
 
 class LegalCaseMapper:
     @staticmethod
@@ -30,12 +48,9 @@ class LegalCaseMapper:
     def _parse_datetime(date_string: Optional[str]) -> datetime:
         if not date_string:
             return datetime.min
-        try:
-            if date_string.endswith("Z"):
-                date_string = date_string[:-1] + "+00:00"
-            return datetime.fromisoformat(date_string)
-        except (ValueError, TypeError):
+        if not isinstance(date_string, str):
             return datetime.min
+        return _parse_timestamp(date_string)
 
     @staticmethod
     def _map_movements(movement_dtos: List[MovimentoDTO]) -> List[Movement]:
@@ -58,9 +73,7 @@ class LegalCaseMapper:
     def from_dto_to_domain(dto: LegalCaseRawDTO) -> LegalCase:
         movements = LegalCaseMapper._map_movements(dto.movimentos)
         latest_update = (
-            movements[-1].description
-            if movements
-            else "Nenhuma movimentação encontrada"
+            movements[-1].description if movements else NO_MOVEMENTS_DESCRIPTION
         )
         return LegalCase(
             case_number=LegalCaseMapper._map_case_number(dto.numero_processo),
@@ -73,3 +86,60 @@ class LegalCaseMapper:
             latest_update=latest_update,
             movement_history=movements if movements else None,
         )
+
+    @staticmethod
+    def _map_raw_movements(raw_movements: List[Dict[str, Any]]) -> List[Movement]:
+        movements = []
+        append = movements.append
+        for raw in raw_movements:
+            if not raw or not isinstance(raw, dict):
+                continue
+            description = raw.get("nome") or ""
+            if complements := raw.get("complementosTabelados"):
+                parts = [description]
+                for comp in complements:
+                    if comp_name := comp.get("nome"):
+                        parts.append(str(comp_name))
+                description = " - ".join(parts)
+            date_string = raw.get("dataHora")
+            append(
+                Movement(
+                    date=(
+                        _parse_timestamp(date_string)
+                        if date_string and isinstance(date_string, str)
+                        else datetime.min
+                    ),
+                    description=description.strip(),
+                )
+            )
+        movements.sort(key=_movement_date)
+        return movements
+
+    @staticmethod
+    def from_source(source: Dict[str, Any]) -> LegalCase:
+        """Map a DataJud ``_source`` document straight to the domain.
+
+        Same result as ``from_dto_to_domain(LegalCaseRawDTO.from_dict(...))``
+        without building the intermediate DTOs, which dominate the cost for
+        cases with thousands of movements.
+        """
+        movements = LegalCaseMapper._map_raw_movements(source.get("movimentos") or [])
+        classe = source.get("classe")
+        orgao = source.get("orgaoJulgador")
+        subject = next(
+            (a for a in source.get("assuntos") or () if a and isinstance(a, dict)),
+            None,
+        )
+        return LegalCase(
+            case_number=LegalCaseMapper._map_case_number(source.get("numeroProcesso")),
+            court=source.get("tribunal") or None,
+            judging_body=orgao.get("nome") if orgao else None,
+            procedural_class=classe.get("nome") if classe else None,
+            subject=subject.get("nome") if subject else None,
+            status=source.get("grau") or None,
+            filing_date=LegalCaseMapper._parse_datetime(source.get("dataAjuizamento")),
+            latest_update=(
+                movements[-1].description if movements else NO_MOVEMENTS_DESCRIPTION
+            ),
+            movement_history=movements if movements else None,
+        )
@@ -1,30 +1,160 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from datetime import timedelta
+from functools import lru_cache
+from typing import Iterator, Optional
+
 from sqlalchemy.orm import Session
 
+from src.domain.core.cache import TTLCache
+from src.domain.core.rate_limit import TokenBucketRegistry
+from src.domain.core.refresh_policy import RefreshPolicy
+from src.domain.core.single_flight import SingleFlight
+from src.domain.entities.case import LegalCase
+from src.domain.gateway.legal_case_gateway import LegalCaseGateway
+from src.domain.gateway.legal_case_revalidator import ILegalCaseRevalidator
 from src.domain.usecases.build_process_dashboard_use_case import (
     BuildProcessDashboardUseCase,
 )
+from src.domain.usecases.dispatch_change_events_use_case import (
+    DispatchChangeEventsUseCase,
+)
 from src.domain.usecases.find_legal_case_use_case import FindLegalCaseUseCase
+from src.domain.usecases.import_legal_cases_use_case import (
+    GetLegalCaseImportUseCase,
+    ImportLegalCasesUseCase,
+)
 from src.domain.usecases.get_legal_case_by_id_use_case import (
     GetLegalCaseByIdUseCase,
     UpdateStaleLegalCasesUseCase,
 )
-from src.infra.config.settings import get_scheduler_settings
+from src.domain.usecases.list_legal_case_changes_use_case import (
+    ListLegalCaseChangesUseCase,
+)
+from src.domain.usecases.list_legal_cases_use_case import ListLegalCasesUseCase
+from src.domain.usecases.list_legal_case_movements_use_case import (
+    ListLegalCaseMovementsUseCase,
+)
+from src.domain.usecases.remap_legal_cases_use_case import (
+    DEFAULT_REMAP_BATCH_SIZE,
+    DEFAULT_REMAP_WORKERS,
+    RemapLegalCasesUseCase,
+)
+from src.domain.usecases.search_legal_cases_use_case import SearchLegalCasesUseCase
+from src.infra.config.settings import (
+    SchedulerSettings,
+    get_change_feed_settings,
+    get_datajud_archive_settings,
+    get_datajud_cache_settings,
+    get_scheduler_settings,
+)
+from src.infra.database.repositories.datajud_lookup_cache_repository import (
+    DataJudLookupCacheRepository,
+)
+from src.infra.database.repositories.legal_case_change_repository import (
+    LegalCaseChangeRepository,
+)
+from src.infra.database.repositories.legal_case_import_repository import (
+    LegalCaseImportRepository,
+)
+from src.infra.database.repositories.legal_case_raw_archive_repository import (
+    LegalCaseRawArchiveRepository,
+)
 from src.infra.database.repositories.legal_case_repository import LegalCaseRepository
+from src.infra.database.session import session_scope
+from src.infra.external.gateway.cached_legal_case_gateway import (
+    CachedLegalCaseGateway,
+)
 from src.infra.external.gateway.datajud_gateway import DataJudGateway
+from src.infra.external.gateway.webhook_change_publisher import (
+    WebhookChangePublisher,
+)
+from src.infra.external.mapper.legal_case_mapper import LegalCaseMapper
+
+
+@lru_cache(maxsize=1)
+def get_datajud_lookup_cache() -> TTLCache[str, LegalCase]:
+    """Process-wide in-memory tier shared by the consult path and the cron."""
+    return TTLCache(max_entries=get_datajud_cache_settings().max_entries)
+
+
+def create_legal_case_raw_archive() -> Optional[LegalCaseRawArchiveRepository]:
+    settings = get_datajud_archive_settings()
+    if not settings.enabled:
+        return None
+    return LegalCaseRawArchiveRepository(
+        session_scope, compression_level=settings.compression_level
+    )
+
+
+def create_legal_case_gateway() -> LegalCaseGateway:
+    settings = get_datajud_cache_settings()
+    return CachedLegalCaseGateway(
+        inner=DataJudGateway(archive=create_legal_case_raw_archive()),
+        memory=get_datajud_lookup_cache(),
+        positive_ttl_seconds=settings.positive_ttl_seconds,
+        negative_ttl_seconds=settings.negative_ttl_seconds,
+        store=(
+            DataJudLookupCacheRepository(session_scope)
+            if settings.postgres_tier
+            else None
+        ),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_case_lookup_single_flight() -> SingleFlight:
+    """Process-wide coalescing of first-time /processos/consultar lookups."""
+    return SingleFlight(metric_name="legal_case_lookups_coalesced")
+
+
+def replica_external_rpm(settings: SchedulerSettings) -> int:
+    """This replica's share of the per-tribunal ``external_rpm``.
+
+    Token buckets live in each process, so the limit is split evenly across
+    the ``replica_count`` replicas to keep their sum within ``external_rpm``.
+    """
+    return max(1, settings.external_rpm // max(1, settings.replica_count))
+
+
+@lru_cache(maxsize=1)
+def get_case_lookup_buckets() -> TokenBucketRegistry:
+    """Process-wide DataJud budget of the multi-get, one bucket per tribunal.
+
+    Gets the share of this replica's ``external_rpm`` the sync cron leaves
+    unused.
+    """
+    settings = get_scheduler_settings()
+    rate = max(
+        1, int((1 - settings.sync_budget_share) * replica_external_rpm(settings))
+    )
+    return TokenBucketRegistry(rate, capacity=settings.lookup_burst)
 
 
 def create_find_legal_case_use_case() -> FindLegalCaseUseCase:
-    return FindLegalCaseUseCase(gateway=DataJudGateway())
+    return FindLegalCaseUseCase(gateway=create_legal_case_gateway())
 
 
-def create_get_legal_case_by_id_use_case(session: Session) -> GetLegalCaseByIdUseCase:
+def create_get_legal_case_by_id_use_case(
+    session: Session, revalidator: Optional[ILegalCaseRevalidator] = None
+) -> GetLegalCaseByIdUseCase:
     repository = LegalCaseRepository(session)
     find_use_case = create_find_legal_case_use_case()
-    rpm = get_scheduler_settings().external_rpm
+    settings = get_scheduler_settings()
     return GetLegalCaseByIdUseCase(
-        repository=repository, find_use_case=find_use_case, max_requests_per_minute=rpm
+        repository=repository,
+        find_use_case=find_use_case,
+        max_requests_per_minute=replica_external_rpm(settings),
+        single_flight=get_case_lookup_single_flight(),
+        lookup_buckets=get_case_lookup_buckets(),
+        max_workers=settings.lookup_max_workers,
+        revalidator=revalidator,
+        revalidate_after=(
+            timedelta(seconds=settings.revalidate_after_seconds)
+            if settings.revalidate_after_seconds > 0
+            else None
+        ),
     )
 
 
@@ -33,12 +163,83 @@ def create_update_stale_cases_use_case(
 ) -> UpdateStaleLegalCasesUseCase:
     repository = LegalCaseRepository(session)
     find_use_case = create_find_legal_case_use_case()
-    rpm = get_scheduler_settings().external_rpm
+    settings = get_scheduler_settings()
     return UpdateStaleLegalCasesUseCase(
-        repository=repository, find_use_case=find_use_case, max_requests_per_minute=rpm
+        repository=repository,
+        find_use_case=find_use_case,
+        max_requests_per_minute=replica_external_rpm(settings),
+        max_workers=settings.sync_max_workers,
+        lookup_batch_size=settings.lookup_batch_size,
+        refresh_policy=RefreshPolicy(
+            freshness_target=timedelta(hours=settings.sync_freshness_target_hours)
+        ),
     )
 
 
 def create_process_dashboard_use_case(session: Session) -> BuildProcessDashboardUseCase:
     repository = LegalCaseRepository(session)
     return BuildProcessDashboardUseCase(repository)
+
+
+def create_list_legal_case_movements_use_case(
+    session: Session,
+) -> ListLegalCaseMovementsUseCase:
+    return ListLegalCaseMovementsUseCase(LegalCaseRepository(session))
+
+
+def create_search_legal_cases_use_case(session: Session) -> SearchLegalCasesUseCase:
+    return SearchLegalCasesUseCase(LegalCaseRepository(session))
+
+
+def create_list_legal_cases_use_case(session: Session) -> ListLegalCasesUseCase:
+    return ListLegalCasesUseCase(LegalCaseRepository(session))
+
+
+def create_import_legal_cases_use_case(session: Session) -> ImportLegalCasesUseCase:
+    return ImportLegalCasesUseCase(LegalCaseImportRepository(session))
+
+
+def create_get_legal_case_import_use_case(
+    session: Session,
+) -> GetLegalCaseImportUseCase:
+    return GetLegalCaseImportUseCase(LegalCaseImportRepository(session))
+
+
+def create_list_legal_case_changes_use_case(
+    session: Session,
+) -> ListLegalCaseChangesUseCase:
+    return ListLegalCaseChangesUseCase(LegalCaseChangeRepository(session))
+
+
+def create_dispatch_change_events_use_case(
+    session: Session,
+) -> Optional[DispatchChangeEventsUseCase]:
+    """Webhook dispatcher, or ``None`` when no webhook URL is configured."""
+    settings = get_change_feed_settings()
+    if not settings.webhook_url:
+        return None
+    return DispatchChangeEventsUseCase(
+        LegalCaseChangeRepository(session),
+        WebhookChangePublisher(settings.webhook_url, settings.webhook_secret),
+        batch_size=settings.dispatch_batch_size,
+    )
+
+
+@contextmanager
+def _legal_case_repository_scope() -> Iterator[LegalCaseRepository]:
+    with session_scope() as session:
+        yield LegalCaseRepository(session)
+
+
+def create_remap_legal_cases_use_case(
+    max_workers: int = DEFAULT_REMAP_WORKERS,
+    batch_size: int = DEFAULT_REMAP_BATCH_SIZE,
+) -> RemapLegalCasesUseCase:
+    """Offline re-mapper; reads the archive even if new archiving is disabled."""
+    return RemapLegalCasesUseCase(
+        archive=LegalCaseRawArchiveRepository(session_scope),
+        mapper=LegalCaseMapper.from_source,
+        repository_scope=_legal_case_repository_scope,
+        max_workers=max_workers,
+        batch_size=batch_size,
+    )
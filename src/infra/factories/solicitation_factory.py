@@ -6,6 +6,11 @@ from sqlalchemy.orm import Session
 
 from src.domain.usecases.document_classification_use_case import (
     ClassificarDocumentosUseCase,
+    ClassifyStoredDocumentsUseCase,
+)
+from src.domain.usecases.document_upload_use_case import (
+    RegisterUploadedDocumentsUseCase,
+    RequestDocumentUploadUseCase,
 )
 from src.domain.usecases.evaluate_eligibility_use_case import (
     EvaluateEligibilityUseCase,
@@ -13,6 +18,7 @@ from src.domain.usecases.evaluate_eligibility_use_case import (
 from src.domain.usecases.build_solicitation_dashboard_use_case import (
     BuildSolicitationDashboardUseCase,
 )
+from src.domain.usecases.download_document_use_case import DownloadDocumentUseCase
 from src.domain.usecases.extract_data_use_case import ExtrairDadosUseCase
 from src.domain.usecases.get_solicitacao_by_id_use_case import (
     GetSolicitacaoByIdUseCase,
@@ -52,7 +58,9 @@ def get_storage_gateway() -> S3ObjectStorageGateway:
     aws_settings = get_aws_settings()
 
     return S3ObjectStorageGateway(
-        region=aws_settings.region, bucket=aws_settings.bucket
+        region=aws_settings.region,
+        bucket=aws_settings.bucket,
+        endpoint_url=aws_settings.endpoint_url,
     )
 
 
@@ -71,6 +79,48 @@ def create_classificar_documentos_usecase(
     )
 
 
+def create_request_document_upload_use_case(
+    session: Session,
+) -> RequestDocumentUploadUseCase:
+    storage = get_storage_gateway()
+    return RequestDocumentUploadUseCase(
+        storage_gateway=storage,
+        solicitation_repository=SolicitationRepository(session),
+        max_upload_bytes=storage.max_upload_bytes,
+        url_ttl_seconds=get_aws_settings().presigned_url_ttl_seconds,
+    )
+
+
+def create_register_uploaded_documents_use_case(
+    session: Session,
+) -> RegisterUploadedDocumentsUseCase:
+    storage = get_storage_gateway()
+    return RegisterUploadedDocumentsUseCase(
+        storage_gateway=storage,
+        document_repository=DocumentRepository(session),
+        solicitation_repository=SolicitationRepository(session),
+        max_upload_bytes=storage.max_upload_bytes,
+    )
+
+
+def create_classify_stored_documents_use_case(
+    session: Session,
+) -> ClassifyStoredDocumentsUseCase:
+    return ClassifyStoredDocumentsUseCase(
+        classificador_gateway=GeminiIAGateway(),
+        storage_gateway=get_storage_gateway(),
+        document_repository=DocumentRepository(session),
+    )
+
+
+def create_download_document_use_case(session: Session) -> DownloadDocumentUseCase:
+    return DownloadDocumentUseCase(
+        storage_gateway=get_storage_gateway(),
+        document_repository=DocumentRepository(session),
+        url_ttl_seconds=get_aws_settings().download_url_ttl_seconds,
+    )
+
+
 def _descriptor_resolver(classification: str) -> Optional[str]:
     key = (classification or "").upper()
     mapped = _EXTRACTION_SYNONYMS.get(key, key)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -29,6 +29,118 @@ class LegalCaseResponseDTO(BaseModel):
     movement_history: Optional[List[LegalCaseMovementDTO]] = None
 
 
+class LegalCaseMovementsPageDTO(BaseModel):
+    """Page of a legal case movement history, newest first."""
+
+    items: List[LegalCaseMovementDTO]
+    next_cursor: Optional[str] = None
+
+
+class LegalCaseSearchHitDTO(BaseModel):
+    """Case matched by a full-text search."""
+
+    numero_processo: str
+    tribunal: Optional[str] = None
+    classe_processual: Optional[str] = None
+    assunto: Optional[str] = None
+    ultima_movimentacao: Optional[datetime] = None
+    relevancia: float
+    movimentacoes_encontradas: List[LegalCaseMovementDTO] = []
+
+
+class LegalCaseSearchPageDTO(BaseModel):
+    """Page of full-text search results, most relevant first."""
+
+    items: List[LegalCaseSearchHitDTO]
+    page: int
+    page_size: int
+    has_more: bool
+
+
+class LegalCaseSummaryDTO(BaseModel):
+    """Case row returned by the listing endpoint."""
+
+    numero_processo: str
+    tribunal: Optional[str] = None
+    classe_processual: Optional[str] = None
+    assunto: Optional[str] = None
+    status: Optional[str] = None
+    prioridade: str
+    movimentacoes: int = 0
+    data_ajuizamento: Optional[datetime] = None
+    ultima_movimentacao: Optional[datetime] = None
+    ultima_movimentacao_descricao: Optional[str] = None
+    created_at: datetime
+
+
+class LegalCaseListPageDTO(BaseModel):
+    """Page of the case listing."""
+
+    items: List[LegalCaseSummaryDTO]
+    next_cursor: Optional[str] = None
+
+
+class LegalCaseChangeEventDTO(BaseModel):
+    """Change applied to a case, as published in the change feed."""
+
+    event_id: int
+    numero_processo: str
+    event_type: str
+    payload: Dict[str, Any]
+    created_at: datetime
+
+
+class LegalCaseChangesPageDTO(BaseModel):
+    """Page of the change feed; resume from ``next_cursor``."""
+
+    items: List[LegalCaseChangeEventDTO]
+    next_cursor: Optional[str] = None
+
+
+class LegalCaseLookupErrorDTO(BaseModel):
+    status: int
+    message: str
+
+
+class LegalCaseLookupItemDTO(BaseModel):
+    """One number of a multi-get, in the order it was requested."""
+
+    numero_processo: str
+    processo: Optional[LegalCaseResponseDTO] = None
+    erro: Optional[LegalCaseLookupErrorDTO] = None
+
+
+class LegalCaseLookupBatchDTO(BaseModel):
+    items: List[LegalCaseLookupItemDTO]
+    encontrados: int
+    com_erro: int
+
+
+class InvalidImportEntryDTO(BaseModel):
+    linha: int
+    valor: str
+    motivo: str
+
+
+class LegalCaseImportDTO(BaseModel):
+    """Bulk import counters; fetch counters advance as the cron runs."""
+
+    id: str
+    formato: str
+    status: str
+    recebidos: int
+    invalidos: int
+    duplicados: int
+    ja_cadastrados: int
+    enfileirados: int
+    encontrados: int
+    nao_encontrados: int
+    com_erro: int
+    pendentes: int
+    invalidos_detalhe: List[InvalidImportEntryDTO]
+    created_at: datetime
+
+
 class DashboardCountItem(BaseModel):
     label: str
     value: int
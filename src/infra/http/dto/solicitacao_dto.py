@@ -77,3 +77,26 @@ class SolicitationDashboardDTO(BaseModel):
     avg_processing_time_days: float
     approval_rate: float
     most_missing_documents: List[Dict[str, object]]
+
+
+class PresignedUploadDTO(BaseModel):
+    """Presigned destination for a direct document upload."""
+
+    arquivo: str
+    mimetype: str
+    key: str
+    url: str
+    method: str = "PUT"
+    headers: Dict[str, str]
+    expires_in: int
+
+
+class UploadTicketDTO(BaseModel):
+    solicitation_id: str
+    uploads: List[PresignedUploadDTO]
+
+
+class RegisteredDocumentsDTO(BaseModel):
+    solicitation_id: str
+    documents: List[DocumentDTO]
+    classification_status: str
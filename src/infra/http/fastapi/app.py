@@ -1,7 +1,8 @@
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 
 from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
@@ -13,7 +14,10 @@ from src.infra.http.fastapi.exception_handlers import (
     validation_exception_handler,
 )
 from src.domain.core.logger import get_logger
-from src.infra.config.settings import get_scheduler_settings
+from src.infra.config.settings import (
+    get_change_feed_settings,
+    get_scheduler_settings,
+)
 from src.infra.http.fastapi.middleware import RequestContextMiddleware
 from src.infra.http.fastapi.router.legal_cases_router import (
     router as legal_cases_router,
@@ -23,7 +27,14 @@ from src.infra.http.fastapi.router.session_router import router as session_route
 from src.infra.http.fastapi.router.solicitation_router import (
     router as solicitation_router,
 )
-from src.infra.scheduler.jobs import run_update_legal_cases_job
+from src.infra.scheduler.jobs import (
+    get_case_revalidator,
+    run_change_events_job,
+    run_dashboard_rollup_job,
+    run_datajud_cache_job,
+    run_movement_partitions_job,
+    run_update_legal_cases_job,
+)
 from src.infra.http.security.auth_decorator import AuthenticatedUser
 
 
@@ -36,9 +47,46 @@ async def lifespan(fastapi_app: FastAPI):
     scheduler = BackgroundScheduler(timezone=scheduler_settings.timezone)
     scheduler.add_job(
         run_update_legal_cases_job,
-        CronTrigger(day="*/3", hour=0, minute=0),
+        IntervalTrigger(seconds=scheduler_settings.sync_tick_seconds, jitter=30),
         id="update_legal_cases_job",
         replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        run_change_events_job,
+        IntervalTrigger(
+            seconds=get_change_feed_settings().dispatch_interval_seconds, jitter=5
+        ),
+        id="change_events_job",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        run_datajud_cache_job,
+        IntervalTrigger(minutes=15, jitter=60),
+        id="datajud_cache_job",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        run_dashboard_rollup_job,
+        IntervalTrigger(minutes=1, jitter=5),
+        id="dashboard_rollup_job",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        run_movement_partitions_job,
+        IntervalTrigger(hours=24, jitter=300),
+        id="movement_partitions_job",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        next_run_time=datetime.now(timezone.utc),
     )
 
     scheduler.start()
@@ -48,6 +96,7 @@ async def lifespan(fastapi_app: FastAPI):
         yield
     finally:
         scheduler.shutdown(wait=False)
+        get_case_revalidator().shutdown()
 
 
 def create_app() -> FastAPI:
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, File, Query, UploadFile, status
 from fastapi.responses import JSONResponse
 
 from src.domain.core.errors import (
     ExternalRateLimitError,
+    ExternalServiceUnavailableError,
     InvalidInputError,
+    LegalCaseImportNotFoundError,
     LegalCaseNotFoundError,
 )
 from src.domain.entities.auth import AuthenticatedUserEntity
@@ -13,41 +15,269 @@ from src.domain.usecases.build_process_dashboard_use_case import (
     BuildProcessDashboardUseCase,
 )
 from src.domain.usecases.get_legal_case_by_id_use_case import GetLegalCaseByIdUseCase
+from src.domain.usecases.import_legal_cases_use_case import (
+    MAX_IMPORT_BYTES,
+    GetLegalCaseImportUseCase,
+    ImportLegalCasesUseCase,
+)
+from src.domain.repositories.legal_case_repository import (
+    DEFAULT_CASE_LIST_SORT_FIELD,
+)
+from src.domain.usecases.list_legal_case_changes_use_case import (
+    DEFAULT_CHANGES_PAGE_SIZE,
+    ListLegalCaseChangesUseCase,
+)
+from src.domain.usecases.list_legal_cases_use_case import (
+    DEFAULT_CASE_LIST_PAGE_SIZE,
+    ListLegalCasesUseCase,
+)
+from src.domain.usecases.list_legal_case_movements_use_case import (
+    DEFAULT_MOVEMENTS_PAGE_SIZE,
+    ListLegalCaseMovementsUseCase,
+)
+from src.domain.usecases.search_legal_cases_use_case import (
+    DEFAULT_SEARCH_PAGE_SIZE,
+    SearchLegalCasesUseCase,
+)
 from src.infra.database.session import get_session
 from src.infra.factories.legal_case_factories import (
     create_get_legal_case_by_id_use_case,
+    create_get_legal_case_import_use_case,
+    create_import_legal_cases_use_case,
+    create_list_legal_case_changes_use_case,
+    create_list_legal_cases_use_case,
+    create_list_legal_case_movements_use_case,
     create_process_dashboard_use_case,
+    create_search_legal_cases_use_case,
 )
 from src.infra.http.dto.general_response_dto import GeneralResponseDTO
+from src.infra.http.dto.legal_case_request_dto import LegalCaseRequestDTO
 from src.infra.http.mapper.process_mapper import ProcessMapper
 from src.infra.http.security.auth_decorator import AuthenticatedUser
+from src.infra.scheduler.jobs import get_case_revalidator
 
 router = APIRouter(prefix="/processos", tags=["Processos"])
 
 
+@router.get("", response_model=GeneralResponseDTO)
+def listar_processos(
+    session=Depends(get_session),
+    current_user: AuthenticatedUserEntity = AuthenticatedUser,
+    status_filter: list[str] | None = Query(default=None, alias="status"),
+    priority: list[str] | None = Query(default=None),
+    tribunal: list[str] | None = Query(default=None),
+    date_from: str | None = Query(default=None),
+    date_to: str | None = Query(default=None),
+    sort_field: str = Query(default=DEFAULT_CASE_LIST_SORT_FIELD),
+    sort_dir: str = Query(default="desc"),
+    limit: int = Query(default=DEFAULT_CASE_LIST_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+):
+    use_case: ListLegalCasesUseCase = create_list_legal_cases_use_case(session)
+    result = use_case.execute(
+        date_from=date_from,
+        date_to=date_to,
+        status=status_filter,
+        priority=priority,
+        tribunal=tribunal,
+        sort_field=sort_field,
+        sort_direction=sort_dir,
+        limit=limit,
+        cursor=cursor,
+    )
+    if result.is_left():
+        error = result.get_left()
+        response = GeneralResponseDTO(errors=[{"message": error.message}])
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content=response.model_dump(),
+        )
+
+    dto = ProcessMapper.case_list_to_dto(result.get_right())
+    return GeneralResponseDTO(data=dto.model_dump())
+
+
+def _lookup_error_status(error: Exception) -> int:
+    if isinstance(error, InvalidInputError):
+        return status.HTTP_422_UNPROCESSABLE_ENTITY
+    if isinstance(error, LegalCaseNotFoundError):
+        return status.HTTP_404_NOT_FOUND
+    if isinstance(error, ExternalRateLimitError):
+        return status.HTTP_429_TOO_MANY_REQUESTS
+    if isinstance(error, ExternalServiceUnavailableError):
+        return status.HTTP_503_SERVICE_UNAVAILABLE
+    return status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+@router.post("/consultar", response_model=GeneralResponseDTO)
+def consultar_processos(
+    body: LegalCaseRequestDTO,
+    session=Depends(get_session),
+    current_user: AuthenticatedUserEntity = AuthenticatedUser,
+):
+    use_case: GetLegalCaseByIdUseCase = create_get_legal_case_by_id_use_case(
+        session, revalidator=get_case_revalidator()
+    )
+    result = use_case.execute_many(body.process_numbers)
+    if result.is_left():
+        error = result.get_left()
+        response = GeneralResponseDTO(errors=[{"message": error.message}])
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content=response.model_dump(),
+        )
+
+    dto = ProcessMapper.lookup_results_to_dto(result.get_right(), _lookup_error_status)
+    return GeneralResponseDTO(data=dto.model_dump())
+
+
 @router.get("/consultar/{case_number}", response_model=GeneralResponseDTO)
 def consultar_processo(
     case_number: str,
     session=Depends(get_session),
     current_user: AuthenticatedUserEntity = AuthenticatedUser,
 ):
-    use_case: GetLegalCaseByIdUseCase = create_get_legal_case_by_id_use_case(session)
+    use_case: GetLegalCaseByIdUseCase = create_get_legal_case_by_id_use_case(
+        session, revalidator=get_case_revalidator()
+    )
     result = use_case.execute(case_number)
+    if result.is_left():
+        error = result.get_left()
+        response = GeneralResponseDTO(errors=[{"message": error.message}])
+        return JSONResponse(
+            status_code=_lookup_error_status(error), content=response.model_dump()
+        )
+
+    persisted = result.get_right()
+    dto = ProcessMapper.case_to_dto(persisted)
+    return GeneralResponseDTO(data=dto.model_dump())
+
+
+@router.get("/changes", response_model=GeneralResponseDTO)
+def listar_alteracoes(
+    session=Depends(get_session),
+    current_user: AuthenticatedUserEntity = AuthenticatedUser,
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=DEFAULT_CHANGES_PAGE_SIZE),
+    numero_processo: str | None = Query(default=None),
+):
+    use_case: ListLegalCaseChangesUseCase = create_list_legal_case_changes_use_case(
+        session
+    )
+    result = use_case.execute(cursor=cursor, limit=limit, case_number=numero_processo)
+    if result.is_left():
+        error = result.get_left()
+        response = GeneralResponseDTO(errors=[{"message": error.message}])
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content=response.model_dump(),
+        )
+
+    dto = ProcessMapper.changes_page_to_dto(result.get_right())
+    return GeneralResponseDTO(data=dto.model_dump())
+
+
+@router.get("/busca", response_model=GeneralResponseDTO)
+def buscar_processos(
+    q: str = Query(default=""),
+    page: int = Query(default=1),
+    page_size: int = Query(default=DEFAULT_SEARCH_PAGE_SIZE),
+    session=Depends(get_session),
+    current_user: AuthenticatedUserEntity = AuthenticatedUser,
+):
+    use_case: SearchLegalCasesUseCase = create_search_legal_cases_use_case(session)
+    result = use_case.execute(q, page=page, page_size=page_size)
+    if result.is_left():
+        error = result.get_left()
+        response = GeneralResponseDTO(errors=[{"message": error.message}])
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content=response.model_dump(),
+        )
+
+    dto = ProcessMapper.search_page_to_dto(result.get_right())
+    return GeneralResponseDTO(data=dto.model_dump())
+
+
+@router.post(
+    "/importacoes",
+    response_model=GeneralResponseDTO,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def importar_processos(
+    file: UploadFile = File(..., description="CSV ou JSON com números CNJ"),
+    session=Depends(get_session),
+    current_user: AuthenticatedUserEntity = AuthenticatedUser,
+):
+    use_case: ImportLegalCasesUseCase = create_import_legal_cases_use_case(session)
+    # Lê um byte além do limite para que o caso de uso rejeite arquivos maiores.
+    content = file.file.read(MAX_IMPORT_BYTES + 1)
+    result = use_case.execute(
+        content,
+        filename=file.filename,
+        content_type=file.content_type,
+        created_by=current_user.id,
+    )
+    if result.is_left():
+        error = result.get_left()
+        if isinstance(error, InvalidInputError):
+            status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+        else:
+            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        response = GeneralResponseDTO(errors=[{"message": error.message}])
+        return JSONResponse(status_code=status_code, content=response.model_dump())
+
+    dto = ProcessMapper.import_to_dto(result.get_right())
+    return GeneralResponseDTO(data=dto.model_dump())
+
+
+@router.get("/importacoes/{import_id}", response_model=GeneralResponseDTO)
+def consultar_importacao(
+    import_id: str,
+    session=Depends(get_session),
+    current_user: AuthenticatedUserEntity = AuthenticatedUser,
+):
+    use_case: GetLegalCaseImportUseCase = create_get_legal_case_import_use_case(session)
+    result = use_case.execute(import_id)
+    if result.is_left():
+        error = result.get_left()
+        if isinstance(error, InvalidInputError):
+            status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+        elif isinstance(error, LegalCaseImportNotFoundError):
+            status_code = status.HTTP_404_NOT_FOUND
+        else:
+            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        response = GeneralResponseDTO(errors=[{"message": error.message}])
+        return JSONResponse(status_code=status_code, content=response.model_dump())
+
+    dto = ProcessMapper.import_to_dto(result.get_right())
+    return GeneralResponseDTO(data=dto.model_dump())
+
+
+@router.get("/{case_number}/movimentacoes", response_model=GeneralResponseDTO)
+def listar_movimentacoes(
+    case_number: str,
+    session=Depends(get_session),
+    current_user: AuthenticatedUserEntity = AuthenticatedUser,
+    limit: int = Query(default=DEFAULT_MOVEMENTS_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+):
+    use_case: ListLegalCaseMovementsUseCase = create_list_legal_case_movements_use_case(
+        session
+    )
+    result = use_case.execute(case_number, limit=limit, cursor=cursor)
     if result.is_left():
         error = result.get_left()
         if isinstance(error, InvalidInputError):
             status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
         elif isinstance(error, LegalCaseNotFoundError):
             status_code = status.HTTP_404_NOT_FOUND
-        elif isinstance(error, ExternalRateLimitError):
-            status_code = status.HTTP_429_TOO_MANY_REQUESTS
         else:
             status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
         response = GeneralResponseDTO(errors=[{"message": error.message}])
         return JSONResponse(status_code=status_code, content=response.model_dump())
 
-    persisted = result.get_right()
-    dto = ProcessMapper.case_to_dto(persisted)
+    dto = ProcessMapper.movement_page_to_dto(result.get_right())
     return GeneralResponseDTO(data=dto.model_dump())
 
 
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
 from typing import List, Optional
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, File, Query, UploadFile, status
-from fastapi.responses import JSONResponse
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Header,
+    Query,
+    UploadFile,
+    status,
+)
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from src.domain.core.errors import (
@@ -13,6 +23,7 @@ from src.domain.core.errors import (
     EligibilityComputationError,
     IncompleteDataError,
     InvalidInputError,
+    RangeNotSatisfiableError,
     SolicitationNotFoundError,
     StorageError,
     UnsupportedDocumentError,
@@ -20,7 +31,11 @@ from src.domain.core.errors import (
 )
 from src.domain.entities.auth import AuthenticatedUserEntity
 
-from src.domain.entities.document import ClassificationDocument
+from src.domain.entities.document import (
+    ClassificationDocument,
+    UploadedDocument,
+    UploadIntent,
+)
 from src.domain.usecases.evaluate_eligibility_use_case import (
     EvaluateEligibilityUseCase,
 )
@@ -30,20 +45,29 @@ from src.domain.usecases.build_solicitation_dashboard_use_case import (
 from src.domain.usecases.document_classification_use_case import (
     ClassificarDocumentosUseCase,
 )
+from src.domain.usecases.document_upload_use_case import (
+    RegisterUploadedDocumentsUseCase,
+    RequestDocumentUploadUseCase,
+)
+from src.domain.usecases.download_document_use_case import DownloadDocumentUseCase
 from src.domain.usecases.extract_data_use_case import ExtrairDadosUseCase
-from src.infra.database.session import get_session
+from src.infra.database.session import get_session, session_scope
 from src.infra.factories.solicitation_factory import (
     create_classificar_documentos_usecase,
 )
 from src.infra.factories.solicitation_factory import (
     create_avaliar_elegibilidade_use_case,
+    create_download_document_use_case,
     create_extrair_dados_use_case,
     create_get_solicitacao_by_id_use_case,
+    create_register_uploaded_documents_use_case,
+    create_request_document_upload_use_case,
     create_solicitation_dashboard_use_case,
 )
 from src.infra.http.dto.general_response_dto import GeneralResponseDTO
 from src.infra.http.mapper.solicitacao_mapper import SolicitacaoMapper
 from src.infra.http.security.auth_decorator import AuthenticatedUser
+from src.infra.scheduler.jobs import run_classify_documents_job
 
 
 router = APIRouter(prefix="/solicitacao", tags=["Solicitações"])
@@ -58,6 +82,27 @@ class EligibilityRequestDTO(BaseModel):
     solicitation_id: str
 
 
+class UploadIntentDTO(BaseModel):
+    name: str
+    mimetype: str
+    size: int = Field(gt=0, description="Tamanho do arquivo em bytes")
+
+
+class UploadUrlRequestDTO(BaseModel):
+    solicitation_id: Optional[str] = None
+    files: List[UploadIntentDTO]
+
+
+class UploadedDocumentDTO(BaseModel):
+    key: str
+    name: str
+    mimetype: str
+
+
+class RegisterDocumentsRequestDTO(BaseModel):
+    documents: List[UploadedDocumentDTO]
+
+
 @router.post("/classificador", response_model=GeneralResponseDTO)
 async def classificar_documentos(
     files: List[UploadFile] = File(..., description="Documentos para classificação"),
@@ -95,6 +140,144 @@ async def classificar_documentos(
     return GeneralResponseDTO(data=classification_result)
 
 
+@router.post("/uploads", response_model=GeneralResponseDTO)
+def solicitar_upload(
+    payload: UploadUrlRequestDTO,
+    session=Depends(get_session),
+    _: AuthenticatedUserEntity = AuthenticatedUser,
+):
+    use_case: RequestDocumentUploadUseCase = create_request_document_upload_use_case(
+        session
+    )
+    files = [
+        UploadIntent(name=item.name, mimetype=item.mimetype, size=item.size)
+        for item in payload.files
+    ]
+    result = use_case.execute(files, solicitation_id=payload.solicitation_id)
+    if result.is_left():
+        error = result.get_left()
+        if isinstance(error, InvalidInputError):
+            status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+        elif isinstance(error, SolicitationNotFoundError):
+            status_code = status.HTTP_404_NOT_FOUND
+        elif isinstance(error, UploadError):
+            status_code = status.HTTP_502_BAD_GATEWAY
+        else:
+            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        response = GeneralResponseDTO(errors=[{"message": error.message}])
+        return JSONResponse(status_code=status_code, content=response.model_dump())
+
+    ticket = result.get_right()
+    dto = SolicitacaoMapper.upload_ticket_response(
+        ticket.solicitation_id, ticket.uploads
+    )
+    return GeneralResponseDTO(data=dto.model_dump())
+
+
+@router.post(
+    "/{solicitacao_id}/documentos",
+    response_model=GeneralResponseDTO,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def registrar_documentos(
+    solicitacao_id: str,
+    payload: RegisterDocumentsRequestDTO,
+    background_tasks: BackgroundTasks,
+    session=Depends(get_session),
+    current_user: AuthenticatedUserEntity = AuthenticatedUser,
+):
+    use_case: RegisterUploadedDocumentsUseCase = (
+        create_register_uploaded_documents_use_case(session)
+    )
+    documents = [
+        UploadedDocument(key=item.key, name=item.name, mimetype=item.mimetype)
+        for item in payload.documents
+    ]
+    result = use_case.execute(current_user.id, solicitacao_id, documents)
+    if result.is_left():
+        error = result.get_left()
+        if isinstance(error, InvalidInputError):
+            status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+        elif isinstance(error, (SolicitationNotFoundError, DocumentNotFoundError)):
+            status_code = status.HTTP_404_NOT_FOUND
+        elif isinstance(error, UploadError):
+            status_code = status.HTTP_502_BAD_GATEWAY
+        elif isinstance(error, StorageError):
+            status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        else:
+            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        response = GeneralResponseDTO(errors=[{"message": error.message}])
+        return JSONResponse(status_code=status_code, content=response.model_dump())
+
+    registered = result.get_right()
+    # The dependency commits only after the background tasks have run, so the
+    # registration is committed here for the classify job's own session to
+    # see it (and to release the connection before the Gemini calls).
+    session.commit()
+    pending_ids = [doc.document_id for doc in registered if not doc.classification]
+    if pending_ids:
+        background_tasks.add_task(run_classify_documents_job, pending_ids)
+    dto = SolicitacaoMapper.registered_documents_response(solicitacao_id, registered)
+    return GeneralResponseDTO(data=dto.model_dump())
+
+
+@router.get(
+    "/documentos/{document_id}/download",
+    summary="Baixa um documento via URL pré-assinada ou streaming",
+)
+def baixar_documento(
+    document_id: str,
+    _: AuthenticatedUserEntity = AuthenticatedUser,
+    mode: str = Query(default="redirect"),
+    byte_range: str | None = Header(default=None, alias="Range"),
+):
+    # Only the metadata lookup needs the database: the session is closed
+    # before a (possibly slow) stream is sent, so it holds no pool connection.
+    with session_scope() as session:
+        use_case: DownloadDocumentUseCase = create_download_document_use_case(session)
+        result = use_case.execute(document_id, mode=mode, byte_range=byte_range)
+    if result.is_left():
+        error = result.get_left()
+        if isinstance(error, InvalidInputError):
+            status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+        elif isinstance(error, DocumentNotFoundError):
+            status_code = status.HTTP_404_NOT_FOUND
+        elif isinstance(error, RangeNotSatisfiableError):
+            status_code = status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        elif isinstance(error, StorageError):
+            status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        else:
+            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        response = GeneralResponseDTO(errors=[{"message": error.message}])
+        return JSONResponse(status_code=status_code, content=response.model_dump())
+
+    download = result.get_right()
+    if download.url is not None:
+        return RedirectResponse(
+            download.url, status_code=status.HTTP_307_TEMPORARY_REDIRECT
+        )
+
+    stream = download.stream
+    file_name = download.metadata.file_name or download.metadata.document_id
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Length": str(stream.content_length),
+        "Content-Disposition": f"attachment; filename*=UTF-8''{quote(file_name)}",
+    }
+    if stream.content_range:
+        headers["Content-Range"] = stream.content_range
+    return StreamingResponse(
+        stream.chunks,
+        status_code=(
+            status.HTTP_206_PARTIAL_CONTENT
+            if stream.content_range
+            else status.HTTP_200_OK
+        ),
+        media_type=stream.content_type or download.metadata.mimetype,
+        headers=headers,
+    )
+
+
 @router.post("/extracao", response_model=GeneralResponseDTO)
 async def extrair_dados(
     payload: ExtractionRequestDTO,
@@ -1,13 +1,49 @@
-from typing import Dict
+from typing import Callable, Dict, List
 
-from src.domain.entities.case import LegalCase, Movement
-from src.domain.repositories.legal_case_repository import PersistedLegalCase
+from src.domain.entities.case import (
+    CNJNumber,
+    LegalCase,
+    LegalCaseChangeEvent,
+    Movement,
+)
+from src.domain.repositories.legal_case_repository import (
+    LegalCaseListPage,
+    LegalCaseSearchHit,
+    LegalCaseSummary,
+    MovementPage,
+    PersistedLegalCase,
+)
+from src.domain.repositories.legal_case_change_repository import ChangeEventPage
+from src.domain.repositories.legal_case_import_repository import (
+    LegalCaseImportProgress,
+)
+from src.domain.usecases.get_legal_case_by_id_use_case import LegalCaseLookupResult
+from src.domain.usecases.list_legal_case_changes_use_case import (
+    encode_change_cursor,
+)
+from src.domain.usecases.list_legal_cases_use_case import encode_case_list_cursor
+from src.domain.usecases.list_legal_case_movements_use_case import (
+    encode_movement_cursor,
+)
+from src.domain.usecases.search_legal_cases_use_case import LegalCaseSearchPage
 from src.infra.http.dto.process_dto import (
     DashboardCaseHighlight,
     DashboardCountItem,
     DashboardPeriodItem,
+    InvalidImportEntryDTO,
+    LegalCaseChangeEventDTO,
+    LegalCaseChangesPageDTO,
+    LegalCaseImportDTO,
+    LegalCaseListPageDTO,
+    LegalCaseLookupBatchDTO,
+    LegalCaseLookupErrorDTO,
+    LegalCaseLookupItemDTO,
     LegalCaseMovementDTO,
+    LegalCaseMovementsPageDTO,
     LegalCaseResponseDTO,
+    LegalCaseSearchHitDTO,
+    LegalCaseSearchPageDTO,
+    LegalCaseSummaryDTO,
     ProcessDashboardDTO,
 )
 
@@ -42,7 +78,11 @@ class ProcessMapper:
             assunto=domain_case.subject,
             situacao=domain_case.status,
             data_ajuizamento=domain_case.filing_date,
-            movimentacoes=len(domain_case.movement_history or []),
+            movimentacoes=(
+                persisted.movement_count
+                if persisted.movement_count is not None
+                else len(domain_case.movement_history or [])
+            ),
             ultima_movimentacao=(
                 domain_case.movement_history[-1].date
                 if domain_case.movement_history
@@ -54,6 +94,148 @@ class ProcessMapper:
             movement_history=movement_history,
         )
 
+    @staticmethod
+    def movement_page_to_dto(page: MovementPage) -> LegalCaseMovementsPageDTO:
+        return LegalCaseMovementsPageDTO(
+            items=[ProcessMapper.movement_to_dto(mov) for mov in page.movements],
+            next_cursor=(
+                encode_movement_cursor(page.next_cursor) if page.next_cursor else None
+            ),
+        )
+
+    @staticmethod
+    def _format_number(numero_processo: str) -> str:
+        if numero_processo.isdigit() and len(numero_processo) == 20:
+            return CNJNumber.from_raw(numero_processo).number
+        return numero_processo
+
+    @staticmethod
+    def summary_to_dto(summary: LegalCaseSummary) -> LegalCaseSummaryDTO:
+        return LegalCaseSummaryDTO(
+            numero_processo=ProcessMapper._format_number(summary.numero_processo),
+            tribunal=summary.tribunal,
+            classe_processual=summary.classe_processual,
+            assunto=summary.assunto,
+            status=summary.status,
+            prioridade=summary.prioridade,
+            movimentacoes=summary.movimentacoes,
+            data_ajuizamento=summary.data_ajuizamento,
+            ultima_movimentacao=summary.ultima_movimentacao,
+            ultima_movimentacao_descricao=summary.ultima_movimentacao_descricao,
+            created_at=summary.created_at,
+        )
+
+    @staticmethod
+    def case_list_to_dto(page: LegalCaseListPage) -> LegalCaseListPageDTO:
+        # The cursor is bound to the ordering actually used, not to the raw
+        # query params, so defaulted params still yield a valid next page.
+        return LegalCaseListPageDTO(
+            items=[ProcessMapper.summary_to_dto(item) for item in page.items],
+            next_cursor=(
+                encode_case_list_cursor(
+                    page.next_cursor, page.sort_field, page.sort_direction
+                )
+                if page.next_cursor
+                else None
+            ),
+        )
+
+    @staticmethod
+    def change_event_to_dto(event: LegalCaseChangeEvent) -> LegalCaseChangeEventDTO:
+        return LegalCaseChangeEventDTO(
+            event_id=event.event_id,
+            numero_processo=ProcessMapper._format_number(event.numero_processo),
+            event_type=event.event_type,
+            payload=event.payload,
+            created_at=event.created_at,
+        )
+
+    @staticmethod
+    def changes_page_to_dto(page: ChangeEventPage) -> LegalCaseChangesPageDTO:
+        return LegalCaseChangesPageDTO(
+            items=[ProcessMapper.change_event_to_dto(event) for event in page.events],
+            next_cursor=(
+                encode_change_cursor(page.next_cursor) if page.next_cursor else None
+            ),
+        )
+
+    @staticmethod
+    def lookup_results_to_dto(
+        results: List[LegalCaseLookupResult],
+        error_status: Callable[[Exception], int],
+    ) -> LegalCaseLookupBatchDTO:
+        items = []
+        for result in results:
+            if result.case is not None:
+                items.append(
+                    LegalCaseLookupItemDTO(
+                        numero_processo=result.case_number,
+                        processo=ProcessMapper.case_to_dto(result.case),
+                    )
+                )
+                continue
+            error = result.error
+            items.append(
+                LegalCaseLookupItemDTO(
+                    numero_processo=result.case_number,
+                    erro=LegalCaseLookupErrorDTO(
+                        status=error_status(error),
+                        message=getattr(error, "message", str(error)),
+                    ),
+                )
+            )
+        found = sum(1 for item in items if item.processo is not None)
+        return LegalCaseLookupBatchDTO(
+            items=items, encontrados=found, com_erro=len(items) - found
+        )
+
+    @staticmethod
+    def import_to_dto(progress: LegalCaseImportProgress) -> LegalCaseImportDTO:
+        return LegalCaseImportDTO(
+            id=progress.import_id,
+            formato=progress.source_format,
+            status="concluida" if progress.completed else "em_andamento",
+            recebidos=progress.total_received,
+            invalidos=progress.invalid_count,
+            duplicados=progress.duplicate_count,
+            ja_cadastrados=progress.already_tracked_count,
+            enfileirados=progress.queued_count,
+            encontrados=progress.found_count,
+            nao_encontrados=progress.not_found_count,
+            com_erro=progress.error_count,
+            pendentes=progress.pending_count,
+            invalidos_detalhe=[
+                InvalidImportEntryDTO(
+                    linha=entry.line, valor=entry.value, motivo=entry.reason
+                )
+                for entry in progress.invalid_entries
+            ],
+            created_at=progress.created_at,
+        )
+
+    @staticmethod
+    def search_hit_to_dto(hit: LegalCaseSearchHit) -> LegalCaseSearchHitDTO:
+        return LegalCaseSearchHitDTO(
+            numero_processo=ProcessMapper._format_number(hit.numero_processo),
+            tribunal=hit.tribunal,
+            classe_processual=hit.classe_processual,
+            assunto=hit.assunto,
+            ultima_movimentacao=hit.ultima_movimentacao,
+            relevancia=round(hit.rank, 6),
+            movimentacoes_encontradas=[
+                ProcessMapper.movement_to_dto(mov) for mov in hit.matched_movements
+            ],
+        )
+
+    @staticmethod
+    def search_page_to_dto(page: LegalCaseSearchPage) -> LegalCaseSearchPageDTO:
+        return LegalCaseSearchPageDTO(
+            items=[ProcessMapper.search_hit_to_dto(hit) for hit in page.hits],
+            page=page.page,
+            page_size=page.page_size,
+            has_more=page.has_more,
+        )
+
     @staticmethod
     def highlight_from_row(row: Dict[str, object]) -> DashboardCaseHighlight:
         return DashboardCaseHighlight(
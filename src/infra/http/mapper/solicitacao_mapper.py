@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import Dict, List
 
-from src.domain.entities.document import DocumentClassification
+from src.domain.entities.document import DocumentClassification, PresignedUpload
 from src.domain.entities.solicitation import SolicitationDetails, SolicitationDocument
 from src.domain.repositories.document_repository import DocumentMetadata
 from src.domain.repositories.document_extraction_repository import (
@@ -19,8 +19,11 @@ from src.infra.http.dto.solicitacao_dto import (
     EligibilityResponseDTO,
     ExtractionItemDTO,
     ExtractionResponseDTO,
+    PresignedUploadDTO,
+    RegisteredDocumentsDTO,
     SolicitationDashboardDTO,
     SolicitacaoDTO,
+    UploadTicketDTO,
 )
 
 
@@ -51,6 +54,43 @@ class SolicitacaoMapper:
             groups.append(ClassificationGroupDTO(categoria=categoria, documentos=itens))
         return ClassificationResponseDTO(solicitation_id=solicitation_id, groups=groups)
 
+    @staticmethod
+    def upload_ticket_response(
+        solicitation_id: str, uploads: List[PresignedUpload]
+    ) -> UploadTicketDTO:
+        items = [
+            PresignedUploadDTO(
+                arquivo=upload.name,
+                mimetype=upload.mimetype,
+                key=upload.key,
+                url=upload.url,
+                headers={"Content-Type": upload.mimetype},
+                expires_in=upload.expires_in,
+            )
+            for upload in uploads
+        ]
+        return UploadTicketDTO(solicitation_id=solicitation_id, uploads=items)
+
+    @staticmethod
+    def registered_documents_response(
+        solicitation_id: str, documents: List[DocumentMetadata]
+    ) -> RegisteredDocumentsDTO:
+        items = [
+            DocumentDTO(
+                id=document.document_id,
+                fileName=document.file_name,
+                mimetype=document.mimetype,
+                classification=document.classification,
+                uploadedAt=document.uploaded_at,
+            )
+            for document in documents
+        ]
+        return RegisteredDocumentsDTO(
+            solicitation_id=solicitation_id,
+            documents=items,
+            classification_status="enfileirada",
+        )
+
     @staticmethod
     def extraction_response(
         solicitation_id: str,
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from threading import Event, Thread
+from typing import Callable, Optional
+
+from src.domain.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Heartbeat:
+    """Calls ``beat`` every ``interval_seconds`` on a daemon thread while active."""
+
+    def __init__(
+        self, beat: Callable[[], None], interval_seconds: float, name: str = "heartbeat"
+    ) -> None:
+        self._beat = beat
+        self._interval = max(1.0, interval_seconds)
+        self._name = name
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            try:
+                self._beat()
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("Falha ao renovar %s: %s", self._name, exc)
+
+    def __enter__(self) -> "Heartbeat":
+        self._thread = Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._interval)
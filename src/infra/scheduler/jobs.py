@@ -1,42 +1,171 @@
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import os
+import socket
+from threading import Lock
+from typing import List, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
 
 from src.domain.core.logger import get_logger
 from src.domain.core import metrics
-from src.domain.usecases.get_legal_case_by_id_use_case import (
-    UpdateStaleLegalCasesUseCase,
+from src.domain.repositories.legal_case_repository import PersistedLegalCase
+from src.infra.config.settings import (
+    SchedulerSettings,
+    get_change_feed_settings,
+    get_datajud_cache_settings,
+    get_scheduler_settings,
+)
+from src.infra.database.dashboard_rollups import (
+    LEGAL_CASE_ROLLUP,
+    refresh_logged_days,
+)
+from src.infra.database.repositories.datajud_lookup_cache_repository import (
+    DataJudLookupCacheRepository,
+)
+from src.infra.database.repositories.legal_case_change_repository import (
+    LegalCaseChangeRepository,
 )
-from src.infra.config.settings import get_scheduler_settings
-from src.infra.database.repositories.scheduler_lock_repository import (
-    SchedulerLockRepository,
+from src.infra.database.repositories.legal_case_import_repository import (
+    LegalCaseImportRepository,
 )
+from src.infra.database.repositories.legal_case_movement_partition_repository import (
+    LegalCaseMovementPartitionRepository,
+)
+from src.infra.database.repositories.sync_run_repository import SyncRunRepository
 from src.infra.database.session import session_scope
-from src.infra.factories.legal_case_factories import create_update_stale_cases_use_case
+from src.infra.external.gateway.cached_legal_case_gateway import publish_hit_ratio
+from src.infra.factories.legal_case_factories import (
+    create_dispatch_change_events_use_case,
+    create_update_stale_cases_use_case,
+)
+from src.infra.factories.solicitation_factory import (
+    create_classify_stored_documents_use_case,
+)
+from src.infra.scheduler.heartbeat import Heartbeat
+from src.infra.scheduler.revalidation import BackgroundRevalidator
 
 logger = get_logger(__name__)
 
 
-LOCK_NAME = "update_legal_cases_cron"
+# Upper bound of outbox rows deleted per purge, to keep the transaction short.
+CHANGE_EVENTS_PURGE_LIMIT = 10000
+# Same bound for expired rows of the DataJud lookup cache.
+DATAJUD_CACHE_PURGE_LIMIT = 10000
+# Dirty-day log entries drained per dashboard rollup refresh.
+DASHBOARD_ROLLUP_REFRESH_LIMIT = 10000
 
+# Identifies this process as the holder of the case leases it claims.
+SYNC_WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
 
-def run_update_legal_cases_job() -> None:
+
+def _import_repository(session: Session) -> LegalCaseImportRepository:
     settings = get_scheduler_settings()
-    lock_ttl_seconds = int(timedelta(minutes=30).total_seconds())
+    return LegalCaseImportRepository(
+        session,
+        max_not_found_attempts=settings.import_not_found_max_attempts,
+        max_placeholder_age=timedelta(days=settings.import_not_found_max_age_days),
+    )
 
-    with session_scope() as session:
-        lock_repository = SchedulerLockRepository(session)
-        if not lock_repository.acquire(LOCK_NAME, lock_ttl_seconds):
+
+def _claim_cases(
+    session: Session, settings: SchedulerSettings
+) -> Tuple[List[PersistedLegalCase], Optional[str]]:
+    """Resume an abandoned run if there is one, else lease a fresh slice."""
+    lease_seconds = settings.sync_lease_seconds
+    use_case = create_update_stale_cases_use_case(session)
+    runs = SyncRunRepository(session)
+    abandoned = runs.find_abandoned(
+        heartbeat_before=datetime.now(timezone.utc)
+        - timedelta(seconds=settings.sync_heartbeat_seconds * 3)
+    )
+    if abandoned is not None:
+        runs.finish(abandoned.id, "interrupted")
+        cases = use_case.claim_cases(
+            abandoned.pending_case_ids or [],
+            owner=SYNC_WORKER_ID,
+            lease_seconds=lease_seconds,
+            previous_owner=abandoned.owner,
+        )
+        if cases:
             logger.info(
-                "Job de atualização de processos já em execução em outra instância."
+                "Retomando execução interrompida %s com %s processo(s) pendente(s).",
+                abandoned.id,
+                len(cases),
             )
+            return cases, str(abandoned.id)
+    batch_size = use_case.plan_batch_size(
+        tick_seconds=settings.sync_tick_seconds,
+        max_batch_size=settings.batch_size,
+        budget_share=settings.sync_budget_share,
+    )
+    if batch_size <= 0:
+        return [], None
+    cases = use_case.claim_batch(
+        batch_size=batch_size, owner=SYNC_WORKER_ID, lease_seconds=lease_seconds
+    )
+    return cases, None
+
+
+def run_update_legal_cases_job() -> None:
+    """Lease a slice of due cases, sync it and release the leases.
+
+    Runs on every scheduler tick, sized by ``plan_batch_size`` to spread the
+    backlog over the freshness target within the external RPM budget. Every
+    replica runs this job; ``FOR UPDATE SKIP LOCKED`` hands each one a
+    disjoint slice. Each case is committed on its own and recorded in
+    ``sync_runs``, and a heartbeat keeps the leases alive, so a run whose
+    worker dies is resumed by the next replica instead of being redone.
+    """
+    settings = get_scheduler_settings()
+    lease_seconds = settings.sync_lease_seconds
+
+    with session_scope() as session:
+        cases, resumed_from = _claim_cases(session, settings)
+        if not cases:
+            logger.info("Nenhum processo desatualizado disponível para esta instância.")
             return
+        run_id = (
+            SyncRunRepository(session)
+            .start(SYNC_WORKER_ID, [case.case_id for case in cases], resumed_from)
+            .id
+        )
 
-        try:
-            use_case: UpdateStaleLegalCasesUseCase = create_update_stale_cases_use_case(
-                session
+    pending = {case.case_id for case in cases}
+    pending_lock = Lock()
+
+    def beat() -> None:
+        with pending_lock:
+            case_ids = list(pending)
+        with session_scope() as beat_session:
+            create_update_stale_cases_use_case(beat_session).renew_batch(
+                case_ids, SYNC_WORKER_ID, lease_seconds
             )
-            result = use_case.execute(batch_size=settings.batch_size)
+            SyncRunRepository(beat_session).heartbeat(run_id)
+
+    status = "failed"
+    try:
+        with (
+            Heartbeat(beat, settings.sync_heartbeat_seconds, name="sync-lease"),
+            session_scope() as session,
+        ):
+            use_case = create_update_stale_cases_use_case(session)
+            runs = SyncRunRepository(session)
+            imports = _import_repository(session)
+
+            def on_case_done(case: PersistedLegalCase, result: str) -> None:
+                if result == "failed":
+                    session.rollback()
+                runs.record_case(run_id, case.case_id, result)
+                imports.record_outcome(case.case_id, result)
+                session.commit()
+                with pending_lock:
+                    pending.discard(case.case_id)
+
+            result = use_case.sync_cases(cases, on_case_done=on_case_done)
             if result.is_left():
                 error = result.get_left()
                 metrics.increment("scheduler_errors")
@@ -44,11 +173,132 @@ def run_update_legal_cases_job() -> None:
                 return
 
             summary = result.get_right()
+            status = "completed"
             metrics.increment("scheduler_runs")
             metrics.increment("scheduler_updated_cases", summary.get("updated", 0))
             logger.info(
                 "Atualização de processos concluída: %s",
                 summary,
             )
+    finally:
+        with session_scope() as session:
+            SyncRunRepository(session).finish(run_id, status)
+            create_update_stale_cases_use_case(session).release_batch(
+                cases, SYNC_WORKER_ID
+            )
+
+
+def run_revalidate_legal_case_job(case_id: str) -> None:
+    """Refresh one case read while stale, unless a sync worker holds it."""
+    settings = get_scheduler_settings()
+    # Its own lease owner: a case leased by this process's cron batch is not
+    # free for the revalidation, and releasing must not drop the cron's lease.
+    owner = f"{SYNC_WORKER_ID}:reval:{uuid4().hex[:8]}"
+    with session_scope() as session:
+        use_case = create_update_stale_cases_use_case(session)
+        cases = use_case.claim_cases(
+            [case_id], owner=owner, lease_seconds=settings.sync_lease_seconds
+        )
+        if not cases:
+            return
+        imports = _import_repository(session)
+
+        def on_case_done(case: PersistedLegalCase, result: str) -> None:
+            if result == "failed":
+                session.rollback()
+            imports.record_outcome(case.case_id, result)
+
+        try:
+            result = use_case.sync_cases(cases, on_case_done=on_case_done)
+            if result.is_right():
+                logger.info("Processo %s revalidado: %s", case_id, result.get_right())
         finally:
-            lock_repository.release(LOCK_NAME)
+            use_case.release_batch(cases, owner)
+
+
+@lru_cache(maxsize=1)
+def get_case_revalidator() -> BackgroundRevalidator:
+    """Process-wide background refresher for stale-while-revalidate reads."""
+    settings = get_scheduler_settings()
+    return BackgroundRevalidator(
+        run_revalidate_legal_case_job,
+        max_per_minute=settings.revalidate_rpm,
+    )
+
+
+def run_change_events_job() -> None:
+    """Purge expired outbox events and push pending ones to the webhook."""
+    settings = get_change_feed_settings()
+    with session_scope() as session:
+        purged = LegalCaseChangeRepository(session).purge(
+            datetime.now(timezone.utc) - timedelta(days=settings.retention_days),
+            CHANGE_EVENTS_PURGE_LIMIT,
+        )
+        if purged:
+            logger.info("%s evento(s) de alteração expirado(s) removido(s).", purged)
+
+    with session_scope() as session:
+        use_case = create_dispatch_change_events_use_case(session)
+        if use_case is None:
+            return
+        result = use_case.execute()
+        if result.is_left():
+            metrics.increment("scheduler_errors")
+            logger.error("Envio de eventos ao webhook falhou: %s", result.get_left())
+
+
+def run_datajud_cache_job() -> None:
+    """Purge expired lookup cache rows and log the cache hit ratio."""
+    if get_datajud_cache_settings().postgres_tier:
+        purged = DataJudLookupCacheRepository(session_scope).purge_expired(
+            DATAJUD_CACHE_PURGE_LIMIT
+        )
+        if purged:
+            logger.info("%s consulta(s) expirada(s) removida(s) do cache.", purged)
+    ratio = publish_hit_ratio()
+    if ratio is not None:
+        logger.info("Taxa de acerto do cache do DataJud: %s%%.", ratio)
+
+
+def run_dashboard_rollup_job() -> None:
+    """Recompute the legal case rollup days changed since the last run."""
+    with session_scope() as session:
+        refreshed = refresh_logged_days(
+            session.connection(), LEGAL_CASE_ROLLUP, DASHBOARD_ROLLUP_REFRESH_LIMIT
+        )
+    if refreshed:
+        metrics.increment("legal_case_rollup_days_refreshed", refreshed)
+        logger.info("%s dia(s) do rollup de processos recalculado(s).", refreshed)
+
+
+def run_movement_partitions_job() -> None:
+    """Create the upcoming yearly partitions of ``legal_case_movements``.
+
+    Also splits out of the default partition any year that gathered rows
+    there, so inserts never depend on this job having run on time.
+    """
+    years_ahead = get_scheduler_settings().movement_partition_years_ahead
+    with session_scope() as session:
+        created = LegalCaseMovementPartitionRepository(session).ensure_partitions(
+            years_ahead
+        )
+    if created:
+        metrics.increment("legal_case_movement_partitions_created", len(created))
+        logger.info(
+            "Partições de movimentações criadas: %s",
+            ", ".join(str(year) for year in created),
+        )
+
+
+def run_classify_documents_job(document_ids: List[str]) -> None:
+    """Classify documents registered after a direct upload."""
+    with session_scope() as session:
+        use_case = create_classify_stored_documents_use_case(session)
+        result = use_case.execute(document_ids)
+        if result.is_left():
+            logger.error("Classificação em segundo plano falhou: %s", result.get_left())
+            return
+        logger.info(
+            "Classificação em segundo plano concluída para %s documento(s).",
+            len(result.get_right()),
+        )
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Set
+
+from src.domain.core import metrics
+from src.domain.core.logger import get_logger
+from src.domain.core.rate_limit import TokenBucket
+from src.domain.gateway.legal_case_revalidator import ILegalCaseRevalidator
+from src.domain.repositories.legal_case_repository import PersistedLegalCase
+
+logger = get_logger(__name__)
+
+
+class BackgroundRevalidator(ILegalCaseRevalidator):
+    """Runs single-case refreshes on a small thread pool.
+
+    A case already queued or running is not queued again, and refreshes
+    beyond ``max_per_minute`` are dropped; the scheduled sync catches up
+    with those.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[str], None],
+        max_per_minute: int,
+        max_workers: int = 1,
+    ) -> None:
+        self._refresh = refresh
+        self._bucket = TokenBucket(max_per_minute, capacity=max(1, max_per_minute // 6))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="case-revalidate"
+        )
+        self._pending: Set[str] = set()
+        self._lock = Lock()
+        self._closed = False
+
+    def schedule(self, case: PersistedLegalCase) -> bool:
+        with self._lock:
+            if self._closed:
+                return False
+            if case.case_id in self._pending:
+                metrics.increment("legal_case_revalidations_deduplicated")
+                return False
+            if not self._bucket.try_acquire():
+                metrics.increment("legal_case_revalidations_throttled")
+                return False
+            self._pending.add(case.case_id)
+        metrics.increment("legal_case_revalidations_scheduled")
+        self._executor.submit(self._run, case.case_id)
+        return True
+
+    def _run(self, case_id: str) -> None:
+        try:
+            self._refresh(case_id)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Falha ao revalidar processo %s: %s", case_id, exc)
+        finally:
+            with self._lock:
+                self._pending.discard(case_id)
+
+    def shutdown(self) -> None:
+        """Drop queued refreshes and wait for the running ones to finish, so
+        their leases are released instead of left to expire."""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
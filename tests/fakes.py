@@ -0,0 +1,422 @@
+"""Fakes shared by the legal case test modules."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from uuid import NAMESPACE_URL, uuid5
+
+import requests
+
+from src.domain.core.errors import LegalCasePersistenceError
+from src.domain.entities.case import (
+    CNJNumber,
+    LegalCase,
+    Movement,
+    movement_history_digest,
+)
+from src.domain.gateway.legal_case_gateway import LegalCaseGateway
+from src.domain.repositories.legal_case_repository import (
+    CaseListCursor,
+    ILegalCaseRepository,
+    LegalCaseListPage,
+    LegalCaseSearchHit,
+    LegalCaseSummary,
+    MovementCursor,
+    MovementPage,
+    PersistedLegalCase,
+    ProcessDashboardAggregation,
+    ProcessDashboardFilters,
+)
+
+TRF1_CASE = "10000000020244010000"
+TJPA_CASE = "08000000020248140000"
+
+
+def build_case(case_number: str, movements: List[Movement]) -> LegalCase:
+    return LegalCase(
+        case_number=CNJNumber.from_raw(case_number).number,
+        court="TRF1",
+        judging_body="1ª Vara",
+        procedural_class="Procedimento Comum",
+        subject="Seguro defeso",
+        status="G1",
+        filing_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        latest_update=movements[-1].description if movements else None,
+        movement_history=movements or None,
+    )
+
+
+class FakeLegalCaseRepository(ILegalCaseRepository):
+    def __init__(self, cases: List[PersistedLegalCase]) -> None:
+        self._cases = cases
+        self.applied: Dict[str, List[Movement]] = {}
+        self.apply_threads: set = set()
+        self.stored: Dict[str, List[Movement]] = {
+            case.case_id: list(case.case.movement_history or []) for case in cases
+        }
+        self.boundary_reads: List[tuple] = []
+        self.leases: Dict[str, tuple] = {}
+        self.schedule: Dict[str, Optional[datetime]] = {}
+        self.bulk_reads = 0
+
+    def _synced(self) -> List[PersistedLegalCase]:
+        return [case for case in self._cases if case.last_synced_at is not None]
+
+    def get_by_number(self, numero_processo: str) -> Optional[PersistedLegalCase]:
+        return next(
+            (case for case in self._cases if case.numero_processo == numero_processo),
+            None,
+        )
+
+    def get_by_numbers(self, numeros_processo: List[str]):
+        self.bulk_reads += 1
+        wanted = set(numeros_processo)
+        return {
+            case.numero_processo: case
+            for case in self._cases
+            if case.numero_processo in wanted
+        }
+
+    def get_case_id(self, numero_processo: str) -> Optional[str]:
+        case = self.get_by_number(numero_processo)
+        return case.case_id if case else None
+
+    def list_movements_page(
+        self,
+        case_id: str,
+        limit: int,
+        before: Optional[MovementCursor] = None,
+    ) -> MovementPage:
+        keyed = sorted(
+            (
+                (m.date, str(uuid5(NAMESPACE_URL, f"{case_id}:{m.description}")), m)
+                for m in self.stored.get(case_id, [])
+            ),
+            key=lambda item: (item[0], item[1]),
+            reverse=True,
+        )
+        if before is not None:
+            position = (before.movement_date, before.movement_id)
+            keyed = [item for item in keyed if (item[0], item[1]) < position]
+        page = keyed[:limit]
+        next_cursor = (
+            MovementCursor(page[-1][0], page[-1][1]) if len(keyed) > limit else None
+        )
+        return MovementPage([item[2] for item in page], next_cursor)
+
+    def lock_case_number(self, numero_processo: str) -> None:
+        return None
+
+    def insert_case_with_movements(
+        self, case_number: str, case: LegalCase, movements: List[Movement]
+    ) -> PersistedLegalCase:
+        if self.get_by_number(case_number) is not None:
+            raise LegalCasePersistenceError("duplicate key value")
+        inserted = persisted(case_number, movements)
+        self._cases.append(inserted)
+        self.stored[inserted.case_id] = list(movements)
+        return inserted
+
+    def list_stale_cases(
+        self, limit: int, stale_before: datetime
+    ) -> List[PersistedLegalCase]:
+        return self._cases[:limit]
+
+    def claim_stale_cases(
+        self,
+        limit: int,
+        stale_before: datetime,
+        owner: str,
+        lease_seconds: int,
+    ) -> List[PersistedLegalCase]:
+        now = datetime.now(timezone.utc)
+        claimed = []
+        for case in self._cases:
+            lease = self.leases.get(case.case_id)
+            if lease is not None and lease[1] > now:
+                continue
+            self.leases[case.case_id] = (owner, now + timedelta(seconds=lease_seconds))
+            claimed.append(case)
+            if len(claimed) == limit:
+                break
+        return claimed
+
+    def claim_cases(
+        self,
+        case_ids: List[str],
+        owner: str,
+        lease_seconds: int,
+        previous_owner: Optional[str] = None,
+    ) -> List[PersistedLegalCase]:
+        expires = datetime.now(timezone.utc) + timedelta(seconds=lease_seconds)
+        claimed = []
+        for case in self._cases:
+            lease = self.leases.get(case.case_id)
+            if case.case_id not in case_ids:
+                continue
+            if lease is not None and lease[0] not in (owner, previous_owner):
+                continue
+            self.leases[case.case_id] = (owner, expires)
+            claimed.append(case)
+        return claimed
+
+    def renew_claims(self, case_ids: List[str], owner: str, lease_seconds: int) -> int:
+        expires = datetime.now(timezone.utc) + timedelta(seconds=lease_seconds)
+        renewed = 0
+        for case_id in case_ids:
+            if self.leases.get(case_id, (None,))[0] == owner:
+                self.leases[case_id] = (owner, expires)
+                renewed += 1
+        return renewed
+
+    def release_claims(self, case_ids: List[str], owner: str) -> None:
+        for case_id in case_ids:
+            if self.leases.get(case_id, (None,))[0] == owner:
+                del self.leases[case_id]
+
+    def list_movements_since(self, case_id: str, since: datetime) -> List[Movement]:
+        self.boundary_reads.append((case_id, since))
+        return [movement for movement in self.stored[case_id] if movement.date >= since]
+
+    def apply_case_updates(
+        self,
+        persisted: PersistedLegalCase,
+        updated_case: LegalCase,
+        new_movements: List[Movement],
+        next_sync_at: Optional[datetime] = None,
+    ) -> PersistedLegalCase:
+        self.apply_threads.add(threading.get_ident())
+        self.applied[persisted.numero_processo] = new_movements
+        self.schedule[persisted.case_id] = next_sync_at
+        self.stored.setdefault(persisted.case_id, []).extend(new_movements)
+        persisted.case = updated_case
+        persisted.last_synced_at = datetime.now(timezone.utc)
+        return persisted
+
+    def rebuild_case(self, case_number: str, case: LegalCase) -> PersistedLegalCase:
+        movements = sorted(case.movement_history or [], key=lambda m: m.date)
+        existing = self.get_by_number(case_number)
+        if existing is None:
+            return self.insert_case_with_movements(case_number, case, movements)
+        existing.case = case
+        self.stored[existing.case_id] = movements
+        return existing
+
+    def reschedule(self, case_id: str, next_sync_at: datetime) -> None:
+        self.schedule[case_id] = next_sync_at
+
+    def count_due_cases(self, stale_before: datetime) -> int:
+        return len(self._cases)
+
+    def search_cases(
+        self, query: str, limit: int, offset: int = 0
+    ) -> List[LegalCaseSearchHit]:
+        term = query.lower()
+        hits = []
+        for case in self._synced():
+            fields = [case.case.subject or "", case.case.procedural_class or ""]
+            matched = [
+                m
+                for m in self.stored.get(case.case_id, [])
+                if term in m.description.lower()
+            ]
+            rank = sum(term in field.lower() for field in fields) + len(matched)
+            if rank:
+                hits.append(
+                    LegalCaseSearchHit(
+                        case_id=case.case_id,
+                        numero_processo=case.numero_processo,
+                        tribunal=case.case.court,
+                        classe_processual=case.case.procedural_class,
+                        assunto=case.case.subject,
+                        ultima_movimentacao=None,
+                        rank=float(rank),
+                        matched_movements=matched[:3],
+                    )
+                )
+        hits.sort(key=lambda hit: (-hit.rank, hit.case_id))
+        return hits[offset : offset + limit]
+
+    def list_cases(
+        self,
+        filters: ProcessDashboardFilters,
+        limit: int,
+        after: Optional[CaseListCursor] = None,
+    ) -> LegalCaseListPage:
+        summaries = []
+        for case in self._synced():
+            history = sorted(self.stored.get(case.case_id, []), key=lambda m: m.date)
+            summaries.append(
+                LegalCaseSummary(
+                    case_id=case.case_id,
+                    numero_processo=case.numero_processo,
+                    tribunal=case.case.court,
+                    classe_processual=case.case.procedural_class,
+                    assunto=case.case.subject,
+                    status=case.status,
+                    prioridade=case.prioridade,
+                    movimentacoes=len(history),
+                    data_ajuizamento=case.case.filing_date,
+                    ultima_movimentacao=history[-1].date if history else None,
+                    ultima_movimentacao_descricao=case.case.latest_update,
+                    created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                )
+            )
+        if filters.status:
+            summaries = [item for item in summaries if item.status in filters.status]
+        descending = filters.sort_direction == "desc"
+
+        def key(item):
+            return (getattr(item, filters.sort_field), item.case_id)
+
+        valued = sorted(
+            (item for item in summaries if key(item)[0] is not None),
+            key=key,
+            reverse=descending,
+        )
+        nulls = sorted(
+            (item for item in summaries if key(item)[0] is None),
+            key=lambda item: item.case_id,
+            reverse=descending,
+        )
+        if after is not None and after.sort_value is not None:
+            position = (after.sort_value, after.case_id)
+            valued = [
+                item
+                for item in valued
+                if (key(item) < position if descending else key(item) > position)
+            ]
+        elif after is not None:
+            valued = []
+            nulls = [
+                item
+                for item in nulls
+                if (
+                    item.case_id < after.case_id
+                    if descending
+                    else item.case_id > after.case_id
+                )
+            ]
+        ordered = valued + nulls
+        page = ordered[:limit]
+        next_cursor = None
+        if len(ordered) > limit:
+            next_cursor = CaseListCursor(
+                getattr(page[-1], filters.sort_field), page[-1].case_id
+            )
+        return LegalCaseListPage(
+            page, next_cursor, filters.sort_field, filters.sort_direction
+        )
+
+    def aggregate_dashboard(
+        self, filters: ProcessDashboardFilters
+    ) -> ProcessDashboardAggregation:
+        raise NotImplementedError
+
+
+class SlowGateway(LegalCaseGateway):
+    def __init__(self, responses: Dict[str, object], delay: float = 0.05) -> None:
+        self._responses = responses
+        self._delay = delay
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def find_case_by_number(
+        self, case_number: CNJNumber, court_acronym: str
+    ) -> Optional[LegalCase]:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self._delay)
+            response = self._responses.get(case_number.clean_number)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class BulkGateway(LegalCaseGateway):
+    def __init__(self, responses: Dict[str, LegalCase]) -> None:
+        self._responses = responses
+        self.batches: List[tuple] = []
+
+    def find_case_by_number(
+        self, case_number: CNJNumber, court_acronym: str
+    ) -> Optional[LegalCase]:
+        raise AssertionError("the sync should use batched lookups")
+
+    def find_cases_by_numbers(
+        self, case_numbers: List[CNJNumber], court_acronym: str
+    ) -> Dict[str, LegalCase]:
+        self.batches.append(
+            (court_acronym, [number.clean_number for number in case_numbers])
+        )
+        return {
+            number.clean_number: self._responses[number.clean_number]
+            for number in case_numbers
+            if number.clean_number in self._responses
+        }
+
+
+SYNCED_AT = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+def persisted(
+    case_number: str,
+    movements: List[Movement],
+    last_synced_at: Optional[datetime] = SYNCED_AT,
+) -> PersistedLegalCase:
+    """A stored case; ``last_synced_at=None`` makes it an import placeholder."""
+    return PersistedLegalCase(
+        case=build_case(case_number, movements),
+        case_id=case_number,
+        numero_processo=case_number,
+        last_synced_at=last_synced_at,
+        prioridade="baixa",
+        status="G1",
+        movement_watermark=max((m.date for m in movements), default=None),
+        movement_digest=movement_history_digest(movements) if movements else None,
+    )
+
+
+class FakeResponse:
+    def __init__(self, payload=None, status_code=200, content=None):
+        self._payload = payload or {}
+        self.status_code = status_code
+        self._content = content
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Client Error")
+
+    @property
+    def content(self):
+        if self._content is not None:
+            return self._content
+        return json.dumps(self._payload).encode("utf-8")
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.calls = []
+
+    def post(self, url, headers, json, params, timeout):
+        self.calls.append(
+            {
+                "url": url,
+                "headers": headers,
+                "json": json,
+                "params": params,
+                "timeout": timeout,
+            }
+        )
+        return self._responses.pop(0)
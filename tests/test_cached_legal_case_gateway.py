@@ -0,0 +1,133 @@
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import pytest
+
+from src.domain.core import metrics
+from src.domain.core.cache import TTLCache
+from src.domain.core.errors import ExternalServiceUnavailableError
+from src.domain.entities.case import CNJNumber, LegalCase, Movement
+from src.domain.gateway.legal_case_gateway import LegalCaseGateway
+from src.infra.external.gateway.cached_legal_case_gateway import (
+    CachedLegalCaseGateway,
+    legal_case_from_payload,
+    legal_case_to_payload,
+    publish_hit_ratio,
+)
+
+FOUND = CNJNumber.from_raw("07108025520188020001")
+MISSING = CNJNumber.from_raw("07108035520188020001")
+
+
+def build_case() -> LegalCase:
+    return LegalCase(
+        case_number=FOUND.number,
+        court="TJAL",
+        judging_body="1ª Vara",
+        procedural_class="Procedimento Comum",
+        subject="Seguro defeso",
+        status="G1",
+        filing_date=datetime(2024, 1, 3, tzinfo=timezone.utc),
+        latest_update="Despacho",
+        movement_history=[
+            Movement(datetime(2024, 2, 1, 12, tzinfo=timezone.utc), "Despacho")
+        ],
+    )
+
+
+class CountingGateway(LegalCaseGateway):
+    def __init__(self, error: Optional[Exception] = None) -> None:
+        self.calls: List[str] = []
+        self._error = error
+
+    def find_case_by_number(
+        self, case_number: CNJNumber, court_acronym: str
+    ) -> Optional[LegalCase]:
+        self.calls.append(case_number.clean_number)
+        if self._error:
+            raise self._error
+        return build_case() if case_number == FOUND else None
+
+
+class FakeStore:
+    def __init__(self) -> None:
+        self.rows: Dict[str, Optional[dict]] = {}
+
+    def get(self, cache_key):
+        if cache_key not in self.rows:
+            return False, None, 0.0
+        return True, self.rows[cache_key], 60.0
+
+    def set(self, cache_key, payload, ttl_seconds):
+        self.rows[cache_key] = payload
+
+
+def build_gateway(inner, clock=None, store=None):
+    memory = TTLCache(max_entries=10, clock=clock or (lambda: 0.0))
+    return CachedLegalCaseGateway(
+        inner, memory, positive_ttl_seconds=10, negative_ttl_seconds=100, store=store
+    )
+
+
+def test_caches_found_and_not_found_results_with_their_own_ttl():
+    now = [0.0]
+    inner = CountingGateway()
+    gateway = build_gateway(inner, clock=lambda: now[0])
+
+    assert gateway.find_case_by_number(FOUND, "tjal").latest_update == "Despacho"
+    assert gateway.find_case_by_number(MISSING, "tjal") is None
+    gateway.find_case_by_number(FOUND, "tjal")
+    gateway.find_case_by_number(MISSING, "tjal")
+    assert len(inner.calls) == 2
+
+    now[0] = 50
+    gateway.find_case_by_number(FOUND, "tjal")
+    gateway.find_case_by_number(MISSING, "tjal")
+    assert inner.calls == [FOUND.clean_number, MISSING.clean_number, FOUND.clean_number]
+    assert metrics.snapshot()["datajud_cache_negative_hits"] >= 2
+    # The ratio gauge is only recomputed when the periodic job publishes it.
+    metrics.set_metric("datajud_cache_hit_ratio_pct", -1)
+    gateway.find_case_by_number(FOUND, "tjal")
+    assert metrics.snapshot()["datajud_cache_hit_ratio_pct"] == -1
+    assert 0 <= publish_hit_ratio() <= 100
+
+
+def test_batch_lookup_only_fetches_misses_and_errors_are_not_cached():
+    inner = CountingGateway()
+    gateway = build_gateway(inner)
+    gateway.find_case_by_number(FOUND, "tjal")
+
+    found = gateway.find_cases_by_numbers([FOUND, MISSING], "tjal")
+    assert set(found) == {FOUND.clean_number}
+    assert inner.calls == [FOUND.clean_number, MISSING.clean_number]
+
+    failing = build_gateway(CountingGateway(ExternalServiceUnavailableError()))
+    for _ in range(2):
+        with pytest.raises(ExternalServiceUnavailableError):
+            failing.find_case_by_number(FOUND, "tjal")
+
+
+def test_postgres_tier_is_shared_between_memory_tiers():
+    store = FakeStore()
+    build_gateway(CountingGateway(), store=store).find_case_by_number(FOUND, "tjal")
+    other_replica = CountingGateway()
+
+    cached = build_gateway(other_replica, store=store).find_case_by_number(
+        FOUND, "tjal"
+    )
+
+    assert other_replica.calls == []
+    assert cached == build_case()
+    assert legal_case_from_payload(legal_case_to_payload(cached)) == cached
+
+
+def test_ttl_cache_evicts_least_recently_used_entries():
+    cache = TTLCache(max_entries=2, clock=lambda: 0.0)
+    cache.set("a", 1, 10)
+    cache.set("b", 2, 10)
+    cache.lookup("a")
+    cache.set("c", 3, 10)
+
+    assert cache.lookup("b") == (False, None)
+    assert cache.lookup("a") == (True, 1)
+    assert len(cache) == 2
@@ -0,0 +1,143 @@
+from datetime import date, datetime, timezone
+
+from sqlalchemy.dialects import postgresql
+
+from src.domain.repositories.solicitation_repository import (
+    SolicitationDashboardFilters,
+)
+from src.infra.database.dashboard_rollups import (
+    LEGAL_CASE_ROLLUP,
+    SOLICITATION_ROLLUP,
+    backfill_statement,
+    create_statements,
+    partial_day_condition,
+    refresh_logged_days,
+    whole_day_conditions,
+)
+from src.infra.database.models import LegalCaseModel
+from src.infra.database.repositories.solicitation_repository import (
+    SolicitationRepository,
+)
+
+
+def test_triggers_apply_the_net_delta_of_each_statement():
+    function, *triggers = create_statements(SOLICITATION_ROLLUP)
+
+    assert "-(1) AS solicitation_count" in function
+    assert "FROM old_rows AS r" in function
+    assert "ON CONFLICT ON CONSTRAINT uq_solicitation_daily_rollup" in function
+    assert [trigger.split()[2] for trigger in triggers] == [
+        "solicitation_daily_rollups_insert",
+        "solicitation_daily_rollups_update",
+        "solicitation_daily_rollups_delete",
+    ]
+    assert all("FOR EACH STATEMENT" in trigger for trigger in triggers)
+    assert "FROM solicitacoes AS r" in backfill_statement(SOLICITATION_ROLLUP)
+
+
+def test_legal_case_triggers_only_log_the_changed_days():
+    function, *triggers = create_statements(LEGAL_CASE_ROLLUP)
+
+    assert "INSERT INTO legal_case_rollup_dirty_days (day) SELECT DISTINCT day" in (
+        function
+    )
+    assert "legal_case_daily_rollups AS t" not in function
+    # Unsynced import placeholders are never counted.
+    assert (
+        "FROM new_rows AS r WHERE r.last_synced_at IS NOT NULL UNION ALL SELECT"
+        in function
+    )
+    assert all("FOR EACH STATEMENT" in trigger for trigger in triggers)
+    assert "ON CONFLICT ON CONSTRAINT uq_legal_case_daily_rollup" in (
+        backfill_statement(LEGAL_CASE_ROLLUP)
+    )
+
+
+def test_unbounded_range_is_read_from_the_rollups_only():
+    created_at = LegalCaseModel.created_at
+
+    assert whole_day_conditions(None, created_at, None, None) == []
+    assert partial_day_condition(created_at, None, None) is None
+
+
+class CapturingSession:
+    def __init__(self) -> None:
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        return self
+
+    def all(self):
+        return []
+
+
+def _dashboard_sql(filters):
+    session = CapturingSession()
+    SolicitationRepository(session).dashboard(filters)
+    return str(session.statements[0].compile(dialect=postgresql.dialect()))
+
+
+def test_edge_days_are_read_from_the_source_table_only_with_a_date_range():
+    assert "FROM solicitacoes" not in _dashboard_sql(SolicitationDashboardFilters())
+
+    sql = _dashboard_sql(
+        SolicitationDashboardFilters(
+            date_from=datetime(2024, 1, 10, 12, tzinfo=timezone.utc)
+        )
+    )
+    assert "FROM solicitation_daily_rollups" in sql
+    assert "FROM solicitacoes" in sql
+
+
+def test_days_and_months_are_taken_in_the_dashboard_time_zone():
+    day = "CAST(r.created_at AT TIME ZONE 'America/Sao_Paulo' AS date) AS day"
+    assert day in create_statements(SOLICITATION_ROLLUP)[0]
+
+    sql = _dashboard_sql(
+        SolicitationDashboardFilters(
+            date_from=datetime(2024, 1, 10, 12, tzinfo=timezone.utc)
+        )
+    )
+    assert "solicitacoes.created_at), %(to_char_2)s" in sql
+    assert "solicitacoes.created_at < timezone(" in sql
+
+
+class LogConnection:
+    """Answers the dirty-log drain with ``days``; records every statement."""
+
+    def __init__(self, days) -> None:
+        self.days = days
+        self.statements = []
+
+    def execute(self, stmt, params=None):
+        self.statements.append((str(stmt), params))
+        return self
+
+    def scalars(self):
+        return iter(self.days)
+
+
+def test_refresh_recomputes_each_logged_day_once():
+    connection = LogConnection([date(2024, 3, 2), date(2024, 3, 1), date(2024, 3, 2)])
+
+    assert refresh_logged_days(connection, LEGAL_CASE_ROLLUP, 100) == 2
+
+    lock, drain, delete, rebuild = connection.statements
+    assert "pg_advisory_xact_lock" in lock[0]
+    assert drain[0].startswith("DELETE FROM legal_case_rollup_dirty_days")
+    assert drain[1] == {"limit": 100}
+    days = {"days": [date(2024, 3, 1), date(2024, 3, 2)]}
+    assert delete == (
+        "DELETE FROM legal_case_daily_rollups WHERE day = ANY(CAST(:days AS date[]))",
+        days,
+    )
+    assert "JOIN unnest(CAST(:days AS date[]))" in rebuild[0]
+    assert rebuild[1] == days
+
+
+def test_refresh_without_logged_days_leaves_the_rollup_alone():
+    connection = LogConnection([])
+
+    assert refresh_logged_days(connection, LEGAL_CASE_ROLLUP, 100) == 0
+    assert len(connection.statements) == 2
@@ -1,14 +1,15 @@
 from datetime import datetime, timezone
 
+import pytest
+
+from src.domain.core.errors import ExternalServiceUnavailableError
 from src.domain.entities.case import CNJNumber
+from src.infra.external.dto.legal_case_dto import SOURCE_FIELDS
 from src.infra.external.gateway.datajud_gateway import DataJudGateway
+from tests.fakes import FakeResponse, FakeSession
 
 
-def test_datajud_gateway_maps_formatted_case_number(monkeypatch):
-    gateway = DataJudGateway()
-    gateway.api_key = "dummy-key"
-    gateway.base_url = "https://api.datajud.example"
-
+def test_datajud_gateway_maps_formatted_case_number():
     canonical_case_number = "0710802-55.2018.8.02.0001"
     payload = {
         "numeroProcesso": canonical_case_number,
@@ -26,30 +27,23 @@ def test_datajud_gateway_maps_formatted_case_number(monkeypatch):
             }
         ],
     }
-
-    def fake_post(url, headers, json, timeout):
-        assert url == f"{gateway.base_url}/api_publica_tjal/_search"
-        assert headers["Authorization"] == "ApiKey dummy-key"
-        assert json == {"query": {"match": {"numeroProcesso": cnj.clean_number}}}
-        assert timeout == 15
-
-        class FakeResponse:
-            def raise_for_status(self):
-                return None
-
-            def json(self):
-                return {"hits": {"hits": [{"_source": payload}]}}
-
-        return FakeResponse()
-
-    monkeypatch.setattr(
-        "src.infra.external.gateway.datajud_gateway.requests.post", fake_post
-    )
+    session = FakeSession([FakeResponse({"hits": {"hits": [{"_source": payload}]}})])
+    gateway = DataJudGateway(session=session)
+    gateway.api_key = "dummy-key"
+    gateway.base_url = "https://api.datajud.example"
 
     cnj = CNJNumber.from_raw("07108025520188020001")
 
     legal_case = gateway.find_case_by_number(cnj, "tjal")
 
+    call = session.calls[0]
+    assert call["url"] == f"{gateway.base_url}/api_publica_tjal/_search"
+    assert call["headers"]["Authorization"] == "ApiKey dummy-key"
+    assert call["json"]["query"] == {"match": {"numeroProcesso": cnj.clean_number}}
+    assert call["json"]["_source"] == SOURCE_FIELDS
+    assert call["params"] == {"filter_path": "hits.hits._source"}
+    assert call["timeout"] == 15
+
     assert legal_case is not None
     assert legal_case.case_number == canonical_case_number
     assert legal_case.latest_update == "Despacho"
@@ -58,3 +52,77 @@ def test_datajud_gateway_maps_formatted_case_number(monkeypatch):
     first_movement = legal_case.movement_history[0]
     assert first_movement.description == "Despacho"
     assert first_movement.date == datetime(2024, 2, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def test_datajud_gateway_retries_transient_failures(monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda _seconds: None)
+    session = FakeSession([FakeResponse(status_code=503), FakeResponse({})])
+    gateway = DataJudGateway(session=session)
+
+    legal_case = gateway.find_case_by_number(
+        CNJNumber.from_raw("07108025520188020001"), "tjal"
+    )
+
+    assert legal_case is None
+    assert len(session.calls) == 2
+
+
+def test_datajud_gateway_raises_when_retries_are_exhausted(monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda _seconds: None)
+    session = FakeSession([FakeResponse(status_code=502) for _ in range(10)])
+    gateway = DataJudGateway(session=session)
+
+    with pytest.raises(ExternalServiceUnavailableError):
+        gateway.find_case_by_number(CNJNumber.from_raw("07108025520188020001"), "tjal")
+
+
+@pytest.mark.parametrize(
+    "response",
+    [FakeResponse(status_code=401), FakeResponse(content=b"<html>erro</html>")],
+)
+def test_datajud_gateway_reports_rejected_or_garbled_calls_as_unavailable(response):
+    gateway = DataJudGateway(session=FakeSession([response]))
+
+    with pytest.raises(ExternalServiceUnavailableError):
+        gateway.find_case_by_number(CNJNumber.from_raw("07108025520188020001"), "tjal")
+    with pytest.raises(ExternalServiceUnavailableError):
+        DataJudGateway(session=FakeSession([response])).find_cases_by_numbers(
+            [CNJNumber.from_raw("07108025520188020001")], "tjal"
+        )
+
+
+def test_datajud_gateway_bulk_lookup_maps_hits_back_by_number():
+    first = "0710802-55.2018.8.02.0001"
+    second = "0710803-55.2018.8.02.0001"
+
+    def source(number, movement):
+        return {
+            "numeroProcesso": number.replace("-", "").replace(".", ""),
+            "tribunal": "TJAL",
+            "movimentos": [{"dataHora": "2024-02-01T12:00:00Z", "nome": movement}],
+        }
+
+    hits = [
+        {"_source": source(second, "Conclusão")},
+        {"_source": source(first, "Despacho")},
+        {"_source": source(first, "Grau recursal")},
+    ]
+    session = FakeSession([FakeResponse({"hits": {"hits": hits}})])
+    gateway = DataJudGateway(session=session)
+    numbers = [
+        CNJNumber.from_raw("07108025520188020001"),
+        CNJNumber.from_raw("07108035520188020001"),
+        CNJNumber.from_raw("07108045520188020001"),
+    ]
+
+    found = gateway.find_cases_by_numbers(numbers, "tjal")
+
+    assert len(session.calls) == 1
+    query = session.calls[0]["json"]
+    assert query["query"] == {
+        "terms": {"numeroProcesso": [number.clean_number for number in numbers]}
+    }
+    assert query["_source"] == SOURCE_FIELDS
+    assert set(found) == {"07108025520188020001", "07108035520188020001"}
+    assert found["07108025520188020001"].latest_update == "Despacho"
+    assert found["07108035520188020001"].latest_update == "Conclusão"
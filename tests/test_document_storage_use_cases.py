@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import BinaryIO, Dict, List, Optional
+from uuid import uuid4
+
+from src.domain.core.errors import (
+    DocumentNotFoundError,
+    InvalidInputError,
+    RangeNotSatisfiableError,
+    SolicitationNotFoundError,
+)
+from src.domain.entities.document import (
+    DocumentMetadata,
+    ObjectStream,
+    StoredObject,
+    UploadedDocument,
+    UploadIntent,
+)
+from src.domain.gateway.object_storage_gateway import IObjectStorageGateway
+from src.domain.repositories.document_repository import IDocumentRepository
+from src.domain.repositories.solicitation_repository import (
+    ISolicitationRepository,
+    SolicitationDashboardAggregation,
+    SolicitationDashboardFilters,
+    SolicitationRecord,
+)
+from src.domain.usecases.document_upload_use_case import (
+    RegisterUploadedDocumentsUseCase,
+    RequestDocumentUploadUseCase,
+)
+from src.domain.usecases.download_document_use_case import DownloadDocumentUseCase
+
+
+class InMemoryObjectStorage(IObjectStorageGateway):
+    """Local S3 stand-in: presigned URLs point to keys stored in a dict."""
+
+    def __init__(self) -> None:
+        self.objects: Dict[str, StoredObject] = {}
+        self.deleted: List[str] = []
+
+    def put(self, key: str, size: int, content_type: str) -> None:
+        self.objects[key] = StoredObject(key=key, size=size, content_type=content_type)
+
+    def upload(self, key: str, fileobj: BinaryIO, content_type: str) -> str:
+        data = fileobj.read()
+        self.put(key, len(data), content_type)
+        return key
+
+    def download(self, key: str) -> bytes:
+        raise NotImplementedError
+
+    def generate_upload_url(self, key: str, content_type: str, expires_in: int) -> str:
+        return f"http://storage.local/{key}?expires={expires_in}"
+
+    def head(self, key: str) -> Optional[StoredObject]:
+        return self.objects.get(key)
+
+    def delete(self, key: str) -> None:
+        self.objects.pop(key, None)
+        self.deleted.append(key)
+
+    def generate_download_url(
+        self, key: str, expires_in: int, file_name: Optional[str] = None
+    ) -> str:
+        return f"http://storage.local/{key}?download&expires={expires_in}"
+
+    def open_stream(self, key: str, byte_range: Optional[str] = None) -> ObjectStream:
+        stored = self.objects[key]
+        if byte_range:
+            start, end = byte_range[len("bytes=") :].split("-")
+            first, last = int(start), min(int(end), stored.size - 1)
+            return ObjectStream(
+                chunks=iter([b"x" * (last - first + 1)]),
+                content_length=last - first + 1,
+                total_size=stored.size,
+                content_type=stored.content_type,
+                content_range=f"bytes {first}-{last}/{stored.size}",
+            )
+        return ObjectStream(
+            chunks=iter([b"x" * stored.size]),
+            content_length=stored.size,
+            total_size=stored.size,
+            content_type=stored.content_type,
+        )
+
+
+class FakeSolicitationRepository(ISolicitationRepository):
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+
+    def ensure_exists(self, solicitation_id: str) -> None:
+        if solicitation_id not in self.ids:
+            raise SolicitationNotFoundError(solicitation_id)
+
+    def get_by_id(self, solicitation_id: str) -> SolicitationRecord:
+        raise NotImplementedError
+
+    def update_status(self, solicitation_id: str, status: str) -> None:
+        raise NotImplementedError
+
+    def dashboard(
+        self, filters: SolicitationDashboardFilters
+    ) -> SolicitationDashboardAggregation:
+        raise NotImplementedError
+
+    def create(self, initial: Optional[Dict[str, object]] = None) -> SolicitationRecord:
+        now = datetime.now(timezone.utc)
+        record = SolicitationRecord(
+            solicitation_id=str(uuid4()),
+            status="pendente",
+            priority="baixa",
+            fisher_data=None,
+            municipality=None,
+            state=None,
+            analysis=None,
+            created_at=now,
+            updated_at=now,
+        )
+        self.ids.append(record.solicitation_id)
+        return record
+
+
+class FakeDocumentRepository(IDocumentRepository):
+    def __init__(self) -> None:
+        self.documents: Dict[str, DocumentMetadata] = {}
+
+    def create_document(self, metadata: Dict[str, object]) -> DocumentMetadata:
+        document = DocumentMetadata(
+            document_id=str(uuid4()),
+            solicitation_id=str(metadata["solicitacao_id"]),
+            s3_key=str(metadata["s3_key"]),
+            mimetype=str(metadata["mimetype"]),
+            file_name=str(metadata["nome_arquivo"]),
+        )
+        self.documents[document.document_id] = document
+        return document
+
+    def get_document(self, document_id: str) -> Optional[DocumentMetadata]:
+        return self.documents.get(document_id)
+
+    def get_by_storage_key(self, s3_key: str) -> Optional[DocumentMetadata]:
+        for document in self.documents.values():
+            if document.s3_key == s3_key:
+                return document
+        return None
+
+    def update_classification(self, document_id: str, classification: str) -> None:
+        raise NotImplementedError
+
+    def list_by_solicitation(self, solicitation_id: str) -> List[DocumentMetadata]:
+        raise NotImplementedError
+
+
+def test_request_upload_creates_solicitation_and_presigned_keys():
+    storage = InMemoryObjectStorage()
+    solicitations = FakeSolicitationRepository()
+    use_case = RequestDocumentUploadUseCase(storage, solicitations)
+
+    result = use_case.execute(
+        [UploadIntent(name="cnis.pdf", mimetype="application/pdf", size=1024)]
+    )
+
+    assert result.is_right()
+    ticket = result.get_right()
+    assert ticket.solicitation_id in solicitations.ids
+    upload = ticket.uploads[0]
+    assert upload.key.startswith(f"solicitacoes/{ticket.solicitation_id}/docs/")
+    assert upload.key.endswith(".pdf")
+    assert upload.url.startswith("http://storage.local/")
+
+
+def test_request_upload_rejects_oversized_files():
+    use_case = RequestDocumentUploadUseCase(
+        InMemoryObjectStorage(), FakeSolicitationRepository(), max_upload_bytes=10
+    )
+
+    result = use_case.execute(
+        [UploadIntent(name="cnis.pdf", mimetype="application/pdf", size=11)]
+    )
+
+    assert result.is_left()
+    assert isinstance(result.get_left(), InvalidInputError)
+
+
+def test_register_creates_documents_once_objects_exist():
+    storage = InMemoryObjectStorage()
+    solicitations = FakeSolicitationRepository()
+    documents = FakeDocumentRepository()
+    ticket = (
+        RequestDocumentUploadUseCase(storage, solicitations)
+        .execute([UploadIntent(name="rg.png", mimetype="image/png", size=10)])
+        .get_right()
+    )
+    key = ticket.uploads[0].key
+    use_case = RegisterUploadedDocumentsUseCase(storage, documents, solicitations)
+    uploaded = [UploadedDocument(key=key, name="rg.png", mimetype="image/png")]
+
+    missing = use_case.execute("user", ticket.solicitation_id, uploaded)
+    assert missing.is_left()
+    assert isinstance(missing.get_left(), DocumentNotFoundError)
+
+    storage.put(key, 10, "image/png")
+    first = use_case.execute("user", ticket.solicitation_id, uploaded)
+    second = use_case.execute("user", ticket.solicitation_id, uploaded)
+
+    assert first.is_right() and second.is_right()
+    assert len(documents.documents) == 1
+    assert first.get_right()[0].document_id == second.get_right()[0].document_id
+
+
+def test_register_rejects_keys_outside_solicitation_prefix():
+    storage = InMemoryObjectStorage()
+    solicitations = FakeSolicitationRepository()
+    solicitation_id = solicitations.create().solicitation_id
+    use_case = RegisterUploadedDocumentsUseCase(
+        storage, FakeDocumentRepository(), solicitations
+    )
+
+    result = use_case.execute(
+        "user",
+        solicitation_id,
+        [UploadedDocument(key="outro/arquivo.pdf", name="a.pdf", mimetype="x")],
+    )
+
+    assert result.is_left()
+    assert isinstance(result.get_left(), InvalidInputError)
+
+
+def test_register_discards_objects_larger_than_limit():
+    storage = InMemoryObjectStorage()
+    solicitations = FakeSolicitationRepository()
+    solicitation_id = solicitations.create().solicitation_id
+    key = f"solicitacoes/{solicitation_id}/docs/grande.pdf"
+    storage.put(key, 100, "application/pdf")
+    use_case = RegisterUploadedDocumentsUseCase(
+        storage, FakeDocumentRepository(), solicitations, max_upload_bytes=50
+    )
+
+    result = use_case.execute(
+        "user",
+        solicitation_id,
+        [UploadedDocument(key=key, name="grande.pdf", mimetype="application/pdf")],
+    )
+
+    assert result.is_left()
+    assert storage.deleted == [key]
+
+
+def _stored_document(storage: InMemoryObjectStorage) -> FakeDocumentRepository:
+    documents = FakeDocumentRepository()
+    document = documents.create_document(
+        {
+            "solicitacao_id": str(uuid4()),
+            "nome_arquivo": "cnis.pdf",
+            "mimetype": "application/pdf",
+            "s3_key": "solicitacoes/x/docs/cnis.pdf",
+        }
+    )
+    storage.put(document.s3_key, 2048, "application/pdf")
+    return documents
+
+
+def test_download_redirects_to_presigned_url():
+    storage = InMemoryObjectStorage()
+    documents = _stored_document(storage)
+    document_id = next(iter(documents.documents))
+
+    result = DownloadDocumentUseCase(storage, documents).execute(document_id)
+
+    assert result.is_right()
+    download = result.get_right()
+    assert download.stream is None
+    assert download.url.startswith("http://storage.local/solicitacoes/x/docs/")
+
+
+def test_download_streams_requested_range():
+    storage = InMemoryObjectStorage()
+    documents = _stored_document(storage)
+    document_id = next(iter(documents.documents))
+
+    result = DownloadDocumentUseCase(storage, documents).execute(
+        document_id, mode="stream", byte_range="bytes=0-1023"
+    )
+
+    assert result.is_right()
+    stream = result.get_right().stream
+    assert stream.content_length == 1024
+    assert stream.content_range == "bytes 0-1023/2048"
+    assert sum(len(chunk) for chunk in stream.chunks) == 1024
+
+
+def test_download_rejects_malformed_range():
+    storage = InMemoryObjectStorage()
+    documents = _stored_document(storage)
+    document_id = next(iter(documents.documents))
+
+    result = DownloadDocumentUseCase(storage, documents).execute(
+        document_id, mode="stream", byte_range="bytes=10-2"
+    )
+
+    assert result.is_left()
+    assert isinstance(result.get_left(), RangeNotSatisfiableError)
+
+
+def test_download_ignores_multipart_range():
+    storage = InMemoryObjectStorage()
+    documents = _stored_document(storage)
+    document_id = next(iter(documents.documents))
+
+    result = DownloadDocumentUseCase(storage, documents).execute(
+        document_id, mode="stream", byte_range="bytes=0-99, 200-299"
+    )
+
+    assert result.is_right()
+    stream = result.get_right().stream
+    assert stream.content_range is None
+    assert stream.content_length == 2048
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from threading import Event, Lock, Timer
+import time
+
+import pytest
+
+from src.domain.core.errors import (
+    ExternalRateLimitError,
+    InvalidInputError,
+    LegalCasePersistenceError,
+    LegalCaseNotFoundError,
+)
+from src.domain.core.rate_limit import TokenBucketRegistry
+from src.domain.core.single_flight import SingleFlight
+from src.domain.entities.case import Movement
+from src.domain.gateway.legal_case_revalidator import ILegalCaseRevalidator
+from src.domain.usecases.find_legal_case_use_case import FindLegalCaseUseCase
+from src.domain.usecases.get_legal_case_by_id_use_case import (
+    MAX_LOOKUP_NUMBERS,
+    GetLegalCaseByIdUseCase,
+)
+from src.infra.database.repositories.legal_case_repository import (
+    LegalCaseRepository,
+)
+from src.infra.scheduler.revalidation import BackgroundRevalidator
+from tests.fakes import (
+    TJPA_CASE,
+    TRF1_CASE,
+    BulkGateway,
+    FakeLegalCaseRepository,
+    SlowGateway,
+    build_case,
+    persisted,
+)
+
+MOVEMENT = Movement(datetime(2024, 1, 2, tzinfo=timezone.utc), "Distribuído")
+
+
+def test_concurrent_lookups_of_the_same_case_fetch_and_insert_once():
+    repository = FakeLegalCaseRepository([])
+    gateway = SlowGateway({TRF1_CASE: build_case(TRF1_CASE, [MOVEMENT])}, delay=0.1)
+    flight = SingleFlight()
+
+    def consult(_):
+        use_case = GetLegalCaseByIdUseCase(
+            repository, FindLegalCaseUseCase(gateway), single_flight=flight
+        )
+        return use_case.execute(TRF1_CASE)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(consult, range(5)))
+
+    assert all(result.is_right() for result in results)
+    assert gateway.max_in_flight == 1
+    assert len({id(result.get_right()) for result in results}) == 1
+    assert len(repository.get_by_number(TRF1_CASE).case.movement_history) == 1
+
+
+def test_lookup_reuses_case_inserted_by_another_replica_while_waiting():
+    class LateInsertRepository(FakeLegalCaseRepository):
+        def lock_case_number(self, numero_processo: str) -> None:
+            self._cases.append(persisted(numero_processo, [MOVEMENT]))
+
+    repository = LateInsertRepository([])
+    gateway = SlowGateway({}, delay=0)
+
+    result = GetLegalCaseByIdUseCase(repository, FindLegalCaseUseCase(gateway)).execute(
+        TRF1_CASE
+    )
+
+    assert result.get_right().numero_processo == TRF1_CASE
+    assert gateway.max_in_flight == 0
+
+
+def test_import_placeholder_is_fetched_and_filled_in_instead_of_returned():
+    placeholder = persisted(TRF1_CASE, [], last_synced_at=None)
+    repository = FakeLegalCaseRepository([placeholder])
+    gateway = SlowGateway({TRF1_CASE: build_case(TRF1_CASE, [MOVEMENT])}, delay=0)
+    use_case = GetLegalCaseByIdUseCase(repository, FindLegalCaseUseCase(gateway))
+
+    case = use_case.execute(TRF1_CASE).get_right()
+
+    assert case is placeholder and case.last_synced_at is not None
+    assert case.case.movement_history == [MOVEMENT]
+    assert repository.applied[TRF1_CASE] == [MOVEMENT]
+    assert gateway.max_in_flight == 1
+
+    unknown = persisted(TJPA_CASE, [], last_synced_at=None)
+    (result,) = (
+        GetLegalCaseByIdUseCase(
+            FakeLegalCaseRepository([unknown]), FindLegalCaseUseCase(BulkGateway({}))
+        )
+        .execute_many([TJPA_CASE])
+        .get_right()
+    )
+    assert isinstance(result.error, LegalCaseNotFoundError)
+
+
+class RecordingRevalidator(ILegalCaseRevalidator):
+    def __init__(self) -> None:
+        self.scheduled = []
+
+    def schedule(self, case) -> bool:
+        self.scheduled.append(case.case_id)
+        return True
+
+
+def test_stale_case_is_returned_immediately_and_refreshed_in_background():
+    stale = persisted(TRF1_CASE, [MOVEMENT])
+    stale.last_synced_at = datetime.now(timezone.utc) - timedelta(days=2)
+    fresh = persisted(TJPA_CASE, [MOVEMENT])
+    fresh.last_synced_at = datetime.now(timezone.utc)
+    gateway = SlowGateway({}, delay=0)
+    revalidator = RecordingRevalidator()
+    use_case = GetLegalCaseByIdUseCase(
+        FakeLegalCaseRepository([stale, fresh]),
+        FindLegalCaseUseCase(gateway),
+        revalidator=revalidator,
+        revalidate_after=timedelta(days=1),
+    )
+
+    assert use_case.execute(TRF1_CASE).get_right() is stale
+    assert use_case.execute(TJPA_CASE).get_right() is fresh
+    assert revalidator.scheduled == [TRF1_CASE]
+    assert gateway.max_in_flight == 0
+
+
+def test_background_revalidator_deduplicates_and_throttles():
+    started = Event()
+    release = Event()
+    refreshed = []
+
+    def refresh(case_id: str) -> None:
+        started.set()
+        release.wait(1)
+        refreshed.append(case_id)
+
+    revalidator = BackgroundRevalidator(refresh, max_per_minute=12)
+    case = persisted(TRF1_CASE, [])
+    other = persisted(TJPA_CASE, [])
+
+    assert revalidator.schedule(case) is True
+    assert revalidator.schedule(case) is False
+    assert revalidator.schedule(other) is True
+    assert revalidator.schedule(persisted("10000010020244010000", [])) is False
+
+    # Shutdown drops the queued refresh, waits for the running one and
+    # accepts no more.
+    started.wait(1)
+    Timer(0.05, release.set).start()
+    revalidator.shutdown()
+    assert refreshed == [TRF1_CASE]
+    assert revalidator.schedule(case) is False
+
+
+UNMAPPED_CASE = "10000000020249990000"
+TJPA_MISS = "08000010020248140000"
+
+
+def test_multi_get_reads_stored_cases_once_and_fetches_misses_per_tribunal():
+    stored = persisted(TRF1_CASE, [MOVEMENT])
+    repository = FakeLegalCaseRepository([stored])
+    gateway = BulkGateway({TJPA_CASE: build_case(TJPA_CASE, [MOVEMENT])})
+    use_case = GetLegalCaseByIdUseCase(repository, FindLegalCaseUseCase(gateway))
+
+    results = use_case.execute_many(
+        [TJPA_CASE, "123", TRF1_CASE, UNMAPPED_CASE, TJPA_MISS, TRF1_CASE]
+    ).get_right()
+
+    assert [result.case_number for result in results] == [
+        TJPA_CASE,
+        "123",
+        TRF1_CASE,
+        UNMAPPED_CASE,
+        TJPA_MISS,
+        TRF1_CASE,
+    ]
+    assert results[0].case.numero_processo == TJPA_CASE
+    assert isinstance(results[1].error, InvalidInputError)
+    assert results[2].case is stored and results[5].case is stored
+    assert isinstance(results[3].error, LegalCaseNotFoundError)
+    assert isinstance(results[4].error, LegalCaseNotFoundError)
+    assert repository.bulk_reads == 1
+    assert gateway.batches == [("tjpa", [TJPA_CASE, TJPA_MISS])]
+    assert repository.get_by_number(TJPA_CASE) is results[0].case
+
+
+def test_multi_get_reports_throttled_tribunals_instead_of_waiting():
+    gateway = BulkGateway({TJPA_CASE: build_case(TJPA_CASE, [MOVEMENT])})
+    buckets = TokenBucketRegistry(rate_per_minute=1)
+    assert buckets.get("tjpa").try_acquire()
+    use_case = GetLegalCaseByIdUseCase(
+        FakeLegalCaseRepository([]),
+        FindLegalCaseUseCase(gateway),
+        lookup_buckets=buckets,
+    )
+
+    started = time.monotonic()
+    (result,) = use_case.execute_many([TJPA_CASE]).get_right()
+
+    assert time.monotonic() - started < 1
+    assert isinstance(result.error, ExternalRateLimitError)
+    assert gateway.batches == []
+
+
+def test_multi_get_queries_tribunals_concurrently():
+    class ConcurrentBulkGateway(BulkGateway):
+        def __init__(self, responses) -> None:
+            super().__init__(responses)
+            self._lock = Lock()
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        def find_cases_by_numbers(self, case_numbers, court_acronym):
+            with self._lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            time.sleep(0.1)
+            with self._lock:
+                self.in_flight -= 1
+            return super().find_cases_by_numbers(case_numbers, court_acronym)
+
+    gateway = ConcurrentBulkGateway(
+        {
+            TRF1_CASE: build_case(TRF1_CASE, [MOVEMENT]),
+            TJPA_CASE: build_case(TJPA_CASE, [MOVEMENT]),
+        }
+    )
+    use_case = GetLegalCaseByIdUseCase(
+        FakeLegalCaseRepository([]),
+        FindLegalCaseUseCase(gateway),
+        lookup_buckets=TokenBucketRegistry(60, capacity=5),
+    )
+
+    results = use_case.execute_many([TRF1_CASE, TJPA_CASE]).get_right()
+
+    assert [result.case.numero_processo for result in results] == [
+        TRF1_CASE,
+        TJPA_CASE,
+    ]
+    assert gateway.max_in_flight == 2
+
+
+def test_multi_get_rejects_empty_and_oversized_requests():
+    use_case = GetLegalCaseByIdUseCase(
+        FakeLegalCaseRepository([]), FindLegalCaseUseCase(BulkGateway({}))
+    )
+
+    assert use_case.execute_many([]).is_left()
+    assert use_case.execute_many([TRF1_CASE] * (MAX_LOOKUP_NUMBERS + 1)).is_left()
+
+
+class SavepointSession:
+    """Fails the first flush; records how each savepoint ended."""
+
+    def __init__(self) -> None:
+        self.savepoints = []
+        self._flushes = 0
+
+    @contextmanager
+    def begin_nested(self):
+        try:
+            yield
+        except Exception:
+            self.savepoints.append("rolled back")
+            raise
+        self.savepoints.append("released")
+
+    def add(self, model) -> None:
+        model.id = 1
+
+    def flush(self) -> None:
+        self._flushes += 1
+        if self._flushes == 1:
+            raise RuntimeError("duplicate key value")
+
+
+def test_failed_insert_rolls_back_its_savepoint_and_keeps_the_session_usable():
+    session = SavepointSession()
+    repository = LegalCaseRepository(session)
+    case = build_case(TJPA_CASE, [])
+
+    with pytest.raises(LegalCasePersistenceError):
+        repository.insert_case_with_movements(TRF1_CASE, case, [])
+    inserted = repository.insert_case_with_movements(TJPA_CASE, case, [])
+
+    assert session.savepoints == ["rolled back", "released"]
+    assert inserted.case.case_number == case.case_number
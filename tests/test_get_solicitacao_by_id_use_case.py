@@ -61,6 +61,9 @@ class FakeDocumentRepository(IDocumentRepository):
     def get_document(self, document_id: str) -> Optional[DocumentMetadata]:
         raise NotImplementedError
 
+    def get_by_storage_key(self, s3_key: str) -> Optional[DocumentMetadata]:
+        raise NotImplementedError
+
     def update_classification(
         self, document_id: str, classification: str, confidence: float
     ) -> None:
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from src.domain.core.errors import InvalidInputError, LegalCaseImportNotFoundError
+from src.domain.entities.case import (
+    CNJNumber,
+    cnj_check_digits,
+    has_valid_cnj_check_digits,
+)
+from src.domain.repositories.legal_case_import_repository import (
+    ILegalCaseImportRepository,
+    InvalidImportEntry,
+    LegalCaseImportProgress,
+)
+from src.domain.usecases.import_legal_cases_use_case import (
+    GetLegalCaseImportUseCase,
+    ImportLegalCasesUseCase,
+)
+from src.infra.database.repositories.legal_case_import_repository import (
+    LegalCaseImportRepository,
+)
+
+
+class FakeImportRepository(ILegalCaseImportRepository):
+    def __init__(self, existing: Optional[Set[str]] = None) -> None:
+        self.existing = set(existing or ())
+        self.queued: List[Tuple[str, str]] = []
+        self.imports: Dict[str, LegalCaseImportProgress] = {}
+
+    def find_existing_numbers(self, numeros_processo: List[str]) -> Set[str]:
+        return self.existing & set(numeros_processo)
+
+    def create_import(
+        self,
+        created_by: Optional[str],
+        source_format: str,
+        total_received: int,
+        invalid_entries: List[InvalidImportEntry],
+        invalid_count: int,
+        duplicate_count: int,
+        already_tracked_count: int,
+        queued: List[Tuple[str, str]],
+    ) -> LegalCaseImportProgress:
+        self.queued.extend(queued)
+        progress = LegalCaseImportProgress(
+            import_id=str(uuid4()),
+            source_format=source_format,
+            created_at=datetime.now(timezone.utc),
+            total_received=total_received,
+            invalid_count=invalid_count,
+            duplicate_count=duplicate_count,
+            already_tracked_count=already_tracked_count,
+            queued_count=len(queued),
+            invalid_entries=invalid_entries,
+        )
+        self.imports[progress.import_id] = progress
+        return progress
+
+    def get_import(self, import_id: str) -> Optional[LegalCaseImportProgress]:
+        return self.imports.get(import_id)
+
+    def record_outcome(self, case_id: str, result: str) -> None:
+        return None
+
+
+def valid_number(sequence: int, court: str = "8.02") -> str:
+    """20-digit CNJ number with correct check digits for the given J.TR."""
+    branch, tribunal = court.split(".")
+    raw = f"{sequence:07d}00" + f"2024{branch}{tribunal}0001"
+    return raw[:7] + cnj_check_digits(raw) + raw[9:]
+
+
+def test_check_digits_follow_the_mod_97_rule():
+    assert cnj_check_digits("07108025520188020001") == "55"
+    assert has_valid_cnj_check_digits("07108025520188020001")
+    assert not has_valid_cnj_check_digits("07108035520188020001")
+    assert not has_valid_cnj_check_digits("0710802-55")
+    assert CNJNumber.from_raw(valid_number(42)).has_valid_check_digits
+
+
+def test_csv_import_validates_dedupes_and_queues_new_numbers():
+    existing = valid_number(1)
+    fresh = valid_number(2)
+    formatted_fresh = CNJNumber.from_raw(valid_number(3)).number
+    wrong_digits = fresh[:7] + ("00" if fresh[7:9] != "00" else "01") + fresh[9:]
+    csv_content = "\n".join(
+        [
+            "cliente;numero_processo",
+            f"A;{existing}",
+            f"B;{fresh}",
+            f"C;{formatted_fresh}",
+            f"D;{fresh}",
+            f"E;{wrong_digits}",
+            "F;123",
+            f"G;{valid_number(4, court='8.99')}",
+        ]
+    ).encode("utf-8")
+    repository = FakeImportRepository(existing={existing})
+
+    progress = (
+        ImportLegalCasesUseCase(repository)
+        .execute(csv_content, filename="clientes.csv", created_by="user-1")
+        .get_right()
+    )
+
+    assert progress.source_format == "csv"
+    assert progress.total_received == 7
+    assert progress.already_tracked_count == 1
+    assert progress.duplicate_count == 1
+    assert progress.invalid_count == 3
+    assert [(e.line, e.reason) for e in progress.invalid_entries] == [
+        (6, "dígito verificador inválido"),
+        (7, "formato inválido"),
+        (8, "tribunal não suportado"),
+    ]
+    assert repository.queued == [(fresh, "tjal"), (valid_number(3), "tjal")]
+    assert progress.queued_count == 2
+    assert progress.pending_count == 2
+    assert not progress.completed
+
+
+def test_json_import_accepts_a_list_or_an_object():
+    numbers = [valid_number(10), valid_number(11, court="4.03"), 71080255201880200]
+    repository = FakeImportRepository()
+    use_case = ImportLegalCasesUseCase(repository)
+
+    progress = use_case.execute(
+        json.dumps({"numeros": numbers}).encode(), content_type="application/json"
+    ).get_right()
+
+    assert progress.source_format == "json"
+    assert progress.invalid_entries[0].reason == "valor deve ser texto"
+    assert repository.queued == [(numbers[0], "tjal"), (numbers[1], "trf3")]
+
+    listed = use_case.execute(
+        json.dumps([valid_number(12)]).encode(), filename="lote.json"
+    ).get_right()
+    assert listed.queued_count == 1
+
+
+def test_import_rejects_unusable_files():
+    use_case = ImportLegalCasesUseCase(FakeImportRepository())
+
+    for content, filename in [
+        (b"numero\n", "vazio.csv"),
+        (b"{nope", "quebrado.json"),
+        (b"0710802", "planilha.xlsx"),
+        (b"x" * (1024 * 1024 + 1), "grande.csv"),
+    ]:
+        result = use_case.execute(content, filename=filename)
+        assert isinstance(result.get_left(), InvalidInputError), filename
+
+
+def test_import_progress_lookup_validates_the_identifier():
+    repository = FakeImportRepository()
+    progress = (
+        ImportLegalCasesUseCase(repository)
+        .execute(valid_number(20).encode(), filename="um.csv")
+        .get_right()
+    )
+    use_case = GetLegalCaseImportUseCase(repository)
+
+    assert use_case.execute(progress.import_id).get_right() is progress
+    assert isinstance(use_case.execute("abc").get_left(), InvalidInputError)
+    assert isinstance(
+        use_case.execute(str(uuid4())).get_left(), LegalCaseImportNotFoundError
+    )
+
+
+class OutcomeSession:
+    """Records compiled statements; the item update returns ``attempts``."""
+
+    def __init__(self, attempts: int) -> None:
+        self.attempts = attempts
+        self.statements: List[str] = []
+
+    def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return self
+
+    def scalars(self):
+        return iter([self.attempts])
+
+
+def test_missed_placeholder_is_kept_until_attempts_or_age_run_out():
+    case_id = str(uuid4())
+
+    retrying = OutcomeSession(attempts=3)
+    LegalCaseImportRepository(retrying, max_not_found_attempts=8).record_outcome(
+        case_id, "skipped"
+    )
+    update, delete = retrying.statements
+    assert "not_found_attempts=(legal_case_import_items.not_found_attempts +" in (
+        update
+    )
+    # Only a placeholder older than the age limit goes before the 8th miss.
+    assert "legal_cases.created_at <" in delete
+
+    exhausted = OutcomeSession(attempts=8)
+    LegalCaseImportRepository(exhausted, max_not_found_attempts=8).record_outcome(
+        case_id, "skipped"
+    )
+    assert "legal_cases.created_at <" not in exhausted.statements[1]
+
+    failed = OutcomeSession(attempts=0)
+    LegalCaseImportRepository(failed).record_outcome(case_id, "error")
+    assert len(failed.statements) == 1
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from src.domain.entities.case import LegalCaseChangeEvent, changed_fields
+from src.domain.gateway.change_event_publisher import IChangeEventPublisher
+from src.domain.repositories.legal_case_change_repository import (
+    ChangeCursor,
+    ChangeEventPage,
+    ILegalCaseChangeRepository,
+)
+from src.domain.usecases.dispatch_change_events_use_case import (
+    DispatchChangeEventsUseCase,
+)
+from src.domain.usecases.list_legal_case_changes_use_case import (
+    ListLegalCaseChangesUseCase,
+)
+from src.infra.external.gateway.webhook_change_publisher import (
+    SIGNATURE_HEADER,
+    WebhookChangePublisher,
+)
+from src.infra.http.mapper.process_mapper import ProcessMapper
+from tests.fakes import TRF1_CASE, build_case
+
+NOW = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+
+def event(event_id: int, txid: int, numero: str = TRF1_CASE) -> LegalCaseChangeEvent:
+    return LegalCaseChangeEvent(
+        event_id=event_id,
+        txid=txid,
+        case_id=numero,
+        numero_processo=numero,
+        event_type="movements_added",
+        payload={"movements": [{"date": NOW.isoformat(), "description": "Sentença"}]},
+        created_at=NOW,
+    )
+
+
+class FakeChangeRepository(ILegalCaseChangeRepository):
+    def __init__(self, events: List[LegalCaseChangeEvent]) -> None:
+        self.events = events
+        self.delivered: List[int] = []
+        self.failed: List[tuple] = []
+
+    def list_changes(
+        self,
+        limit: int,
+        after: Optional[ChangeCursor] = None,
+        numero_processo: Optional[str] = None,
+    ) -> ChangeEventPage:
+        ordered = sorted(self.events, key=lambda e: (e.txid, e.event_id))
+        if after is not None:
+            ordered = [
+                e
+                for e in ordered
+                if (e.txid, e.event_id) > (after.txid, after.event_id)
+            ]
+        if numero_processo is not None:
+            ordered = [e for e in ordered if e.numero_processo == numero_processo]
+        page = ordered[:limit]
+        cursor = ChangeCursor(page[-1].txid, page[-1].event_id) if page else after
+        return ChangeEventPage(page, cursor)
+
+    def claim_undelivered(
+        self, limit: int, now: datetime
+    ) -> List[LegalCaseChangeEvent]:
+        return [e for e in self.events if e.event_id not in self.delivered][:limit]
+
+    def mark_delivered(self, event_ids: List[int]) -> None:
+        self.delivered.extend(event_ids)
+
+    def mark_failed(self, event_ids: List[int], retry_at: datetime) -> None:
+        self.failed.append((event_ids, retry_at))
+        for item in self.events:
+            if item.event_id in event_ids:
+                item.delivery_attempts += 1
+
+    def purge(self, created_before: datetime, limit: int) -> int:
+        return 0
+
+
+class FlakyPublisher(IChangeEventPublisher):
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.batches: List[List[int]] = []
+
+    def publish(self, events: List[LegalCaseChangeEvent]) -> None:
+        self.batches.append([e.event_id for e in events])
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("webhook offline")
+
+
+def test_feed_follows_transaction_order_and_resumes_from_cursor():
+    # Event 3 was written by an older transaction than event 2.
+    repository = FakeChangeRepository([event(1, 100), event(2, 105), event(3, 102)])
+    use_case = ListLegalCaseChangesUseCase(repository)
+
+    first = ProcessMapper.changes_page_to_dto(use_case.execute(limit=2).get_right())
+    rest = ProcessMapper.changes_page_to_dto(
+        use_case.execute(cursor=first.next_cursor, limit=2).get_right()
+    )
+    idle = use_case.execute(cursor=rest.next_cursor).get_right()
+
+    assert [item.event_id for item in first.items] == [1, 3]
+    assert [item.event_id for item in rest.items] == [2]
+    assert idle.events == []
+    assert idle.next_cursor is not None
+    assert use_case.execute(cursor="???").is_left()
+    assert use_case.execute(case_number="123").is_left()
+
+
+def test_dispatch_retries_with_backoff_until_the_webhook_accepts():
+    repository = FakeChangeRepository([event(1, 100), event(2, 101)])
+    publisher = FlakyPublisher(failures=2)
+    use_case = DispatchChangeEventsUseCase(
+        repository, publisher, retry_base_seconds=30, retry_max_seconds=3600
+    )
+
+    assert use_case.execute().get_right() == {"delivered": 0, "failed": 2}
+    assert use_case.execute().get_right() == {"delivered": 0, "failed": 2}
+    assert use_case.execute().get_right() == {"delivered": 2, "failed": 0}
+    assert use_case.execute().get_right() == {"delivered": 0, "failed": 0}
+
+    assert repository.delivered == [1, 2]
+    assert repository.failed[1][1] > repository.failed[0][1]
+    assert use_case.retry_delay(1).total_seconds() == 30
+    assert use_case.retry_delay(2).total_seconds() == 60
+    assert use_case.retry_delay(20).total_seconds() == 3600
+
+
+def test_webhook_body_is_signed_with_the_shared_secret():
+    class Session:
+        def post(self, url, data, headers, timeout):
+            self.sent = (url, data, headers)
+
+            class Response:
+                def raise_for_status(self):
+                    return None
+
+            return Response()
+
+    session = Session()
+    WebhookChangePublisher("https://hooks.example", "s3cret", session).publish(
+        [event(1, 100)]
+    )
+
+    _, body, headers = session.sent
+    expected = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+    assert headers[SIGNATURE_HEADER] == f"sha256={expected}"
+    assert b'"event_id":1' in body
+
+
+def test_changed_fields_matches_the_sync_field_count():
+    before = build_case(TRF1_CASE, [])
+    after = build_case(TRF1_CASE, [])
+    after.status = "Baixado"
+    after.subject = "Outro assunto"
+
+    assert changed_fields(before, after) == ["subject", "status"]
@@ -1,3 +1,6 @@
+import json
+from datetime import datetime
+
 from src.infra.external.dto.legal_case_dto import LegalCaseRawDTO
 from src.infra.external.mapper.legal_case_mapper import LegalCaseMapper
 
@@ -20,3 +23,80 @@ def test_from_dto_to_domain_formats_digit_only_case_number():
     legal_case = LegalCaseMapper.from_dto_to_domain(dto)
 
     assert legal_case.case_number == "0710802-55.2018.8.02.0001"
+
+
+def _edge_case_source():
+    return {
+        "numeroProcesso": "07108025520188020001",
+        "tribunal": "TJAL",
+        "classe": {"nome": "Procedimento Comum"},
+        "orgaoJulgador": {},
+        "dataAjuizamento": "2018-05-02T00:00:00Z",
+        "grau": "",
+        "assuntos": ["inválido", {"nome": "Dano Moral"}],
+        "movimentos": [
+            {"dataHora": "2024-02-01T12:00:00Z", "nome": "Despacho"},
+            {
+                "dataHora": "2024-02-01T12:00:00.000Z",
+                "nome": "Juntada",
+                "complementosTabelados": [{"nome": "Petição"}, {}, {"nome": 7}],
+            },
+            {
+                "dataHora": "2023-01-01T08:00:00-03:00",
+                "complementosTabelados": [{"nome": "X"}],
+            },
+            {
+                "dataHora": "2022-06-01T00:00:00Z",
+                "nome": " Conclusão ",
+                "complementosTabelados": [],
+            },
+            None,
+            "ruído",
+        ],
+    }
+
+
+def test_from_source_matches_dto_path_on_edge_cases():
+    source = _edge_case_source()
+
+    fast = LegalCaseMapper.from_source(source)
+    legacy = LegalCaseMapper.from_dto_to_domain(LegalCaseRawDTO.from_dict(source))
+
+    assert fast == legacy
+    assert [m.description for m in fast.movement_history][-2:] == [
+        "Despacho",
+        "Juntada - Petição - 7",
+    ]
+
+
+def test_from_source_matches_dto_path_on_unparseable_dates():
+    source = {
+        "dataAjuizamento": "ontem",
+        "movimentos": [
+            {"dataHora": "data inválida", "nome": "Conclusão"},
+            {"nome": "Sem data"},
+            {"dataHora": "2023-01-01T08:00:00", "nome": ""},
+        ],
+    }
+
+    fast = LegalCaseMapper.from_source(source)
+
+    assert fast == LegalCaseMapper.from_dto_to_domain(LegalCaseRawDTO.from_dict(source))
+    assert fast.filing_date == datetime.min
+    assert [m.description for m in fast.movement_history] == [
+        "Conclusão",
+        "Sem data",
+        "",
+    ]
+
+
+def test_from_source_matches_dto_path_on_large_payload():
+    from benchmarks.legal_case_mapper import build_payload
+
+    source = json.loads(build_payload(10000))["hits"]["hits"][0]["_source"]
+
+    fast = LegalCaseMapper.from_source(source)
+    legacy = LegalCaseMapper.from_dto_to_domain(LegalCaseRawDTO.from_dict(source))
+
+    assert len(fast.movement_history) == 10000
+    assert fast == legacy
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from src.domain.entities.case import CNJNumber
+from src.domain.repositories.legal_case_raw_archive_repository import (
+    ArchivedSource,
+    ILegalCaseRawArchive,
+)
+from src.domain.usecases.remap_legal_cases_use_case import RemapLegalCasesUseCase
+from src.infra.database.repositories.legal_case_raw_archive_repository import (
+    decode_source,
+    encode_source,
+)
+from src.infra.external.gateway.datajud_gateway import DataJudGateway
+from src.infra.external.mapper.legal_case_mapper import LegalCaseMapper
+from tests.fakes import (
+    FakeLegalCaseRepository,
+    FakeResponse,
+    FakeSession,
+    persisted,
+)
+
+
+class FakeArchive(ILegalCaseRawArchive):
+    def __init__(self, fail: bool = False) -> None:
+        self.sources: Dict[str, ArchivedSource] = {}
+        self.fail = fail
+
+    def store(
+        self, numero_processo: str, court_acronym: str, source: Dict[str, Any]
+    ) -> None:
+        if self.fail:
+            raise RuntimeError("banco indisponível")
+        self.sources[numero_processo] = ArchivedSource(
+            numero_processo, court_acronym, source, datetime.now(timezone.utc)
+        )
+
+    def list_case_numbers(self, limit: int, after: Optional[str] = None) -> List[str]:
+        numbers = sorted(n for n in self.sources if after is None or n > after)
+        return numbers[:limit]
+
+    def load(self, numeros_processo: List[str]) -> List[ArchivedSource]:
+        return [self.sources[n] for n in numeros_processo if n in self.sources]
+
+
+def source(number: str, subject: str, movement: str) -> Dict[str, Any]:
+    return {
+        "numeroProcesso": number,
+        "tribunal": "TJAL",
+        "assuntos": [{"nome": subject}],
+        "movimentos": [{"dataHora": "2024-02-01T12:00:00Z", "nome": movement}],
+    }
+
+
+def test_encoded_sources_are_deduplicated_by_canonical_content():
+    first = {"numeroProcesso": "1", "movimentos": [{"nome": "Despacho"}]}
+    reordered = {"movimentos": [{"nome": "Despacho"}], "numeroProcesso": "1"}
+
+    content_hash, codec, blob, raw_size = encode_source(first)
+
+    assert encode_source(reordered)[0] == content_hash
+    assert encode_source({**first, "grau": "G1"})[0] != content_hash
+    assert codec in ("zstd", "zlib")
+    assert raw_size > 0
+    assert decode_source(codec, blob) == first
+
+
+def test_gateway_archives_raw_sources_without_failing_on_archive_errors():
+    number = "07108025520188020001"
+    raw = source(number, "Dano Moral", "Despacho")
+    archive = FakeArchive()
+    session = FakeSession([FakeResponse({"hits": {"hits": [{"_source": raw}]}})])
+    gateway = DataJudGateway(session=session, archive=archive)
+
+    gateway.find_case_by_number(CNJNumber.from_raw(number), "tjal")
+
+    assert archive.sources[number].source == raw
+    assert archive.sources[number].court_acronym == "tjal"
+
+    broken = DataJudGateway(
+        session=FakeSession([FakeResponse({"hits": {"hits": [{"_source": raw}]}})]),
+        archive=FakeArchive(fail=True),
+    )
+    assert broken.find_case_by_number(CNJNumber.from_raw(number), "tjal") is not None
+
+
+def test_remap_rebuilds_cases_from_the_archive_in_parallel():
+    numbers = [f"0710802552018802{suffix:04d}" for suffix in range(5)]
+    archive = FakeArchive()
+    for number in numbers:
+        archive.store(number, "tjal", source(number, "Assunto novo", "Juntada"))
+    archive.store("07108025520188029999", "tjal", {"movimentos": "quebrado"})
+    repository = FakeLegalCaseRepository([persisted(numbers[0], [])])
+
+    @contextmanager
+    def scope():
+        yield repository
+
+    def mapper(raw):
+        if not isinstance(raw["movimentos"], list):
+            raise ValueError("payload inválido")
+        return LegalCaseMapper.from_source(raw)
+
+    use_case = RemapLegalCasesUseCase(
+        archive, mapper, scope, max_workers=3, batch_size=2
+    )
+
+    summary = use_case.execute().get_right()
+
+    assert summary["remapped"] == 5
+    assert summary["failed"] == 1
+    assert summary["errors"] == ["07108025520188029999: payload inválido"]
+    rebuilt = repository.get_by_number(numbers[0])
+    assert rebuilt.case.subject == "Assunto novo"
+    assert [m.description for m in repository.stored[rebuilt.case_id]] == ["Juntada"]
+    assert all(repository.get_by_number(number) for number in numbers)
+
+    only_missing = use_case.execute(["07108025520188020099"]).get_right()
+    assert only_missing["missing"] == 1
+    assert only_missing["remapped"] == 0
@@ -0,0 +1,66 @@
+from datetime import datetime, timezone
+
+from src.domain.core.errors import InvalidInputError, LegalCaseNotFoundError
+from src.domain.entities.case import Movement
+from src.domain.usecases.list_legal_case_movements_use_case import (
+    ListLegalCaseMovementsUseCase,
+)
+from src.infra.http.mapper.process_mapper import ProcessMapper
+from tests.fakes import (
+    TRF1_CASE,
+    FakeLegalCaseRepository,
+    persisted,
+)
+
+
+def movement(day: int, description: str) -> Movement:
+    return Movement(
+        date=datetime(2024, 1, day, tzinfo=timezone.utc), description=description
+    )
+
+
+def test_pages_walk_the_history_newest_first_without_gaps():
+    # Two movements share a timestamp: the id breaks the tie between pages.
+    history = [movement(day, f"Movimento {day}") for day in range(1, 6)]
+    history.append(movement(3, "Movimento 3b"))
+    repository = FakeLegalCaseRepository([persisted(TRF1_CASE, history)])
+    use_case = ListLegalCaseMovementsUseCase(repository)
+
+    seen = []
+    cursor = None
+    while True:
+        result = use_case.execute(TRF1_CASE, limit=2, cursor=cursor)
+        assert result.is_right()
+        dto = ProcessMapper.movement_page_to_dto(result.get_right())
+        seen.extend(item.description for item in dto.items)
+        cursor = dto.next_cursor
+        if cursor is None:
+            break
+
+    assert len(seen) == len(history)
+    assert set(seen) == {m.description for m in history}
+    assert seen[0] == "Movimento 5" and seen[-1] == "Movimento 1"
+
+
+def test_rejects_bad_input_and_unknown_cases():
+    use_case = ListLegalCaseMovementsUseCase(FakeLegalCaseRepository([]))
+
+    assert isinstance(use_case.execute("123").get_left(), InvalidInputError)
+    assert isinstance(
+        use_case.execute(TRF1_CASE, limit=0).get_left(), InvalidInputError
+    )
+    assert isinstance(
+        use_case.execute(TRF1_CASE, cursor="not-a-cursor").get_left(),
+        InvalidInputError,
+    )
+    assert isinstance(use_case.execute(TRF1_CASE).get_left(), LegalCaseNotFoundError)
+
+
+def test_case_detail_reports_full_count_with_embedded_tail():
+    case = persisted(TRF1_CASE, [movement(9, "Sentença")])
+    case.movement_count = 120
+
+    dto = ProcessMapper.case_to_dto(case)
+
+    assert dto.movimentacoes == 120
+    assert [item.description for item in dto.movement_history] == ["Sentença"]
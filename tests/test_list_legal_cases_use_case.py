@@ -0,0 +1,81 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from src.domain.core.errors import InvalidInputError
+from src.domain.entities.case import Movement
+from src.domain.usecases.list_legal_cases_use_case import ListLegalCasesUseCase
+from src.infra.http.mapper.process_mapper import ProcessMapper
+from tests.fakes import (
+    FakeLegalCaseRepository,
+    persisted,
+)
+
+
+def case_with_last_movement(index: int, day):
+    case = persisted(
+        f"100000{index}0020244010000",
+        [Movement(datetime(2024, 1, day, tzinfo=timezone.utc), "Despacho")]
+        if day
+        else [],
+    )
+    # Cursors carry the case id, which the real table stores as a UUID.
+    case.case_id = str(UUID(int=index))
+    return case
+
+
+def test_keyset_pages_cover_every_case_once_with_nulls_last():
+    cases = [
+        case_with_last_movement(1, 5),
+        case_with_last_movement(2, None),
+        case_with_last_movement(3, 5),
+        case_with_last_movement(4, 9),
+        case_with_last_movement(5, None),
+    ]
+    use_case = ListLegalCasesUseCase(FakeLegalCaseRepository(cases))
+
+    seen = []
+    cursor = None
+    while True:
+        result = use_case.execute(
+            sort_field="ultima_movimentacao", limit=2, cursor=cursor
+        )
+        assert result.is_right()
+        dto = ProcessMapper.case_list_to_dto(result.get_right())
+        seen.extend(item.numero_processo for item in dto.items)
+        cursor = dto.next_cursor
+        if cursor is None:
+            break
+
+    expected_order = [cases[i].numero_processo for i in (3, 2, 0, 4, 1)]
+    assert [number.replace("-", "").replace(".", "") for number in seen] == (
+        expected_order
+    )
+
+
+def test_rejects_unknown_sort_and_foreign_cursors():
+    cases = [case_with_last_movement(index, index) for index in range(1, 4)]
+    use_case = ListLegalCasesUseCase(FakeLegalCaseRepository(cases))
+    page = use_case.execute(sort_field="movimentacoes", limit=1).get_right()
+    cursor = ProcessMapper.case_list_to_dto(page).next_cursor
+
+    assert isinstance(
+        use_case.execute(sort_field="assunto").get_left(), InvalidInputError
+    )
+    assert isinstance(
+        use_case.execute(sort_direction="up").get_left(), InvalidInputError
+    )
+    assert isinstance(
+        use_case.execute(sort_field="numero_processo", cursor=cursor).get_left(),
+        InvalidInputError,
+    )
+    assert use_case.execute(sort_field="movimentacoes", cursor=cursor).is_right()
+
+
+def test_cursor_of_a_defaulted_sort_opens_the_next_page():
+    cases = [case_with_last_movement(index, index) for index in range(1, 4)]
+    use_case = ListLegalCasesUseCase(FakeLegalCaseRepository(cases))
+    page = use_case.execute(sort_field="", limit=1).get_right()
+    cursor = ProcessMapper.case_list_to_dto(page).next_cursor
+
+    assert page.sort_field == "created_at"
+    assert use_case.execute(sort_field="", limit=1, cursor=cursor).is_right()
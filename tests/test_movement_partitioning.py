@@ -0,0 +1,337 @@
+import json
+import os
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.domain.repositories.legal_case_repository import MovementCursor
+from src.infra.database.repositories.legal_case_movement_partition_repository import (
+    DEFAULT_PARTITION,
+    LegalCaseMovementPartitionRepository,
+    partition_bounds,
+    partition_name,
+    plan_partition_years,
+)
+from src.domain.entities.case import Movement
+from src.infra.database.repositories.legal_case_repository import (
+    MOVEMENT_INSERT_CHUNK_SIZE,
+    LegalCaseRepository,
+)
+from src.infra.database.repositories.movement_type_dictionary import (
+    MovementTypeDictionary,
+)
+
+
+class FakeResult:
+    def __init__(self, rows=(), scalar=None) -> None:
+        self._rows = list(rows)
+        self._scalar = scalar
+
+    def all(self):
+        return self._rows
+
+    def scalars(self):
+        return iter(self._rows)
+
+    def scalar(self):
+        return self._scalar
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+class RecordingSession:
+    """Records the SQL it receives; answers partition catalog queries."""
+
+    def __init__(self, partitions=(), parked_years=()) -> None:
+        self.partitions = list(partitions)
+        self.parked_years = set(parked_years)
+        self.statements = []
+
+    def execute(self, stmt, params=None):
+        sql = str(
+            stmt.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"render_postcompile": True},
+            )
+        )
+        self.statements.append(sql)
+        if "pg_inherits" in sql:
+            return FakeResult(self.partitions)
+        if "SELECT DISTINCT" in sql:
+            return FakeResult(sorted(self.parked_years))
+        if "SELECT EXISTS" in sql:
+            return FakeResult(scalar=params["start"].year in self.parked_years)
+        return FakeResult()
+
+
+def test_plan_partition_years_covers_parked_and_upcoming_years():
+    assert plan_partition_years(
+        existing={2024, 2025},
+        default_years={1850, 1999, 2026},
+        current_year=2026,
+        years_ahead=2,
+    ) == [1999, 2026, 2027, 2028]
+    assert plan_partition_years({2026}, (), 2026, 0) == []
+
+
+def test_partition_name_and_bounds():
+    assert partition_name(2024) == "legal_case_movements_p2024"
+    assert partition_bounds(2024) == (
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+        datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_ensure_partitions_creates_missing_years_under_lock():
+    session = RecordingSession(
+        partitions=[DEFAULT_PARTITION, "legal_case_movements_p2026"]
+    )
+
+    created = LegalCaseMovementPartitionRepository(session).ensure_partitions(
+        years_ahead=1, now=datetime(2026, 10, 19, tzinfo=timezone.utc)
+    )
+
+    assert created == [2027]
+    assert "pg_advisory_xact_lock" in session.statements[0]
+    assert session.statements[-1] == (
+        "CREATE TABLE legal_case_movements_p2027 PARTITION OF legal_case_movements "
+        "FOR VALUES FROM ('2027-01-01T00:00:00+00:00') "
+        "TO ('2028-01-01T00:00:00+00:00')"
+    )
+
+
+def test_ensure_partitions_moves_parked_rows_out_of_the_default():
+    session = RecordingSession(
+        partitions=[DEFAULT_PARTITION, "legal_case_movements_p2026"],
+        parked_years={2019},
+    )
+
+    created = LegalCaseMovementPartitionRepository(session).ensure_partitions(
+        years_ahead=0, now=datetime(2026, 10, 19, tzinfo=timezone.utc)
+    )
+
+    assert created == [2019]
+    create, move, attach = session.statements[-3:]
+    assert create.startswith("CREATE TABLE legal_case_movements_p2019 (LIKE")
+    assert f"DELETE FROM {DEFAULT_PARTITION}" in move
+    assert "INSERT INTO legal_case_movements_p2019" in move
+    assert attach.startswith(
+        "ALTER TABLE legal_case_movements ATTACH PARTITION legal_case_movements_p2019"
+    )
+
+
+def _repository(session):
+    return LegalCaseRepository(session, movement_types=MovementTypeDictionary())
+
+
+def test_movement_page_after_cursor_bounds_the_partition_key():
+    session = RecordingSession()
+    cursor = MovementCursor(
+        datetime(2023, 5, 1, tzinfo=timezone.utc), str(uuid.uuid4())
+    )
+
+    _repository(session).list_movements_page(str(uuid.uuid4()), 10, cursor)
+
+    assert "legal_case_movements.movement_date <= " in session.statements[-1]
+
+
+def test_movements_since_bounds_the_partition_key():
+    session = RecordingSession()
+
+    _repository(session).list_movements_since(
+        str(uuid.uuid4()), datetime(2024, 1, 1, tzinfo=timezone.utc)
+    )
+
+    assert "legal_case_movements.movement_date >= " in session.statements[-1]
+
+
+class FixedMovementTypes(MovementTypeDictionary):
+    def encode(self, session, descriptions):
+        return {text: 1 for text in descriptions}
+
+
+def test_movement_insert_is_chunked_below_the_bind_parameter_limit():
+    session = RecordingSession()
+    start = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    movements = [
+        Movement(start + timedelta(hours=hour), "Juntada")
+        for hour in range(2 * MOVEMENT_INSERT_CHUNK_SIZE + 1)
+    ]
+
+    LegalCaseRepository(session, movement_types=FixedMovementTypes())._insert_movements(
+        uuid.uuid4(), movements
+    )
+
+    inserts = [sql for sql in session.statements if "INSERT INTO" in sql]
+    assert len(inserts) == 3
+    assert all(sql.count("%(") < 65535 for sql in inserts)
+
+
+# --- Scale test --------------------------------------------------------------
+# Needs a disposable Postgres: SCALE_TEST_DATABASE_URL=postgresql+psycopg2://...
+# Loads SCALE_TEST_MOVEMENTS rows into the default partition, lets the
+# maintenance job split them into yearly partitions and checks with EXPLAIN
+# that the repository queries only scan the partitions of their date range.
+
+SCALE_DATABASE_URL = os.getenv("SCALE_TEST_DATABASE_URL")
+SCALE_MOVEMENTS = int(os.getenv("SCALE_TEST_MOVEMENTS", "200000"))
+SCALE_YEARS = range(2005, 2025)
+
+
+def _scanned_relations(plan):
+    found = set()
+    if "Relation Name" in plan:
+        found.add(plan["Relation Name"])
+    for child in plan.get("Plans", ()):
+        found |= _scanned_relations(child)
+    return found
+
+
+class ExplainingSession:
+    """Runs every repository statement through ``EXPLAIN (FORMAT JSON)``."""
+
+    def __init__(self, session) -> None:
+        self._session = session
+        self.scanned = []
+
+    def execute(self, stmt, params=None):
+        sql = str(
+            stmt.compile(
+                dialect=self._session.get_bind().dialect,
+                compile_kwargs={"render_postcompile": True, "literal_binds": True},
+            )
+        )
+        plan = (
+            self._session.connection()
+            .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+            .scalar()
+        )
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        self.scanned.append(_scanned_relations(plan[0]["Plan"]))
+        return FakeResult()
+
+
+@pytest.mark.skipif(not SCALE_DATABASE_URL, reason="SCALE_TEST_DATABASE_URL is not set")
+def test_partition_pruning_at_scale():
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.orm import Session
+
+    from src.infra.database.models import (
+        Base,
+        LegalCaseModel,
+        LegalCaseMovementModel,
+        LegalCaseMovementTypeModel,
+    )
+
+    schema = f"partition_scale_{uuid.uuid4().hex[:8]}"
+    engine = create_engine(
+        SCALE_DATABASE_URL,
+        connect_args={"options": f"-csearch_path={schema}"},
+    )
+    with engine.begin() as connection:
+        connection.execute(text(f"CREATE SCHEMA {schema}"))
+    try:
+        with Session(engine) as session:
+            Base.metadata.create_all(
+                session.connection(),
+                tables=[
+                    LegalCaseModel.__table__,
+                    LegalCaseMovementTypeModel.__table__,
+                    LegalCaseMovementModel.__table__,
+                ],
+            )
+            session.execute(
+                text(
+                    f"CREATE TABLE {DEFAULT_PARTITION} "
+                    "PARTITION OF legal_case_movements DEFAULT"
+                )
+            )
+            case_ids = [uuid.uuid4() for _ in range(max(1, SCALE_MOVEMENTS // 500))]
+            session.execute(
+                LegalCaseModel.__table__.insert(),
+                [
+                    {"id": case_id, "numero_processo": f"scale-{index}"}
+                    for index, case_id in enumerate(case_ids)
+                ],
+            )
+            type_id = session.execute(
+                LegalCaseMovementTypeModel.__table__.insert()
+                .values(description_hash=b"\0" * 16, description="Conclusão")
+                .returning(LegalCaseMovementTypeModel.id)
+            ).scalar()
+            randomizer = random.Random(47)
+            start = partition_bounds(SCALE_YEARS[0])[0]
+            span = (partition_bounds(SCALE_YEARS[-1])[1] - start).total_seconds()
+            rows = [
+                {
+                    "id": uuid.uuid4(),
+                    "legal_case_id": randomizer.choice(case_ids),
+                    "movement_date": start
+                    + timedelta(seconds=randomizer.random() * span),
+                    "movement_type_id": type_id,
+                }
+                for _ in range(SCALE_MOVEMENTS)
+            ]
+            for offset in range(0, len(rows), 10_000):
+                session.execute(
+                    LegalCaseMovementModel.__table__.insert(),
+                    rows[offset : offset + 10_000],
+                )
+
+            created = LegalCaseMovementPartitionRepository(session).ensure_partitions(
+                years_ahead=1, now=datetime(2024, 6, 1, tzinfo=timezone.utc)
+            )
+            assert created == list(SCALE_YEARS) + [2025]
+            assert not session.execute(
+                text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION})")
+            ).scalar()
+            session.execute(text("ANALYZE legal_case_movements"))
+
+            explaining = ExplainingSession(session)
+            repository = _repository(explaining)
+            repository.list_movements_since(
+                str(case_ids[0]), datetime(2023, 3, 1, tzinfo=timezone.utc)
+            )
+            repository.list_movements_page(
+                str(case_ids[0]),
+                20,
+                MovementCursor(
+                    datetime(2007, 6, 1, tzinfo=timezone.utc), str(uuid.uuid4())
+                ),
+            )
+
+            since_scan, page_scan = explaining.scanned
+            assert since_scan <= {
+                partition_name(2023),
+                partition_name(2024),
+                partition_name(2025),
+                DEFAULT_PARTITION,
+            }
+            assert page_scan <= {
+                partition_name(year) for year in (2005, 2006, 2007)
+            } | {DEFAULT_PARTITION}
+            session.rollback()
+    finally:
+        with engine.begin() as connection:
+            connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        engine.dispose()
+
+
+def test_scanned_relations_walks_nested_plans():
+    plan = {
+        "Node Type": "Append",
+        "Plans": [
+            {"Relation Name": "legal_case_movements_p2024"},
+            {"Plans": [{"Relation Name": "legal_case_movements_default"}]},
+        ],
+    }
+
+    assert _scanned_relations(plan) == {
+        "legal_case_movements_p2024",
+        "legal_case_movements_default",
+    }
@@ -0,0 +1,100 @@
+import hashlib
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from src.infra.database.repositories.movement_type_dictionary import (
+    MovementTypeDictionary,
+    description_hash,
+)
+
+
+class FakeTypeSession:
+    """Answers the dictionary statements from an in-memory table."""
+
+    def __init__(self, rows=None, committed_elsewhere=None) -> None:
+        self.rows = dict(rows or {})
+        self._next_id = max(self.rows, default=0) + 1
+        # Descriptions another transaction commits while our insert runs.
+        self._committed_elsewhere = set(committed_elsewhere or ())
+        self.statements = []
+
+    def _row(self, type_id):
+        return SimpleNamespace(id=type_id, description=self.rows[type_id])
+
+    def _add(self, description):
+        type_id = self._next_id
+        self._next_id += 1
+        self.rows[type_id] = description
+        return type_id
+
+    def execute(self, stmt):
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        if stmt.is_insert:
+            self.statements.append("insert")
+            texts = [params[f"description_m{i}"] for i in range(len(params) // 2)]
+            inserted = []
+            for text in texts:
+                if text in self._committed_elsewhere:
+                    self._add(text)
+                    continue
+                if text not in self.rows.values():
+                    inserted.append(self._row(self._add(text)))
+            return inserted
+        if "id_1" in params:
+            self.statements.append("select_ids")
+            return [self._row(i) for i in params["id_1"] if i in self.rows]
+        self.statements.append("select_hashes")
+        hashes = set(params["description_hash_1"])
+        return [
+            self._row(type_id)
+            for type_id, text in self.rows.items()
+            if description_hash(text) in hashes
+        ]
+
+
+def test_description_hash_matches_postgres_md5():
+    text = "Juntada de Petição - Manifestação"
+    assert description_hash(text) == bytes.fromhex(
+        hashlib.md5(text.encode("utf-8")).hexdigest()
+    )
+    assert len(description_hash("x" * 10_000)) == 16
+
+
+def test_encode_inserts_only_new_descriptions():
+    session = FakeTypeSession({1: "Conclusão"})
+    dictionary = MovementTypeDictionary()
+
+    ids = dictionary.encode(session, ["Conclusão", "Sentença", "Conclusão"])
+
+    assert ids == {"Conclusão": 1, "Sentença": 2}
+    assert session.statements == ["select_hashes", "insert"]
+    assert dictionary.encode(session, ["Sentença"]) == {"Sentença": 2}
+    assert session.statements[-1] == "select_hashes"
+
+
+def test_encode_picks_up_descriptions_inserted_concurrently():
+    session = FakeTypeSession(committed_elsewhere={"Despacho"})
+
+    ids = MovementTypeDictionary().encode(session, ["Despacho", "Sentença"])
+
+    assert set(ids) == {"Despacho", "Sentença"}
+    assert session.statements == ["select_hashes", "insert", "select_hashes"]
+
+
+def test_describe_reads_only_uncached_ids_and_evicts_least_recent():
+    session = FakeTypeSession({1: "Conclusão", 2: "Sentença", 3: "Despacho"})
+    dictionary = MovementTypeDictionary(max_entries=2)
+
+    assert dictionary.describe(session, [1, 2, 1]) == {
+        1: "Conclusão",
+        2: "Sentença",
+    }
+    assert dictionary.describe(session, [1]) == {1: "Conclusão"}
+    assert session.statements == ["select_ids"]
+
+    dictionary.describe(session, [3])
+    dictionary.describe(session, [1])
+    assert session.statements == ["select_ids", "select_ids"]
+    dictionary.describe(session, [2])
+    assert len(session.statements) == 3
@@ -0,0 +1,204 @@
+import os
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain.repositories.legal_case_repository import ProcessDashboardFilters
+from src.infra.database.repositories.legal_case_repository import (
+    LegalCaseRepository,
+)
+
+
+def _counter(section, label, count, avg_seconds=None):
+    return SimpleNamespace(
+        section=section,
+        label=label,
+        count=count,
+        avg_seconds=avg_seconds,
+        tribunal=None,
+        movimentacoes=None,
+        ultima_movimentacao=None,
+    )
+
+
+def _case(section, number, movimentacoes, ultima_movimentacao, tribunal="TJAL"):
+    return SimpleNamespace(
+        section=section,
+        label=number,
+        count=None,
+        avg_seconds=None,
+        tribunal=tribunal,
+        movimentacoes=movimentacoes,
+        ultima_movimentacao=ultima_movimentacao,
+    )
+
+
+class SingleStatementSession:
+    def __init__(self, rows) -> None:
+        self._rows = rows
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        return iter(self._rows)
+
+
+def test_aggregate_dashboard_assembles_every_section_from_one_statement():
+    march = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    may = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    # UNION ALL branches may come back interleaved.
+    rows = [
+        _case("last_updated_list", "B", 3, march),
+        _counter("by_court", "TJSP", 1),
+        _case("top_by_movements", "B", 3, march),
+        _counter("status_count", None, 1),
+        _counter("by_period", "2024-05", 2),
+        _case("last_updated_list", "C", 0, None, tribunal=None),
+        _counter("total", None, 3, Decimal("172800")),
+        _counter("by_court", None, 2),
+        _case("top_by_movements", "A", 7, may),
+        _counter("status_count", "Em andamento", 2),
+        _counter("by_period", "2024-03", 1),
+        _case("last_updated_list", "A", 7, may),
+        _case("top_by_movements", "C", 0, None, tribunal=None),
+    ]
+    session = SingleStatementSession(rows)
+
+    data = (
+        LegalCaseRepository(session)
+        .aggregate_dashboard(ProcessDashboardFilters(status=["Em andamento"]))
+        .data
+    )
+
+    assert len(session.statements) == 1
+    assert data == {
+        "status_count": {"desconhecido": 1, "Em andamento": 2},
+        "by_court": [
+            {"tribunal": "desconhecido", "count": 2},
+            {"tribunal": "TJSP", "count": 1},
+        ],
+        "by_period": [
+            {"period": "2024-03", "count": 1},
+            {"period": "2024-05", "count": 2},
+        ],
+        "period_granularity": "monthly",
+        "avg_time_between_movements_days": 2.0,
+        "top_by_movements": [
+            {
+                "numero_processo": "A",
+                "tribunal": "TJAL",
+                "movimentacoes": 7,
+                "ultima_movimentacao": may,
+            },
+            {
+                "numero_processo": "B",
+                "tribunal": "TJAL",
+                "movimentacoes": 3,
+                "ultima_movimentacao": march,
+            },
+            {
+                "numero_processo": "C",
+                "tribunal": None,
+                "movimentacoes": 0,
+                "ultima_movimentacao": None,
+            },
+        ],
+        # Descending order puts cases without movements first, as in Postgres.
+        "last_updated_list": [
+            {
+                "numero_processo": "C",
+                "tribunal": None,
+                "movimentacoes": 0,
+                "ultima_movimentacao": None,
+            },
+            {
+                "numero_processo": "A",
+                "tribunal": "TJAL",
+                "movimentacoes": 7,
+                "ultima_movimentacao": may,
+            },
+            {
+                "numero_processo": "B",
+                "tribunal": "TJAL",
+                "movimentacoes": 3,
+                "ultima_movimentacao": march,
+            },
+        ],
+    }
+
+
+def test_aggregate_dashboard_defaults_when_nothing_matches():
+    session = SingleStatementSession([_counter("total", None, 0)])
+
+    data = (
+        LegalCaseRepository(session).aggregate_dashboard(ProcessDashboardFilters()).data
+    )
+
+    assert data["status_count"] == {}
+    assert data["by_court"] == [] and data["by_period"] == []
+    assert data["avg_time_between_movements_days"] == 0.0
+    assert data["top_by_movements"] == [] and data["last_updated_list"] == []
+
+
+SCALE_DATABASE_URL = os.getenv("SCALE_TEST_DATABASE_URL")
+
+
+@pytest.mark.skipif(not SCALE_DATABASE_URL, reason="SCALE_TEST_DATABASE_URL is not set")
+def test_rollup_dashboard_matches_per_section_queries():
+    from sqlalchemy import text
+
+    from benchmarks.database import temporary_schema
+    from benchmarks.process_dashboard import (
+        SCENARIOS,
+        legacy_aggregate_dashboard,
+        seed_cases,
+    )
+    from src.infra.database.dashboard_rollups import (
+        LEGAL_CASE_ROLLUP,
+        install,
+        refresh_logged_days,
+    )
+    from src.infra.database.models import (
+        LegalCaseDailyRollupModel,
+        LegalCaseModel,
+        LegalCaseRollupDirtyDayModel,
+    )
+
+    scenarios = dict(SCENARIOS)
+    scenarios["nenhum resultado"] = ProcessDashboardFilters(tribunal=["STF"])
+    scenarios["fim à meia-noite"] = ProcessDashboardFilters(
+        date_from=datetime(2020, 1, 1), date_to=datetime(2020, 6, 30)
+    )
+    with temporary_schema(
+        SCALE_DATABASE_URL,
+        LegalCaseModel.__table__,
+        LegalCaseDailyRollupModel.__table__,
+        LegalCaseRollupDirtyDayModel.__table__,
+    ) as session:
+        install(session.connection(), LEGAL_CASE_ROLLUP)
+        seed_cases(session, 5000)
+        repository = LegalCaseRepository(session)
+
+        def assert_equivalent():
+            # Drained in small batches to cover partial refreshes.
+            while refresh_logged_days(session.connection(), LEGAL_CASE_ROLLUP, 50):
+                pass
+            for filters in scenarios.values():
+                assert (
+                    repository.aggregate_dashboard(filters).data
+                    == legacy_aggregate_dashboard(session, filters).data
+                )
+
+        assert_equivalent()
+        # Writes after the seed are logged by the update and delete triggers.
+        session.execute(
+            text(
+                "UPDATE legal_cases SET status = 'Arquivado', "
+                "movimentacoes = movimentacoes + 1, tribunal = NULL "
+                "WHERE numero_processo LIKE '%3'"
+            )
+        )
+        session.execute(text("DELETE FROM legal_cases WHERE numero_processo LIKE '%7'"))
+        assert_equivalent()
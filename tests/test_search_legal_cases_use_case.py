@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+
+from src.domain.core.errors import InvalidInputError
+from src.domain.entities.case import Movement
+from src.domain.usecases.search_legal_cases_use_case import SearchLegalCasesUseCase
+from src.infra.http.mapper.process_mapper import ProcessMapper
+from tests.fakes import (
+    TJPA_CASE,
+    TRF1_CASE,
+    FakeLegalCaseRepository,
+    persisted,
+)
+
+
+def movement(day: int, description: str) -> Movement:
+    return Movement(
+        date=datetime(2024, 1, day, tzinfo=timezone.utc), description=description
+    )
+
+
+def test_search_returns_ranked_pages_with_matching_movements():
+    repository = FakeLegalCaseRepository(
+        [
+            persisted(TRF1_CASE, [movement(1, "Sentença publicada")]),
+            persisted(
+                TJPA_CASE,
+                [
+                    movement(1, "Sentença registrada"),
+                    movement(2, "Embargos à sentença"),
+                ],
+            ),
+            persisted("10000010020244010000", [movement(1, "Despacho")]),
+        ]
+    )
+    use_case = SearchLegalCasesUseCase(repository)
+
+    first = use_case.execute("sentença", page=1, page_size=1).get_right()
+    second = use_case.execute("sentença", page=2, page_size=1).get_right()
+
+    assert [hit.numero_processo for hit in first.hits] == [TJPA_CASE]
+    assert first.has_more is True
+    assert [hit.numero_processo for hit in second.hits] == [TRF1_CASE]
+    assert second.has_more is False
+    dto = ProcessMapper.search_page_to_dto(first)
+    assert dto.items[0].numero_processo == "0800000-00.2024.8.14.0000"
+    assert len(dto.items[0].movimentacoes_encontradas) == 2
+
+
+def test_search_validates_terms_and_paging():
+    use_case = SearchLegalCasesUseCase(FakeLegalCaseRepository([]))
+
+    for kwargs in (
+        {"query": " "},
+        {"query": "sentença", "page_size": 0},
+        {"query": "sentença", "page": 0},
+        {"query": "sentença", "page": 60, "page_size": 20},
+    ):
+        assert isinstance(use_case.execute(**kwargs).get_left(), InvalidInputError)
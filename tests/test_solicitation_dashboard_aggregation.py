@@ -0,0 +1,146 @@
+import os
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain.repositories.solicitation_repository import (
+    SolicitationDashboardFilters,
+)
+from src.infra.database.repositories.solicitation_repository import (
+    SOLICITATION_STATUSES,
+    SolicitationRepository,
+)
+
+
+def _month(period, seconds=0, processed=0, **counts):
+    values = {status: counts.get(status, 0) for status in SOLICITATION_STATUSES}
+    return SimpleNamespace(
+        period=period,
+        count=sum(values.values()),
+        seconds=seconds,
+        processed=processed,
+        **values,
+    )
+
+
+class FakeResult:
+    def __init__(self, rows) -> None:
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class SingleScanSession:
+    def __init__(self, rows) -> None:
+        self._rows = rows
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        return FakeResult(self._rows)
+
+
+def test_dashboard_folds_every_indicator_from_one_scan():
+    session = SingleScanSession(
+        [
+            _month("2024-01", pendente=2),
+            _month(
+                "2024-02",
+                seconds=Decimal("259200"),
+                processed=2,
+                pendente=1,
+                aprovada=1,
+                reprovada=1,
+            ),
+            _month("2024-03", seconds=Decimal("86400"), processed=1, aprovada=1),
+        ]
+    )
+
+    data = (
+        SolicitationRepository(session)
+        .dashboard(
+            SolicitationDashboardFilters(
+                date_from=datetime(2024, 1, 1, tzinfo=timezone.utc), state=["AL"]
+            )
+        )
+        .data
+    )
+
+    assert len(session.statements) == 1
+    assert "FILTER (WHERE" in str(session.statements[0])
+    assert data == {
+        "status_count": {"pendente": 3, "aprovada": 2, "reprovada": 1},
+        "by_period": [
+            {"period": "2024-01", "count": 2},
+            {"period": "2024-02", "count": 3},
+            {"period": "2024-03", "count": 1},
+        ],
+        "period_granularity": "monthly",
+        "avg_processing_time_days": 1.33,
+        "approval_rate": 0.67,
+        "most_missing_documents": [],
+    }
+
+
+def test_dashboard_defaults_when_nothing_matches():
+    data = SolicitationRepository(SingleScanSession([])).dashboard(
+        SolicitationDashboardFilters()
+    )
+
+    assert data.data["status_count"] == {}
+    assert data.data["by_period"] == []
+    assert data.data["avg_processing_time_days"] == 0.0
+    assert data.data["approval_rate"] == 0.0
+
+
+SCALE_DATABASE_URL = os.getenv("SCALE_TEST_DATABASE_URL")
+
+
+@pytest.mark.skipif(not SCALE_DATABASE_URL, reason="SCALE_TEST_DATABASE_URL is not set")
+def test_rollup_dashboard_matches_per_indicator_queries():
+    from sqlalchemy import text
+
+    from benchmarks.database import temporary_schema
+    from benchmarks.solicitation_dashboard import (
+        SCENARIOS,
+        legacy_dashboard,
+        seed_solicitations,
+    )
+    from src.infra.database.dashboard_rollups import SOLICITATION_ROLLUP, install
+    from src.infra.database.models import (
+        SolicitationDailyRollupModel,
+        SolicitationModel,
+    )
+
+    scenarios = dict(SCENARIOS)
+    scenarios["nenhum resultado"] = SolicitationDashboardFilters(state=["RS"])
+    with temporary_schema(
+        SCALE_DATABASE_URL,
+        SolicitationModel.__table__,
+        SolicitationDailyRollupModel.__table__,
+    ) as session:
+        install(session.connection(), SOLICITATION_ROLLUP)
+        seed_solicitations(session, 5000)
+        repository = SolicitationRepository(session)
+
+        def assert_equivalent():
+            for filters in scenarios.values():
+                assert (
+                    repository.dashboard(filters).data
+                    == legacy_dashboard(session, filters).data
+                )
+
+        assert_equivalent()
+        # Status updates and deletes go through the rollup triggers.
+        session.execute(
+            text(
+                "UPDATE solicitacoes SET status = 'aprovada', "
+                "updated_at = updated_at + interval '2 days' "
+                "WHERE status = 'em_analise' AND estado = 'AL'"
+            )
+        )
+        session.execute(text("DELETE FROM solicitacoes WHERE municipio = 'Penedo'"))
+        assert_equivalent()
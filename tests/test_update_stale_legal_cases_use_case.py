@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from src.domain.core.errors import ExternalServiceUnavailableError
+from src.domain.core.rate_limit import TokenBucket
+from src.domain.core.refresh_policy import RefreshPolicy
+from src.domain.entities.case import Movement
+from src.domain.usecases.find_legal_case_use_case import FindLegalCaseUseCase
+from src.domain.usecases.get_legal_case_by_id_use_case import (
+    UpdateStaleLegalCasesUseCase,
+)
+from tests.fakes import (
+    TJPA_CASE,
+    TRF1_CASE,
+    BulkGateway,
+    FakeLegalCaseRepository,
+    SlowGateway,
+    build_case,
+    persisted,
+)
+
+
+def test_token_bucket_spaces_acquisitions_by_rate():
+    now = [0.0]
+    waits: List[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        waits.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(60, clock=lambda: now[0], sleep=fake_sleep)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 1.0
+    now[0] += 5
+    assert bucket.acquire() == 0.0
+    assert waits == [1.0]
+
+
+def test_execute_fans_out_across_tribunals_and_reports_stats():
+    old = Movement(datetime(2024, 1, 2, tzinfo=timezone.utc), "Distribuído")
+    new = Movement(datetime(2024, 3, 2, tzinfo=timezone.utc), "Conclusão")
+    cases = [persisted(TRF1_CASE, [old]), persisted(TJPA_CASE, [old])]
+    gateway = SlowGateway(
+        {
+            TRF1_CASE: build_case(TRF1_CASE, [old, new]),
+            TJPA_CASE: build_case(TJPA_CASE, [old]),
+        }
+    )
+    repository = FakeLegalCaseRepository(cases)
+    use_case = UpdateStaleLegalCasesUseCase(
+        repository,
+        FindLegalCaseUseCase(gateway),
+        max_requests_per_minute=6000,
+        max_workers=4,
+    )
+
+    summary = use_case.execute(batch_size=10).get_right()
+
+    assert gateway.max_in_flight == 2
+    assert repository.apply_threads == {threading.get_ident()}
+    assert repository.applied[TRF1_CASE] == [new]
+    assert repository.applied[TJPA_CASE] == []
+    assert summary["updated"] == 2
+    assert summary["new_movements"] == 1
+    assert set(summary["by_tribunal"]) == {"trf1", "tjpa"}
+    assert summary["by_tribunal"]["trf1"]["requests"] == 1
+    assert summary["by_tribunal"]["trf1"]["avg_latency_ms"] >= 40
+
+
+def test_execute_reports_transient_failures_as_errors():
+    cases = [persisted(TRF1_CASE, [])]
+    gateway = SlowGateway({TRF1_CASE: ExternalServiceUnavailableError()}, delay=0)
+    use_case = UpdateStaleLegalCasesUseCase(
+        FakeLegalCaseRepository(cases), FindLegalCaseUseCase(gateway)
+    )
+
+    summary = use_case.execute(batch_size=10).get_right()
+
+    assert summary["updated"] == 0
+    assert summary["skipped"] == 0
+    assert len(summary["errors"]) == 1
+
+
+def test_execute_batches_lookups_per_tribunal():
+    trf1_cases = [f"100000{index}0020244010000" for index in range(3)]
+    old = Movement(datetime(2024, 1, 2, tzinfo=timezone.utc), "Distribuído")
+    new = Movement(datetime(2024, 3, 2, tzinfo=timezone.utc), "Conclusão")
+    cases = [persisted(number, [old]) for number in trf1_cases]
+    cases.append(persisted(TJPA_CASE, [old]))
+    gateway = BulkGateway(
+        {
+            trf1_cases[0]: build_case(trf1_cases[0], [old, new]),
+            trf1_cases[2]: build_case(trf1_cases[2], [old]),
+            TJPA_CASE: build_case(TJPA_CASE, [old]),
+        }
+    )
+    repository = FakeLegalCaseRepository(cases)
+    use_case = UpdateStaleLegalCasesUseCase(
+        repository,
+        FindLegalCaseUseCase(gateway),
+        max_requests_per_minute=6000,
+        lookup_batch_size=2,
+    )
+
+    summary = use_case.execute(batch_size=10).get_right()
+
+    assert gateway.batches == [
+        ("trf1", trf1_cases[:2]),
+        ("trf1", trf1_cases[2:]),
+        ("tjpa", [TJPA_CASE]),
+    ]
+    assert repository.applied[trf1_cases[0]] == [new]
+    assert repository.applied[trf1_cases[2]] == []
+    assert trf1_cases[1] not in repository.applied
+    assert summary["updated"] == 3
+    assert summary["skipped"] == 1
+    assert summary["by_tribunal"]["trf1"]["requests"] == 2
+    assert summary["by_tribunal"]["trf1"]["cases"] == 3
+
+
+def test_execute_diffs_only_movements_past_the_watermark():
+    history = [
+        Movement(datetime(2023, 1, day, tzinfo=timezone.utc), f"Ato {day}")
+        for day in range(1, 29)
+    ]
+    latest = history[-1]
+    same_instant = Movement(latest.date, "Juntada")
+    newer = Movement(datetime(2024, 3, 2, tzinfo=timezone.utc), "Conclusão")
+    unchanged = persisted(TJPA_CASE, history)
+    changed = persisted(TRF1_CASE, history)
+    repository = FakeLegalCaseRepository([changed, unchanged])
+    gateway = BulkGateway(
+        {
+            TRF1_CASE: build_case(TRF1_CASE, history + [same_instant, newer]),
+            TJPA_CASE: build_case(TJPA_CASE, list(reversed(history))),
+        }
+    )
+    use_case = UpdateStaleLegalCasesUseCase(
+        repository, FindLegalCaseUseCase(gateway), max_requests_per_minute=6000
+    )
+
+    summary = use_case.execute(batch_size=10).get_right()
+
+    assert repository.boundary_reads == [(TRF1_CASE, latest.date)]
+    assert repository.applied[TRF1_CASE] == [same_instant, newer]
+    assert repository.applied[TJPA_CASE] == []
+    assert summary["new_movements"] == 2
+
+
+def test_naive_provider_dates_are_compared_as_utc():
+    stored = [Movement(datetime(2024, 3, 1, tzinfo=timezone.utc), "Distribuído")]
+    naive = [
+        Movement(datetime(2024, 3, 1), "Distribuído"),
+        Movement(datetime(2024, 3, 2, 9), "Despacho"),
+        Movement(datetime.min, "Sem data"),
+    ]
+    repository = FakeLegalCaseRepository([persisted(TRF1_CASE, stored)])
+    gateway = BulkGateway({TRF1_CASE: build_case(TRF1_CASE, naive)})
+    use_case = UpdateStaleLegalCasesUseCase(
+        repository, FindLegalCaseUseCase(gateway), max_requests_per_minute=6000
+    )
+
+    summary = use_case.execute(batch_size=10).get_right()
+
+    assert summary["updated"] == 1 and summary["errors"] == []
+    assert repository.applied[TRF1_CASE] == [
+        Movement(datetime(2024, 3, 2, 9, tzinfo=timezone.utc), "Despacho")
+    ]
+
+
+def test_workers_claim_disjoint_slices_and_reclaim_expired_leases():
+    numbers = [f"100000{index}0020244010000" for index in range(3)]
+    repository = FakeLegalCaseRepository([persisted(number, []) for number in numbers])
+    use_case = UpdateStaleLegalCasesUseCase(
+        repository, FindLegalCaseUseCase(BulkGateway({}))
+    )
+
+    first = use_case.claim_batch(batch_size=2, owner="a", lease_seconds=60)
+    second = use_case.claim_batch(batch_size=2, owner="b", lease_seconds=60)
+    assert [case.case_id for case in first] == numbers[:2]
+    assert [case.case_id for case in second] == numbers[2:]
+
+    use_case.release_batch(first, owner="b")
+    assert use_case.claim_batch(batch_size=2, owner="c", lease_seconds=60) == []
+
+    repository.leases[numbers[0]] = ("a", datetime.now(timezone.utc))
+    reclaimed = use_case.claim_batch(batch_size=2, owner="c", lease_seconds=60)
+    assert [case.case_id for case in reclaimed] == [numbers[0]]
+
+    use_case.release_batch(second, owner="b")
+    assert numbers[2] not in repository.leases
+
+
+def test_sync_cases_reports_each_case_and_resumes_pending_ones():
+    old = Movement(datetime(2024, 1, 2, tzinfo=timezone.utc), "Distribuído")
+    cases = [persisted(TRF1_CASE, [old]), persisted(TJPA_CASE, [old])]
+    repository = FakeLegalCaseRepository(cases)
+    gateway = BulkGateway({TRF1_CASE: build_case(TRF1_CASE, [old])})
+    use_case = UpdateStaleLegalCasesUseCase(
+        repository, FindLegalCaseUseCase(gateway), max_requests_per_minute=6000
+    )
+    done: List[tuple] = []
+
+    use_case.sync_cases(
+        cases, on_case_done=lambda case, result: done.append((case.case_id, result))
+    )
+
+    assert done == [(TRF1_CASE, "updated"), (TJPA_CASE, "skipped")]
+
+    repository.leases[TJPA_CASE] = ("crashed", datetime.now(timezone.utc))
+    repository.leases[TRF1_CASE] = ("other", datetime.now(timezone.utc))
+    resumed = use_case.claim_cases(
+        [TJPA_CASE, TRF1_CASE], owner="b", lease_seconds=60, previous_owner="crashed"
+    )
+    assert [case.case_id for case in resumed] == [TJPA_CASE]
+    assert use_case.renew_batch([TJPA_CASE, TRF1_CASE], "b", 60) == 1
+
+
+def test_refresh_policy_follows_activity_and_priority():
+    now = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    policy = RefreshPolicy()
+    busy = [Movement(now - timedelta(days=day), "Ato") for day in range(1, 90, 3)]
+    dormant = [Movement(now - timedelta(days=400), "Arquivado")]
+
+    assert policy.interval_for(busy, "media", now) == timedelta(hours=36)
+    assert policy.interval_for(busy, "alta", now) == timedelta(hours=18)
+    assert policy.interval_for(dormant, "media", now) == timedelta(days=30)
+    assert policy.interval_for([], "media", now) == timedelta(days=7, hours=12)
+    # Low priority never stretches an active case past the freshness target.
+    assert policy.interval_for(busy[:1], "baixa", now) == timedelta(days=3)
+    assert policy.interval_for([], "baixa", now) == timedelta(days=11, hours=6)
+
+
+def test_sync_reschedules_each_case_and_plans_ticks_within_budget():
+    old = Movement(datetime(2024, 1, 2, tzinfo=timezone.utc), "Distribuído")
+    cases = [persisted(TRF1_CASE, [old]), persisted(TJPA_CASE, [old])]
+    repository = FakeLegalCaseRepository(cases)
+    use_case = UpdateStaleLegalCasesUseCase(
+        repository,
+        FindLegalCaseUseCase(BulkGateway({TRF1_CASE: build_case(TRF1_CASE, [old])})),
+        max_requests_per_minute=6,
+        lookup_batch_size=1,
+    )
+
+    before = datetime.now(timezone.utc)
+    use_case.sync_cases(cases)
+
+    assert repository.schedule[TRF1_CASE] >= before + timedelta(days=3)
+    assert repository.schedule[TJPA_CASE] >= before + timedelta(days=3)
+    # Two due cases spread over a three-day target: one per tick.
+    assert use_case.plan_batch_size(tick_seconds=60, max_batch_size=20) == 1
+
+    tight = UpdateStaleLegalCasesUseCase(
+        repository,
+        FindLegalCaseUseCase(BulkGateway({})),
+        max_requests_per_minute=6,
+        lookup_batch_size=1,
+        refresh_policy=RefreshPolicy(freshness_target=timedelta(seconds=30)),
+    )
+    assert tight.plan_batch_size(tick_seconds=60, max_batch_size=20) == 2
+    # The target asks for two, the RPM share over 20 seconds allows one.
+    assert tight.plan_batch_size(tick_seconds=20, max_batch_size=20) == 1